@@ -0,0 +1,650 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline benchmarks of the client library against the mock Spanner server.
+
+The benchmarks run common workloads (point queries, large streaming scans,
+chunked values, DML, batch DML, mutation commits, partitioned queries and
+DB-API queries and DML) with the sync client and, where it has an
+equivalent, the async client. No Spanner instance or emulator is needed, so
+the benchmarks can run in CI to catch client-side performance regressions.
+
+By default the mock server runs in a separate process, so that the reported
+CPU time and allocations only include the work of the client. A simulation
+profile (see ``SimulationProfile`` in
+``google/cloud/spanner_v1/testing/mock_spanner.py``) adds production-like
+latencies, throughput limits and errors to the mock server. For every
+workload the benchmark reports the throughput, the p50 and p99 latency, the
+CPU time per operation and the peak memory allocated per operation.
+
+Usage:
+
+  $ python benchmark/mock_server_benchmark.py --iterations 500 \
+      --output results.json
+  $ python benchmark/mock_server_benchmark.py --compare results.json
+"""
+
+import argparse
+import asyncio
+import base64
+import collections
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from google.api_core.client_options import ClientOptions
+from google.auth.credentials import AnonymousCredentials
+
+from google.cloud.spanner_dbapi import Connection
+from google.cloud.spanner_v1 import Client, FixedSizePool, KeySet, TypeCode
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.testing.mock_spanner import (
+    SimulationProfile,
+    start_mock_server,
+)
+from google.cloud.spanner_v1.testing.synthetic_results import SyntheticResult
+from google.cloud.spanner_v1.types import (
+    PartialResultSet,
+    ResultSet,
+    ResultSetMetadata,
+    ResultSetStats,
+    StructType,
+    Type,
+)
+
+POINT_QUERY = "SELECT SingerId, FirstName, LastName FROM Singers WHERE SingerId=1"
+SCAN_QUERY = "SELECT * FROM Tracks"
+CHUNKED_QUERY = "SELECT AlbumId, CoverArt FROM AlbumArt"
+UPDATE_DML = "UPDATE Singers SET FirstName='Alice' WHERE SingerId=1"
+BATCH_DML_COUNT = 10
+PARTITIONED_QUERY = "SELECT SingerId, FirstName FROM Singers"
+
+SCAN_ROW_COUNT = 10000
+SCAN_ROWS_PER_PARTIAL_RESULT_SET = 100
+CHUNKED_ROW_COUNT = 20
+CHUNKED_VALUE_SIZE = 256 * 1024
+CHUNK_SIZE = 32 * 1024
+MUTATION_ROW_COUNT = 10
+PARTITIONED_ROW_COUNT = 4000
+PARTITION_COUNT = 4
+
+_SERVER_READY = "SERVING ON PORT "
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=200,
+        help="The number of measured operations per benchmark.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=20,
+        help="The number of operations before measuring.",
+    )
+    parser.add_argument(
+        "--allocation-iterations",
+        type=int,
+        default=20,
+        help="The number of operations that are traced to measure allocations.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        dest="benchmarks",
+        choices=sorted(BENCHMARKS),
+        help="The benchmark to run. Can be repeated. Defaults to all benchmarks.",
+    )
+    parser.add_argument(
+        "--client",
+        action="append",
+        dest="clients",
+        choices=("sync", "async"),
+        help="The client to benchmark. Can be repeated. Defaults to both.",
+    )
+    parser.add_argument(
+        "--in-process-server",
+        action="store_true",
+        help="Run the mock server in the benchmark process.",
+    )
+    parser.add_argument(
+        "--profile",
+        help="A JSON file with a simulation profile for the mock server, e.g. "
+        '{"latencies": {"*": {"median": 0.002, "p99": 0.02}}}.',
+    )
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    parser.add_argument(
+        "--compare", help="Compare the results with the JSON results in this file."
+    )
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def _metadata(*fields):
+    return ResultSetMetadata(
+        row_type=StructType(
+            fields=[
+                StructType.Field(name=name, type_=Type(code=code))
+                for name, code in fields
+            ]
+        )
+    )
+
+
+def _point_query_result():
+    result = ResultSet(
+        metadata=_metadata(
+            ("SingerId", TypeCode.INT64),
+            ("FirstName", TypeCode.STRING),
+            ("LastName", TypeCode.STRING),
+        )
+    )
+    result.rows.extend([("1", "Alice", "Trentor")])
+    return result
+
+
+def _scan_partial_result_sets():
+    metadata = _metadata(
+        ("TrackId", TypeCode.INT64),
+        ("Title", TypeCode.STRING),
+        ("Duration", TypeCode.FLOAT64),
+        ("Explicit", TypeCode.BOOL),
+        ("ReleasedAt", TypeCode.TIMESTAMP),
+    )
+    released_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    partials = []
+    for start in range(0, SCAN_ROW_COUNT, SCAN_ROWS_PER_PARTIAL_RESULT_SET):
+        partial = PartialResultSet()
+        if not partials:
+            partial.metadata = metadata
+        for track_id in range(start, start + SCAN_ROWS_PER_PARTIAL_RESULT_SET):
+            partial.values.extend(
+                [
+                    _make_value_pb(track_id),
+                    _make_value_pb("Track %d" % track_id),
+                    _make_value_pb(track_id / 7.0),
+                    _make_value_pb(track_id % 2 == 0),
+                    _make_value_pb(released_at),
+                ]
+            )
+        partials.append(partial)
+    partials[-1].last = True
+    return partials
+
+
+def _chunked_partial_result_sets():
+    """Return large BYTES values that are split over many partial result
+    sets, like Spanner does for values that do not fit in a single message."""
+    metadata = _metadata(("AlbumId", TypeCode.INT64), ("CoverArt", TypeCode.BYTES))
+    encoded = base64.b64encode(os.urandom(CHUNKED_VALUE_SIZE)).decode("ascii")
+    chunks = [
+        encoded[start : start + CHUNK_SIZE]
+        for start in range(0, len(encoded), CHUNK_SIZE)
+    ]
+    partials = []
+    for album_id in range(CHUNKED_ROW_COUNT):
+        first = PartialResultSet()
+        first.values.extend([_make_value_pb(album_id), _make_value_pb(chunks[0])])
+        if not partials:
+            first.metadata = metadata
+        partials.append(first)
+        for chunk in chunks[1:]:
+            partials[-1].chunked_value = True
+            partial = PartialResultSet()
+            partial.values.append(_make_value_pb(chunk))
+            partials.append(partial)
+    partials[-1].last = True
+    return partials
+
+
+def _update_count_result(count=1):
+    return ResultSet(stats=ResultSetStats(row_count_exact=count))
+
+
+def _batch_dml_statements():
+    return [
+        "UPDATE Singers SET FirstName='Alice' WHERE SingerId=%d" % singer_id
+        for singer_id in range(BATCH_DML_COUNT)
+    ]
+
+
+def _mutation_rows():
+    return [(singer_id, "Alice", "Trentor") for singer_id in range(MUTATION_ROW_COUNT)]
+
+
+def register_results(spanner_servicer):
+    """Register the results of all benchmarks with the mock server."""
+    mock_spanner = spanner_servicer.mock_spanner
+    mock_spanner.add_result(POINT_QUERY, _point_query_result())
+    mock_spanner.add_synthetic_result(
+        PARTITIONED_QUERY,
+        SyntheticResult(
+            [("SingerId", TypeCode.INT64), ("FirstName", TypeCode.STRING)],
+            row_count=PARTITIONED_ROW_COUNT,
+            partition_count=PARTITION_COUNT,
+        ),
+    )
+    mock_spanner.add_execute_streaming_sql_results(
+        SCAN_QUERY, _scan_partial_result_sets()
+    )
+    mock_spanner.add_execute_streaming_sql_results(
+        CHUNKED_QUERY, _chunked_partial_result_sets()
+    )
+    mock_spanner.add_result(UPDATE_DML, _update_count_result())
+    for statement in _batch_dml_statements():
+        mock_spanner.add_result(statement, _update_count_result())
+    # The mock server records all requests. Only keep the latest ones, so
+    # that memory use does not grow while benchmarking.
+    spanner_servicer._requests = collections.deque(maxlen=1000)
+
+
+def _load_profile(path):
+    if path is None:
+        return None
+    with open(path) as f:
+        return SimulationProfile.from_dict(json.load(f))
+
+
+def serve(profile_path):
+    """Run the mock server until stdin is closed."""
+    server, spanner_servicer, _, port = start_mock_server(
+        simulation_profile=_load_profile(profile_path)
+    )
+    register_results(spanner_servicer)
+    print(_SERVER_READY + str(port), flush=True)
+    try:
+        sys.stdin.read()
+    finally:
+        server.stop(grace=None)
+
+
+def _start_server_process(profile_path):
+    args = [sys.executable, os.path.abspath(__file__), "--serve"]
+    if profile_path is not None:
+        args += ["--profile", os.path.abspath(profile_path)]
+    process = subprocess.Popen(
+        args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline()
+    if not line.startswith(_SERVER_READY):
+        process.kill()
+        raise RuntimeError("Failed to start the mock server: %r" % (line,))
+    return process, int(line[len(_SERVER_READY) :])
+
+
+def _client_kwargs(port):
+    return dict(
+        project="p",
+        credentials=AnonymousCredentials(),
+        client_options=ClientOptions(api_endpoint="localhost:" + str(port)),
+        disable_builtin_metrics=True,
+    )
+
+
+def _sync_database(port):
+    client = Client(**_client_kwargs(port))
+    instance = client.instance("test-instance")
+    return instance.database("test-database", pool=FixedSizePool(size=4))
+
+
+async def _async_database(port):
+    from google.cloud.spanner_v1._async.client import Client as AsyncClient
+    from google.cloud.spanner_v1._async.pool import FixedSizePool as AsyncPool
+
+    client = AsyncClient(**_client_kwargs(port))
+    instance = client.instance("test-instance")
+    return await instance.database("test-database", pool=AsyncPool(size=4))
+
+
+def point_query(database):
+    with database.snapshot() as snapshot:
+        return list(snapshot.execute_sql(POINT_QUERY))
+
+
+def point_read(database):
+    with database.snapshot() as snapshot:
+        return list(snapshot.read("Singers", ["SingerId"], KeySet(keys=[[1]])))
+
+
+def streaming_scan(database):
+    with database.snapshot() as snapshot:
+        return sum(1 for _ in snapshot.execute_sql(SCAN_QUERY))
+
+
+def chunked_values(database):
+    with database.snapshot() as snapshot:
+        return sum(len(row[1]) for row in snapshot.execute_sql(CHUNKED_QUERY))
+
+
+def dml(database):
+    return database.run_in_transaction(
+        lambda transaction: transaction.execute_update(UPDATE_DML)
+    )
+
+
+def batch_dml(database):
+    return database.run_in_transaction(
+        lambda transaction: transaction.batch_update(_batch_dml_statements())
+    )
+
+
+def mutation_commit(database):
+    with database.batch() as batch:
+        batch.insert("Singers", ("SingerId", "FirstName", "LastName"), _mutation_rows())
+
+
+def partitioned_query(database):
+    batch_snapshot = database.batch_snapshot()
+    try:
+        rows = 0
+        for batch in batch_snapshot.generate_query_batches(PARTITIONED_QUERY):
+            rows += sum(1 for _ in batch_snapshot.process_query_batch(batch))
+        return rows
+    finally:
+        batch_snapshot.close()
+
+
+def dbapi_query(database):
+    connection = Connection(database._instance, database)
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        cursor.execute(POINT_QUERY)
+        return cursor.fetchall()
+
+
+def dbapi_dml(database):
+    connection = Connection(database._instance, database)
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        cursor.execute(UPDATE_DML)
+        return cursor.rowcount
+
+
+async def async_point_query(database):
+    async with database.snapshot() as snapshot:
+        results = await snapshot.execute_sql(POINT_QUERY)
+        return [row async for row in results]
+
+
+async def async_point_read(database):
+    async with database.snapshot() as snapshot:
+        results = await snapshot.read("Singers", ["SingerId"], KeySet(keys=[[1]]))
+        return [row async for row in results]
+
+
+async def async_streaming_scan(database):
+    async with database.snapshot() as snapshot:
+        results = await snapshot.execute_sql(SCAN_QUERY)
+        rows = 0
+        async for _ in results:
+            rows += 1
+        return rows
+
+
+async def async_chunked_values(database):
+    async with database.snapshot() as snapshot:
+        results = await snapshot.execute_sql(CHUNKED_QUERY)
+        total = 0
+        async for row in results:
+            total += len(row[1])
+        return total
+
+
+async def async_dml(database):
+    async def update(transaction):
+        return await transaction.execute_update(UPDATE_DML)
+
+    return await database.run_in_transaction(update)
+
+
+async def async_batch_dml(database):
+    async def update(transaction):
+        return await transaction.batch_update(_batch_dml_statements())
+
+    return await database.run_in_transaction(update)
+
+
+async def async_mutation_commit(database):
+    async with database.batch() as batch:
+        batch.insert("Singers", ("SingerId", "FirstName", "LastName"), _mutation_rows())
+
+
+async def async_partitioned_query(database):
+    batch_snapshot = database.batch_snapshot()
+    try:
+        rows = 0
+        async for batch in batch_snapshot.generate_query_batches(PARTITIONED_QUERY):
+            results = await batch_snapshot.process_query_batch(batch)
+            async for _ in results:
+                rows += 1
+        return rows
+    finally:
+        await batch_snapshot.close()
+
+
+# Maps the name of a benchmark to its sync and async implementation. The
+# DB-API has no async equivalent.
+BENCHMARKS = {
+    "point_query": (point_query, async_point_query),
+    "point_read": (point_read, async_point_read),
+    "streaming_scan": (streaming_scan, async_streaming_scan),
+    "chunked_values": (chunked_values, async_chunked_values),
+    "dml": (dml, async_dml),
+    "batch_dml": (batch_dml, async_batch_dml),
+    "mutation_commit": (mutation_commit, async_mutation_commit),
+    "partitioned_query": (partitioned_query, async_partitioned_query),
+    "dbapi_query": (dbapi_query, None),
+    "dbapi_dml": (dbapi_dml, None),
+}
+
+
+def _percentile(sorted_values, percentile):
+    index = int(round(percentile / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def _summarize(name, client, latencies, elapsed, elapsed_cpu, peak_allocations):
+    latencies = sorted(latencies)
+    iterations = len(latencies)
+    return {
+        "benchmark": name,
+        "client": client,
+        "iterations": iterations,
+        "ops_per_sec": iterations / elapsed,
+        "p50_latency_us": _percentile(latencies, 50) * 1e6,
+        "p99_latency_us": _percentile(latencies, 99) * 1e6,
+        "cpu_us_per_op": elapsed_cpu / iterations * 1e6,
+        "peak_alloc_bytes_per_op": (
+            sum(peak_allocations) / len(peak_allocations) if peak_allocations else 0
+        ),
+    }
+
+
+def run_sync(name, func, database, options):
+    for _ in range(options.warmup):
+        func(database)
+
+    latencies = []
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    for _ in range(options.iterations):
+        op_start = time.perf_counter()
+        func(database)
+        latencies.append(time.perf_counter() - op_start)
+    elapsed = time.perf_counter() - start
+    elapsed_cpu = time.process_time() - start_cpu
+
+    # Allocations are measured separately, as tracing them slows down every
+    # operation considerably.
+    peak_allocations = []
+    tracemalloc.start()
+    try:
+        for _ in range(options.allocation_iterations):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func(database)
+            peak_allocations.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return _summarize(name, "sync", latencies, elapsed, elapsed_cpu, peak_allocations)
+
+
+async def run_async(name, func, database, options):
+    for _ in range(options.warmup):
+        await func(database)
+
+    latencies = []
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    for _ in range(options.iterations):
+        op_start = time.perf_counter()
+        await func(database)
+        latencies.append(time.perf_counter() - op_start)
+    elapsed = time.perf_counter() - start
+    elapsed_cpu = time.process_time() - start_cpu
+
+    peak_allocations = []
+    tracemalloc.start()
+    try:
+        for _ in range(options.allocation_iterations):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await func(database)
+            peak_allocations.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return _summarize(name, "async", latencies, elapsed, elapsed_cpu, peak_allocations)
+
+
+async def _run_all_async(port, names, options):
+    database = await _async_database(port)
+    results = []
+    for name in names:
+        func = BENCHMARKS[name][1]
+        if func is not None:
+            results.append(await run_async(name, func, database, options))
+    return results
+
+
+def run(port, options):
+    names = options.benchmarks or list(BENCHMARKS)
+    clients = options.clients or ["sync", "async"]
+    results = []
+    if "sync" in clients:
+        database = _sync_database(port)
+        for name in names:
+            results.append(run_sync(name, BENCHMARKS[name][0], database, options))
+    if "async" in clients:
+        results.extend(asyncio.run(_run_all_async(port, names, options)))
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print the relative change of the results compared to a baseline."""
+    baseline_results = {
+        (result["benchmark"], result["client"]): result
+        for result in baseline["results"]
+    }
+    print(
+        "%-20s %-6s %12s %12s %12s %12s"
+        % ("benchmark", "client", "ops/s", "p50", "p99", "cpu/op")
+    )
+    for result in results:
+        previous = baseline_results.get((result["benchmark"], result["client"]))
+        if previous is None:
+            continue
+        changes = [
+            (result[key] - previous[key]) / previous[key] * 100 if previous[key] else 0
+            for key in (
+                "ops_per_sec",
+                "p50_latency_us",
+                "p99_latency_us",
+                "cpu_us_per_op",
+            )
+        ]
+        print(
+            "%-20s %-6s %+11.1f%% %+11.1f%% %+11.1f%% %+11.1f%%"
+            % ((result["benchmark"], result["client"]) + tuple(changes))
+        )
+
+
+def main():
+    options = parse_options()
+    if options.serve:
+        serve(options.profile)
+        return
+
+    os.environ["SPANNER_DISABLE_BUILTIN_METRICS"] = "true"
+    if options.in_process_server:
+        server, spanner_servicer, _, port = start_mock_server(
+            simulation_profile=_load_profile(options.profile)
+        )
+        register_results(spanner_servicer)
+        stop = lambda: server.stop(grace=None)  # noqa: E731
+    else:
+        process, port = _start_server_process(options.profile)
+
+        def stop():
+            process.stdin.close()
+            process.wait()
+
+    try:
+        results = run(port, options)
+    finally:
+        stop()
+
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "in_process_server": options.in_process_server,
+        "profile": options.profile,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w") as f:
+            f.write(text + "\n")
+    if options.compare:
+        with open(options.compare) as f:
+            compare(results, json.load(f))
+    elif not options.output:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for the client-side overhead of tracing and metrics.
+
+Runs ``Snapshot.read`` point reads against the in-process mock Spanner server,
+once with telemetry disabled (no tracer provider and built-in metrics
+disabled) and once with an OpenTelemetry SDK tracer provider and built-in
+metrics enabled, and reports the average time per read for both.
+
+Usage:
+
+  $ python benchmark/telemetry_overhead.py --iterations 2000
+"""
+
+import argparse
+import json
+import os
+import time
+
+from google.api_core.client_options import ClientOptions
+from google.auth.credentials import AnonymousCredentials
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from google.cloud.spanner_v1 import Client, FixedSizePool, KeySet
+from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+    SpannerMetricsTracerFactory,
+)
+from google.cloud.spanner_v1.testing.mock_spanner import start_mock_server
+
+
+class _DiscardingSpanExporter(SpanExporter):
+    """Span exporter that drops all spans, so that only the cost of creating
+    and ending spans is measured."""
+
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self):
+        pass
+
+
+def parse_options():
+    """Parses options."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1000,
+        help="The number of reads per configuration.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=100,
+        help="The number of reads before measuring.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    return parser.parse_args()
+
+
+def _make_database(port, telemetry_enabled):
+    observability_options = None
+    if telemetry_enabled:
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(
+            SimpleSpanProcessor(_DiscardingSpanExporter())
+        )
+        observability_options = dict(tracer_provider=tracer_provider)
+
+    client = Client(
+        project="p",
+        credentials=AnonymousCredentials(),
+        client_options=ClientOptions(api_endpoint="localhost:" + str(port)),
+        observability_options=observability_options,
+        disable_builtin_metrics=True,
+    )
+    # Built-in metrics are recorded without exporting them, as exporting
+    # requires Cloud Monitoring.
+    SpannerMetricsTracerFactory().enabled = telemetry_enabled
+    instance = client.instance("test-instance")
+    return instance.database("test-database", pool=FixedSizePool(size=1))
+
+
+def _read(database):
+    with database.snapshot() as snapshot:
+        return list(snapshot.read("Singers", ["SingerId"], KeySet(keys=[[1]])))
+
+
+def run(port, telemetry_enabled, iterations, warmup):
+    database = _make_database(port, telemetry_enabled)
+    for _ in range(warmup):
+        _read(database)
+
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _read(database)
+    elapsed = time.perf_counter() - start
+    elapsed_cpu = time.process_time() - start_cpu
+    return {
+        "telemetry_enabled": telemetry_enabled,
+        "iterations": iterations,
+        "ops_per_sec": iterations / elapsed,
+        "avg_latency_us": elapsed / iterations * 1e6,
+        "avg_cpu_us": elapsed_cpu / iterations * 1e6,
+    }
+
+
+def main():
+    options = parse_options()
+    os.environ["SPANNER_DISABLE_BUILTIN_METRICS"] = "true"
+    server, _, _, port = start_mock_server()
+    try:
+        results = [
+            run(port, False, options.iterations, options.warmup),
+            run(port, True, options.iterations, options.warmup),
+        ]
+    finally:
+        server.stop(grace=None)
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        print(
+            "telemetry %-8s %10.1f ops/s %10.1f us/op (wall) %10.1f us/op (cpu)"
+            % (
+                "enabled" if result["telemetry_enabled"] else "disabled",
+                result["ops_per_sec"],
+                result["avg_latency_us"],
+                result["avg_cpu_us"],
+            )
+        )
+    overhead = results[1]["avg_cpu_us"] - results[0]["avg_cpu_us"]
+    print("telemetry overhead: %.1f us/op (cpu)" % overhead)
+
+
+if __name__ == "__main__":
+    main()
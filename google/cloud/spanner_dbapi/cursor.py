@@ -48,12 +48,20 @@ from google.cloud.spanner_dbapi.parsed_statement import (
     StatementType,
 )
 from google.cloud.spanner_dbapi.transaction_helper import CursorStatementType
-from google.cloud.spanner_dbapi.utils import PeekIterator, StreamedManyResultSets
+from google.cloud.spanner_dbapi.utils import (
+    PeekIterator,
+    StreamedManyResultSets,
+    _plain_row,
+)
 from google.cloud.spanner_v1 import RequestOptions
+from google.cloud.spanner_v1 import _arrow
 from google.cloud.spanner_v1.merged_result_set import MergedResultSet
 
 ColumnDetails = namedtuple("column_details", ["null_ok", "spanner_type"])
 
+# The default number of rows per record batch for the Arrow fetch methods.
+DEFAULT_ARROW_BATCH_SIZE = 10000
+
 
 def check_not_closed(function):
     """`Cursor` class methods decorator.
@@ -508,20 +516,16 @@ class Cursor(object):
                 try:
                     if cursor_statement_type == CursorStatementType.FETCH_ALL:
                         is_fetch_all = True
-                        for row in self:
-                            rows.append(row)
+                        itr = iter(self)
+                        if isinstance(itr, PeekIterator):
+                            rows = itr.fetch()
+                        else:
+                            rows = list(itr)
                     elif cursor_statement_type == CursorStatementType.FETCH_MANY:
-                        for _ in range(size):
-                            try:
-                                row = next(self)
-                                rows.append(row)
-                            except StopIteration:
-                                break
+                        rows = self._fetch_rows(size)
                     elif cursor_statement_type == CursorStatementType.FETCH_ONE:
-                        try:
-                            row = next(self)
-                            rows.append(row)
-                        except StopIteration:
+                        rows = self._fetch_rows(1)
+                        if not rows:
                             return
                     break
                 except Aborted:
@@ -540,6 +544,107 @@ class Cursor(object):
                 )
         return rows
 
+    @check_not_closed
+    def fetch_record_batches(self, batch_size=None):
+        """Fetch the (remaining) rows of a query result as Apache Arrow
+        record batches. Requires the ``pyarrow`` package.
+
+        The rows are pulled from the result set in batches of ``batch_size``
+        rows and are converted directly into columns, using the column types
+        from the result set metadata.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of rows per record
+                           batch. Defaults to ``DEFAULT_ARROW_BATCH_SIZE``, or
+                           :attr:`arraysize` if that is larger.
+
+        :rtype: Iterator[:class:`pyarrow.RecordBatch`]
+        :returns: An iterator over the record batches.
+
+        :raises ProgrammingError:
+            if the previous call to .execute*() did not produce any result set
+            or if no call was issued yet.
+        """
+        fields = self._result_fields()
+        schema = _arrow.to_arrow_schema(fields)
+        if batch_size is None:
+            batch_size = max(self.arraysize, DEFAULT_ARROW_BATCH_SIZE)
+        return self._iter_record_batches(fields, schema, batch_size)
+
+    @check_not_closed
+    def fetch_arrow_table(self, batch_size=None):
+        """Fetch all (remaining) rows of a query result as an Apache Arrow
+        table. Requires the ``pyarrow`` package.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of rows that are
+                           converted at a time.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: A table with one column per result set column.
+        """
+        fields = self._result_fields()
+        schema = _arrow.to_arrow_schema(fields)
+        if batch_size is None:
+            batch_size = max(self.arraysize, DEFAULT_ARROW_BATCH_SIZE)
+        batches = self._iter_record_batches(fields, schema, batch_size)
+        return _arrow.pyarrow.Table.from_batches(batches, schema=schema)
+
+    @check_not_closed
+    def fetch_df(self, batch_size=None, **to_pandas_kwargs):
+        """Fetch all (remaining) rows of a query result as a pandas
+        DataFrame. Requires the ``pyarrow`` and ``pandas`` packages.
+
+        :type batch_size: int
+        :param batch_size: (Optional) The maximum number of rows that are
+                           converted at a time.
+
+        :type to_pandas_kwargs: dict
+        :param to_pandas_kwargs: (Optional) Keyword arguments that are passed
+                                 to :meth:`pyarrow.Table.to_pandas`.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: A DataFrame with one column per result set column.
+        """
+        return self.fetch_arrow_table(batch_size).to_pandas(**to_pandas_kwargs)
+
+    def _iter_record_batches(self, fields, schema, batch_size):
+        while True:
+            rows = self._fetch(CursorStatementType.FETCH_MANY, batch_size)
+            if not rows:
+                return
+            # Converting the rows in bulk does not count as an access of
+            # their columns.
+            rows = [_plain_row(row) for row in rows]
+            yield _arrow.rows_to_record_batch(rows, fields, schema)
+
+    def _result_fields(self):
+        if self._itr is None:
+            raise ProgrammingError("no results to return")
+        metadata = getattr(self._result_set, "metadata", None)
+        if metadata is None or metadata.row_type is None:
+            raise ProgrammingError("no result set metadata available")
+        return list(metadata.row_type.fields)
+
+    def _fetch_rows(self, size):
+        """Fetch up to ``size`` rows from the current result set.
+
+        Rows are pulled from the underlying result set in batches of at
+        least :attr:`arraysize` rows, so that consecutive calls to
+        :meth:`fetchone` and :meth:`fetchmany` don't have to go through the
+        iterator protocol for every row.
+        """
+        if isinstance(self._itr, PeekIterator):
+            return self._itr.fetch(size, prefetch=self.arraysize)
+
+        rows = []
+        for _ in range(size):
+            try:
+                rows.append(next(self))
+            except StopIteration:
+                break
+        return rows
+
     def _handle_DQL_with_snapshot(self, snapshot, sql, params):
         self._result_set = snapshot.execute_sql(
             sql,
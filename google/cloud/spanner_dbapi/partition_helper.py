@@ -14,24 +14,24 @@
 
 import base64
 from dataclasses import dataclass
-import gzip
-import pickle
 from typing import Any
 
 from google.cloud.spanner_v1 import BatchTransactionId
+from google.cloud.spanner_v1.partition_codec import decode_partition, encode_partition
 
 
 def decode_from_string(encoded_partition_id):
-    gzip_bytes = base64.b64decode(bytes(encoded_partition_id, "utf-8"))
-    partition_id_bytes = gzip.decompress(gzip_bytes)
-    return pickle.loads(partition_id_bytes)
+    partition_result, batch_transaction_id, _ = decode_partition(
+        base64.b64decode(encoded_partition_id)
+    )
+    if partition_result is None or batch_transaction_id is None:
+        raise ValueError("Invalid partition id")
+    return PartitionId(batch_transaction_id, partition_result)
 
 
 def encode_to_string(batch_transaction_id, partition_result):
-    partition_id = PartitionId(batch_transaction_id, partition_result)
-    partition_id_bytes = pickle.dumps(partition_id)
-    gzip_bytes = gzip.compress(partition_id_bytes)
-    return str(base64.b64encode(gzip_bytes), "utf-8")
+    partition_id_bytes = encode_partition(partition_result, batch_transaction_id)
+    return str(base64.b64encode(partition_id_bytes), "utf-8")
 
 
 @dataclass
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+import itertools
 import re
 
+from google.cloud.spanner_v1.row import Row
+
 re_UNICODE_POINTS = re.compile(r"([^\s]*[\u0080-\uFFFF]+[^\s]*)")
 
 
@@ -21,43 +25,126 @@ class PeekIterator:
     """
     Peek at the first element out of an iterator for the sake of operations
     like auto-population of fields on reading the first element.
-    If next's result is an instance of list, it'll be converted into a tuple to
-    conform with DBAPI v2's sequence expectations.
+    If next's result is an instance of list or a
+    :class:`~google.cloud.spanner_v1.row.Row`, it'll be converted into a tuple
+    to conform with DBAPI v2's sequence expectations.
+
+    Rows can also be pulled in batches with :meth:`fetch`, which reads
+    directly from the underlying source and converts the rows in bulk.
 
     :type source: list
     :param source: A list of source for the Iterator.
     """
 
     def __init__(self, source):
-        itr_src = iter(source)
-
-        self.__iters = []
-        self.__index = 0
+        self._source = iter(source)
+        self._buffer = deque()
+        self._exhausted = False
 
         try:
-            head = next(itr_src)
-            # Restitch and prepare to read from multiple iterators.
-            self.__iters = [iter(itr) for itr in [[head], itr_src]]
+            self._buffer.append(_as_row(next(self._source)))
         except StopIteration:
-            pass
+            self._exhausted = True
 
     def __next__(self):
-        if self.__index >= len(self.__iters):
+        if self._buffer:
+            return self._buffer.popleft()
+        if self._exhausted:
             raise StopIteration
 
-        iterator = self.__iters[self.__index]
         try:
-            head = next(iterator)
+            head = next(self._source)
         except StopIteration:
-            # That iterator has been exhausted, try with the next one.
-            self.__index += 1
-            return self.__next__()
-        else:
-            return tuple(head) if isinstance(head, list) else head
+            self._exhausted = True
+            raise
+        return _as_row(head)
 
     def __iter__(self):
         return self
 
+    def fetch(self, size=None, prefetch=0):
+        """Fetch the next batch of rows.
+
+        :type size: int
+        :param size: (Optional) The maximum number of rows to return. All the
+                     remaining rows are returned if not set.
+
+        :type prefetch: int
+        :param prefetch: (Optional) The minimum number of rows to read from
+                         the source in one go when the internal buffer is
+                         empty. Rows that are read but not returned are kept
+                         for the next call.
+
+        :rtype: list
+        :returns: The fetched rows.
+        """
+        buffer = self._buffer
+        if size is None:
+            rows = list(buffer)
+            buffer.clear()
+        else:
+            rows = [buffer.popleft() for _ in range(min(size, len(buffer)))]
+        if self._exhausted or (size is not None and len(rows) >= size):
+            return rows
+
+        wanted = None if size is None else size - len(rows)
+        to_read = None if wanted is None else max(wanted, prefetch)
+        batch = list(itertools.islice(self._source, to_read))
+        if to_read is None or len(batch) < to_read:
+            self._exhausted = True
+
+        batch = [_as_row(row) for row in batch]
+        if wanted is not None and len(batch) > wanted:
+            buffer.extend(batch[wanted:])
+            del batch[wanted:]
+        rows.extend(batch)
+        return rows
+
+
+def _as_row(value):
+    if isinstance(value, Row):
+        if value._schema.usage is None:
+            return tuple(value._decoded_values())
+        return _ProfiledRow(value)
+    return tuple(value) if isinstance(value, list) else value
+
+
+class _ProfiledRow(tuple):
+    """A row of a profiled result set, which records the columns that are
+    read by the caller of the cursor."""
+
+    def __new__(cls, row):
+        self = super(_ProfiledRow, cls).__new__(cls, row._decoded_values())
+        self._usage = row._schema.usage
+        return self
+
+    def __getitem__(self, key):
+        value = super(_ProfiledRow, self).__getitem__(key)
+        if isinstance(key, slice):
+            for index in range(*key.indices(len(self))):
+                self._usage.accessed |= 1 << index
+        else:
+            self._usage.accessed |= 1 << (key + len(self) if key < 0 else key)
+        return value
+
+    def __iter__(self):
+        usage = self._usage
+        for index, value in enumerate(super(_ProfiledRow, self).__iter__()):
+            usage.accessed |= 1 << index
+            yield value
+
+    def __reduce__(self):
+        # Checksums of the rows of a transaction pickle the row as a plain
+        # tuple, which does not count as an access of the columns.
+        return tuple, (_plain_row(self),)
+
+
+def _plain_row(row):
+    """Return a row as a tuple, without recording its columns as accessed."""
+    if isinstance(row, _ProfiledRow):
+        return tuple(tuple.__iter__(row))
+    return row
+
 
 class StreamedManyResultSets:
     """Iterator to walk through several `StreamedResultsSet` iterators.
@@ -32,7 +32,7 @@ from google.cloud.spanner_v1._async.pool import (
     TransactionPingingPool as AsyncTransactionPingingPool,
 )
 from google.cloud.spanner_v1.client import Client
-from google.cloud.spanner_v1.keyset import KeyRange, KeySet
+from google.cloud.spanner_v1.keyset import EncodedKeySet, KeyRange, KeySet
 from google.cloud.spanner_v1.pool import (
     AbstractSessionPool,
     BurstyPool,
@@ -41,10 +41,25 @@ from google.cloud.spanner_v1.pool import (
     TransactionPingingPool,
 )
 
-from .data_types import Interval, JsonObject
+from .admin_index import AdminIndex, AdminLister
+from .column_profiler import ColumnAccessProfiler, ColumnUsage
+from .data_types import Interval, JsonObject, LazyJsonObject
+from .ddl_executor import DdlBatch, DdlExecutor, DdlStatementProgress
 from .exceptions import wrap_with_request_id
+from .partition_queue import (
+    PartitionCoordinator,
+    PartitionJobProgress,
+    PartitionLease,
+    PartitionQueue,
+    PartitionWorker,
+    SQLitePartitionQueue,
+)
+from .read_cache import ReadCache
+from .retry_policy import RetryBudget, RetryPolicy
+from .row import Row
 from .services.spanner import SpannerAsyncClient, SpannerClient
 from .transaction import BatchTransactionId, DefaultTransactionOptions
+from .transaction_scheduler import TransactionScheduler
 from .types import RequestOptions
 from .types.commit_response import CommitResponse
 from .types.keys import KeyRange as KeyRangePB
@@ -102,9 +117,27 @@ __all__ = (
     # google.cloud.spanner_v1.client
     "Client",
     "AsyncClient",
+    # google.cloud.spanner_v1.admin_index
+    "AdminIndex",
+    "AdminLister",
+    # google.cloud.spanner_v1.column_profiler
+    "ColumnAccessProfiler",
+    "ColumnUsage",
+    # google.cloud.spanner_v1.ddl_executor
+    "DdlBatch",
+    "DdlExecutor",
+    "DdlStatementProgress",
     # google.cloud.spanner_v1.keyset
+    "EncodedKeySet",
     "KeyRange",
     "KeySet",
+    # google.cloud.spanner_v1.partition_queue
+    "PartitionCoordinator",
+    "PartitionJobProgress",
+    "PartitionLease",
+    "PartitionQueue",
+    "PartitionWorker",
+    "SQLitePartitionQueue",
     # google.cloud.spanner_v1.pool
     "AbstractSessionPool",
     "BurstyPool",
@@ -116,6 +149,15 @@ __all__ = (
     "AsyncFixedSizePool",
     "AsyncPingingPool",
     "AsyncTransactionPingingPool",
+    # google.cloud.spanner_v1.read_cache
+    "ReadCache",
+    # google.cloud.spanner_v1.retry_policy
+    "RetryBudget",
+    "RetryPolicy",
+    # google.cloud.spanner_v1.row
+    "Row",
+    # google.cloud.spanner_v1.transaction_scheduler
+    "TransactionScheduler",
     # local
     "COMMIT_TIMESTAMP",
     # google.cloud.spanner_v1.types
@@ -163,6 +205,7 @@ __all__ = (
     "TypeCode",
     # Custom spanner related data types
     "JsonObject",
+    "LazyJsonObject",
     "Interval",
     # google.cloud.spanner_v1.services
     "SpannerClient",
@@ -0,0 +1,200 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for converting Cloud Spanner results into Apache Arrow data."""
+
+import datetime
+
+from google.cloud.spanner_v1.types import TypeCode
+
+try:
+    import pyarrow
+
+    HAS_PYARROW_INSTALLED = True
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+    HAS_PYARROW_INSTALLED = False
+
+# Precision and scale of the Cloud Spanner NUMERIC type.
+NUMERIC_PRECISION = 38
+NUMERIC_SCALE = 9
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW_INSTALLED:
+        raise ImportError(
+            "pyarrow is required for this operation. "
+            "Install it with `pip install google-cloud-spanner[arrow]`."
+        )
+    return pyarrow
+
+
+def to_arrow_type(field_type):
+    """Return the Arrow data type that is used for a Cloud Spanner type.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.types.Type`
+    :param field_type: the Cloud Spanner type of a column
+
+    :rtype: :class:`pyarrow.DataType`
+    :returns: the corresponding Arrow data type
+    :raises ValueError: if unknown type is passed
+    """
+    pa = _require_pyarrow()
+    type_code = field_type.code
+    if type_code == TypeCode.STRING:
+        return pa.string()
+    elif type_code == TypeCode.BYTES:
+        return pa.binary()
+    elif type_code == TypeCode.BOOL:
+        return pa.bool_()
+    elif type_code == TypeCode.INT64:
+        return pa.int64()
+    elif type_code == TypeCode.FLOAT64:
+        return pa.float64()
+    elif type_code == TypeCode.FLOAT32:
+        return pa.float32()
+    elif type_code == TypeCode.DATE:
+        return pa.date32()
+    elif type_code == TypeCode.TIMESTAMP:
+        return pa.timestamp("ns", tz="UTC")
+    elif type_code == TypeCode.NUMERIC:
+        return pa.decimal128(NUMERIC_PRECISION, NUMERIC_SCALE)
+    elif type_code in (TypeCode.JSON, TypeCode.UUID, TypeCode.INTERVAL):
+        return pa.string()
+    elif type_code == TypeCode.PROTO:
+        return pa.binary()
+    elif type_code == TypeCode.ENUM:
+        return pa.int64()
+    elif type_code == TypeCode.ARRAY:
+        return pa.list_(to_arrow_type(field_type.array_element_type))
+    elif type_code == TypeCode.STRUCT:
+        return pa.struct(
+            [
+                pa.field(
+                    _struct_field_name(item_field, index),
+                    to_arrow_type(item_field.type_),
+                )
+                for index, item_field in enumerate(field_type.struct_type.fields)
+            ]
+        )
+    else:
+        raise ValueError("Unknown type: %s" % (field_type,))
+
+
+def to_arrow_schema(fields):
+    """Return the Arrow schema for the columns of a result set.
+
+    :type fields: list of :class:`~google.cloud.spanner_v1.types.StructType.Field`
+    :param fields: the columns of the result set, as returned by
+                   ``metadata.row_type.fields``
+
+    :rtype: :class:`pyarrow.Schema`
+    :returns: the Arrow schema of the result set
+    """
+    pa = _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field(_struct_field_name(field, index), to_arrow_type(field.type_))
+            for index, field in enumerate(fields)
+        ]
+    )
+
+
+def rows_to_record_batch(rows, fields, schema=None):
+    """Convert a list of decoded rows into an Arrow record batch.
+
+    :type rows: list
+    :param rows: decoded rows, as returned by a result set iterator
+
+    :type fields: list of :class:`~google.cloud.spanner_v1.types.StructType.Field`
+    :param fields: the columns of the result set
+
+    :type schema: :class:`pyarrow.Schema`
+    :param schema: (Optional) the Arrow schema of the result set, as returned
+                   by :func:`to_arrow_schema`
+
+    :rtype: :class:`pyarrow.RecordBatch`
+    :returns: the rows in columnar form
+    """
+    pa = _require_pyarrow()
+    if schema is None:
+        schema = to_arrow_schema(fields)
+    if rows:
+        columns = list(zip(*rows))
+    else:
+        columns = [()] * len(fields)
+
+    arrays = []
+    for column, field, arrow_field in zip(columns, fields, schema):
+        converter = _get_value_converter(field.type_)
+        if converter is not None:
+            column = [None if value is None else converter(value) for value in column]
+        arrays.append(pa.array(column, type=arrow_field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _struct_field_name(field, index):
+    return field.name or "_%d" % index
+
+
+def _get_value_converter(field_type):
+    """Return a function that converts a decoded value into a value that
+    Arrow accepts for the type returned by :func:`to_arrow_type`, or None if
+    the decoded value can be used as is.
+    """
+    type_code = field_type.code
+    if type_code == TypeCode.TIMESTAMP:
+        return _timestamp_to_nanos
+    elif type_code == TypeCode.JSON:
+        return _json_to_str
+    elif type_code in (TypeCode.UUID, TypeCode.INTERVAL):
+        return str
+    elif type_code == TypeCode.ARRAY:
+        element_converter = _get_value_converter(field_type.array_element_type)
+        if element_converter is None:
+            return None
+        return lambda values: [
+            None if value is None else element_converter(value) for value in values
+        ]
+    elif type_code == TypeCode.STRUCT:
+        names = [
+            _struct_field_name(item_field, index)
+            for index, item_field in enumerate(field_type.struct_type.fields)
+        ]
+        converters = [
+            _get_value_converter(item_field.type_)
+            for item_field in field_type.struct_type.fields
+        ]
+        return lambda values: {
+            name: value if value is None or converter is None else converter(value)
+            for name, converter, value in zip(names, converters, values)
+        }
+    return None
+
+
+def _timestamp_to_nanos(value):
+    if isinstance(value, int):
+        # Decoded with the COMPACT_TEMPORAL column hint.
+        return value
+    nanos = (value - _EPOCH) // _ONE_MICROSECOND * 1000
+    return nanos + getattr(value, "nanosecond", 0) % 1000
+
+
+def _json_to_str(value):
+    if hasattr(value, "serialize"):
+        return value.serialize()
+    return value
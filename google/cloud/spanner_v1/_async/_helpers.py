@@ -4,6 +4,8 @@ import time
 
 from google.api_core.exceptions import Aborted
 
+from google.cloud.spanner_v1.retry_policy import get_default_retry_policy
+
 
 async def _delay_until_retry(exc, deadline, attempts, default_retry_delay=None):
     from google.cloud.spanner_v1._helpers import _get_retry_delay
@@ -20,35 +22,55 @@ async def _delay_until_retry(exc, deadline, attempts, default_retry_delay=None):
     await asyncio.sleep(delay)
 
 
-async def _retry_on_aborted_exception(func, deadline, default_retry_delay=None):
-    attempts = 0
+async def _retry_on_aborted_exception(
+    func, deadline, default_retry_delay=None, retry_policy=None
+):
+    from google.cloud.spanner_v1._helpers import (
+        _get_server_retry_delay,
+        _record_retry,
+    )
+
+    if retry_policy is None:
+        retry_policy = get_default_retry_policy()
+    retry_state = retry_policy.start(deadline=deadline)
     while True:
         try:
-            attempts += 1
-            return await func()
+            result = await func()
         except Aborted as exc:
-            await _delay_until_retry(
-                exc,
-                deadline=deadline,
-                attempts=attempts,
-                default_retry_delay=default_retry_delay,
-            )
+            cause = exc.errors[0] if hasattr(exc, "errors") and exc.errors else exc
+            delay = _get_server_retry_delay(cause)
+            if delay is None:
+                delay = default_retry_delay
+            delay = retry_state.next_delay(exc, delay=delay)
+            if delay is None:
+                raise exc
+            _record_retry()
+            await asyncio.sleep(delay)
             continue
+        retry_state.record_success()
+        return result
 
 
 async def _retry(
     func,
     retry_count=5,
-    delay=2,
+    delay=None,
     allowed_exceptions=None,
     before_next_retry=None,
+    retry_policy=None,
 ):
+    from google.cloud.spanner_v1._helpers import _record_retry
+
+    if retry_policy is None:
+        retry_policy = get_default_retry_policy()
+    retry_state = retry_policy.start(initial_delay=delay)
     retries = 0
     while True:
         try:
             res = func()
             if asyncio.iscoroutine(res) or inspect.isawaitable(res):
-                return await res
+                res = await res
+            retry_state.record_success()
             return res
         except Exception as e:
             if allowed_exceptions is not None:
@@ -59,10 +81,14 @@ async def _retry(
                     raise e
             if retries >= retry_count:
                 raise e
+            delay = retry_state.next_delay(e)
+            if delay is None:
+                raise e
             if before_next_retry:
                 res = before_next_retry(retries, delay)
                 if asyncio.iscoroutine(res) or inspect.isawaitable(res):
                     await res
+            _record_retry()
             await asyncio.sleep(delay)
             retries += 1
 
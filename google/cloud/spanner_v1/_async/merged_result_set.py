@@ -0,0 +1,194 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, List
+
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+
+if TYPE_CHECKING:
+    from google.cloud.spanner_v1._async.database import BatchSnapshot
+
+BATCHES_PER_WORKER = 2
+MAX_PARALLELISM = 16
+
+
+@dataclass
+class PartitionExecutorResult:
+    rows: List[Any] = None
+    exception: Exception = None
+    is_last: bool = False
+
+
+class MergedResultSet:
+    """
+    Executes multiple partitions as tasks on the event loop and then combines
+    the results from multiple queries using an asyncio queue. The order of the
+    records in the MergedResultSet is not guaranteed.
+
+    At most ``max_parallelism`` partitions are executed at the same time. The
+    rows of each partition are put in the queue in batches, and a partition
+    stops reading from its stream while the queue is full. If a partition
+    fails, the other partitions are cancelled and the error is raised by the
+    iterator.
+
+    A consumer that may stop iterating before all rows have been returned
+    should use the result set in an ``async with`` block, or call
+    :meth:`close`, so that the partitions that are still running are
+    cancelled and their streams are closed.
+    """
+
+    def __init__(
+        self, batch_snapshot, partition_ids, max_parallelism, lazy_decode=False
+    ):
+        self._batch_snapshot: BatchSnapshot = batch_snapshot
+        self._partitions = deque(partition_ids)
+        self._lazy_decode = lazy_decode
+        self._result_set = None
+        self._exception = None
+        self._metadata = None
+        self._rows = deque()
+        self._tasks = None
+
+        partition_ids_count = len(partition_ids)
+        parallelism = min(MAX_PARALLELISM, partition_ids_count)
+        if max_parallelism != 0:
+            parallelism = min(partition_ids_count, max_parallelism)
+        self._parallelism = parallelism
+        self._finished_count_down_latch = parallelism
+        self._queue = None
+
+    def _start(self):
+        # The queue and the tasks are created when the iteration starts, as
+        # they must be created on the event loop that consumes the results.
+        self._queue = asyncio.Queue(maxsize=BATCHES_PER_WORKER * self._parallelism)
+        self._tasks = [
+            asyncio.create_task(self._run_partitions())
+            for _ in range(self._parallelism)
+        ]
+
+    async def _run_partitions(self):
+        try:
+            while self._partitions:
+                partition_id = self._partitions.popleft()
+                observability_options = getattr(
+                    self._batch_snapshot, "observability_options", {}
+                )
+                with trace_call(
+                    "CloudSpanner.PartitionExecutor.run",
+                    observability_options=observability_options,
+                ), MetricsCapture():
+                    await self._run_partition(partition_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            await self._queue.put(PartitionExecutorResult(exception=ex))
+        # Emit a special 'is_last' result to ensure that the MergedResultSet
+        # is not blocked on a queue that never receives any more results.
+        await self._queue.put(PartitionExecutorResult(is_last=True))
+
+    async def _run_partition(self, partition_id):
+        results = await self._batch_snapshot.process_query_batch(
+            partition_id, lazy_decode=self._lazy_decode
+        )
+        async for rows in results.batches():
+            self._set_metadata(results)
+            await self._queue.put(PartitionExecutorResult(rows=rows))
+        # Special case: The result set did not return any rows.
+        # Push the metadata to the merged result set.
+        self._set_metadata(results)
+
+    def _set_metadata(self, results):
+        if self._metadata is None:
+            self._metadata = results.metadata
+            self._result_set = results
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._exception is not None:
+            raise self._exception
+        if self._tasks is None:
+            self._start()
+        while not self._rows:
+            if self._finished_count_down_latch == 0:
+                raise StopAsyncIteration
+            partition_result = await self._queue.get()
+            if partition_result.is_last:
+                self._finished_count_down_latch -= 1
+            elif partition_result.exception is not None:
+                self._exception = partition_result.exception
+                await self.close()
+                raise self._exception
+            else:
+                self._rows.extend(partition_result.rows)
+        return self._rows.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Cancels the partitions that are still running and discards the
+        rows that have not been returned yet."""
+        self._finished_count_down_latch = 0
+        self._rows.clear()
+        if self._tasks is None:
+            self._tasks = []
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @property
+    def metadata(self):
+        """The metadata of the result set, or None until the first partition
+        has returned its first rows."""
+        return self._metadata
+
+    @property
+    def stats(self):
+        """The statistics of the result set of the first partition that has
+        returned rows, or None."""
+        if self._result_set is None:
+            return None
+        return self._result_set.stats
+
+    def decode_row(self, row: []) -> []:
+        """Decodes a row from protobuf values to Python objects. This function
+           should only be called for result sets that use ``lazy_decoding=True``.
+           The array that is returned by this function is the same as the array
+           that would have been returned by the rows iterator if ``lazy_decoding=False``.
+
+        :returns: an array containing the decoded values of all the columns in the given row
+        """
+        if self._result_set is None:
+            raise ValueError("iterator not started")
+        return self._result_set.decode_row(row)
+
+    def decode_column(self, row: [], column_index: int):
+        """Decodes a column from a protobuf value to a Python object. This function
+           should only be called for result sets that use ``lazy_decoding=True``.
+           The object that is returned by this function is the same as the object
+           that would have been returned by the rows iterator if ``lazy_decoding=False``.
+
+        :returns: the decoded column value
+        """
+        if self._result_set is None:
+            raise ValueError("iterator not started")
+        return self._result_set.decode_column(row, column_index)
@@ -15,6 +15,7 @@
 """Pools managing shared Session objects."""
 __CROSS_SYNC_OUTPUT__ = "google.cloud.spanner_v1.pool"
 import asyncio
+from collections import deque
 import datetime
 import time
 from warnings import warn
@@ -182,6 +183,55 @@ class AbstractSessionPool(object):
         role = self.database_role or self._database.database_role
         return Session(database=self._database, labels=self.labels, database_role=role)
 
+    @CrossSync.drop
+    async def _batch_create_sessions(self, session_count):
+        """Create sessions with a single ``BatchCreateSessions`` request.
+
+        The response can contain fewer sessions than requested.
+
+        :type session_count: int
+        :param session_count: the number of sessions to create.
+
+        :rtype: list of :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the created sessions.
+        """
+        database = self._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        if database._route_to_leader_enabled:
+            metadata.append(_metadata_with_leader_aware_routing(True))
+        request = BatchCreateSessionsRequest(
+            database=database.name,
+            session_count=session_count,
+            session_template=SessionProto(creator_role=self.database_role),
+        )
+
+        observability_options = getattr(database, "observability_options", None)
+        with trace_call(
+            f"CloudSpanner.{type(self).__name__}.BatchCreateSessions",
+            observability_options=observability_options,
+            metadata=metadata,
+        ) as span, MetricsCapture(self._resource_info):
+            call_metadata, error_augmenter = database.with_error_augmentation(
+                database._next_nth_request,
+                1,
+                metadata,
+                span,
+            )
+            with error_augmenter:
+                resp = await api.batch_create_sessions(
+                    request=request,
+                    metadata=call_metadata,
+                )
+            add_span_event(span, "Created sessions", dict(count=len(resp.session)))
+
+        sessions = []
+        for session_pb in resp.session:
+            session = self._new_session()
+            session._session_id = session_pb.name.split("/")[-1]
+            sessions.append(session)
+        return sessions
+
     def session(self, **kwargs):
         """Check out a session from the pool.
 
@@ -258,6 +308,11 @@ class FixedSizePool(AbstractSessionPool):
         self._sessions = CrossSync.LifoQueue(size)
         self._max_age = datetime.timedelta(minutes=max_age_minutes)
         self._lock = CrossSync.Lock()
+        if CrossSync.is_async:
+            # Futures of the coroutines that are waiting for a session, in
+            # the order in which they started to wait.
+            self._waiters = deque()
+            self._background_tasks = set()
 
     @CrossSync.convert
     async def bind(self, database):
@@ -373,17 +428,24 @@ class FixedSizePool(AbstractSessionPool):
             while not self._sessions.empty():
                 sessions_to_ping.append(await CrossSync.queue_get(self._sessions))
 
-            for session in sessions_to_ping:
-                if (_NOW() - session.last_use_time) > self._max_age:
-                    try:
-                        await session.ping()
-                    except NotFound:
-                        session = self._new_session()
-                        await session.create()
-                    except Exception as e:
-                        warn(f"Failed to ping session {session.session_id}: {e}")
-
-                await CrossSync.queue_put(self._sessions, session)
+            if CrossSync.is_async:
+                # Ping the sessions concurrently. Every session is returned to
+                # the pool as soon as it has been checked.
+                await asyncio.gather(
+                    *[self._ping_session(session) for session in sessions_to_ping]
+                )
+            else:
+                for session in sessions_to_ping:
+                    if (_NOW() - session.last_use_time) > self._max_age:
+                        try:
+                            await session.ping()
+                        except NotFound:
+                            session = self._new_session()
+                            await session.create()
+                        except Exception as e:
+                            warn(f"Failed to ping session {session.session_id}: {e}")
+
+                    await CrossSync.queue_put(self._sessions, session)
 
             add_span_event(
                 current_span,
@@ -391,6 +453,98 @@ class FixedSizePool(AbstractSessionPool):
                 {"count": len(sessions_to_ping)},
             )
 
+    @CrossSync.drop
+    async def _ping_session(self, session):
+        """Ping a session if it has not been used recently, replace it if it
+        no longer exists, and return it to the pool."""
+        if (_NOW() - session.last_use_time) > self._max_age:
+            try:
+                await session.ping()
+            except NotFound:
+                session = self._new_session()
+                await session.create()
+            except Exception as e:
+                warn(f"Failed to ping session {session.session_id}: {e}")
+        await self.put(session)
+
+    @CrossSync.drop
+    async def _wait_for_session(self, timeout):
+        """Take the next entry from the queue, or wait for one to be returned.
+
+        Waiting coroutines are served in FIFO order: an entry that is
+        returned to the pool is handed to the coroutine that has waited the
+        longest, and a coroutine only takes an entry from the queue if no
+        other coroutine is waiting.
+
+        :raises: :exc:`CrossSync.QueueEmpty` if no entry is returned within
+                 ``timeout`` seconds.
+        """
+        if not self._waiters:
+            try:
+                return self._sessions.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The entry was handed over while the wait timed out.
+                return waiter.result()
+            raise CrossSync.QueueEmpty()
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The entry was handed over after this coroutine was
+                # cancelled. Pass it on, so that it does not leak.
+                self._hand_off(waiter.result())
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    @CrossSync.drop
+    def _hand_off(self, entry):
+        """Hand an entry to the longest waiting coroutine, or put it in the
+        queue if no coroutine is waiting.
+
+        :raises: :exc:`CrossSync.QueueFull` if the queue is full.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(entry)
+                return
+        self._sessions.put_nowait(entry)
+
+    @CrossSync.drop
+    def _new_entry(self, session):
+        """Return the queue entry for a session."""
+        return session
+
+    @CrossSync.drop
+    def _replace_in_background(self):
+        """Create a session in a background task and return it to the pool.
+
+        The coroutine that found a defunct session waits for the next session
+        in the pool instead, which is the new session unless another session
+        is returned first. If the coroutine is cancelled, the new session is
+        still returned to the pool.
+        """
+
+        async def replace():
+            session = self._new_session()
+            try:
+                await session.create()
+            except Exception as e:
+                warn(f"Failed to create session: {e}")
+                return
+            self._hand_off(self._new_entry(session))
+
+        task = asyncio.create_task(replace())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     @CrossSync.convert
     async def get(self, timeout=None):
         """Check a session out from the pool.
@@ -419,22 +573,46 @@ class FixedSizePool(AbstractSessionPool):
                 span_event_attributes,
             )
 
-            session = await CrossSync.queue_get(
-                self._sessions, block=True, timeout=timeout
-            )
-            age = _NOW() - session.last_use_time
-
-            if age >= self._max_age and not await session.exists():
-                if not await session.exists():
+            if CrossSync.is_async:
+                deadline = time.monotonic() + timeout
+                while True:
+                    session = await self._wait_for_session(
+                        max(0, deadline - time.monotonic())
+                    )
+                    if _NOW() - session.last_use_time < self._max_age:
+                        break
+                    try:
+                        exists = await session.exists()
+                    except BaseException:
+                        # Do not leak the session if the check fails or
+                        # this coroutine is cancelled.
+                        self._hand_off(session)
+                        raise
+                    if exists:
+                        break
                     add_span_event(
                         current_span,
                         "Session is not valid, recreating it",
                         span_event_attributes,
                     )
-                session = self._new_session()
-                await session.create()
-                # Replacing with the updated session.id.
-                span_event_attributes["session.id"] = session._session_id
+                    self._replace_in_background()
+            else:
+                session = await CrossSync.queue_get(
+                    self._sessions, block=True, timeout=timeout
+                )
+                age = _NOW() - session.last_use_time
+
+                if age >= self._max_age and not await session.exists():
+                    if not await session.exists():
+                        add_span_event(
+                            current_span,
+                            "Session is not valid, recreating it",
+                            span_event_attributes,
+                        )
+                    session = self._new_session()
+                    await session.create()
+                    # Replacing with the updated session.id.
+                    span_event_attributes["session.id"] = session._session_id
 
             span_event_attributes["session.id"] = session._session_id
             span_event_attributes["time.elapsed"] = time.time() - start_time
@@ -459,7 +637,10 @@ class FixedSizePool(AbstractSessionPool):
 
         :raises: :exc:`queue.Full` if the queue is full.
         """
-        await CrossSync.queue_put(self._sessions, session, block=False)
+        if CrossSync.is_async:
+            self._hand_off(session)
+        else:
+            await CrossSync.queue_put(self._sessions, session, block=False)
 
     @CrossSync.convert
     async def clear(self):
@@ -503,6 +684,10 @@ class BurstyPool(AbstractSessionPool):
         self.target_size = target_size
         self._database = None
         self._sessions = CrossSync.LifoQueue(target_size)
+        if CrossSync.is_async:
+            # Futures of the coroutines that are waiting for a new session.
+            self._pending_creates = []
+            self._create_task = None
 
     @CrossSync.convert
     async def bind(self, database):
@@ -540,19 +725,93 @@ class BurstyPool(AbstractSessionPool):
                 "No sessions available in pool. Creating session",
                 span_event_attributes,
             )
-            session = self._new_session()
-            await session.create()
+            if CrossSync.is_async:
+                session = await self._create_session()
+            else:
+                session = self._new_session()
+                await session.create()
         else:
-            if not await session.exists():
+            if CrossSync.is_async:
+                try:
+                    exists = await session.exists()
+                except BaseException:
+                    # Do not leak the session if the check fails or this
+                    # coroutine is cancelled.
+                    await self.put(session)
+                    raise
+            else:
+                exists = await session.exists()
+            if not exists:
                 add_span_event(
                     current_span,
                     "Session is not valid, recreating it",
                     span_event_attributes,
                 )
-                session = self._new_session()
-                await session.create()
+                if CrossSync.is_async:
+                    session = await self._create_session()
+                else:
+                    session = self._new_session()
+                    await session.create()
         return session
 
+    @CrossSync.drop
+    async def _create_session(self):
+        """Wait for a new session.
+
+        The sessions of all coroutines that need a new session at the same
+        time are created by a single background task, with one
+        ``BatchCreateSessions`` request. If the waiting coroutine is
+        cancelled, its session is returned to the pool.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending_creates.append(waiter)
+        if self._create_task is None or self._create_task.done():
+            self._create_task = asyncio.create_task(self._create_pending_sessions())
+        return await waiter
+
+    @CrossSync.drop
+    async def _create_pending_sessions(self):
+        """Create the sessions for the coroutines that wait for a session."""
+        # Let the other coroutines that are about to miss join this batch.
+        await asyncio.sleep(0)
+        try:
+            while self._pending_creates:
+                waiters = [
+                    waiter for waiter in self._pending_creates if not waiter.done()
+                ]
+                self._pending_creates = []
+                if not waiters:
+                    continue
+                try:
+                    if len(waiters) == 1:
+                        session = self._new_session()
+                        await session.create()
+                        sessions = [session]
+                    else:
+                        sessions = await self._batch_create_sessions(len(waiters))
+                        # Fail rather than retry a request that makes no
+                        # progress forever.
+                        if not sessions:
+                            raise RuntimeError(
+                                "BatchCreateSessions did not return any sessions"
+                            )
+                except Exception as exc:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(exc)
+                    continue
+                for waiter, session in zip(waiters, sessions):
+                    if waiter.done():
+                        await self.put(session)
+                    else:
+                        waiter.set_result(session)
+                # BatchCreateSessions can return fewer sessions than requested.
+                self._pending_creates[:0] = waiters[len(sessions) :]
+        finally:
+            for waiter in self._pending_creates:
+                waiter.cancel()
+            self._pending_creates = []
+
     @CrossSync.convert
     async def put(self, session):
         """Return a session to the pool.
@@ -745,9 +1004,12 @@ class PingingPool(FixedSizePool):
         ping_after = None
         session = None
         try:
-            ping_after, session = await CrossSync.queue_get(
-                self._sessions, block=True, timeout=timeout
-            )
+            if CrossSync.is_async:
+                session = await self._get_checked_session(timeout)
+            else:
+                ping_after, session = await CrossSync.queue_get(
+                    self._sessions, block=True, timeout=timeout
+                )
         except CrossSync.QueueEmpty as e:
             add_span_event(
                 current_span,
@@ -757,13 +1019,14 @@ class PingingPool(FixedSizePool):
             # Re-raising CrossSync.QueueEmpty is correct as it's the expected interface
             raise e
 
-        if _NOW() > ping_after:
-            # Using session.exists() guarantees the returned session exists.
-            # session.ping() uses a cached result in the backend which could
-            # result in a recently deleted session being returned.
-            if not await session.exists():
-                session = self._new_session()
-                await session.create()
+        if not CrossSync.is_async:
+            if _NOW() > ping_after:
+                # Using session.exists() guarantees the returned session exists.
+                # session.ping() uses a cached result in the backend which could
+                # result in a recently deleted session being returned.
+                if not await session.exists():
+                    session = self._new_session()
+                    await session.create()
 
         span_event_attributes.update(
             {
@@ -787,9 +1050,12 @@ class PingingPool(FixedSizePool):
         :raises: :exc:`queue.Full` if the queue is full.
         """
         try:
-            await CrossSync.queue_put(
-                self._sessions, (_NOW() + self._delta, session), block=False
-            )
+            if CrossSync.is_async:
+                self._hand_off(self._new_entry(session))
+            else:
+                await CrossSync.queue_put(
+                    self._sessions, (_NOW() + self._delta, session), block=False
+                )
         except CrossSync.QueueFull:
             # PingingPool.put doesn't catch queue.Full in sync version either,
             # but it's better to be safe or follow sync version exactly.
@@ -814,6 +1080,8 @@ class PingingPool(FixedSizePool):
         This method is designed to be called from a background thread,
         or during the "idle" phase of an event loop.
         """
+        if CrossSync.is_async:
+            expired_sessions = []
         while True:
             try:
                 ping_after, session = await CrossSync.queue_get(
@@ -825,6 +1093,10 @@ class PingingPool(FixedSizePool):
                 # Re-add to queue with existing expiration
                 await CrossSync.queue_put(self._sessions, (ping_after, session))
                 break
+            if CrossSync.is_async:
+                # The expired sessions are pinged concurrently below.
+                expired_sessions.append(session)
+                continue
             try:
                 await session.ping()
             except NotFound:
@@ -832,6 +1104,59 @@ class PingingPool(FixedSizePool):
                 await session.create()
             # Re-add to queue with new expiration
             await self.put(session)
+        if CrossSync.is_async:
+            await asyncio.gather(
+                *[self._refresh_session(session) for session in expired_sessions]
+            )
+
+    @CrossSync.drop
+    def _new_entry(self, session):
+        """Return the queue entry for a session."""
+        return (_NOW() + self._delta, session)
+
+    @CrossSync.drop
+    async def _get_checked_session(self, timeout):
+        """Take a session from the pool, checking that it still exists if it
+        has not been used recently.
+
+        A session that no longer exists is replaced by a background task,
+        and the next session is taken instead.
+
+        :raises: :exc:`CrossSync.QueueEmpty` if no session is returned
+                 within ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            ping_after, session = await self._wait_for_session(
+                max(0, deadline - time.monotonic())
+            )
+            if _NOW() <= ping_after:
+                return session
+            # Using session.exists() guarantees the returned session exists.
+            # session.ping() uses a cached result in the backend which could
+            # result in a recently deleted session being returned.
+            try:
+                exists = await session.exists()
+            except BaseException:
+                # Do not leak the session if the check fails or this
+                # coroutine is cancelled.
+                self._hand_off((ping_after, session))
+                raise
+            if exists:
+                return session
+            self._replace_in_background()
+
+    @CrossSync.drop
+    async def _refresh_session(self, session):
+        """Ping a session, replace it if it no longer exists, and return it
+        to the pool."""
+        try:
+            await session.ping()
+        except NotFound:
+            session = self._new_session()
+            await session.create()
+        # Re-add to queue with new expiration
+        await self.put(session)
 
 
 @CrossSync.convert_class
@@ -15,6 +15,7 @@
 """Model a set of read-only queries to a database as a snapshot."""
 __CROSS_SYNC_OUTPUT__ = "google.cloud.spanner_v1.snapshot"
 import functools
+import threading
 from typing import List, Optional, Union
 
 from google.api_core import gapic_v1
@@ -41,9 +42,16 @@ from google.cloud.spanner_v1._helpers import (
     _validate_client_context,
     _merge_client_context,
     _merge_request_options,
+    _record_retry,
 )
 from google.cloud.spanner_v1._opentelemetry_tracing import add_span_event, trace_call
+from google.cloud.spanner_v1.column_profiler import (
+    _column_profile_tag,
+    get_column_profiler,
+)
 from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.read_cache import _make_read_cache_key
+from google.cloud.spanner_v1.retry_policy import get_stream_resumption_retry_policy
 from google.cloud.spanner_v1.types import MultiplexedSessionPrecommitToken
 from google.cloud.spanner_v1.types.mutation import Mutation
 from google.cloud.spanner_v1.types.result_set import PartialResultSet, ResultSet
@@ -101,7 +109,12 @@ async def _restart_on_unavailable(
     resume_token: bytes = b""
     item_buffer: List[PartialResultSet] = []
 
+    # If this request begins the transaction, the transaction is locked until
+    # the first response has returned the transaction ID, so that concurrent
+    # statements do not begin the transaction again.
+    is_inline_begin = False
     if transaction is not None:
+        is_inline_begin = await transaction._wait_for_inline_begin()
         transaction_selector = transaction._build_transaction_selector_pb()
     elif transaction_selector is None:
         raise InvalidArgument(
@@ -113,91 +126,130 @@ async def _restart_on_unavailable(
     attempt = 1
     nth_request = getattr(request_id_manager, "_next_nth_request", 0)
     current_request_id = None
-
-    while True:
-        try:
-            # Get results iterator.
-            if iterator is None:
-                with trace_call(
-                    trace_name,
-                    session,
-                    attributes,
-                    observability_options=observability_options,
-                    metadata=metadata,
-                ) as span, MetricsCapture(resource_info):
-                    (
-                        call_metadata,
-                        current_request_id,
-                    ) = request_id_manager.metadata_and_request_id(
-                        nth_request,
-                        attempt,
-                        metadata,
-                        span,
-                    )
-                    iterator = await CrossSync.run_if_async(
-                        method,
-                        request=request,
-                        metadata=call_metadata,
-                    )
-
-            # Add items from iterator to buffer.
-            item: PartialResultSet
-            async for item in iterator:
-                item_buffer.append(item)
-
-                # Update the transaction from the response.
+    retry_state = get_stream_resumption_retry_policy().start()
+
+    try:
+        while True:
+            try:
+                # Get results iterator.
+                if iterator is None:
+                    with trace_call(
+                        trace_name,
+                        session,
+                        attributes,
+                        observability_options=observability_options,
+                        metadata=metadata,
+                    ) as span, MetricsCapture(resource_info):
+                        if attempt > 1:
+                            _record_retry()
+                        (
+                            call_metadata,
+                            current_request_id,
+                        ) = request_id_manager.metadata_and_request_id(
+                            nth_request,
+                            attempt,
+                            metadata,
+                            span,
+                        )
+                        if transaction is not None:
+                            transaction._rpc_count.increment()
+                        iterator = await CrossSync.run_if_async(
+                            method,
+                            request=request,
+                            metadata=call_metadata,
+                        )
+
+                # Add items from iterator to buffer.
+                item: PartialResultSet
+                async for item in iterator:
+                    item_buffer.append(item)
+
+                    # Update the transaction from the response.
+                    if transaction is not None:
+                        transaction._update_for_result_set_pb(item)
+                        if is_inline_begin:
+                            is_inline_begin = False
+                            transaction._lock.release()
+                    if (
+                        item._pb is not None
+                        and item._pb.HasField("precommit_token")
+                        and transaction is not None
+                    ):
+                        await transaction._update_for_precommit_token_pb(
+                            item.precommit_token
+                        )
+
+                    if item.resume_token:
+                        resume_token = item.resume_token
+                        break
+
+            except ServiceUnavailable as exc:
+                delay = retry_state.next_delay(exc)
+                if delay is None:
+                    raise _augment_error_with_request_id(exc, current_request_id)
+                await CrossSync.sleep(delay)
+                del item_buffer[:]
+                request.resume_token = resume_token
                 if transaction is not None:
-                    transaction._update_for_result_set_pb(item)
-                if (
-                    item._pb is not None
-                    and item._pb.HasField("precommit_token")
-                    and transaction is not None
-                ):
-                    await transaction._update_for_precommit_token_pb(
-                        item.precommit_token
-                    )
-
-                if item.resume_token:
-                    resume_token = item.resume_token
-                    break
-
-        except ServiceUnavailable:
-            del item_buffer[:]
-            request.resume_token = resume_token
-            if transaction is not None:
-                transaction_selector = transaction._build_transaction_selector_pb()
-            request.transaction = transaction_selector
-            attempt += 1
-            iterator = None
-            continue
-
-        except InternalServerError as exc:
-            resumable_error = any(
-                resumable_message in exc.message
-                for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
-            )
-            if not resumable_error:
+                    transaction_selector = transaction._build_transaction_selector_pb()
+                request.transaction = transaction_selector
+                attempt += 1
+                iterator = None
+                continue
+
+            except InternalServerError as exc:
+                resumable_error = any(
+                    resumable_message in exc.message
+                    for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
+                )
+                if not resumable_error:
+                    raise _augment_error_with_request_id(exc, current_request_id)
+                delay = retry_state.next_delay(exc)
+                if delay is None:
+                    raise _augment_error_with_request_id(exc, current_request_id)
+                await CrossSync.sleep(delay)
+                del item_buffer[:]
+                request.resume_token = resume_token
+                if transaction is not None:
+                    transaction_selector = transaction._build_transaction_selector_pb()
+                attempt += 1
+                request.transaction = transaction_selector
+                iterator = None
+                continue
+
+            except Exception as exc:
+                # Augment any other exception with the request ID
                 raise _augment_error_with_request_id(exc, current_request_id)
+
+            if len(item_buffer) == 0:
+                retry_state.record_success()
+                break
+
+            for item in item_buffer:
+                yield item
+
             del item_buffer[:]
-            request.resume_token = resume_token
-            if transaction is not None:
-                transaction_selector = transaction._build_transaction_selector_pb()
-            attempt += 1
-            request.transaction = transaction_selector
-            iterator = None
-            continue
+    finally:
+        if is_inline_begin:
+            transaction._lock.release()
 
-        except Exception as exc:
-            # Augment any other exception with the request ID
-            raise _augment_error_with_request_id(exc, current_request_id)
 
-        if len(item_buffer) == 0:
-            break
+@CrossSync.convert
+async def _replay_result_sets(result_sets):
+    """Yield partial result sets that were read from a read cache."""
+    for result_set in result_sets:
+        yield result_set
 
-        for item in item_buffer:
-            yield item
 
-        del item_buffer[:]
+@CrossSync.convert
+async def _populate_read_cache(iterator, read_cache, key):
+    """Yield the partial result sets of a read, and cache them once the read
+    has returned all of them."""
+    result_sets = []
+    async for result_set in iterator:
+        result_sets.append(result_set)
+        yield result_set
+    read_cache.put(key, result_sets)
 
 
 class _SnapshotBase(_SessionWrapper):
@@ -219,7 +271,15 @@ class _SnapshotBase(_SessionWrapper):
         self._read_request_count: int = 0
         self._transaction_id: Optional[bytes] = None
         self._precommit_token: Optional[MultiplexedSessionPrecommitToken] = None
+        # Held by the statement that begins the transaction inline, until the
+        # transaction ID has been returned.
         self._lock: CrossSync.Lock = CrossSync.Lock()
+        # Guards the sequence number and the precommit token, which are
+        # updated by statements that run concurrently.
+        self._state_lock = threading.Lock()
+        # The number of RPCs that were sent for this transaction, including
+        # the RPCs of retries.
+        self._rpc_count = AtomicCounter()
 
     @property
     def _resource_info(self):
@@ -260,18 +320,38 @@ class _SnapshotBase(_SessionWrapper):
         timeout=gapic_v1.method.DEFAULT,
         column_info=None,
         lazy_decode=False,
+        decode_offload_bytes=None,
+        lazy_rows=False,
     ):
         """Perform a ``StreamingRead`` API request for rows in a table."""
         if self._read_request_count > 0:
             if not self._multi_use:
                 raise ValueError("Cannot re-use single-use snapshot.")
-            if self._transaction_id is None:
+            # Statements of a read/write transaction may be executed
+            # concurrently, and wait until the transaction has begun.
+            if self._transaction_id is None and self._read_only:
                 raise ValueError("Transaction has not begun.")
 
         session = self._session
         database = session._database
         api = database.spanner_api
 
+        read_cache_key = self._get_read_cache_key(
+            table, columns, keyset, index, limit, partition
+        )
+        if read_cache_key is not None:
+            cached = self._read_cache.get(read_cache_key, self._max_staleness)
+            if cached is not None:
+                result_sets, self._transaction_read_timestamp = cached
+                self._read_request_count += 1
+                return StreamedResultSet(
+                    response_iterator=_replay_result_sets(result_sets),
+                    column_info=column_info,
+                    lazy_decode=lazy_decode,
+                    decode_offload_bytes=decode_offload_bytes,
+                    lazy_rows=lazy_rows,
+                )
+
         metadata = _metadata_with_prefix(database.name)
         if not self._read_only and database._route_to_leader_enabled:
             metadata.append(
@@ -330,8 +410,16 @@ class _SnapshotBase(_SessionWrapper):
             },
             column_info=column_info,
             lazy_decode=lazy_decode,
+            decode_offload_bytes=decode_offload_bytes,
+            lazy_rows=lazy_rows,
+            read_cache_key=read_cache_key,
         )
 
+    def _get_read_cache_key(self, table, columns, keyset, index, limit, partition):
+        """Return the key of a read in the read cache of the snapshot, or None
+        if the read cannot be served from the cache."""
+        return None
+
     @CrossSync.convert
     @CrossSync.convert
     async def execute_sql(
@@ -350,12 +438,16 @@ class _SnapshotBase(_SessionWrapper):
         directed_read_options=None,
         column_info=None,
         lazy_decode=False,
+        decode_offload_bytes=None,
+        lazy_rows=False,
     ):
         """Perform an ``ExecuteStreamingSql`` API request."""
         if self._read_request_count > 0:
             if not self._multi_use:
                 raise ValueError("Cannot re-use single-use snapshot.")
-            if self._transaction_id is None:
+            # Statements of a read/write transaction may be executed
+            # concurrently, and wait until the transaction has begun.
+            if self._transaction_id is None and self._read_only:
                 raise ValueError("Transaction has not begun.")
 
         if params is not None:
@@ -405,7 +497,7 @@ class _SnapshotBase(_SessionWrapper):
             param_types=param_types,
             query_mode=query_mode,
             partition_token=partition,
-            seqno=self._execute_sql_request_count,
+            seqno=self._next_execute_sql_seqno(),
             query_options=query_options,
             request_options=request_options,
             last_statement=last_statement,
@@ -428,11 +520,22 @@ class _SnapshotBase(_SessionWrapper):
             trace_attributes={"db.statement": sql, "request_options": request_options},
             column_info=column_info,
             lazy_decode=lazy_decode,
+            decode_offload_bytes=decode_offload_bytes,
+            lazy_rows=lazy_rows,
         )
 
     @CrossSync.convert
     async def _get_streamed_result_set(
-        self, method, request, metadata, trace_attributes, column_info, lazy_decode
+        self,
+        method,
+        request,
+        metadata,
+        trace_attributes,
+        column_info,
+        lazy_decode,
+        decode_offload_bytes=None,
+        lazy_rows=False,
+        read_cache_key=None,
     ):
         """Returns the streamed result set for a read or execute SQL request."""
         session = self._session
@@ -442,43 +545,42 @@ class _SnapshotBase(_SessionWrapper):
         trace_method_name = "execute_sql" if is_execute_sql_request else "read"
         trace_name = f"CloudSpanner.{type(self).__name__}.{trace_method_name}"
 
-        is_inline_begin = False
-        if self._transaction_id is None:
-            is_inline_begin = True
-            await self._lock.acquire()
-
-        try:
-            iterator = _restart_on_unavailable(
-                method=method,
-                request=request,
-                session=session,
-                metadata=metadata,
-                trace_name=trace_name,
-                attributes=trace_attributes,
-                transaction=self,
-                observability_options=getattr(database, "observability_options", None),
-                request_id_manager=database,
-                resource_info=self._resource_info,
-            )
+        iterator = _restart_on_unavailable(
+            method=method,
+            request=request,
+            session=session,
+            metadata=metadata,
+            trace_name=trace_name,
+            attributes=trace_attributes,
+            transaction=self,
+            observability_options=getattr(database, "observability_options", None),
+            request_id_manager=database,
+            resource_info=self._resource_info,
+        )
+        if read_cache_key is not None:
+            iterator = _populate_read_cache(iterator, self._read_cache, read_cache_key)
 
-            if is_execute_sql_request:
-                self._execute_sql_request_count += 1
+        self._read_request_count += 1
 
-            self._read_request_count += 1
+        streamed_result_set_args = {
+            "response_iterator": iterator,
+            "column_info": column_info,
+            "lazy_decode": lazy_decode,
+            "decode_offload_bytes": decode_offload_bytes,
+            "lazy_rows": lazy_rows,
+        }
 
-            streamed_result_set_args = {
-                "response_iterator": iterator,
-                "column_info": column_info,
-                "lazy_decode": lazy_decode,
-            }
+        column_profiler = get_column_profiler()
+        if column_profiler is not None:
+            streamed_result_set_args["column_profiler"] = column_profiler
+            streamed_result_set_args["column_profile_tag"] = _column_profile_tag(
+                request
+            )
 
-            if self._multi_use:
-                streamed_result_set_args["source"] = self
+        if self._multi_use:
+            streamed_result_set_args["source"] = self
 
-            return StreamedResultSet(**streamed_result_set_args)
-        finally:
-            if is_inline_begin:
-                self._lock.release()
+        return StreamedResultSet(**streamed_result_set_args)
 
     @CrossSync.convert
     async def partition_read(
@@ -691,6 +793,7 @@ class _SnapshotBase(_SessionWrapper):
             attempt = AtomicCounter()
 
             async def wrapped_method():
+                self._rpc_count.increment()
                 begin_transaction_request = BeginTransactionRequest(
                     **begin_request_kwargs
                 )
@@ -731,6 +834,41 @@ class _SnapshotBase(_SessionWrapper):
         """Builds and returns the transaction options for this snapshot."""
         raise NotImplementedError
 
+    def _next_execute_sql_seqno(self) -> int:
+        """Allocates the sequence number of an ``ExecuteSql`` or
+        ``ExecuteBatchDml`` request.
+
+        :rtype: int
+        :returns: the sequence number for the request.
+        """
+        with self._state_lock:
+            seqno = self._execute_sql_request_count
+            self._execute_sql_request_count += 1
+            return seqno
+
+    @CrossSync.convert
+    async def _wait_for_inline_begin(self) -> bool:
+        """Waits until the transaction ID is known, unless the calling
+        statement must begin the transaction inline.
+
+        Only the first statement of a multi-use transaction begins it. Other
+        statements that are executed concurrently wait until that statement
+        has returned the transaction ID, or has failed, in which case the next
+        statement begins the transaction instead.
+
+        :rtype: bool
+        :returns: True if the calling statement must begin the transaction.
+            The caller then holds ``_lock``, and must release it once the
+            transaction ID has been returned or the statement has failed.
+        """
+        if self._transaction_id is not None or not self._multi_use:
+            return False
+        await self._lock.acquire()
+        if self._transaction_id is not None:
+            self._lock.release()
+            return False
+        return True
+
     def _build_transaction_selector_pb(self) -> TransactionSelector:
         """Builds and returns a transaction selector for this snapshot."""
         if self._transaction_id is not None:
@@ -755,14 +893,17 @@ class _SnapshotBase(_SessionWrapper):
             self._transaction_id = transaction_pb.id
 
         if transaction_pb._pb.HasField("precommit_token"):
-            self._update_for_precommit_token_pb_unsafe(transaction_pb.precommit_token)
+            with self._state_lock:
+                self._update_for_precommit_token_pb_unsafe(
+                    transaction_pb.precommit_token
+                )
 
     @CrossSync.convert
     async def _update_for_precommit_token_pb(
         self, precommit_token_pb: MultiplexedSessionPrecommitToken
     ) -> None:
         """Updates the snapshot for the given multiplexed session precommit token."""
-        async with self._lock:
+        with self._state_lock:
             self._update_for_precommit_token_pb_unsafe(precommit_token_pb)
 
     def _update_for_precommit_token_pb_unsafe(
@@ -789,6 +930,7 @@ class Snapshot(_SnapshotBase):
         multi_use=False,
         transaction_id=None,
         client_context=None,
+        read_cache=None,
     ):
         super(Snapshot, self).__init__(session, client_context=client_context)
         opts = [read_timestamp, min_read_timestamp, max_staleness, exact_staleness]
@@ -810,6 +952,28 @@ class Snapshot(_SnapshotBase):
         self._exact_staleness = exact_staleness
         self._multi_use = multi_use
         self._transaction_id = transaction_id
+        self._read_cache = read_cache
+
+    def _get_read_cache_key(self, table, columns, keyset, index, limit, partition):
+        """Return the key of a read in the read cache of the snapshot, or None
+        if the read cannot be served from the cache.
+
+        Only reads of a single key by a single-use snapshot with a
+        ``max_staleness`` bound are cached."""
+        if (
+            self._read_cache is None
+            or self._multi_use
+            or not self._max_staleness
+            or limit
+            or partition is not None
+            or keyset.all_
+            or keyset.ranges
+            or len(keyset.keys) != 1
+        ):
+            return None
+        return _make_read_cache_key(
+            self._session._database.name, table, columns, keyset.keys[0], index
+        )
 
     def _build_transaction_options_pb(self) -> TransactionOptions:
         """Builds and returns transaction options for this snapshot."""
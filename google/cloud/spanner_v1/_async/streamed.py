@@ -14,11 +14,14 @@
 
 """Wrapper for streaming results."""
 __CROSS_SYNC_OUTPUT__ = "google.cloud.spanner_v1.streamed"
+import asyncio
+
 from google.protobuf.struct_pb2 import ListValue, Value
 
 from google.cloud import exceptions
 from google.cloud.aio._cross_sync import CrossSync
 from google.cloud.spanner_v1._helpers import _get_type_decoder, _parse_nullable
+from google.cloud.spanner_v1.row import Row, _RowSchema
 from google.cloud.spanner_v1.types.result_set import PartialResultSet, ResultSetMetadata
 from google.cloud.spanner_v1.types.type import TypeCode
 
@@ -34,6 +37,27 @@ class StreamedResultSet(object):
 
     :type source: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
     :param source: Deprecated. Snapshot from which the result set was fetched.
+
+    :type decode_offload_bytes: int
+    :param decode_offload_bytes: (Optional) partial result sets of at least
+        this many bytes are decoded in a worker thread instead of on the
+        event loop. Only used by the asyncio client.
+
+    :type lazy_rows: bool
+    :param lazy_rows: (Optional) return the rows as
+        :class:`~google.cloud.spanner_v1.row.Row` objects, which decode a
+        value when it is first accessed.
+
+    :type column_profiler:
+        :class:`~google.cloud.spanner_v1.column_profiler.ColumnAccessProfiler`
+    :param column_profiler: (Optional) records the columns of the rows that
+        are accessed. The rows are returned as
+        :class:`~google.cloud.spanner_v1.row.Row` objects, unless
+        ``lazy_decode`` is used.
+
+    :type column_profile_tag: str
+    :param column_profile_tag: (Optional) the tag under which the columns
+        are recorded by ``column_profiler``.
     """
 
     def __init__(
@@ -42,6 +66,10 @@ class StreamedResultSet(object):
         source=None,
         column_info=None,
         lazy_decode: bool = False,
+        decode_offload_bytes: int = None,
+        lazy_rows: bool = False,
+        column_profiler=None,
+        column_profile_tag: str = None,
     ):
         self._response_iterator = response_iterator
         self._rows = []  # Fully-processed rows
@@ -52,6 +80,11 @@ class StreamedResultSet(object):
         self._column_info = column_info  # Column information
         self._field_decoders = None
         self._lazy_decode = lazy_decode  # Return protobuf values
+        self._decode_offload_bytes = decode_offload_bytes
+        self._lazy_rows = lazy_rows or (column_profiler is not None and not lazy_decode)
+        self._column_profiler = column_profiler
+        self._column_profile_tag = column_profile_tag
+        self._row_schema = None
         self._done = False
 
     @property
@@ -95,6 +128,18 @@ class StreamedResultSet(object):
             ]
         return self._field_decoders
 
+    @property
+    def _schema(self):
+        if self._row_schema is None:
+            names = [field.name for field in self.fields]
+            usage = None
+            if self._column_profiler is not None:
+                usage = self._column_profiler._start_result_set(
+                    self._column_profile_tag, names
+                )
+            self._row_schema = _RowSchema(names, self._decoders, usage)
+        return self._row_schema
+
     def _merge_chunk(self, value):
         """Merge pending chunk with next value.
 
@@ -120,14 +165,21 @@ class StreamedResultSet(object):
         decoders = self._decoders
         width = len(self.fields)
         index = len(self._current_row)
+        decode = not (self._lazy_decode or self._lazy_rows)
         for value in values:
-            if self._lazy_decode:
-                self._current_row.append(value)
-            else:
+            if decode:
                 self._current_row.append(_parse_nullable(value, decoders[index]))
+            else:
+                self._current_row.append(value)
             index += 1
             if index == width:
-                self._rows.append(self._current_row)
+                if self._lazy_rows:
+                    schema = self._schema
+                    if schema.usage is not None:
+                        schema.usage.add_row(self._current_row)
+                    self._rows.append(Row(schema, self._current_row))
+                else:
+                    self._rows.append(self._current_row)
                 self._current_row = []
                 index = 0
 
@@ -138,6 +190,24 @@ class StreamedResultSet(object):
         Parse the result set into new/existing rows in :attr:`_rows`
         """
         response = await self._response_iterator.__anext__()
+        if CrossSync.is_async:
+            if (
+                self._decode_offload_bytes is not None
+                and PartialResultSet.pb(response).ByteSize()
+                >= self._decode_offload_bytes
+            ):
+                # Decode large partial result sets in a worker thread, so
+                # that they do not block other tasks on the event loop.
+                await asyncio.to_thread(self._merge_response, response)
+                return
+        self._merge_response(response)
+
+    def _merge_response(self, response):
+        """Merge a partial result set into new/existing rows in :attr:`_rows`.
+
+        :type response: :class:`~google.cloud.spanner_v1.types.PartialResultSet`
+        :param response: the partial result set.
+        """
         response_pb = PartialResultSet.pb(response)
 
         if self._metadata is None:  # first response
@@ -161,15 +231,112 @@ class StreamedResultSet(object):
     @CrossSync.convert(sync_name="__iter__")
     async def __aiter__(self):
         while True:
-            iter_rows, self._rows[:] = self._rows[:], ()
-            while iter_rows:
-                yield iter_rows.pop(0)
+            iter_rows, self._rows = self._rows, []
+            for row in iter_rows:
+                yield row
             if self._done:
                 return
             try:
                 await self._consume_next()
             except StopAsyncIteration:
                 return
+            # Let other tasks run between two partial result sets, also when
+            # the next one is already buffered by the stream.
+            await CrossSync.yield_to_event_loop()
+
+    @CrossSync.convert
+    async def _next_batches(self, batch_size):
+        """Consume the stream until at least one batch of rows is available.
+
+        :type batch_size: int
+        :param batch_size: the maximum number of rows in a batch, or None to
+            return the rows of each partial result set as one batch.
+
+        :rtype: list of list
+        :returns: the batches, or an empty list at the end of the stream.
+        """
+        while not self._done and (
+            not self._rows or (batch_size is not None and len(self._rows) < batch_size)
+        ):
+            try:
+                await self._consume_next()
+            except StopAsyncIteration:
+                self._done = True
+        rows = self._rows
+        if batch_size is None:
+            self._rows = []
+            return [rows] if rows else []
+        # Keep the rows of an incomplete batch until the stream has ended.
+        end = len(rows) if self._done else len(rows) - len(rows) % batch_size
+        self._rows = rows[end:]
+        return [rows[start : start + batch_size] for start in range(0, end, batch_size)]
+
+    @CrossSync.convert
+    async def batches(self, batch_size: int = None, max_buffered_batches: int = 2):
+        """Iterate over the rows of the result set in batches.
+
+        With the asyncio client, the stream is read and decoded by a
+        background task while the batches are consumed. That task stops
+        reading from the stream when ``max_buffered_batches`` batches are
+        waiting to be consumed, so a slow consumer does not cause the whole
+        result set to be buffered in memory.
+
+        :type batch_size: int
+        :param batch_size: (Optional) the maximum number of rows in a batch.
+            By default, a batch contains the rows that were completed by one
+            partial result set.
+
+        :type max_buffered_batches: int
+        :param max_buffered_batches: the maximum number of batches that are
+            read ahead of the consumer. Only used by the asyncio client.
+
+        :rtype: iterable of list
+        :returns: lists of rows
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if CrossSync.is_async:
+            if max_buffered_batches < 1:
+                raise ValueError("max_buffered_batches must be positive")
+            queue = asyncio.Queue(maxsize=max_buffered_batches)
+
+            async def produce():
+                try:
+                    while True:
+                        batches = await self._next_batches(batch_size)
+                        if not batches:
+                            break
+                        for batch in batches:
+                            await queue.put((batch, None))
+                        await CrossSync.yield_to_event_loop()
+                except Exception as exc:
+                    await queue.put((None, exc))
+                    return
+                await queue.put((None, None))
+
+            producer = asyncio.create_task(produce())
+            try:
+                while True:
+                    batch, exc = await queue.get()
+                    if exc is not None:
+                        raise exc
+                    if batch is None:
+                        return
+                    yield batch
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                    try:
+                        await producer
+                    except asyncio.CancelledError:
+                        pass
+        else:
+            while True:
+                batches = await self._next_batches(batch_size)
+                if not batches:
+                    return
+                for batch in batches:
+                    yield batch
 
     def decode_row(self, row: []) -> []:
         """Decodes a row from protobuf values to Python objects. This function
@@ -179,6 +346,8 @@ class StreamedResultSet(object):
 
         :returns: an array containing the decoded values of all the columns in the given row
         """
+        if isinstance(row, Row):
+            return list(row)
         if not hasattr(row, "__len__"):
             raise TypeError("row", "row must be an array of protobuf values")
         decoders = self._decoders
@@ -194,6 +363,8 @@ class StreamedResultSet(object):
 
         :returns: the decoded column value
         """
+        if isinstance(row, Row):
+            return row[column_index]
         if not hasattr(row, "__len__"):
             raise TypeError("row", "row must be an array of protobuf values")
         decoders = self._decoders
@@ -255,15 +426,15 @@ class StreamedResultSet(object):
         :returns: result rows as a list of dictionaries
         """
         rows = []
+        names = None
         for row in self:
-            rows.append(
-                {
-                    column: value
-                    for column, value in zip(
-                        [column.name for column in self._metadata.row_type.fields], row
-                    )
-                }
-            )
+            if names is None:
+                names = [column.name for column in self._metadata.row_type.fields]
+            if isinstance(row, Row):
+                # Converting the rows in bulk does not count as an access of
+                # their columns.
+                row = row._decoded_values()
+            rows.append(dict(zip(names, row)))
         return rows
 
 
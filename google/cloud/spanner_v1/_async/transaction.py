@@ -57,6 +57,11 @@ from google.cloud.spanner_v1.types.transaction import TransactionOptions
 class Transaction(_SnapshotBase, _BatchBase):
     """Implement read-write transaction semantics for a session.
 
+    Queries, reads and DML statements may be executed concurrently on the
+    same transaction, e.g. from multiple tasks or threads. Only the first
+    statement includes the BeginTransaction option; the other statements wait
+    until it has returned the transaction ID, and are then sent in parallel.
+
     :type session: :class:`~google.cloud.spanner_v1.session.Session`
     :param session: the session used to perform the commit
 
@@ -70,6 +75,9 @@ class Transaction(_SnapshotBase, _BatchBase):
     read_lock_mode: TransactionOptions.ReadWrite.ReadLockMode = (
         TransactionOptions.ReadWrite.ReadLockMode.READ_LOCK_MODE_UNSPECIFIED
     )
+    # If true, a transaction that only buffers mutations is committed in a
+    # single Commit RPC with a single-use transaction, like a Batch.
+    single_use_commit: bool = False
 
     # Override defaults from _SnapshotBase.
     _multi_use: bool = True
@@ -193,6 +201,7 @@ class Transaction(_SnapshotBase, _BatchBase):
 
                 def wrapped_method(*args, **kwargs):
                     attempt.increment()
+                    self._rpc_count.increment()
                     call_metadata, error_augmenter = database.with_error_augmentation(
                         nth_request,
                         attempt.value,
@@ -277,11 +286,21 @@ class Transaction(_SnapshotBase, _BatchBase):
             if self.rolled_back:
                 raise ValueError("Transaction already rolled back.")
 
+            # A transaction that did not execute any statements can commit its
+            # mutations without beginning the transaction first. Such a commit
+            # is not replay-protected, and is therefore only used if enabled.
+            single_use = False
             if self._transaction_id is None:
-                if num_mutations > 0:
-                    await self._begin_mutations_only_transaction()
-                else:
+                if num_mutations == 0:
                     raise ValueError("Transaction has not begun.")
+                if (
+                    self.single_use_commit
+                    and self._read_request_count == 0
+                    and self._execute_sql_request_count == 0
+                ):
+                    single_use = True
+                else:
+                    await self._begin_mutations_only_transaction()
 
             client_context = _merge_client_context(
                 database._instance._client._client_context, self._client_context
@@ -306,6 +325,10 @@ class Transaction(_SnapshotBase, _BatchBase):
                 "max_commit_delay": max_commit_delay,
                 "request_options": request_options,
             }
+            if single_use:
+                common_commit_request_args[
+                    "single_use_transaction"
+                ] = self._build_transaction_options_pb()
 
             add_span_event(span, "Starting Commit")
 
@@ -314,6 +337,7 @@ class Transaction(_SnapshotBase, _BatchBase):
 
             async def wrapped_method(*args, **kwargs):
                 attempt.increment()
+                self._rpc_count.increment()
                 commit_request_args = {
                     "mutations": mutations,
                     **common_commit_request_args,
@@ -349,9 +373,13 @@ class Transaction(_SnapshotBase, _BatchBase):
                     },
                 )
 
+            # A single-use commit is not retried, as the mutations could
+            # otherwise be applied twice.
             commit_response_pb: CommitResponse = await _retry(
                 wrapped_method,
-                allowed_exceptions={InternalServerError: _check_rst_stream_error},
+                allowed_exceptions=(
+                    {} if single_use else {InternalServerError: _check_rst_stream_error}
+                ),
                 before_next_retry=before_next_retry,
             )
 
@@ -359,9 +387,10 @@ class Transaction(_SnapshotBase, _BatchBase):
             # successfully commit, and must be retried with the new precommit token.
             # The mutations should not be included in the new request, and no further
             # retries or exception handling should be performed.
-            if commit_response_pb._pb.HasField("precommit_token"):
+            if not single_use and commit_response_pb._pb.HasField("precommit_token"):
                 add_span_event(span, commit_retry_event_name)
                 nth_request = database._next_nth_request
+                self._rpc_count.increment()
                 call_metadata, error_augmenter = database.with_error_augmentation(
                     nth_request,
                     1,
@@ -494,11 +523,6 @@ class Transaction(_SnapshotBase, _BatchBase):
                 _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
             )
 
-        seqno, self._execute_sql_request_count = (
-            self._execute_sql_request_count,
-            self._execute_sql_request_count + 1,
-        )
-
         # Query-level options have higher precedence than client-level and
         # environment-level options
         default_query_options = database._instance._client._query_options
@@ -522,55 +546,53 @@ class Transaction(_SnapshotBase, _BatchBase):
 
         # If this request begins the transaction, we need to lock
         # the transaction until the transaction ID is updated.
-        is_inline_begin = False
-
-        if self._transaction_id is None:
-            is_inline_begin = True
-            await self._lock.acquire()
-
-        execute_sql_request = ExecuteSqlRequest(
-            session=session.name,
-            transaction=self._build_transaction_selector_pb(),
-            sql=dml,
-            params=params_pb,
-            param_types=param_types,
-            query_mode=query_mode,
-            query_options=query_options,
-            seqno=seqno,
-            request_options=request_options,
-            last_statement=last_statement,
-        )
+        is_inline_begin = await self._wait_for_inline_begin()
+
+        try:
+            execute_sql_request = ExecuteSqlRequest(
+                session=session.name,
+                transaction=self._build_transaction_selector_pb(),
+                sql=dml,
+                params=params_pb,
+                param_types=param_types,
+                query_mode=query_mode,
+                query_options=query_options,
+                seqno=self._next_execute_sql_seqno(),
+                request_options=request_options,
+                last_statement=last_statement,
+            )
 
-        nth_request = database._next_nth_request
-        attempt = AtomicCounter(0)
+            nth_request = database._next_nth_request
+            attempt = AtomicCounter(0)
 
-        async def wrapped_method(*args, **kwargs):
-            attempt.increment()
-            call_metadata, error_augmenter = database.with_error_augmentation(
-                nth_request, attempt.value, metadata
-            )
-            execute_sql_method = functools.partial(
-                api.execute_sql,
-                request=execute_sql_request,
-                metadata=call_metadata,
-                retry=retry,
-                timeout=timeout,
-            )
-            with error_augmenter:
-                return await execute_sql_method(*args, **kwargs)
-
-        result_set_pb: ResultSet = await self._execute_request(
-            wrapped_method,
-            execute_sql_request,
-            metadata,
-            f"CloudSpanner.{type(self).__name__}.execute_update",
-            trace_attributes,
-        )
+            async def wrapped_method(*args, **kwargs):
+                attempt.increment()
+                self._rpc_count.increment()
+                call_metadata, error_augmenter = database.with_error_augmentation(
+                    nth_request, attempt.value, metadata
+                )
+                execute_sql_method = functools.partial(
+                    api.execute_sql,
+                    request=execute_sql_request,
+                    metadata=call_metadata,
+                    retry=retry,
+                    timeout=timeout,
+                )
+                with error_augmenter:
+                    return await execute_sql_method(*args, **kwargs)
 
-        self._update_for_result_set_pb(result_set_pb)
+            result_set_pb: ResultSet = await self._execute_request(
+                wrapped_method,
+                execute_sql_request,
+                metadata,
+                f"CloudSpanner.{type(self).__name__}.execute_update",
+                trace_attributes,
+            )
 
-        if is_inline_begin:
-            self._lock.release()
+            self._update_for_result_set_pb(result_set_pb)
+        finally:
+            if is_inline_begin:
+                self._lock.release()
 
         if result_set_pb._pb.HasField("precommit_token"):
             await self._update_for_precommit_token_pb(result_set_pb.precommit_token)
@@ -658,11 +680,6 @@ class Transaction(_SnapshotBase, _BatchBase):
                 _metadata_with_leader_aware_routing(database._route_to_leader_enabled)
             )
 
-        seqno, self._execute_sql_request_count = (
-            self._execute_sql_request_count,
-            self._execute_sql_request_count + 1,
-        )
-
         client_context = _merge_client_context(
             database._instance._client._client_context, self._client_context
         )
@@ -682,51 +699,49 @@ class Transaction(_SnapshotBase, _BatchBase):
 
         # If this request begins the transaction, we need to lock
         # the transaction until the transaction ID is updated.
-        is_inline_begin = False
-
-        if self._transaction_id is None:
-            is_inline_begin = True
-            await self._lock.acquire()
-
-        execute_batch_dml_request = ExecuteBatchDmlRequest(
-            session=session.name,
-            transaction=self._build_transaction_selector_pb(),
-            statements=parsed,
-            seqno=seqno,
-            request_options=request_options,
-            last_statements=last_statement,
-        )
+        is_inline_begin = await self._wait_for_inline_begin()
+
+        try:
+            execute_batch_dml_request = ExecuteBatchDmlRequest(
+                session=session.name,
+                transaction=self._build_transaction_selector_pb(),
+                statements=parsed,
+                seqno=self._next_execute_sql_seqno(),
+                request_options=request_options,
+                last_statements=last_statement,
+            )
 
-        nth_request = database._next_nth_request
-        attempt = AtomicCounter(0)
+            nth_request = database._next_nth_request
+            attempt = AtomicCounter(0)
 
-        async def wrapped_method(*args, **kwargs):
-            attempt.increment()
-            call_metadata, error_augmenter = database.with_error_augmentation(
-                nth_request, attempt.value, metadata
-            )
-            execute_batch_dml_method = functools.partial(
-                api.execute_batch_dml,
-                request=execute_batch_dml_request,
-                metadata=call_metadata,
-                retry=retry,
-                timeout=timeout,
-            )
-            with error_augmenter:
-                return await execute_batch_dml_method(*args, **kwargs)
-
-        response_pb: ExecuteBatchDmlResponse = await self._execute_request(
-            wrapped_method,
-            execute_batch_dml_request,
-            metadata,
-            "CloudSpanner.DMLTransaction",
-            trace_attributes,
-        )
+            async def wrapped_method(*args, **kwargs):
+                attempt.increment()
+                self._rpc_count.increment()
+                call_metadata, error_augmenter = database.with_error_augmentation(
+                    nth_request, attempt.value, metadata
+                )
+                execute_batch_dml_method = functools.partial(
+                    api.execute_batch_dml,
+                    request=execute_batch_dml_request,
+                    metadata=call_metadata,
+                    retry=retry,
+                    timeout=timeout,
+                )
+                with error_augmenter:
+                    return await execute_batch_dml_method(*args, **kwargs)
 
-        self._update_for_execute_batch_dml_response_pb(response_pb)
+            response_pb: ExecuteBatchDmlResponse = await self._execute_request(
+                wrapped_method,
+                execute_batch_dml_request,
+                metadata,
+                "CloudSpanner.DMLTransaction",
+                trace_attributes,
+            )
 
-        if is_inline_begin:
-            self._lock.release()
+            self._update_for_execute_batch_dml_response_pb(response_pb)
+        finally:
+            if is_inline_begin:
+                self._lock.release()
 
         if (
             len(response_pb.result_sets) > 0
@@ -34,12 +34,18 @@ from google.rpc.error_details_pb2 import RetryInfo
 from google.cloud._helpers import _date_from_iso8601_date
 from google.cloud.spanner_v1.types import ClientContext
 from google.cloud.spanner_v1.types import RequestOptions
-from google.cloud.spanner_v1.data_types import JsonObject, Interval
+from google.cloud.spanner_v1.data_types import (
+    ALL_COLUMNS,
+    COMPACT_TEMPORAL,
+    JsonObject,
+    Interval,
+)
 from google.cloud.spanner_v1.exceptions import wrap_with_request_id
 from google.cloud.spanner_v1.request_id_header import (
     with_request_id,
     with_request_id_metadata_only,
 )
+from google.cloud.spanner_v1.retry_policy import get_default_retry_policy
 from google.cloud.spanner_v1.types import (
     ExecuteSqlRequest,
     TransactionOptions,
@@ -77,6 +83,10 @@ NUMERIC_MAX_PRECISION_ERR_MSG = (
 
 GOOGLE_CLOUD_REGION_GLOBAL = "global"
 
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_NANOS_PER_SECOND = 1000000000
+_NANOS_PER_DAY = 86400 * _NANOS_PER_SECOND
+
 log = logging.getLogger(__name__)
 
 _cloud_region: str = None
@@ -391,6 +401,10 @@ def _make_value_pb(value):
             return Value(null_value="NULL_VALUE")
         else:
             return Value(string_value=value)
+    if isinstance(value, Value):
+        # A value that has already been encoded, e.g. a query parameter of a
+        # deserialized partition.
+        return value
     if isinstance(value, Message):
         value = value.SerializeToString()
         if value is None:
@@ -449,6 +463,9 @@ def _parse_value_pb(value_pb, field_type, field_name, column_info=None):
             the custom object enables deserialization of backend-received column data.
             If not provided, data remains serialized as bytes for Proto Messages and
             integer for Proto Enums.
+            Use :data:`~google.cloud.spanner_v1.data_types.COMPACT_TEMPORAL` as the value
+            of a column, or of the ``"*"`` key for all columns, to decode TIMESTAMP
+            values as int nanoseconds and DATE values as int days since the Unix epoch.
 
     :rtype: varies on field_type
     :returns: value extracted from value_pb
@@ -475,6 +492,9 @@ def _get_type_decoder(field_type, field_name, column_info=None):
             the custom object enables deserialization of backend-received column data.
             If not provided, data remains serialized as bytes for Proto Messages and
             integer for Proto Enums.
+            Use :data:`~google.cloud.spanner_v1.data_types.COMPACT_TEMPORAL` as the value
+            of a column, or of the ``"*"`` key for all columns, to decode TIMESTAMP
+            values as int nanoseconds and DATE values as int days since the Unix epoch.
 
     :rtype: a function that takes a single protobuf value as an input argument
     :returns: a function that can be used to extract a value from a protobuf value
@@ -495,8 +515,12 @@ def _get_type_decoder(field_type, field_name, column_info=None):
     elif type_code == TypeCode.FLOAT32:
         return _parse_float
     elif type_code == TypeCode.DATE:
+        if _is_compact_temporal(column_info, field_name):
+            return _parse_date_days
         return _parse_date
     elif type_code == TypeCode.TIMESTAMP:
+        if _is_compact_temporal(column_info, field_name):
+            return _parse_timestamp_nanos
         return _parse_timestamp
     elif type_code == TypeCode.NUMERIC:
         return _parse_numeric
@@ -578,6 +602,66 @@ def _parse_timestamp(value_pb):
     return DatetimeWithNanoseconds.from_rfc3339(value_pb.string_value)
 
 
+def _is_compact_temporal(column_info, field_name):
+    if not column_info:
+        return False
+    hint = column_info.get(field_name, column_info.get(ALL_COLUMNS))
+    return hint is COMPACT_TEMPORAL
+
+
+def _parse_date_days(value_pb) -> int:
+    """Parse a DATE value into the number of days since the Unix epoch."""
+    value = value_pb.string_value
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        date = datetime.date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    else:
+        date = _date_from_iso8601_date(value)
+    return date.toordinal() - _EPOCH_ORDINAL
+
+
+def _parse_timestamp_nanos(value_pb) -> int:
+    """Parse a TIMESTAMP value into the number of nanoseconds since the Unix
+    epoch.
+
+    Timestamps in the canonical ``YYYY-MM-DDTHH:MM:SS[.fffffffff]Z`` format
+    that Spanner returns are parsed by position, other timestamps by
+    :meth:`DatetimeWithNanoseconds.from_rfc3339`.
+    """
+    value = value_pb.string_value
+    length = len(value)
+    if (
+        20 <= length <= 30
+        and length != 21
+        and value[-1] == "Z"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and (length == 20 or value[19] == ".")
+    ):
+        fraction = value[20:-1]
+        if not fraction or fraction.isdigit():
+            days = (
+                datetime.date(
+                    int(value[0:4]), int(value[5:7]), int(value[8:10])
+                ).toordinal()
+                - _EPOCH_ORDINAL
+            )
+            seconds = (
+                int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+            )
+            nanos = int(fraction.ljust(9, "0")) if fraction else 0
+            return days * _NANOS_PER_DAY + seconds * _NANOS_PER_SECOND + nanos
+    timestamp = datetime_helpers.DatetimeWithNanoseconds.from_rfc3339(value)
+    delta = timestamp - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+    return (
+        delta.days * _NANOS_PER_DAY
+        + delta.seconds * _NANOS_PER_SECOND
+        + timestamp.nanosecond
+    )
+
+
 def _parse_numeric(value_pb):
     return decimal.Decimal(value_pb.string_value)
 
@@ -665,31 +749,43 @@ def _retry_on_aborted_exception(
     func,
     deadline,
     default_retry_delay=None,
+    retry_policy=None,
 ):
     """
     Handles retry logic for Aborted exceptions, considering the deadline.
+
+    A retry delay that is returned by the server takes precedence over
+    ``default_retry_delay``, which takes precedence over the backoff of the
+    retry policy.
     """
-    attempts = 0
+    if retry_policy is None:
+        retry_policy = get_default_retry_policy()
+    retry_state = retry_policy.start(deadline=deadline)
     while True:
         try:
-            attempts += 1
-            return func()
+            result = func()
         except Aborted as exc:
-            _delay_until_retry(
-                exc,
-                deadline=deadline,
-                attempts=attempts,
-                default_retry_delay=default_retry_delay,
-            )
+            cause = exc.errors[0] if exc.errors else exc
+            delay = _get_server_retry_delay(cause)
+            if delay is None:
+                delay = default_retry_delay
+            delay = retry_state.next_delay(exc, delay=delay)
+            if delay is None:
+                raise
+            _record_retry()
+            time.sleep(delay)
             continue
+        retry_state.record_success()
+        return result
 
 
 def _retry(
     func,
     retry_count=5,
-    delay=2,
+    delay=None,
     allowed_exceptions=None,
     before_next_retry=None,
+    retry_policy=None,
 ):
     """
     Retry a function with a specified number of retries, delay between retries, and list of allowed exceptions.
@@ -697,20 +793,24 @@ def _retry(
     Args:
         func: The function to be retried.
         retry_count: The maximum number of times to retry the function.
-        delay: The delay in seconds between retries.
+        delay: The initial delay in seconds between retries. Defaults to the initial delay of the retry policy.
         allowed_exceptions: A tuple of exceptions that are allowed to occur without triggering a retry.
                             Passing allowed_exceptions as None will lead to retrying for all exceptions.
+        retry_policy: The RetryPolicy that computes the backoff. Defaults to the default retry policy.
 
     Returns:
         The result of the function if it is successful, or raises the last exception if all retries fail.
     """
+    if retry_policy is None:
+        retry_policy = get_default_retry_policy()
+    retry_state = retry_policy.start(initial_delay=delay)
     retries = 0
     while retries <= retry_count:
         if retries > 0 and before_next_retry:
             before_next_retry(retries, delay)
 
         try:
-            return func()
+            result = func()
         except Exception as exc:
             is_allowed = (
                 allowed_exceptions is None or exc.__class__ in allowed_exceptions
@@ -722,11 +822,28 @@ def _retry(
                     and allowed_exceptions[exc.__class__] is not None
                 ):
                     allowed_exceptions[exc.__class__](exc)
+                delay = retry_state.next_delay(exc)
+                if delay is None:
+                    raise exc
+                _record_retry()
                 time.sleep(delay)
-                delay = delay * 2
                 retries = retries + 1
             else:
                 raise exc
+        else:
+            retry_state.record_success()
+            return result
+
+
+def _record_retry():
+    """Count a client-side retry for the operation of the current metrics tracer."""
+    from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+        SpannerMetricsTracerFactory,
+    )
+
+    tracer = SpannerMetricsTracerFactory.get_current_tracer()
+    if tracer is not None:
+        tracer.record_retry()
 
 
 def _check_rst_stream_error(exc):
@@ -809,20 +926,36 @@ def _get_retry_delay(cause, attempts, default_retry_delay=None):
     :type attempts: int
     :param attempts: number of call retries
     """
+    delay = _get_server_retry_delay(cause)
+    if delay is not None:
+        return delay
+    if default_retry_delay is not None:
+        return default_retry_delay
+
+    return 2**attempts + random.random()
+
+
+def _get_server_retry_delay(cause):
+    """Return the retry delay from the ``RetryInfo`` trailer of an error.
+
+    :type cause: :class:`grpc.Call`
+    :param cause: the cause of the error
+
+    :rtype: float
+    :returns: seconds to wait before retrying, or None if the server did not
+              return a retry delay.
+    """
     if hasattr(cause, "trailing_metadata"):
         metadata = dict(cause.trailing_metadata())
     else:
         metadata = {}
     retry_info_pb = metadata.get("google.rpc.retryinfo-bin")
-    if retry_info_pb is not None:
-        retry_info = RetryInfo()
-        retry_info.ParseFromString(retry_info_pb)
-        nanos = retry_info.retry_delay.nanos
-        return retry_info.retry_delay.seconds + nanos / 1.0e9
-    if default_retry_delay is not None:
-        return default_retry_delay
-
-    return 2**attempts + random.random()
+    if retry_info_pb is None:
+        return None
+    retry_info = RetryInfo()
+    retry_info.ParseFromString(retry_info_pb)
+    nanos = retry_info.retry_delay.nanos
+    return retry_info.retry_delay.seconds + nanos / 1.0e9
 
 
 class AtomicCounter:
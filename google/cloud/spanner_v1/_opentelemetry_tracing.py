@@ -14,11 +14,11 @@
 
 """Manages OpenTelemetry trace creation and handling"""
 
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 import os
 
-from opentelemetry import trace
+from opentelemetry import context, trace
 from opentelemetry.semconv.attributes.otel_attributes import (
     OTEL_SCOPE_NAME,
     OTEL_SCOPE_VERSION,
@@ -31,6 +31,9 @@ from google.cloud.spanner_v1._helpers import (
 )
 from google.cloud.spanner_v1.gapic_version import __version__ as gapic_version
 from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+    SpannerMetricsTracerFactory,
+)
 from google.cloud.spanner_v1.services.spanner.client import SpannerClient
 
 TRACER_NAME = "cloud.google.com/python/spanner"
@@ -42,6 +45,10 @@ extended_tracing_globally_disabled = (
 end_to_end_tracing_globally_enabled = (
     os.getenv("SPANNER_ENABLE_END_TO_END_TRACING", "").lower() == "true"
 )
+# Tracer providers that only ever create non-recording spans. The proxy tracer
+# provider is returned by the OpenTelemetry API as long as no tracer provider
+# has been set globally.
+_NOOP_TRACER_PROVIDER_TYPES = (trace.NoOpTracerProvider, trace.ProxyTracerProvider)
 
 
 def get_tracer(tracer_provider=None):
@@ -59,6 +66,53 @@ def get_tracer(tracer_provider=None):
     return tracer_provider.get_tracer(TRACER_NAME, TRACER_VERSION)
 
 
+def is_tracing_enabled(tracer_provider=None):
+    """
+    Returns False if spans created with the given tracer provider, or the
+    global tracer provider if none is given, can never be recorded. This is the
+    case until an OpenTelemetry SDK tracer provider has been configured.
+
+    The check is cheap and is evaluated on every call, so that configuring a
+    tracer provider at any point in time is picked up immediately.
+    """
+    if not tracer_provider:
+        tracer_provider = trace.get_tracer_provider()
+    return not isinstance(tracer_provider, _NOOP_TRACER_PROVIDER_TYPES)
+
+
+def _get_request_tag(extra_attributes):
+    if not extra_attributes:
+        return None
+    request_options = extra_attributes.get("request_options")
+    if not request_options:
+        return None
+    return request_options.request_tag
+
+
+def _set_metrics_request_tag(request_tag):
+    # The request tag is only used to group the local latency metrics.
+    if request_tag:
+        tracer = SpannerMetricsTracerFactory.get_current_tracer()
+        if tracer is not None:
+            tracer.set_request_tag(request_tag)
+
+
+@contextmanager
+def _noop_trace_call(request_tag=None):
+    # Make the invalid span the current span for the duration of the call, so
+    # that nested calls to get_current_span() behave as with a no-op tracer.
+    token = context.attach(trace.set_span_in_context(trace.INVALID_SPAN))
+    try:
+        if MetricsCapture.is_enabled():
+            with MetricsCapture():
+                _set_metrics_request_tag(request_tag)
+                yield trace.INVALID_SPAN
+        else:
+            yield trace.INVALID_SPAN
+    finally:
+        context.detach(token)
+
+
 @contextmanager
 def trace_call(
     name, session=None, extra_attributes=None, observability_options=None, metadata=None
@@ -67,6 +121,15 @@ def trace_call(
         session._last_use_time = datetime.now()
 
     tracer_provider = None
+    if isinstance(observability_options, dict):  # Avoid false positives with mock.Mock
+        tracer_provider = observability_options.get("tracer_provider", None)
+
+    if not is_tracing_enabled(tracer_provider):
+        # Fast path: skip building attributes and creating spans that would
+        # never be recorded.
+        with _noop_trace_call(_get_request_tag(extra_attributes)) as span:
+            yield span
+        return
 
     # By default enable_extended_tracing=True because in a bid to minimize
     # breaking changes and preserve legacy behavior, we are keeping it turned
@@ -81,7 +144,6 @@ def trace_call(
         db_name = session._database.name
 
     if isinstance(observability_options, dict):  # Avoid false positives with mock.Mock
-        tracer_provider = observability_options.get("tracer_provider", None)
         enable_extended_tracing = observability_options.get(
             "enable_extended_tracing", enable_extended_tracing
         )
@@ -112,10 +174,13 @@ def trace_call(
     if extra_attributes:
         attributes.update(extra_attributes)
 
+    request_tag = None
+
     if "request_options" in attributes:
         request_options = attributes.pop("request_options")
         if request_options and request_options.request_tag:
             attributes["request.tag"] = request_options.request_tag
+            request_tag = request_options.request_tag
 
     if extended_tracing_globally_disabled:
         enable_extended_tracing = False
@@ -129,7 +194,8 @@ def trace_call(
     with tracer.start_as_current_span(
         name, kind=trace.SpanKind.CLIENT, attributes=attributes
     ) as span:
-        with MetricsCapture():
+        with MetricsCapture() if MetricsCapture.is_enabled() else nullcontext():
+            _set_metrics_request_tag(request_tag)
             try:
                 if enable_end_to_end_tracing:
                     _metadata_with_span_context(metadata)
@@ -0,0 +1,393 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Listing of the databases and backups of many instances, and a local index
+of the listed resources.
+
+:meth:`Instance.list_databases` and :meth:`Instance.list_backups` fetch the
+pages of a single instance one by one, when the previous page has been
+consumed. An :class:`AdminLister` lists the resources of many instances at
+the same time, and fetches the next pages of every instance while the
+listed resources are consumed. An :class:`AdminIndex` answers queries over
+the listed resources, e.g. the backups that expire within a day and are
+larger than a given size, without listing them again.
+"""
+
+import bisect
+from concurrent import futures
+import queue
+import threading
+
+from google.cloud.spanner_v1.instance import Instance
+
+_DONE = object()
+
+
+class _Error(object):
+    """An error of a producer, which is raised to the consumer."""
+
+    __slots__ = ("exception",)
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+class AdminLister(object):
+    """Lists the databases, backups and backup operations of many
+    instances at the same time.
+
+    Every instance is listed by a worker thread, which fetches the pages of
+    the instance in order. The listed resources are buffered until they are
+    consumed, up to ``prefetch`` resources, so that the workers fetch the
+    next pages while the current resources are processed.
+
+    :type client: :class:`~google.cloud.spanner_v1.client.Client`
+    :param client: the client that is used to list the instances and their
+                   resources.
+
+    :type max_workers: int
+    :param max_workers: (Optional) the maximum number of instances that are
+                        listed at the same time.
+
+    :type prefetch: int
+    :param prefetch: (Optional) the maximum number of resources that are
+                     listed ahead of the consumer.
+    """
+
+    def __init__(self, client, max_workers=8, prefetch=1000):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self._client = client
+        self._max_workers = max_workers
+        self._prefetch = prefetch
+
+    def list_instances(self, filter_=""):
+        """List the instances of the project of the client.
+
+        :type filter_: str
+        :param filter_: (Optional) a filter for the instances to list.
+
+        :rtype: list of :class:`~google.cloud.spanner_v1.instance.Instance`
+        :returns: the instances.
+        """
+        return [
+            Instance.from_pb(instance_pb, self._client)
+            for instance_pb in self._client.list_instances(filter_=filter_)
+        ]
+
+    def list_databases(self, instances=None, page_size=None):
+        """List the databases of many instances.
+
+        :type instances: list
+        :param instances: (Optional) the instances, or instance IDs, to list
+                          the databases of. Defaults to all instances of the
+                          project.
+
+        :type page_size: int
+        :param page_size: (Optional) the maximum number of databases in each
+                          page of results.
+
+        :rtype: iterator
+        :returns: the :class:`~google.cloud.spanner_admin_database_v1.types.Database`
+                  resources, in no particular order.
+        """
+        return self._fan_out(
+            instances,
+            lambda instance: instance.list_databases(page_size=page_size),
+        )
+
+    def list_backups(self, instances=None, filter_="", page_size=None):
+        """List the backups of many instances.
+
+        :type instances: list
+        :param instances: (Optional) the instances, or instance IDs, to list
+                          the backups of. Defaults to all instances of the
+                          project.
+
+        :type filter_: str
+        :param filter_: (Optional) a filter for the backups to list.
+
+        :type page_size: int
+        :param page_size: (Optional) the maximum number of backups in each
+                          page of results.
+
+        :rtype: iterator
+        :returns: the :class:`~google.cloud.spanner_admin_database_v1.types.Backup`
+                  resources, in no particular order.
+        """
+        return self._fan_out(
+            instances,
+            lambda instance: instance.list_backups(
+                filter_=filter_, page_size=page_size
+            ),
+        )
+
+    def list_backup_operations(self, instances=None, filter_="", page_size=None):
+        """List the backup operations of many instances.
+
+        :type instances: list
+        :param instances: (Optional) the instances, or instance IDs, to list
+                          the backup operations of. Defaults to all instances
+                          of the project.
+
+        :type filter_: str
+        :param filter_: (Optional) a filter for the operations to list.
+
+        :type page_size: int
+        :param page_size: (Optional) the maximum number of operations in each
+                          page of results.
+
+        :rtype: iterator
+        :returns: the :class:`~google.api_core.operation.Operation` resources,
+                  in no particular order.
+        """
+        return self._fan_out(
+            instances,
+            lambda instance: instance.list_backup_operations(
+                filter_=filter_, page_size=page_size
+            ),
+        )
+
+    def _instances(self, instances):
+        if instances is None:
+            return self.list_instances()
+        return [
+            self._client.instance(instance) if isinstance(instance, str) else instance
+            for instance in instances
+        ]
+
+    def _fan_out(self, instances, list_method):
+        """Yield the resources that ``list_method`` lists for every instance,
+        listing the instances from worker threads."""
+        instances = self._instances(instances)
+        if not instances:
+            return
+        items = queue.Queue(maxsize=self._prefetch)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(instance):
+            try:
+                for item in list_method(instance):
+                    if not put(item):
+                        return
+            except Exception as exc:
+                put(_Error(exc))
+            finally:
+                put(_DONE)
+
+        executor = futures.ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(instances))
+        )
+        try:
+            for instance in instances:
+                executor.submit(produce, instance)
+            remaining = len(instances)
+            while remaining:
+                item = items.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, _Error):
+                    raise item.exception
+                else:
+                    yield item
+        finally:
+            # Stops the workers if the consumer stops early or fails.
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AdminIndex(object):
+    """An in-memory index of listed databases and backups.
+
+    The index is built once from the listed resources, and answers queries
+    by state, instance, source database, expire time and size without
+    listing the resources again. Resources are identified by their names;
+    adding a resource with the name of an indexed resource replaces it.
+
+    :type resources: iterable
+    :param resources: (Optional) the
+                      :class:`~google.cloud.spanner_admin_database_v1.types.Database`
+                      and :class:`~google.cloud.spanner_admin_database_v1.types.Backup`
+                      resources to index, e.g. as listed by an
+                      :class:`AdminLister`.
+    """
+
+    def __init__(self, resources=()):
+        self._resources = {}
+        self._by_state = {}
+        self._by_instance = {}
+        self._by_database = {}
+        self._expire_times = None
+        self._sizes = None
+        for resource in resources:
+            self.add(resource)
+
+    def __len__(self):
+        return len(self._resources)
+
+    def __iter__(self):
+        return iter(self._resources.values())
+
+    def get(self, name):
+        """Return an indexed resource by name.
+
+        :type name: str
+        :param name: the fully qualified name of the resource.
+
+        :returns: the resource, or None if it is not indexed.
+        """
+        return self._resources.get(name)
+
+    def add(self, resource):
+        """Add a resource to the index.
+
+        :param resource: a
+                         :class:`~google.cloud.spanner_admin_database_v1.types.Database`
+                         or :class:`~google.cloud.spanner_admin_database_v1.types.Backup`.
+        """
+        name = resource.name
+        if name in self._resources:
+            self.remove(name)
+        self._resources[name] = resource
+        self._by_state.setdefault(resource.state, set()).add(name)
+        self._by_instance.setdefault(_instance_name(name), set()).add(name)
+        database = getattr(resource, "database", None)
+        if database:
+            self._by_database.setdefault(database, set()).add(name)
+        # The sorted indexes are rebuilt by the next query that uses them.
+        self._expire_times = None
+        self._sizes = None
+
+    def remove(self, name):
+        """Remove a resource from the index.
+
+        :type name: str
+        :param name: the fully qualified name of the resource.
+
+        :raises KeyError: if the resource is not indexed.
+        """
+        resource = self._resources.pop(name)
+        self._by_state[resource.state].discard(name)
+        self._by_instance[_instance_name(name)].discard(name)
+        database = getattr(resource, "database", None)
+        if database:
+            self._by_database[database].discard(name)
+        self._expire_times = None
+        self._sizes = None
+
+    def query(
+        self,
+        state=None,
+        instance=None,
+        source_database=None,
+        expire_after=None,
+        expire_before=None,
+        min_size_bytes=None,
+        max_size_bytes=None,
+    ):
+        """Return the indexed resources that match all given conditions.
+
+        Resources without an expire time or size, such as databases, do not
+        match conditions on the expire time or size.
+
+        :type state: enum
+        :param state: (Optional) the state of the resources, e.g.
+                      ``Backup.State.READY``, which only matches backups.
+
+        :type instance: str
+        :param instance: (Optional) the fully qualified name of the instance
+                         of the resources.
+
+        :type source_database: str
+        :param source_database: (Optional) the fully qualified name of the
+                                source database of the backups.
+
+        :type expire_after: :class:`datetime.datetime`
+        :param expire_after: (Optional) the earliest expire time, inclusive.
+
+        :type expire_before: :class:`datetime.datetime`
+        :param expire_before: (Optional) the latest expire time, exclusive.
+
+        :type min_size_bytes: int
+        :param min_size_bytes: (Optional) the minimum size, inclusive.
+
+        :type max_size_bytes: int
+        :param max_size_bytes: (Optional) the maximum size, inclusive.
+
+        :rtype: list
+        :returns: the matching resources, ordered by name.
+        """
+        candidates = []
+        if state is not None:
+            candidates.append(self._by_state.get(state, set()))
+        if instance is not None:
+            candidates.append(self._by_instance.get(instance, set()))
+        if source_database is not None:
+            candidates.append(self._by_database.get(source_database, set()))
+        if expire_after is not None or expire_before is not None:
+            if self._expire_times is None:
+                self._expire_times = self._sorted_index("expire_time")
+            candidates.append(
+                _range(self._expire_times, expire_after, expire_before, False)
+            )
+        if min_size_bytes is not None or max_size_bytes is not None:
+            if self._sizes is None:
+                self._sizes = self._sorted_index("size_bytes")
+            candidates.append(_range(self._sizes, min_size_bytes, max_size_bytes, True))
+        if not candidates:
+            names = self._resources.keys()
+        else:
+            candidates.sort(key=len)
+            names = set(candidates[0]).intersection(*candidates[1:])
+        return [self._resources[name] for name in sorted(names)]
+
+    def _sorted_index(self, field):
+        entries = sorted(
+            (value, name)
+            for name, value in (
+                (name, getattr(resource, field, None))
+                for name, resource in self._resources.items()
+            )
+            if value is not None
+        )
+        return [value for value, _ in entries], [name for _, name in entries]
+
+
+def _range(index, lower, upper, inclusive):
+    """Return the names of the sorted index with a value in the range."""
+    values, names = index
+    start = 0 if lower is None else bisect.bisect_left(values, lower)
+    if upper is None:
+        end = len(values)
+    elif inclusive:
+        end = bisect.bisect_right(values, upper)
+    else:
+        end = bisect.bisect_left(values, upper)
+    return names[start:end]
+
+
+def _instance_name(name):
+    """Return the instance name of a database or backup name."""
+    return "/".join(name.split("/")[:4])
@@ -220,6 +220,13 @@ class Client(ClientWithProject):
     :param disable_builtin_metrics: (Optional) Default False. Set to True to disable
             the Spanner built-in metrics collection and exporting.
 
+    :type enable_local_metrics: bool
+    :param enable_local_metrics: (Optional) Default False. Set to True to record
+            attempt and operation latencies in an in-process histogram, which can
+            be inspected with :meth:`metrics_snapshot` and
+            :meth:`metrics_prometheus_text`. The histograms are shared by all
+            clients in the process.
+
     :raises: :class:`ValueError <exceptions.ValueError>` if both ``read_only``
              and ``admin`` are :data:`True`
     """
@@ -249,6 +256,7 @@ class Client(ClientWithProject):
         ca_certificate=None,
         client_certificate=None,
         client_key=None,
+        enable_local_metrics=False,
     ):
         self._emulator_host = _get_spanner_emulator_host()
         self._experimental_host = experimental_host
@@ -298,6 +306,8 @@ class Client(ClientWithProject):
             _initialize_metrics(project, credentials)
         else:
             SpannerMetricsTracerFactory(enabled=False)
+        if enable_local_metrics:
+            SpannerMetricsTracerFactory().enable_local_metrics()
         self._route_to_leader_enabled = route_to_leader_enabled
         self._directed_read_options = directed_read_options
         self._observability_options = observability_options
@@ -455,6 +465,39 @@ class Client(ClientWithProject):
         :returns: The directed_read_options for the client."""
         return self._directed_read_options
 
+    def metrics_snapshot(self):
+        """Return the client-side latency percentiles recorded so far.
+
+        Requires the client to be created with ``enable_local_metrics=True``.
+
+        :rtype: dict
+        :returns: The attempt and operation latency statistics per RPC method,
+                  database and request tag, see
+                  :meth:`~google.cloud.spanner_v1.metrics.local_metrics.LocalMetricsSink.snapshot`.
+        :raises ValueError: if local metrics are not enabled.
+        """
+        return self._local_metrics_sink().snapshot()
+
+    def metrics_prometheus_text(self):
+        """Return the client-side latencies in the Prometheus text format.
+
+        Requires the client to be created with ``enable_local_metrics=True``.
+
+        :rtype: str
+        :returns: The attempt and operation latency summaries.
+        :raises ValueError: if local metrics are not enabled.
+        """
+        return self._local_metrics_sink().to_prometheus()
+
+    def _local_metrics_sink(self):
+        sink = SpannerMetricsTracerFactory().local_sink
+        if sink is None:
+            raise ValueError(
+                "Local metrics are not enabled. "
+                "Create the client with enable_local_metrics=True."
+            )
+        return sink
+
     def copy(self):
         """Make a copy of this client.
 
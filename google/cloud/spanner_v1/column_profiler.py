@@ -0,0 +1,219 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Profiling of the columns that are fetched by reads and queries but are
+never used.
+
+Profiling is enabled for all reads and queries of the process with
+``set_column_profiler(ColumnAccessProfiler())``. Result sets then return
+:class:`~google.cloud.spanner_v1.row.Row` objects, which record the columns
+that are accessed. The profiler aggregates the accessed columns and the
+fetched bytes per request tag, or per statement if a request is not tagged,
+and :meth:`ColumnAccessProfiler.report` lists the statements that fetch
+columns that are mostly unused.
+"""
+
+from dataclasses import dataclass
+import threading
+from typing import Tuple
+
+from google.cloud.spanner_v1.types.spanner import ExecuteSqlRequest
+
+
+@dataclass
+class ColumnUsage:
+    """The columns that are fetched and accessed by a statement."""
+
+    tag: str
+    """The request tag of the statement, or its SQL text or read target if
+    the requests are not tagged."""
+
+    columns: Tuple[str, ...]
+    """The columns that are fetched."""
+
+    accessed_columns: Tuple[str, ...]
+    """The fetched columns that have been accessed in at least one row."""
+
+    unused_columns: Tuple[str, ...]
+    """The fetched columns that have never been accessed."""
+
+    result_sets: int
+    """The number of result sets of the statement."""
+
+    rows: int
+    """The number of rows of the result sets."""
+
+    fetched_bytes: int
+    """The encoded size of the values of all columns."""
+
+    wasted_bytes: int
+    """The encoded size of the values of the unused columns."""
+
+    @property
+    def accessed_fraction(self) -> float:
+        """The fraction of the fetched columns that have been accessed."""
+        if not self.columns:
+            return 1.0
+        return len(self.accessed_columns) / len(self.columns)
+
+
+class _ColumnUsageCounter(object):
+    """The aggregated column accesses of the result sets of a statement."""
+
+    __slots__ = ("tag", "names", "accessed", "result_sets", "rows", "bytes", "_lock")
+
+    def __init__(self, tag, names):
+        self.tag = tag
+        self.names = names
+        # A bit per column that has been accessed in any row. Bits are set
+        # without a lock; a bit that is lost in a race is set again by the
+        # next row in which the column is accessed.
+        self.accessed = 0
+        self.result_sets = 0
+        self.rows = 0
+        self.bytes = [0] * len(names)
+        self._lock = threading.Lock()
+
+    def add_row(self, values):
+        """Count a row of protobuf values that has not been decoded yet."""
+        sizes = [value.ByteSize() for value in values]
+        with self._lock:
+            self.rows += 1
+            column_bytes = self.bytes
+            for index, size in enumerate(sizes):
+                column_bytes[index] += size
+
+    def usage(self):
+        with self._lock:
+            column_bytes = list(self.bytes)
+            result_sets = self.result_sets
+            rows = self.rows
+        accessed = self.accessed
+        accessed_columns = []
+        unused_columns = []
+        wasted_bytes = 0
+        for index, name in enumerate(self.names):
+            if accessed >> index & 1:
+                accessed_columns.append(name)
+            else:
+                unused_columns.append(name)
+                wasted_bytes += column_bytes[index]
+        return ColumnUsage(
+            tag=self.tag,
+            columns=self.names,
+            accessed_columns=tuple(accessed_columns),
+            unused_columns=tuple(unused_columns),
+            result_sets=result_sets,
+            rows=rows,
+            fetched_bytes=sum(column_bytes),
+            wasted_bytes=wasted_bytes,
+        )
+
+
+class ColumnAccessProfiler(object):
+    """Records which fetched columns are accessed, per request tag.
+
+    The profiler is shared by all result sets of the process, see
+    :func:`set_column_profiler`. Rows of result sets that use
+    ``lazy_decode=True``, and reads that are served from a read cache, are
+    not profiled. DB-API cursors return tuples that record the columns that
+    are read from them. Rows that are converted in bulk, by
+    ``to_dict_list`` or by the Arrow and pandas fetch methods of DB-API
+    cursors, do not count as an access of their columns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def _start_result_set(self, tag, names):
+        """Return the counter of a result set with the given tag and
+        columns."""
+        names = tuple(names)
+        key = (tag, names)
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = self._counters[key] = _ColumnUsageCounter(tag, names)
+            counter.result_sets += 1
+        return counter
+
+    def report(self, max_accessed_fraction=0.5, min_rows=1):
+        """List the statements whose fetched columns are mostly unused.
+
+        :type max_accessed_fraction: float
+        :param max_accessed_fraction: (Optional) only statements for which at
+            most this fraction of the fetched columns has been accessed are
+            listed.
+
+        :type min_rows: int
+        :param min_rows: (Optional) only statements that returned at least
+            this many rows are listed.
+
+        :rtype: list of :class:`ColumnUsage`
+        :returns: the column usage of the statements, with the most wasted
+                  bytes first.
+        """
+        with self._lock:
+            counters = list(self._counters.values())
+        usages = [
+            usage
+            for usage in (counter.usage() for counter in counters)
+            if usage.rows >= min_rows
+            and usage.accessed_fraction <= max_accessed_fraction
+        ]
+        usages.sort(key=lambda usage: usage.wasted_bytes, reverse=True)
+        return usages
+
+    def reset(self):
+        """Discard the recorded column accesses."""
+        with self._lock:
+            self._counters.clear()
+
+
+_column_profiler = None
+
+
+def get_column_profiler():
+    """Return the column access profiler of the process.
+
+    :rtype: :class:`ColumnAccessProfiler`
+    :returns: the current profiler, or None if profiling is disabled.
+    """
+    return _column_profiler
+
+
+def set_column_profiler(profiler=None):
+    """Enable or disable column access profiling for all reads and queries.
+
+    :type profiler: :class:`ColumnAccessProfiler`
+    :param profiler: (Optional) the profiler to use. Disables profiling if
+                     not given.
+    """
+    global _column_profiler
+    _column_profiler = profiler
+
+
+def _column_profile_tag(request):
+    """Return the tag under which the columns of a read or query are
+    profiled."""
+    tag = request.request_options.request_tag
+    if tag:
+        return tag
+    if isinstance(request, ExecuteSqlRequest):
+        return request.sql
+    target = request.table
+    if request.index:
+        target = "%s@%s" % (target, request.index)
+    return "READ %s(%s)" % (target, ", ".join(request.columns))
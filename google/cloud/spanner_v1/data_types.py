@@ -15,13 +15,15 @@
 """Custom data types for spanner."""
 
 from dataclasses import dataclass
-import json
+import functools
 import re
 import types
 
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 from google.protobuf.message import Message
 
+from google.cloud.spanner_v1 import json_codec
+
 
 class JsonObject(dict):
     """
@@ -67,19 +69,28 @@ class JsonObject(dict):
         return super(JsonObject, self).__repr__()
 
     @classmethod
-    def from_str(cls, str_repr):
+    def from_str(cls, str_repr, lazy=None):
         """Initiate an object from its `str` representation.
 
         Args:
             str_repr (str): JSON text representation.
+            lazy (bool): (Optional) return a `LazyJsonObject` that is only
+                parsed when it is first used. Defaults to the `lazy` option
+                of the current JSON codec.
 
         Returns:
             JsonObject: JSON object.
         """
+        codec = json_codec.get_json_codec()
+        if lazy is None:
+            lazy = codec.lazy
+        if lazy and cls is JsonObject:
+            return LazyJsonObject(str_repr)
+
         if str_repr == "null":
             return cls()
 
-        return cls(json.loads(str_repr))
+        return cls(codec.loads(str_repr))
 
     def serialize(self):
         """Return the object text representation.
@@ -90,13 +101,136 @@ class JsonObject(dict):
         if self._is_null:
             return None
 
+        codec = json_codec.get_json_codec()
         if self._is_scalar_value:
-            return json.dumps(self._simple_value)
+            return codec.dumps(self._simple_value)
 
-        if self._is_array:
-            return json.dumps(self._array_value, sort_keys=True, separators=(",", ":"))
+        value = self._array_value if self._is_array else self
+        if LazyJsonObject._created and not codec.parses_lazy_objects:
+            _parse_lazy_json_objects(value)
+        return codec.dumps(value)
+
+
+# The attributes that are set by `JsonObject.__init__`.
+_JSON_OBJECT_ATTRIBUTES = frozenset(
+    ["_is_null", "_is_array", "_is_scalar_value", "_array_value", "_simple_value"]
+)
+
+
+# The key of the placeholder entry of an unparsed `LazyJsonObject`.
+_UNPARSED = object()
+
+
+def _parse_first(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._parse()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class LazyJsonObject(JsonObject):
+    """
+    A `JsonObject` that keeps the JSON text that was read from
+    Cloud Spanner, and is only parsed when it is first used. An
+    object that has not been parsed is serialized as the original
+    text, so that values which are passed through are never parsed.
+    """
+
+    # Whether any lazy object has been created in this process.
+    _created = False
+
+    def __init__(self, str_repr):
+        # `JsonObject.__init__` is called when the text is parsed.
+        self._json_text = str_repr
+        # Encoders that read the dict storage directly, such as the `json`
+        # module, skip an empty dict without calling its methods. A
+        # placeholder entry makes them call `items`, which parses the text.
+        dict.__setitem__(self, _UNPARSED, None)
+        LazyJsonObject._created = True
+
+    @property
+    def is_parsed(self):
+        """Whether the JSON text has been parsed."""
+        return "_json_text" not in self.__dict__
+
+    def _parse(self):
+        str_repr = self.__dict__.get("_json_text")
+        if str_repr is None:
+            return
+        dict.clear(self)
+        if str_repr == "null":
+            JsonObject.__init__(self)
+        else:
+            JsonObject.__init__(self, json_codec.get_json_codec().loads(str_repr))
+        del self.__dict__["_json_text"]
+
+    def __getattr__(self, name):
+        if name in _JSON_OBJECT_ATTRIBUTES and not self.is_parsed:
+            self._parse()
+            return getattr(self, name)
+        raise AttributeError(
+            "%r object has no attribute %r" % (type(self).__name__, name)
+        )
+
+    def serialize(self):
+        """Return the object text representation.
 
-        return json.dumps(self, sort_keys=True, separators=(",", ":"))
+        Returns:
+            str: JSON object text representation.
+        """
+        str_repr = self.__dict__.get("_json_text")
+        if str_repr is not None:
+            return None if str_repr == "null" else str_repr
+        return super(LazyJsonObject, self).serialize()
+
+    def __eq__(self, other):
+        self._parse()
+        if isinstance(other, LazyJsonObject):
+            other._parse()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._parse()
+        if isinstance(other, LazyJsonObject):
+            other._parse()
+        return dict.__ne__(self, other)
+
+    def __reduce__(self):
+        return (JsonObject.from_str, (self.serialize() or "null", False))
+
+    __getitem__ = _parse_first(dict.__getitem__)
+    __setitem__ = _parse_first(dict.__setitem__)
+    __delitem__ = _parse_first(dict.__delitem__)
+    __contains__ = _parse_first(dict.__contains__)
+    __iter__ = _parse_first(dict.__iter__)
+    __reversed__ = _parse_first(dict.__reversed__)
+    __len__ = _parse_first(dict.__len__)
+    __or__ = _parse_first(dict.__or__)
+    __ror__ = _parse_first(dict.__ror__)
+    __ior__ = _parse_first(dict.__ior__)
+    clear = _parse_first(dict.clear)
+    copy = _parse_first(dict.copy)
+    get = _parse_first(dict.get)
+    items = _parse_first(dict.items)
+    keys = _parse_first(dict.keys)
+    pop = _parse_first(dict.pop)
+    popitem = _parse_first(dict.popitem)
+    setdefault = _parse_first(dict.setdefault)
+    update = _parse_first(dict.update)
+    values = _parse_first(dict.values)
+
+
+def _parse_lazy_json_objects(value):
+    if isinstance(value, dict):
+        if isinstance(value, LazyJsonObject):
+            value._parse()
+        for item in value.values():
+            _parse_lazy_json_objects(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _parse_lazy_json_objects(item)
 
 
 @dataclass
@@ -245,6 +379,28 @@ class Interval:
         return cls(months=total_months, days=days, nanos=nanos)
 
 
+class _DecodeHint(object):
+    """A `column_info` value that changes how the values of a column are
+    decoded."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __repr__(self):
+        return self._name
+
+
+# Decode TIMESTAMP values as int nanoseconds since the Unix epoch and DATE
+# values as int days since the Unix epoch, instead of datetime objects, e.g.
+# `column_info={"ts": COMPACT_TEMPORAL}`. Applies to the elements of ARRAY
+# and the fields of STRUCT columns as well.
+COMPACT_TEMPORAL = _DecodeHint("COMPACT_TEMPORAL")
+
+# A `column_info` key whose value applies to all columns that have no value
+# of their own, e.g. `column_info={ALL_COLUMNS: COMPACT_TEMPORAL}`.
+ALL_COLUMNS = "*"
+
+
 def _proto_message(bytes_val, proto_message_object):
     """Helper for :func:`get_proto_message`.
     parses serialized protocol buffer bytes data into proto message.
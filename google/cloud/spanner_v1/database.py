@@ -16,6 +16,7 @@
 # This file is automatically generated by CrossSync. Do not edit manually.
 
 """User-friendly container for Cloud Spanner Database."""
+import concurrent.futures
 import copy
 import functools
 import logging
@@ -58,7 +59,7 @@ from google.cloud.spanner_v1._helpers import (
     _metadata_with_request_id,
     _metadata_with_request_id_and_req_id,
 )
-from google.cloud.spanner_v1.keyset import KeySet
+from google.cloud.spanner_v1.keyset import EncodedKeySet, KeySet
 from google.cloud.spanner_v1.merged_result_set import MergedResultSet
 from google.cloud.spanner_v1.services.spanner.client import (
     SpannerClient as SpannerClient,
@@ -82,6 +83,11 @@ from google.cloud.spanner_v1._opentelemetry_tracing import (
     trace_call,
 )
 from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.metrics.metrics_interceptor import MetricsInterceptor
+from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+    SpannerMetricsTracerFactory,
+)
+from google.cloud.spanner_v1.partition_codec import decode_partition, encode_partition
 
 from google.cloud.spanner_v1.table import Table
 
@@ -433,7 +439,14 @@ class Database(object):
             client_options = self._instance._client._client_options
             if self._instance.emulator_host is not None:
                 channel = grpc.insecure_channel(self._instance.emulator_host)
-                transport = SpannerGrpcTransport(channel=channel)
+                # Built-in metrics are not exported for the emulator, but the
+                # latencies can still be recorded in the local metrics sink.
+                metrics_interceptor = None
+                if SpannerMetricsTracerFactory().local_sink is not None:
+                    metrics_interceptor = MetricsInterceptor()
+                transport = SpannerGrpcTransport(
+                    channel=channel, metrics_interceptor=metrics_interceptor
+                )
                 self._spanner_api = SpannerClient(
                     client_info=client_info, transport=transport
                 )
@@ -900,11 +913,131 @@ class Database(object):
         :param kw:
             Passed through to
             :class:`~google.cloud.spanner_v1.snapshot.Snapshot` constructor.
+            Pass a :class:`~google.cloud.spanner_v1.read_cache.ReadCache` as
+            "read_cache" together with "max_staleness" to serve single-key
+            reads from memory while the cached rows are within the
+            staleness bound.
 
         :rtype: :class:`~google.cloud.spanner_v1.database.SnapshotCheckout`
         :returns: new wrapper"""
         return SnapshotCheckout(self, **kw)
 
+    def read_many(
+        self,
+        table,
+        columns,
+        keys,
+        index="",
+        parallelism=4,
+        key_columns=None,
+        request_options=None,
+        **kw,
+    ):
+        """Read the rows of many keys with concurrent reads.
+
+        The keys are deduplicated, sorted and split into up to
+        ``parallelism`` contiguous chunks. Every chunk is read with its own
+        ``StreamingRead`` RPC, so that the chunks can be read from different
+        splits at the same time. All chunks are read in one read-only
+        snapshot, so that they see the data at the same timestamp.
+
+        :type table: str
+        :param table: name of the table from which to fetch data.
+
+        :type columns: list of str
+        :param columns: names of columns to be retrieved.
+
+        :type keys: iterable of list of scalars
+        :param keys: the keys of the rows to be read.
+
+        :type index: str
+        :param index: (Optional) name of index to use, rather than the
+                      table's primary key.
+
+        :type parallelism: int
+        :param parallelism: (Optional) the maximum number of concurrent reads.
+
+        :type key_columns: list of str
+        :param key_columns: (Optional) the names of the columns in ``columns``
+                            that contain the key of a row. If given, the rows
+                            are returned in the order of ``keys``. Rows whose
+                            key does not compare equal to any of ``keys``,
+                            e.g. because a key value was given with another
+                            type than the value that is returned for its
+                            column, are returned after the ordered rows.
+                            Otherwise, the rows are returned in key order.
+
+        :type request_options:
+            :class:`google.cloud.spanner_v1.types.RequestOptions`
+        :param request_options:
+                (Optional) Common options for the read requests.
+
+        :type kw: dict
+        :param kw:
+            (Optional) passed through to
+            :class:`~google.cloud.spanner_v1.snapshot.Snapshot` constructor,
+            e.g. ``read_timestamp`` or ``exact_staleness``.
+
+        :rtype: list
+        :returns: the rows, as lists of column values.
+        :raises ValueError: if ``parallelism`` is smaller than 1, or if a
+                            column in ``key_columns`` is not in ``columns``.
+        """
+        if parallelism < 1:
+            raise ValueError("parallelism must be at least 1")
+        keys = [tuple(key) for key in keys]
+        key_indexes = None
+        if key_columns is not None:
+            key_indexes = [list(columns).index(column) for column in key_columns]
+        sorted_keys = EncodedKeySet.from_keys(keys).keys
+        if not sorted_keys:
+            return []
+        chunk_count = min(parallelism, len(sorted_keys))
+        chunk_size = -(-len(sorted_keys) // chunk_count)
+        chunks = [
+            sorted_keys[start : start + chunk_size]
+            for start in range(0, len(sorted_keys), chunk_size)
+        ]
+
+        with self.snapshot(multi_use=True, **kw) as snapshot:
+            if len(chunks) > 1:
+                snapshot.begin()
+
+            def read_chunk(chunk):
+                results = snapshot.read(
+                    table,
+                    columns,
+                    EncodedKeySet(keys=chunk),
+                    index=index,
+                    request_options=request_options,
+                )
+                return [row for row in results]
+
+            executor = None
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(chunks))
+            try:
+                chunk_rows = CrossSync._Sync_Impl.gather_partials(
+                    [functools.partial(read_chunk, chunk) for chunk in chunks],
+                    sync_executor=executor,
+                )
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+
+        rows = [row for rows in chunk_rows for row in rows]
+        if key_indexes is None:
+            return rows
+        rows_by_key = {}
+        for row in rows:
+            key = tuple(row[key_index] for key_index in key_indexes)
+            rows_by_key.setdefault(key, []).append(row)
+        ordered_rows = []
+        for key in dict.fromkeys(keys):
+            ordered_rows.extend(rows_by_key.pop(key, ()))
+        for unmatched_rows in rows_by_key.values():
+            ordered_rows.extend(unmatched_rows)
+        return ordered_rows
+
     def batch(
         self,
         request_options=None,
@@ -1033,6 +1166,9 @@ class Database(object):
                    the DDL option `allow_txn_exclusion` being false or unset.
                    "isolation_level" sets the isolation level for the transaction.
                    "read_lock_mode" sets the read lock mode for the transaction.
+                   "single_use_commit" if true, commits a transaction that only
+                   buffers mutations in a single Commit RPC. Such a commit is not
+                   replay-protected.
 
         :rtype: Any
         :returns: The return value of ``func``.
@@ -1514,10 +1650,13 @@ class BatchSnapshot(object):
         :type database: :class:`~google.cloud.spanner_v1.database.Database`
         :param database: database to use
 
-        :type mapping: mapping
-        :param mapping: serialized state of the instance
+        :type mapping: mapping or bytes
+        :param mapping: serialized state of the instance, as returned by
+                        :meth:`to_dict` or :meth:`to_bytes`
 
         :rtype: :class:`BatchSnapshot`"""
+        if isinstance(mapping, bytes):
+            return cls.from_bytes(database, mapping)
         instance = cls(database)
         session = instance._session = Session(database=database)
         instance._session_id = session._session_id = mapping["session_id"]
@@ -1544,6 +1683,66 @@ class BatchSnapshot(object):
             "client_context": self._client_context,
         }
 
+    @classmethod
+    def from_bytes(cls, database, data):
+        """Reconstruct an instance from the result of :meth:`to_bytes`.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database to use
+
+        :type data: bytes
+        :param data: serialized state of the instance
+
+        Unlike an instance reconstructed from :meth:`to_dict`, the instance
+        can process any number of batches.
+
+        :rtype: :class:`BatchSnapshot`"""
+        _, batch_transaction_id, client_context = decode_partition(data)
+        if batch_transaction_id is None:
+            raise ValueError("Serialized state does not contain a transaction")
+        return cls(
+            database,
+            session_id=batch_transaction_id.session_id,
+            transaction_id=batch_transaction_id.transaction_id,
+            client_context=client_context,
+        )
+
+    def to_bytes(self):
+        """Return state as compact bytes.
+
+        Unlike the result of :meth:`to_dict`, the result does not need to be
+        pickled to be shipped to other processes, and can be used to
+        reconstitute the instance with :meth:`from_bytes`.
+
+        :rtype: bytes"""
+        session = self._get_session()
+        snapshot = self._get_snapshot()
+        return encode_partition(
+            batch_transaction_id=BatchTransactionId(
+                snapshot._transaction_id,
+                session._session_id,
+                snapshot._read_timestamp,
+            ),
+            client_context=self._client_context,
+        )
+
+    def encode_batch(self, batch):
+        """Serialize a partition of this batch transaction.
+
+        The result contains the partition and the batch transaction, and can
+        be processed by :meth:`process` of any instance for the same
+        database that has not begun another batch transaction.
+
+        :type batch: dict
+        :param batch: a partition, as generated by
+                      :meth:`generate_query_batches` or
+                      :meth:`generate_read_batches`.
+
+        :rtype: bytes"""
+        return encode_partition(
+            batch, self.get_batch_transaction_id(), self._client_context
+        )
+
     def __enter__(self):
         """Begin ``with`` block."""
         return self
@@ -1590,6 +1789,22 @@ class BatchSnapshot(object):
                 self._snapshot.begin()
         return self._snapshot
 
+    def _use_batch_transaction(self, batch_transaction_id, client_context):
+        """Restore a serialized batch transaction, or check that it is the
+        batch transaction of this instance."""
+        if self._snapshot is not None:
+            transaction_id = self._snapshot._transaction_id
+        else:
+            transaction_id = self._transaction_id
+        if transaction_id is None and self._session_id is None:
+            self._session_id = batch_transaction_id.session_id
+            self._transaction_id = batch_transaction_id.transaction_id
+            if self._client_context is None:
+                self._client_context = client_context
+            return
+        if transaction_id != batch_transaction_id.transaction_id:
+            raise ValueError("Batch belongs to another batch transaction")
+
     def get_batch_transaction_id(self):
         snapshot = self._snapshot
         if snapshot is None:
@@ -1760,9 +1975,16 @@ class BatchSnapshot(object):
         query_options=None,
         data_boost_enabled=False,
         lazy_decode=False,
+        max_parallelism=0,
     ):
         """Start a partitioned query operation to get list of partitions and
-        then executes each partition on a separate thread"""
+        then executes each partition concurrently.
+
+        At most ``max_parallelism`` partitions, or 16 if it is 0, are executed
+        at the same time, on separate threads with the sync client and as
+        tasks on the event loop with the asyncio client. With the asyncio
+        client, iterate the result in an ``async with`` block, so that the
+        partitions are cancelled if the iteration stops early."""
         with trace_call(
             f"CloudSpanner.${type(self).__name__}.run_partitioned_query",
             extra_attributes=dict(sql=sql),
@@ -1779,10 +2001,26 @@ class BatchSnapshot(object):
                 data_boost_enabled,
             ):
                 partitions.append(partition)
-            return MergedResultSet(self, partitions, 0, lazy_decode=lazy_decode)
+            return MergedResultSet(
+                self, partitions, max_parallelism, lazy_decode=lazy_decode
+            )
 
     def process(self, batch):
-        """Process a single, partitioned query or read."""
+        """Process a single, partitioned query or read.
+
+        The batch may also be serialized by :meth:`encode_batch`. A serialized
+        batch is processed in its own batch transaction, which is restored
+        if this instance has not begun a batch transaction yet.
+
+        :raises ValueError: if the batch is invalid, or if it was serialized
+                            in another batch transaction than the one of this
+                            instance."""
+        if isinstance(batch, bytes):
+            batch, batch_transaction_id, client_context = decode_partition(batch)
+            if batch is None:
+                raise ValueError("Invalid batch")
+            if batch_transaction_id is not None:
+                self._use_batch_transaction(batch_transaction_id, client_context)
         if "query" in batch:
             return self.process_query_batch(batch)
         if "read" in batch:
@@ -0,0 +1,417 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched execution of DDL statements on many databases.
+
+:meth:`Database.update_ddl` starts one long-running operation, and waiting
+for its result polls that operation alone. A :class:`DdlExecutor` collects
+the DDL statements of any number of databases, applies the statements of a
+database with as few ``UpdateDatabaseDdl`` requests as possible, runs the
+schema changes of different databases at the same time, and polls all
+running operations from a single loop.
+"""
+
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass
+import datetime
+import functools
+import threading
+import time
+from typing import Optional
+
+
+@dataclass
+class DdlStatementProgress:
+    """The progress of a DDL statement of a :class:`DdlExecutor`."""
+
+    database: str
+    """The name of the database."""
+
+    statement: str
+    """The DDL statement."""
+
+    progress_percent: int
+    """The percentage of the statement that has been completed."""
+
+    commit_timestamp: Optional[datetime.datetime] = None
+    """The commit timestamp of the statement, or None if it has not been
+    committed, or if Spanner did not return it."""
+
+
+class DdlBatch(object):
+    """DDL statements that are applied to a database with a single
+    ``UpdateDatabaseDdl`` request.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: the database to apply the statements to.
+
+    :type statements: list of str
+    :param statements: the DDL statements.
+
+    :type proto_descriptors: bytes
+    :param proto_descriptors: (Optional) proto descriptors used by
+                              CREATE/ALTER PROTO BUNDLE statements.
+    """
+
+    def __init__(self, database, statements, proto_descriptors=None):
+        self.database = database
+        self.statements = list(statements)
+        self.proto_descriptors = proto_descriptors
+        self.operation = None
+        self.exception = None
+        self.skipped = False
+        self.progress = [
+            DdlStatementProgress(database.name, statement, 0)
+            for statement in self.statements
+        ]
+        self._done = False
+
+    @property
+    def done(self):
+        """Whether the batch has completed, failed or has been skipped.
+
+        :rtype: bool
+        :returns: True if the batch will not make further progress.
+        """
+        return self._done
+
+    def result(self):
+        """Raise the error of the batch, if any.
+
+        :raises: the error of the long-running operation of the batch, or
+                 :exc:`RuntimeError` if the batch was skipped or has not
+                 completed.
+        """
+        if self.exception is not None:
+            raise self.exception
+        if self.skipped:
+            raise RuntimeError("Batch was skipped after a previous batch failed.")
+        if not self._done:
+            raise RuntimeError("Batch has not completed.")
+
+
+class _PollState(object):
+    """The polling schedule of the running operation of a batch."""
+
+    __slots__ = ("queue", "interval", "next_poll", "polling")
+
+    def __init__(self, queue, interval):
+        # The batches of the database, starting with the running batch.
+        self.queue = queue
+        self.interval = interval
+        self.next_poll = time.monotonic() + interval
+        self.polling = False
+
+
+def _keep_operation(batch, future):
+    if not future.cancelled() and future.exception() is None:
+        batch.operation = future.result()
+
+
+class DdlExecutor(object):
+    """Applies DDL statements to many databases at the same time.
+
+    Statements are added per database with :meth:`add`, and are applied
+    by :meth:`run`. Consecutive statements of a database are merged into
+    one batch, which is applied with a single ``UpdateDatabaseDdl``
+    request. The batches of a database are applied in order; the batches of
+    different databases are applied at the same time.
+
+    Running operations are polled with an adaptive interval: the interval
+    starts at ``initial_poll_interval``, grows by ``poll_multiplier`` up to
+    ``max_poll_interval`` while an operation does not make progress, and is
+    reset when another statement of the operation completes.
+
+    :type max_workers: int
+    :param max_workers: (Optional) the maximum number of concurrent
+                        requests.
+
+    :type max_statements_per_batch: int
+    :param max_statements_per_batch: (Optional) the maximum number of
+                                     statements in a batch. Unlimited by
+                                     default.
+
+    :type initial_poll_interval: float
+    :param initial_poll_interval: (Optional) the first polling interval of
+                                  an operation, in seconds.
+
+    :type max_poll_interval: float
+    :param max_poll_interval: (Optional) the maximum polling interval of an
+                              operation, in seconds.
+
+    :type poll_multiplier: float
+    :param poll_multiplier: (Optional) the growth of the polling interval of
+                            an operation that did not make progress.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) called with a
+                              :class:`DdlStatementProgress` whenever the
+                              progress of a statement changes.
+    """
+
+    def __init__(
+        self,
+        max_workers=8,
+        max_statements_per_batch=None,
+        initial_poll_interval=0.5,
+        max_poll_interval=10.0,
+        poll_multiplier=1.5,
+        progress_callback=None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_statements_per_batch is not None and max_statements_per_batch < 1:
+            raise ValueError("max_statements_per_batch must be at least 1")
+        if poll_multiplier < 1:
+            raise ValueError("poll_multiplier must be at least 1")
+        self._max_workers = max_workers
+        self._max_statements_per_batch = max_statements_per_batch
+        self._initial_poll_interval = initial_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._poll_multiplier = poll_multiplier
+        self._progress_callback = progress_callback
+        self._batches = {}
+        self._lock = threading.Lock()
+
+    @property
+    def batches(self):
+        """The batches of all databases, in the order in which they are
+        applied to each database.
+
+        :rtype: list of :class:`DdlBatch`
+        :returns: the batches.
+        """
+        with self._lock:
+            return [batch for batches in self._batches.values() for batch in batches]
+
+    def add(self, database, statements, proto_descriptors=None):
+        """Add DDL statements for a database.
+
+        The statements are added to the last batch of the database that has
+        not been started, unless that batch is full or uses other proto
+        descriptors.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: the database to apply the statements to.
+
+        :type statements: Sequence[str]
+        :param statements: the DDL statements.
+
+        :type proto_descriptors: bytes
+        :param proto_descriptors: (Optional) proto descriptors used by
+                                  CREATE/ALTER PROTO BUNDLE statements.
+        """
+        limit = self._max_statements_per_batch
+        with self._lock:
+            batches = self._batches.setdefault(database.name, [])
+            for statement in statements:
+                batch = batches[-1] if batches else None
+                if (
+                    batch is None
+                    or batch.operation is not None
+                    or batch.done
+                    or (limit is not None and len(batch.statements) >= limit)
+                    or (
+                        proto_descriptors is not None
+                        and batch.proto_descriptors not in (None, proto_descriptors)
+                    )
+                ):
+                    batch = DdlBatch(database, [], proto_descriptors)
+                    batches.append(batch)
+                elif proto_descriptors is not None:
+                    batch.proto_descriptors = proto_descriptors
+                batch.statements.append(statement)
+                batch.progress.append(DdlStatementProgress(database.name, statement, 0))
+
+    def run(self, timeout=None):
+        """Apply all batches that have not been applied yet.
+
+        A batch that fails does not stop the batches of other databases, but
+        the following batches of its database are skipped.
+
+        The operations of batches that were started by a run that timed out
+        are polled again, instead of sending their statements again.
+
+        :type timeout: float
+        :param timeout: (Optional) the maximum time to wait for all batches,
+                        in seconds.
+
+        :rtype: list of :class:`DdlBatch`
+        :returns: the batches of all databases.
+
+        :raises: the error of the first batch that failed, after all other
+                 batches have completed.
+        :raises: :exc:`concurrent.futures.TimeoutError` if the batches did
+                 not complete within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            queues = [
+                deque(batch for batch in batches if not batch.done)
+                for batches in self._batches.values()
+            ]
+        # Running operations, and futures of requests that are in flight.
+        polling = {}
+        in_flight = {}
+
+        with futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+
+            def start(queue):
+                batch = queue[0]
+                if batch.operation is not None:
+                    # The batch was started by a run that timed out; resume
+                    # polling its operation instead of sending it again.
+                    in_flight[executor.submit(batch.operation.done)] = (batch, queue)
+                    return
+                future = executor.submit(
+                    batch.database.update_ddl,
+                    batch.statements,
+                    proto_descriptors=batch.proto_descriptors,
+                )
+                in_flight[future] = (batch, queue)
+
+            def finish(batch, queue, exception=None):
+                batch.exception = exception
+                batch._done = True
+                polling.pop(batch, None)
+                queue.popleft()
+                if exception is not None:
+                    for skipped in queue:
+                        skipped.skipped = True
+                        skipped._done = True
+                    queue.clear()
+                elif queue:
+                    start(queue)
+
+            def update(batch, queue, future):
+                try:
+                    if batch.operation is None:
+                        batch.operation = future.result()
+                    else:
+                        future.result()
+                    progressed = self._update_progress(batch)
+                    if not batch.operation.operation.done:
+                        state = polling.get(batch)
+                        if state is None:
+                            polling[batch] = _PollState(
+                                queue, self._initial_poll_interval
+                            )
+                            return
+                        if progressed:
+                            state.interval = self._initial_poll_interval
+                        else:
+                            state.interval = min(
+                                state.interval * self._poll_multiplier,
+                                self._max_poll_interval,
+                            )
+                        state.next_poll = time.monotonic() + state.interval
+                        state.polling = False
+                        return
+                    exception = batch.operation.exception()
+                    if exception is None:
+                        self._complete_progress(batch)
+                except Exception as exc:
+                    exception = exc
+                finish(batch, queue, exception)
+
+            for queue in queues:
+                if queue:
+                    start(queue)
+            while in_flight or polling:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    for future, (batch, _) in in_flight.items():
+                        if not future.cancel() and batch.operation is None:
+                            # The request has been sent. Keep its operation,
+                            # so that the next run polls it.
+                            future.add_done_callback(
+                                functools.partial(_keep_operation, batch)
+                            )
+                    raise futures.TimeoutError(
+                        "DDL batches did not complete within %s seconds" % timeout
+                    )
+                wakeup = deadline
+                for batch, state in polling.items():
+                    if state.polling:
+                        continue
+                    if state.next_poll <= now:
+                        state.polling = True
+                        in_flight[executor.submit(batch.operation.done)] = (
+                            batch,
+                            state.queue,
+                        )
+                    elif wakeup is None or state.next_poll < wakeup:
+                        wakeup = state.next_poll
+                completed, _ = futures.wait(
+                    in_flight,
+                    timeout=None if wakeup is None else max(wakeup - now, 0),
+                    return_when=futures.FIRST_COMPLETED,
+                )
+                for future in completed:
+                    batch, queue = in_flight.pop(future)
+                    update(batch, queue, future)
+
+        batches = self.batches
+        for batch in batches:
+            if batch.exception is not None:
+                raise batch.exception
+        return batches
+
+    def _update_progress(self, batch):
+        """Update the progress of the statements of a batch from the metadata
+        of its operation.
+
+        :rtype: bool
+        :returns: True if any statement has made progress.
+        """
+        metadata = batch.operation.metadata
+        if metadata is None:
+            return False
+        commit_timestamps = list(metadata.commit_timestamps)
+        percents = [progress.progress_percent for progress in metadata.progress]
+        progressed = False
+        for index, progress in enumerate(batch.progress):
+            commit_timestamp = (
+                commit_timestamps[index] if index < len(commit_timestamps) else None
+            )
+            percent = percents[index] if index < len(percents) else 0
+            if commit_timestamp is not None:
+                percent = 100
+            if (
+                percent != progress.progress_percent
+                or commit_timestamp != progress.commit_timestamp
+            ):
+                progress.progress_percent = percent
+                progress.commit_timestamp = commit_timestamp
+                progressed = True
+                self._report(progress)
+        return progressed
+
+    def _complete_progress(self, batch):
+        for progress in batch.progress:
+            if progress.progress_percent != 100:
+                progress.progress_percent = 100
+                self._report(progress)
+
+    def _report(self, progress):
+        if self._progress_callback is not None:
+            self._progress_callback(
+                DdlStatementProgress(
+                    progress.database,
+                    progress.statement,
+                    progress.progress_percent,
+                    progress.commit_timestamp,
+                )
+            )
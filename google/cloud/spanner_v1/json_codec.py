@@ -0,0 +1,209 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Codecs that parse and serialize the values of JSON columns.
+
+The codec is used by :class:`~google.cloud.spanner_v1.data_types.JsonObject`
+for every JSON value that is read from or written to Spanner. The standard
+library :mod:`json` module is used by default, so that the serialized values
+do not depend on the installed packages. Use :func:`set_json_codec` to select
+another codec, e.g. ``set_json_codec(fastest_json_codec())`` to use
+``orjson`` or ``ujson`` if installed, or
+``set_json_codec(JsonCodec(lazy=True))``.
+"""
+
+import json
+
+try:
+    import orjson
+
+    HAS_ORJSON_INSTALLED = True
+except ImportError:  # pragma: NO COVER
+    orjson = None
+    HAS_ORJSON_INSTALLED = False
+
+try:
+    import ujson
+
+    HAS_UJSON_INSTALLED = True
+except ImportError:  # pragma: NO COVER
+    ujson = None
+    HAS_UJSON_INSTALLED = False
+
+
+class JsonCodec(object):
+    """Parses and serializes JSON with the standard library.
+
+    :type lazy: bool
+    :param lazy: (Optional) if True, JSON values that are read from Spanner
+                 are returned as
+                 :class:`~google.cloud.spanner_v1.data_types.LazyJsonObject`,
+                 which keeps the JSON text and is only parsed when it is
+                 first used.
+    """
+
+    name = "json"
+
+    # Whether `dumps` parses nested lazy JSON objects itself. Otherwise, they
+    # are parsed before they are serialized, as the encoder would read their
+    # contents without calling their methods.
+    parses_lazy_objects = False
+
+    def __init__(self, lazy=False):
+        self.lazy = lazy
+
+    def loads(self, text):
+        """Parse a JSON text.
+
+        :type text: str
+        :param text: the JSON text.
+
+        :rtype: object
+        :returns: the parsed value.
+        """
+        return json.loads(text)
+
+    def dumps(self, value):
+        """Serialize a value to compact JSON with sorted keys.
+
+        :type value: object
+        :param value: the value to serialize.
+
+        :rtype: str
+        :returns: the JSON text.
+        """
+        return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+    def __repr__(self):
+        return "%s(lazy=%r)" % (type(self).__name__, self.lazy)
+
+
+class OrjsonCodec(JsonCodec):
+    """Parses and serializes JSON with ``orjson``.
+
+    Integers that do not fit in 64 bits are parsed as floats, which is how
+    Spanner stores them in JSON values. Values that ``orjson`` cannot
+    serialize are serialized by the standard library. Non-ASCII characters
+    are serialized as UTF-8 instead of escape sequences, and NaN and infinity
+    are serialized as ``null``.
+
+    :raises ImportError: if ``orjson`` is not installed.
+    """
+
+    name = "orjson"
+    parses_lazy_objects = True
+
+    def __init__(self, lazy=False):
+        if not HAS_ORJSON_INSTALLED:
+            raise ImportError("orjson is not installed")
+        super(OrjsonCodec, self).__init__(lazy=lazy)
+
+    def loads(self, text):
+        return orjson.loads(text)
+
+    def dumps(self, value):
+        try:
+            return orjson.dumps(
+                value,
+                default=_orjson_default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return super(OrjsonCodec, self).dumps(value)
+
+
+class UjsonCodec(JsonCodec):
+    """Parses and serializes JSON with ``ujson``.
+
+    Values that ``ujson`` does not support are handled by the standard
+    library.
+
+    :raises ImportError: if ``ujson`` is not installed.
+    """
+
+    name = "ujson"
+
+    def __init__(self, lazy=False):
+        if not HAS_UJSON_INSTALLED:
+            raise ImportError("ujson is not installed")
+        super(UjsonCodec, self).__init__(lazy=lazy)
+
+    def loads(self, text):
+        try:
+            return ujson.loads(text)
+        except (ValueError, OverflowError):
+            return super(UjsonCodec, self).loads(text)
+
+    def dumps(self, value):
+        try:
+            return ujson.dumps(value, sort_keys=True, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return super(UjsonCodec, self).dumps(value)
+
+
+def fastest_json_codec(lazy=False):
+    """Return the fastest installed JSON codec.
+
+    The codecs of ``orjson`` and ``ujson`` do not serialize all values
+    exactly like the standard library, see :class:`OrjsonCodec`.
+
+    :type lazy: bool
+    :param lazy: (Optional) whether JSON values are parsed lazily.
+
+    :rtype: :class:`JsonCodec`
+    :returns: an ``orjson`` or ``ujson`` codec if installed, or the standard
+              library codec.
+    """
+    if HAS_ORJSON_INSTALLED:
+        return OrjsonCodec(lazy=lazy)
+    if HAS_UJSON_INSTALLED:
+        return UjsonCodec(lazy=lazy)
+    return JsonCodec(lazy=lazy)
+
+
+_json_codec = JsonCodec()
+
+
+def get_json_codec():
+    """Return the JSON codec that is used for JSON values.
+
+    :rtype: :class:`JsonCodec`
+    :returns: the current codec.
+    """
+    return _json_codec
+
+
+def set_json_codec(codec=None):
+    """Set the JSON codec that is used for JSON values.
+
+    :type codec: :class:`JsonCodec`
+    :param codec: (Optional) the codec to use. Restores the standard library
+                  codec if not given.
+    """
+    global _json_codec
+    _json_codec = codec if codec is not None else JsonCodec()
+
+
+def _orjson_default(value):
+    # Subclasses are passed to this function, so that lazy JSON objects are
+    # parsed by their own methods.
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, int):
+        return int(value)
+    raise TypeError("Type is not JSON serializable: %s" % type(value).__name__)
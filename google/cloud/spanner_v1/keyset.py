@@ -14,7 +14,13 @@
 
 """Wrap representation of Spanner keys / ranges."""
 
-from google.cloud.spanner_v1._helpers import _make_list_value_pb, _make_list_value_pbs
+from google.protobuf import json_format
+
+from google.cloud.spanner_v1._helpers import (
+    _make_list_value_pb,
+    _make_list_value_pbs,
+    _make_value_pb,
+)
 from google.cloud.spanner_v1.types.keys import KeyRange as KeyRangePB
 from google.cloud.spanner_v1.types.keys import KeySet as KeySetPB
 
@@ -182,6 +188,11 @@ class KeySet(object):
         :type mapping: dict
         :param mapping: the instance state.
         """
+        if "encoded" in mapping:
+            return EncodedKeySet._from_encoded(
+                mapping["encoded"], mapping.get("int_positions", ())
+            )
+
         if mapping.get("all"):
             return cls(all_=True)
 
@@ -189,3 +200,240 @@ class KeySet(object):
         ranges = [KeyRange(**r_mapping) for r_mapping in r_mappings]
 
         return cls(keys=mapping.get("keys", ()), ranges=ranges)
+
+
+class EncodedKeySet(KeySet):
+    """Key set whose protobuf is encoded once, for reads of many keys.
+
+    The protobuf is built on the first read, and is reused by all reads and
+    partitions of the key set. Batches of partitioned reads carry the
+    serialized protobuf instead of the list of keys, so that processing a
+    batch does not copy and encode all keys again.
+
+    Use :meth:`from_keys` or :meth:`from_columns` to deduplicate and sort the
+    keys, and optionally to replace runs of consecutive integer keys with
+    key ranges.
+
+    :type keys: list of list of scalars
+    :param keys: keys identifying individual rows within a table.
+
+    :type ranges: list of :class:`KeyRange`
+    :param ranges: ranges identifying rows within a table.
+
+    :type all_: boolean
+    :param all_: if True, identify all rows within a table
+    """
+
+    def __init__(self, keys=(), ranges=(), all_=False):
+        super(EncodedKeySet, self).__init__(keys=keys, ranges=ranges, all_=all_)
+        self._pb = None
+        # The positions of the key values that are integers. Integers are
+        # encoded as strings, and are decoded as integers again.
+        self._int_positions = ()
+
+    @classmethod
+    def from_keys(cls, keys, sort=True, coalesce=False):
+        """Create a key set from keys, removing duplicate keys.
+
+        :type keys: iterable of list of scalars
+        :param keys: keys identifying individual rows within a table.
+
+        :type sort: bool
+        :param sort: sort the keys. Keys whose values cannot be compared with
+                     each other, e.g. keys with NULL values, are not sorted.
+
+        :type coalesce: bool
+        :param coalesce: replace runs of sorted keys that only differ by one
+                         in their last value, which must be an integer, with
+                         a closed key range. This is only correct if the last
+                         column of the key is an ``INT64`` column in
+                         ascending order.
+
+        :rtype: :class:`EncodedKeySet`
+        :returns: the key set.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        if sort or coalesce:
+            try:
+                keys = sorted(keys)
+            except TypeError:
+                sort = coalesce = False
+        ranges = []
+        if coalesce:
+            keys, ranges = _coalesce_keys(keys)
+        return cls(keys=[list(key) for key in keys], ranges=ranges)
+
+    @classmethod
+    def from_columns(cls, *columns, sort=True, coalesce=False):
+        """Create a key set from one sequence of values per key column.
+
+        The columns can be lists, NumPy arrays, pandas series or Arrow
+        arrays.
+
+        :type columns: tuple of sequences
+        :param columns: the values of the key columns, one sequence per
+                        column, in the order of the key columns.
+
+        :type sort: bool
+        :param sort: sort the keys, see :meth:`from_keys`.
+
+        :type coalesce: bool
+        :param coalesce: replace runs of consecutive integer keys with key
+                         ranges, see :meth:`from_keys`.
+
+        :rtype: :class:`EncodedKeySet`
+        :returns: the key set.
+        :raises ValueError: if the columns have different lengths.
+        """
+        if not columns:
+            raise ValueError("At least one key column is required.")
+        values = [_column_to_list(column) for column in columns]
+        if len({len(column) for column in values}) > 1:
+            raise ValueError("Key columns must have the same length.")
+        return cls.from_keys(zip(*values), sort=sort, coalesce=coalesce)
+
+    def _to_pb(self):
+        """Return the KeySet protobuf, encoding it on the first call.
+
+        :rtype: :class:`~google.cloud.spanner_v1.types.KeySet`
+        :returns: protobuf corresponding to this instance.
+        """
+        if self._pb is None:
+            keyset_pb = KeySetPB.pb()()
+            if self.all_:
+                keyset_pb.all_ = True
+            int_positions = set()
+            other_positions = set()
+            for key in self.keys:
+                _encode_key(keyset_pb.keys.add(), key, int_positions, other_positions)
+            for keyrange in self.ranges:
+                keyset_pb.ranges.append(KeyRangePB.pb(keyrange._to_pb()))
+                for key in keyrange._to_dict().values():
+                    _add_value_positions(key, int_positions, other_positions)
+            self._int_positions = tuple(sorted(int_positions - other_positions))
+            self._pb = KeySetPB.wrap(keyset_pb)
+        return self._pb
+
+    def _to_dict(self):
+        """Return the state of the keyset as a dict.
+
+        The state contains the serialized protobuf of the keyset, and the
+        positions of the key values that are integers.
+
+        :rtype: dict
+        :returns: state of this instance.
+        """
+        encoded = KeySetPB.serialize(self._to_pb())
+        if not self._int_positions:
+            return {"encoded": encoded}
+        return {"encoded": encoded, "int_positions": list(self._int_positions)}
+
+    @classmethod
+    def _from_encoded(cls, data, int_positions=()):
+        """Create an instance from a serialized KeySet protobuf.
+
+        The keys and ranges are only decoded when they are accessed. The
+        key values at ``int_positions`` are decoded as integers.
+        """
+        keyset = cls.__new__(cls)
+        keyset._pb = KeySetPB.deserialize(data)
+        keyset._int_positions = tuple(int_positions)
+        keyset.all_ = keyset._pb.all_
+        return keyset
+
+    def __getattr__(self, name):
+        # Decodes the keys and ranges of an instance that was created from
+        # a serialized protobuf.
+        if name == "keys":
+            self.keys = [
+                _list_value_pb_to_list(key, self._int_positions)
+                for key in self._pb._pb.keys
+            ]
+            return self.keys
+        if name == "ranges":
+            self.ranges = [
+                KeyRange(
+                    **{
+                        field.name: _list_value_pb_to_list(value, self._int_positions)
+                        for field, value in keyrange.ListFields()
+                    }
+                )
+                for keyrange in self._pb._pb.ranges
+            ]
+            return self.ranges
+        raise AttributeError(name)
+
+
+def _encode_key(list_value_pb, key, int_positions, other_positions):
+    """Append the values of a key to a ListValue protobuf, and record the
+    positions of its integer and other non-NULL values."""
+    values = list_value_pb.values
+    for position, value in enumerate(key):
+        value_type = type(value)
+        # Integer and string values are by far the most common key values.
+        if value_type is int:
+            values.add(string_value=str(value))
+            int_positions.add(position)
+        elif value_type is str:
+            values.add(string_value=value)
+            other_positions.add(position)
+        else:
+            values.append(_make_value_pb(value))
+            if value is not None:
+                other_positions.add(position)
+
+
+def _add_value_positions(key, int_positions, other_positions):
+    """Record the positions of the integer and other non-NULL values of a
+    key."""
+    for position, value in enumerate(key):
+        if type(value) is int:
+            int_positions.add(position)
+        elif value is not None:
+            other_positions.add(position)
+
+
+def _list_value_pb_to_list(list_value_pb, int_positions=()):
+    values = json_format.MessageToDict(list_value_pb)
+    for position in int_positions:
+        if position < len(values) and isinstance(values[position], str):
+            values[position] = int(values[position])
+    return values
+
+
+def _column_to_list(column):
+    """Convert a column of key values to a list of Python scalars."""
+    if hasattr(column, "to_pylist"):  # Arrow arrays
+        return column.to_pylist()
+    if hasattr(column, "tolist"):  # NumPy arrays and pandas series
+        return column.tolist()
+    return list(column)
+
+
+def _coalesce_keys(keys):
+    """Split sorted keys into single keys and runs of consecutive keys."""
+    single_keys = []
+    ranges = []
+
+    def add_run(run):
+        if len(run) > 1:
+            ranges.append(KeyRange(start_closed=list(run[0]), end_closed=list(run[-1])))
+        else:
+            single_keys.extend(run)
+
+    run = []
+    for key in keys:
+        last = key[-1] if key else None
+        if (
+            run
+            and type(last) is int
+            and type(run[-1][-1]) is int
+            and key[:-1] == run[-1][:-1]
+            and last == run[-1][-1] + 1
+        ):
+            run.append(key)
+            continue
+        add_run(run)
+        run = [key]
+    add_run(run)
+    return single_keys, ranges
@@ -0,0 +1,476 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module provides an in-process sink for client-side latency metrics.
+
+The built-in metrics are exported to Cloud Monitoring, which is not always
+available, e.g. in benchmarks, local development or when running against the
+emulator. The LocalMetricsSink keeps a log-linear latency histogram for every
+combination of RPC method, database and request tag, so that latency
+percentiles can be inspected from within the application. It also counts
+the RPCs that are needed per read/write transaction.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+"""The percentiles that are included in a snapshot by default."""
+
+DEFAULT_MAX_REQUEST_TAGS = 1000
+"""The maximum number of distinct request tags that are tracked."""
+
+OTHER_REQUEST_TAG = "__other__"
+"""The request tag that is used once the request tag limit has been reached."""
+
+PROMETHEUS_ATTEMPT_LATENCY = "spanner_client_attempt_latency_ms"
+PROMETHEUS_OPERATION_LATENCY = "spanner_client_operation_latency_ms"
+PROMETHEUS_RETRY_COUNT = "spanner_client_retries_total"
+PROMETHEUS_TRANSACTION_COUNT = "spanner_client_transactions_total"
+PROMETHEUS_TRANSACTION_RPC_COUNT = "spanner_client_transaction_rpcs_total"
+
+_DIMENSIONS = ("method", "database", "request_tag")
+_TRANSACTION_DIMENSIONS = ("database", "transaction_tag")
+
+
+class LatencyHistogram:
+    """A histogram of latencies with a bounded relative error.
+
+    Latencies are recorded in microseconds into log-linear buckets: every
+    power of two is split into ``2 ** (significant_bits - 1)`` equally sized
+    sub-buckets, similar to an HDR histogram. The relative error of a
+    percentile is therefore at most ``2 ** -(significant_bits - 1)``, while
+    the memory used only grows with the logarithm of the recorded range.
+    """
+
+    def __init__(self, significant_bits: int = 7):
+        """Initialize an empty histogram.
+
+        Args:
+            significant_bits (int): The number of significant bits that are
+                kept for every recorded value. Defaults to 7, which gives a
+                relative error of less than 1.6%.
+        """
+        if significant_bits < 1:
+            raise ValueError("significant_bits must be positive")
+        self._significant_bits = significant_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket_index(self, micros: int) -> int:
+        bits = self._significant_bits
+        if micros < (1 << bits):
+            return micros
+        shift = micros.bit_length() - bits
+        return (shift << bits) + (micros >> shift)
+
+    def _bucket_upper_bound(self, index: int) -> int:
+        bits = self._significant_bits
+        if index < (1 << bits):
+            return index
+        shift = index >> bits
+        sub_bucket = index & ((1 << bits) - 1)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, latency_ms: float) -> None:
+        """Record a single latency.
+
+        Args:
+            latency_ms (float): The latency in milliseconds.
+        """
+        latency_ms = max(latency_ms, 0.0)
+        index = self._bucket_index(int(round(latency_ms * 1000)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += latency_ms
+        self.min = min(self.min, latency_ms)
+        self.max = max(self.max, latency_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add all values of another histogram to this histogram.
+
+        Args:
+            other (LatencyHistogram): A histogram with the same number of
+                significant bits.
+        """
+        if other._significant_bits != self._significant_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Return the latency at the given percentile.
+
+        Args:
+            percentile (float): A percentile between 0 and 100.
+
+        Returns:
+            float: The latency in milliseconds, or 0.0 if the histogram is empty.
+        """
+        if not 0.0 <= percentile <= 100.0:
+            raise ValueError("percentile must be between 0 and 100")
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100.0))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                value = self._bucket_upper_bound(index) / 1000.0
+                return min(max(value, self.min), self.max)
+        return self.max  # pragma: NO COVER
+
+    def stats(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """Return the summary statistics of this histogram.
+
+        Args:
+            percentiles (Iterable[float]): The percentiles to include.
+
+        Returns:
+            dict: The count, sum, min, max and mean latency, and a
+            ``p<percentile>`` entry for every requested percentile. All
+            latencies are in milliseconds.
+        """
+        result = {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+        }
+        for percentile in percentiles:
+            result[_percentile_key(percentile)] = self.percentile(percentile)
+        return result
+
+
+class LocalMetricsSink:
+    """An in-process, thread-safe store of client-side latencies.
+
+    The sink records attempt and operation latencies per RPC method, database
+    and request tag, and the number of RPCs per transaction by database and
+    transaction tag. Use :meth:`snapshot` to get the latency percentiles, or
+    :meth:`to_prometheus` to get them in the Prometheus text format.
+    """
+
+    def __init__(
+        self,
+        significant_bits: int = 7,
+        max_request_tags: int = DEFAULT_MAX_REQUEST_TAGS,
+    ):
+        """Initialize an empty sink.
+
+        Args:
+            significant_bits (int): The precision of the histograms, see
+                :class:`LatencyHistogram`.
+            max_request_tags (int): The maximum number of distinct request
+                tags. Latencies of any further request tags are recorded
+                under ``__other__`` to bound the memory usage.
+        """
+        self._significant_bits = significant_bits
+        self._max_request_tags = max_request_tags
+        self._lock = threading.Lock()
+        self._attempts: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._operations: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._operation_counts: Dict[Tuple[str, str, str], Dict[str, int]] = {}
+        self._transactions: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._request_tags = set()
+        self._transaction_tags = set()
+
+    def _key(self, method, database, request_tag) -> Tuple[str, str, str]:
+        request_tag = request_tag or ""
+        if request_tag and request_tag not in self._request_tags:
+            if len(self._request_tags) >= self._max_request_tags:
+                request_tag = OTHER_REQUEST_TAG
+            else:
+                self._request_tags.add(request_tag)
+        return (method or "", database or "", request_tag)
+
+    def _histogram(self, histograms, key) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram(self._significant_bits)
+        return histogram
+
+    def record_attempt(
+        self,
+        method: str,
+        database: str,
+        request_tag: Optional[str],
+        latency_ms: float,
+    ) -> None:
+        """Record the latency of a single RPC attempt.
+
+        Args:
+            method (str): The RPC method, e.g. ``Spanner.ExecuteStreamingSql``.
+            database (str): The database ID.
+            request_tag (str): The request tag of the RPC, if any.
+            latency_ms (float): The latency of the attempt in milliseconds.
+        """
+        with self._lock:
+            key = self._key(method, database, request_tag)
+            self._histogram(self._attempts, key).record(latency_ms)
+
+    def record_operation(
+        self,
+        method: str,
+        database: str,
+        request_tag: Optional[str],
+        latency_ms: float,
+        attempt_count: int,
+        retry_count: int = 0,
+    ) -> None:
+        """Record the latency of an operation, including all its retries.
+
+        Args:
+            method (str): The RPC method, e.g. ``Spanner.ExecuteStreamingSql``.
+            database (str): The database ID.
+            request_tag (str): The request tag of the operation, if any.
+            latency_ms (float): The latency of the operation in milliseconds.
+            attempt_count (int): The number of attempts of the operation.
+            retry_count (int): The number of client-side retries of the operation.
+        """
+        with self._lock:
+            key = self._key(method, database, request_tag)
+            self._histogram(self._operations, key).record(latency_ms)
+            counts = self._operation_counts.setdefault(
+                key, {"attempt_count": 0, "retry_count": 0}
+            )
+            counts["attempt_count"] += attempt_count
+            counts["retry_count"] += retry_count
+
+    def record_transaction(
+        self,
+        database: str,
+        transaction_tag: Optional[str],
+        rpc_count: int,
+        attempt_count: int = 1,
+    ) -> None:
+        """Record the number of RPCs of a read/write transaction.
+
+        Args:
+            database (str): The database ID.
+            transaction_tag (str): The transaction tag, if any.
+            rpc_count (int): The number of RPCs of the transaction, including
+                the RPCs of all attempts and client-side retries.
+            attempt_count (int): The number of attempts of the transaction.
+        """
+        with self._lock:
+            transaction_tag = transaction_tag or ""
+            if transaction_tag and transaction_tag not in self._transaction_tags:
+                if len(self._transaction_tags) >= self._max_request_tags:
+                    transaction_tag = OTHER_REQUEST_TAG
+                else:
+                    self._transaction_tags.add(transaction_tag)
+            counts = self._transactions.setdefault(
+                (database or "", transaction_tag),
+                {"count": 0, "rpc_count": 0, "attempt_count": 0, "max_rpc_count": 0},
+            )
+            counts["count"] += 1
+            counts["rpc_count"] += rpc_count
+            counts["attempt_count"] += attempt_count
+            counts["max_rpc_count"] = max(counts["max_rpc_count"], rpc_count)
+
+    def reset(self) -> None:
+        """Remove all recorded latencies and transactions."""
+        with self._lock:
+            self._attempts.clear()
+            self._operations.clear()
+            self._operation_counts.clear()
+            self._transactions.clear()
+            self._request_tags.clear()
+            self._transaction_tags.clear()
+
+    def snapshot(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """Return the latency statistics that have been recorded so far.
+
+        Args:
+            percentiles (Iterable[float]): The percentiles to include.
+
+        Returns:
+            dict: A dictionary with the keys ``attempt_latencies`` and
+            ``operation_latencies``. Each of them maps the dimensions
+            ``method``, ``database`` and ``request_tag`` to a dictionary of
+            dimension values and their statistics, see
+            :meth:`LatencyHistogram.stats`. Operation statistics also
+            contain the total ``attempt_count`` and ``retry_count``. Recordings without a
+            request tag are not included in the ``request_tag`` dimension.
+            The ``transactions`` key maps the dimensions ``database`` and
+            ``transaction_tag`` to the number of transactions, their total
+            and maximum number of RPCs and attempts, and the mean number of
+            ``rpcs_per_transaction``.
+        """
+        percentiles = tuple(percentiles)
+        with self._lock:
+            return {
+                "attempt_latencies": self._aggregate(self._attempts, None, percentiles),
+                "operation_latencies": self._aggregate(
+                    self._operations, self._operation_counts, percentiles
+                ),
+                "transactions": self._aggregate_transactions(),
+            }
+
+    def _aggregate_transactions(self) -> dict:
+        result = {}
+        for position, dimension in enumerate(_TRANSACTION_DIMENSIONS):
+            totals: Dict[str, Dict[str, int]] = {}
+            for key, counts in self._transactions.items():
+                value = key[position]
+                if dimension == "transaction_tag" and not value:
+                    continue
+                total = totals.setdefault(
+                    value,
+                    {
+                        "count": 0,
+                        "rpc_count": 0,
+                        "attempt_count": 0,
+                        "max_rpc_count": 0,
+                    },
+                )
+                for name in ("count", "rpc_count", "attempt_count"):
+                    total[name] += counts[name]
+                total["max_rpc_count"] = max(
+                    total["max_rpc_count"], counts["max_rpc_count"]
+                )
+            for total in totals.values():
+                total["rpcs_per_transaction"] = total["rpc_count"] / total["count"]
+            result[dimension] = totals
+        return result
+
+    def _aggregate(self, histograms, counts, percentiles) -> dict:
+        result = {}
+        for position, dimension in enumerate(_DIMENSIONS):
+            merged: Dict[str, LatencyHistogram] = {}
+            totals: Dict[str, Dict[str, int]] = {}
+            for key, histogram in histograms.items():
+                value = key[position]
+                if dimension == "request_tag" and not value:
+                    continue
+                if value not in merged:
+                    merged[value] = LatencyHistogram(self._significant_bits)
+                merged[value].merge(histogram)
+                if counts is not None:
+                    total = totals.setdefault(value, {})
+                    for name, count in counts.get(key, {}).items():
+                        total[name] = total.get(name, 0) + count
+            result[dimension] = {}
+            for value, histogram in merged.items():
+                stats = histogram.stats(percentiles)
+                if counts is not None:
+                    stats.update(totals[value])
+                result[dimension][value] = stats
+        return result
+
+    def to_prometheus(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> str:
+        """Return the recorded latencies in the Prometheus text format.
+
+        Every combination of method, database and request tag is exported as
+        a summary with one sample per percentile.
+
+        Args:
+            percentiles (Iterable[float]): The quantiles to export.
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        percentiles = tuple(percentiles)
+        lines = []
+        with self._lock:
+            for name, description, histograms in (
+                (
+                    PROMETHEUS_ATTEMPT_LATENCY,
+                    "Latency of individual Spanner RPC attempts.",
+                    self._attempts,
+                ),
+                (
+                    PROMETHEUS_OPERATION_LATENCY,
+                    "Latency of Spanner operations, including retries.",
+                    self._operations,
+                ),
+            ):
+                lines.append("# HELP %s %s" % (name, description))
+                lines.append("# TYPE %s summary" % name)
+                for key in sorted(histograms):
+                    histogram = histograms[key]
+                    labels = _format_labels(key)
+                    for percentile in percentiles:
+                        lines.append(
+                            '%s{%s,quantile="%s"} %s'
+                            % (
+                                name,
+                                labels,
+                                "%g" % (percentile / 100.0),
+                                repr(histogram.percentile(percentile)),
+                            )
+                        )
+                    lines.append("%s_sum{%s} %r" % (name, labels, histogram.sum))
+                    lines.append("%s_count{%s} %d" % (name, labels, histogram.count))
+            name = PROMETHEUS_RETRY_COUNT
+            lines.append("# HELP %s Number of client-side retries." % name)
+            lines.append("# TYPE %s counter" % name)
+            for key in sorted(self._operation_counts):
+                lines.append(
+                    "%s{%s} %d"
+                    % (
+                        name,
+                        _format_labels(key),
+                        self._operation_counts[key]["retry_count"],
+                    )
+                )
+            for name, description, counter in (
+                (
+                    PROMETHEUS_TRANSACTION_COUNT,
+                    "Number of read/write transactions.",
+                    "count",
+                ),
+                (
+                    PROMETHEUS_TRANSACTION_RPC_COUNT,
+                    "Number of RPCs of read/write transactions.",
+                    "rpc_count",
+                ),
+            ):
+                lines.append("# HELP %s %s" % (name, description))
+                lines.append("# TYPE %s counter" % name)
+                for key in sorted(self._transactions):
+                    lines.append(
+                        "%s{%s} %d"
+                        % (
+                            name,
+                            _format_labels(key, _TRANSACTION_DIMENSIONS),
+                            self._transactions[key][counter],
+                        )
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def _percentile_key(percentile: float) -> str:
+    return "p" + ("%g" % percentile).replace(".", "")
+
+
+def _format_labels(key: Tuple[str, ...], dimensions=_DIMENSIONS) -> str:
+    return ",".join(
+        '%s="%s"' % (dimension, _escape_label_value(value))
+        for dimension, value in zip(dimensions, key)
+    )
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
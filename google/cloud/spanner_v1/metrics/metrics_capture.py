@@ -43,6 +43,27 @@ class MetricsCapture:
         """
         self._resource_info = resource_info
 
+    @staticmethod
+    def _get_factory():
+        # Reading the singleton directly avoids going through
+        # SpannerMetricsTracerFactory.__new__ on every operation.
+        factory = SpannerMetricsTracerFactory._metrics_tracer_factory
+        if factory is None:
+            factory = SpannerMetricsTracerFactory()
+        return factory
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether built-in metrics are currently enabled.
+
+        Callers can use this to skip creating a MetricsCapture altogether when
+        metrics are disabled.
+
+        Returns:
+            bool: True if metrics are recorded for new operations.
+        """
+        return MetricsCapture._get_factory().recording_enabled
+
     def __enter__(self):
         """Enter the runtime context related to this object.
 
@@ -53,8 +74,8 @@ class MetricsCapture:
             MetricsCapture: The instance of the context manager.
         """
         # Short circuit out if metrics are disabled
-        factory = SpannerMetricsTracerFactory()
-        if not factory.enabled:
+        factory = self._get_factory()
+        if not factory.recording_enabled:
             return self
 
         # Define a new metrics tracer for the new operation
@@ -69,6 +90,11 @@ class MetricsCapture:
             if "database" in self._resource_info:
                 tracer.set_database(self._resource_info["database"])
 
+        # Nested operations inherit the request tag of the enclosing operation
+        parent = SpannerMetricsTracerFactory.get_current_tracer()
+        if tracer and parent:
+            tracer.set_request_tag(parent.request_tag)
+
         self._token = SpannerMetricsTracerFactory.set_current_tracer(tracer)
         if tracer:
             tracer.record_operation_start()
@@ -89,7 +115,7 @@ class MetricsCapture:
             bool: False to propagate the exception if any occurred.
         """
         # Short circuit out if metrics are disable
-        if not SpannerMetricsTracerFactory().enabled:
+        if not self._get_factory().recording_enabled:
             return False
 
         tracer = SpannerMetricsTracerFactory.get_current_tracer()
@@ -100,3 +126,47 @@ class MetricsCapture:
         if getattr(self, "_token", None):
             SpannerMetricsTracerFactory.reset_current_tracer(self._token)
         return False  # Propagate the exception if any
+
+
+class TransactionMetricsCapture:
+    """Context manager for counting the RPCs of a read/write transaction.
+
+    The RPCs of all transactions that are added with :meth:`add_transaction`
+    are recorded as one transaction in the local metrics sink when the
+    context exits, so that the retries of a transaction after it was aborted
+    are counted as part of the same transaction. Nothing is recorded if
+    local metrics are not enabled.
+    """
+
+    def __init__(self, resource_info: dict = None, transaction_tag: str = None):
+        """Initialize the context manager.
+
+        Args:
+            resource_info (dict): Optional dictionary containing project, instance and database info.
+            transaction_tag (str): Optional transaction tag of the transaction.
+        """
+        self._resource_info = resource_info or {}
+        self._transaction_tag = transaction_tag
+        self._transactions = []
+
+    def add_transaction(self, transaction) -> None:
+        """Add an attempt of the transaction.
+
+        Args:
+            transaction: The transaction that is used for the attempt.
+        """
+        self._transactions.append(transaction)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        sink = MetricsCapture._get_factory().local_sink
+        if sink is not None and self._transactions:
+            sink.record_transaction(
+                self._resource_info.get("database"),
+                self._transaction_tag,
+                sum(txn._rpc_count.value for txn in self._transactions),
+                len(self._transactions),
+            )
+        return False  # Propagate the exception if any
@@ -120,7 +120,7 @@ class MetricsInterceptor(ClientInterceptor):
         """
         factory = SpannerMetricsTracerFactory()
         tracer = SpannerMetricsTracerFactory.get_current_tracer()
-        if tracer is None or not factory.enabled:
+        if tracer is None or not factory.recording_enabled:
             return invoked_method(request_or_iterator, call_details)
 
         # Setup Metric Tracer attributes from call details
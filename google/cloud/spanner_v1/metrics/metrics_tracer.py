@@ -20,7 +20,7 @@ while the helper classes provide additional functionality and context for the me
 """
 
 from datetime import datetime
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 from grpc import StatusCode
 
@@ -38,6 +38,9 @@ from .constants import (
     MONITORED_RES_LABEL_KEY_PROJECT,
 )
 
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .local_metrics import LocalMetricsSink
+
 try:
     from opentelemetry.metrics import Counter, Histogram
 
@@ -86,6 +89,7 @@ class MetricOpTracer:
     """
 
     _attempt_count: int
+    _retry_count: int
     _start_time: datetime
     _current_attempt: MetricAttemptTracer
     status: str
@@ -104,6 +108,7 @@ class MetricOpTracer:
             instrument_operation_counter (Counter): The instrumentation for counting operations.
         """
         self._attempt_count = 0
+        self._retry_count = 0
         self._start_time = datetime.now()
         self._current_attempt = None
         self.status = ""
@@ -120,6 +125,19 @@ class MetricOpTracer:
         """
         return self._attempt_count
 
+    @property
+    def retry_count(self):
+        """
+        Getter method for the retry_count property.
+
+        This method returns the number of client-side retries of the metric operation, e.g. after an aborted
+        commit or a resumed stream. Retries that are performed by the generated API layer are only counted as attempts.
+
+        Returns:
+            int: The current count of retries.
+        """
+        return self._retry_count
+
     @property
     def current_attempt(self):
         """
@@ -152,6 +170,12 @@ class MetricOpTracer:
         """
         self._attempt_count += 1
 
+    def increment_retry_count(self):
+        """
+        Increments the retry count by 1.
+        """
+        self._retry_count += 1
+
     def start(self):
         """
         Set the start time of the metric operation to the current time.
@@ -187,7 +211,9 @@ class MetricsTracer:
     current_op: MetricOpTracer
     enabled: bool
     gfe_enabled: bool
+    local_sink: "LocalMetricsSink"
     method: str
+    request_tag: str
 
     def __init__(
         self,
@@ -198,6 +224,7 @@ class MetricsTracer:
         instrument_operation_counter: "Counter",
         client_attributes: Dict[str, str],
         gfe_enabled: bool = False,
+        local_sink: "LocalMetricsSink" = None,
     ):
         """
         Initialize a MetricsTracer instance with the given parameters.
@@ -214,6 +241,8 @@ class MetricsTracer:
             instrument_operation_counter (Counter): Instrument for counting operations.
             client_attributes (Dict[str, str]): Dictionary of client attributes used for metrics tracing.
             gfe_enabled (bool, optional): Indicates if GFE metrics are enabled. Defaults to False.
+            local_sink (LocalMetricsSink, optional): In-process sink that also receives the
+                attempt and operation latencies, regardless of whether metrics are enabled.
         """
         self.current_op = MetricOpTracer()
         self._client_attributes = client_attributes
@@ -223,6 +252,8 @@ class MetricsTracer:
         self._instrument_operation_counter = instrument_operation_counter
         self.enabled = enabled
         self.gfe_enabled = gfe_enabled
+        self.local_sink = local_sink
+        self.request_tag = ""
 
     @staticmethod
     def _get_ms_time_diff(start: datetime, end: datetime) -> float:
@@ -327,8 +358,18 @@ class MetricsTracer:
         It calculates the elapsed time since the attempt started and uses this value to record the attempt latency metric.
         This metric is useful for tracking the performance of individual attempts and can help identify bottlenecks or issues in the operation flow.
 
-        If metrics tracing is not enabled, this method does not perform any operations.
-        """
+        If metrics tracing is not enabled, this method only records the latency in the local sink, if any.
+        """
+        if self.local_sink is not None:
+            self.local_sink.record_attempt(
+                self._client_attributes.get(METRIC_LABEL_KEY_METHOD),
+                self._client_attributes.get(METRIC_LABEL_KEY_DATABASE),
+                self.request_tag,
+                self._get_ms_time_diff(
+                    start=self.current_op.current_attempt.start_time,
+                    end=datetime.now(),
+                ),
+            )
         if not self.enabled or not HAS_OPENTELEMETRY_INSTALLED:
             return
         self.current_op.current_attempt.status = status
@@ -352,9 +393,11 @@ class MetricsTracer:
 
         This method marks the beginning of a new operation and initializes the operation's metrics tracking.
         It is used to track the start time of an operation, which is essential for calculating operation latency and other metrics.
-        If metrics tracing is not enabled, this method does not perform any operations.
+        If metrics tracing is not enabled and there is no local sink, this method does not perform any operations.
         """
-        if not self.enabled or not HAS_OPENTELEMETRY_INSTALLED:
+        if self.local_sink is None and (
+            not self.enabled or not HAS_OPENTELEMETRY_INSTALLED
+        ):
             return
         self.current_op.start()
 
@@ -365,8 +408,20 @@ class MetricsTracer:
         This method marks the end of an operation and updates the metrics accordingly.
         It calculates the operation latency by measuring the time elapsed since the operation started and records this metric.
         Additionally, it increments the operation count and records the attempt count for the operation.
-        If metrics tracing is not enabled, this method does not perform any operations.
-        """
+        If metrics tracing is not enabled, this method only records the latency in the local sink, if any.
+        Operations without any attempts are not recorded in the local sink.
+        """
+        if self.local_sink is not None and self.current_op.attempt_count:
+            self.local_sink.record_operation(
+                self._client_attributes.get(METRIC_LABEL_KEY_METHOD),
+                self._client_attributes.get(METRIC_LABEL_KEY_DATABASE),
+                self.request_tag,
+                self._get_ms_time_diff(
+                    start=self.current_op.start_time, end=datetime.now()
+                ),
+                self.current_op.attempt_count,
+                self.current_op.retry_count,
+            )
         if not self.enabled or not HAS_OPENTELEMETRY_INSTALLED:
             return
         end_time = datetime.now()
@@ -392,6 +447,15 @@ class MetricsTracer:
             self.current_op.attempt_count, attributes=attempt_attributes
         )
 
+    def record_retry(self) -> None:
+        """
+        Record a client-side retry of the current operation.
+
+        The number of retries is only reported to the local metrics sink, as the
+        exported metrics are limited to a predefined set of metrics.
+        """
+        self.current_op.increment_retry_count()
+
     def record_gfe_latency(self, latency: int) -> None:
         """
         Records the GFE latency using the Histogram instrument.
@@ -575,6 +639,18 @@ class MetricsTracer:
             self.client_attributes[METRIC_LABEL_KEY_METHOD] = method
         return self
 
+    def set_request_tag(self, request_tag: str) -> "MetricsTracer":
+        """
+        Set the request tag that is used for the local latency metrics.
+
+        The request tag is not added to the exported metric attributes.
+
+        :param request_tag: The request tag of the operation.
+        :return: This instance of MetricsTracer for method chaining.
+        """
+        self.request_tag = request_tag or ""
+        return self
+
     def enable_direct_path(self, enable: bool = False) -> "MetricsTracer":
         """
         Enable or disable the direct path for metrics tracing.
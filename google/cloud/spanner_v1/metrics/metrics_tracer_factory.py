@@ -34,6 +34,7 @@ from google.cloud.spanner_v1.metrics.constants import (
     MONITORED_RES_LABEL_KEY_LOCATION,
     MONITORED_RES_LABEL_KEY_PROJECT,
 )
+from google.cloud.spanner_v1.metrics.local_metrics import LocalMetricsSink
 from google.cloud.spanner_v1.metrics.metrics_tracer import MetricsTracer
 
 try:
@@ -51,6 +52,7 @@ class MetricsTracerFactory:
 
     enabled: bool
     gfe_enabled: bool
+    local_sink: LocalMetricsSink
     _instrument_attempt_latency: "Histogram"
     _instrument_attempt_counter: "Counter"
     _instrument_operation_latency: "Histogram"
@@ -85,9 +87,35 @@ class MetricsTracerFactory:
             project (str): The project ID for the monitored resource.
         """
         self.enabled = enabled
+        self.local_sink = None
         self._create_metric_instruments(service_name)
         self._client_attributes = {}
 
+    @property
+    def recording_enabled(self) -> bool:
+        """Return whether metrics tracers record anything.
+
+        Metrics are recorded if they are exported, or if a local sink has been
+        configured, see :meth:`enable_local_metrics`.
+
+        Returns:
+            bool: True if new operations should be traced.
+        """
+        return self.enabled or self.local_sink is not None
+
+    def enable_local_metrics(self) -> LocalMetricsSink:
+        """Record attempt and operation latencies in an in-process sink.
+
+        The sink is shared by all clients in the process, and it is created
+        the first time this method is called.
+
+        Returns:
+            LocalMetricsSink: The local metrics sink.
+        """
+        if self.local_sink is None:
+            self.local_sink = LocalMetricsSink()
+        return self.local_sink
+
     @property
     def client_attributes(self) -> Dict[str, str]:
         """Return a dictionary of client attributes used for metrics tracing.
@@ -268,6 +296,7 @@ class MetricsTracerFactory:
             instrument_operation_latency=self._instrument_operation_latency,
             instrument_operation_counter=self._instrument_operation_counter,
             client_attributes=self._client_attributes.copy(),
+            local_sink=self.local_sink,
         )
         return metrics_tracer
 
@@ -0,0 +1,260 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact binary serialization of partitions and batch transactions.
+
+The partitions of :class:`~google.cloud.spanner_v1.database.BatchSnapshot`
+are processed by other processes or hosts, and must be serialized to be
+shipped to them. :func:`encode_partition` serializes a partition, and
+optionally the batch transaction that it belongs to, as a protobuf message
+that embeds the ``ExecuteSqlRequest`` or ``ReadRequest`` of the partition.
+The format is versioned, and does not execute code when it is decoded.
+"""
+
+import proto
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from google.protobuf import timestamp_pb2
+
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.keyset import EncodedKeySet, KeySet
+from google.cloud.spanner_v1.transaction import BatchTransactionId
+from google.cloud.spanner_v1.types.spanner import (
+    ClientContext,
+    DirectedReadOptions,
+    ExecuteSqlRequest,
+    ReadRequest,
+)
+from google.cloud.spanner_v1.types.type import Type
+
+__protobuf__ = proto.module(
+    package="google.cloud.spanner_v1.partition_codec",
+    manifest={"SerializedPartition"},
+)
+
+FORMAT_VERSION = 1
+"""The version of the serialized partitions that are written and read."""
+
+
+class SerializedPartition(proto.Message):
+    """A partition of a batch transaction, or the batch transaction alone."""
+
+    version = proto.Field(proto.UINT32, number=1)
+    session_id = proto.Field(proto.STRING, number=2)
+    transaction_id = proto.Field(proto.BYTES, number=3)
+    read_timestamp = proto.Field(
+        proto.MESSAGE, number=4, message=timestamp_pb2.Timestamp
+    )
+    client_context = proto.Field(proto.MESSAGE, number=5, message=ClientContext)
+    execute_sql = proto.Field(
+        proto.MESSAGE, number=6, message=ExecuteSqlRequest, oneof="request"
+    )
+    read = proto.Field(proto.MESSAGE, number=7, message=ReadRequest, oneof="request")
+    key_int_positions = proto.RepeatedField(proto.UINT32, number=8)
+
+
+def encode_partition(batch=None, batch_transaction_id=None, client_context=None):
+    """Serialize a partition and its batch transaction.
+
+    :type batch: dict
+    :param batch: (Optional) a partition, as generated by
+                  :meth:`BatchSnapshot.generate_query_batches` or
+                  :meth:`BatchSnapshot.generate_read_batches`.
+
+    :type batch_transaction_id:
+        :class:`~google.cloud.spanner_v1.transaction.BatchTransactionId`
+    :param batch_transaction_id: (Optional) the batch transaction of the
+                                 partition.
+
+    :type client_context: :class:`~google.cloud.spanner_v1.types.ClientContext`
+    :param client_context: (Optional) the client context of the batch
+                           transaction.
+
+    :rtype: bytes
+    :returns: the serialized partition.
+    :raises ValueError: if the batch is neither a query nor a read.
+    """
+    message = SerializedPartition.pb()(version=FORMAT_VERSION)
+    if batch_transaction_id is not None:
+        _encode_transaction(
+            message,
+            batch_transaction_id.session_id,
+            batch_transaction_id.transaction_id,
+            batch_transaction_id.read_timestamp,
+        )
+    if client_context is not None:
+        message.client_context.CopyFrom(_to_pb(client_context, ClientContext))
+    if batch is not None:
+        if "query" in batch:
+            _encode_query(message.execute_sql, batch["partition"], batch["query"])
+        elif "read" in batch:
+            message.key_int_positions.extend(
+                _encode_read(message.read, batch["partition"], batch["read"])
+            )
+        else:
+            raise ValueError("Invalid batch")
+    return message.SerializeToString()
+
+
+def decode_partition(data):
+    """Deserialize a partition that was serialized by
+    :func:`encode_partition`.
+
+    The parameters of a decoded query are
+    :class:`~google.protobuf.struct_pb2.Value` protobufs, and the key set of
+    a decoded read is kept in its serialized form.
+
+    :type data: bytes
+    :param data: the serialized partition.
+
+    :rtype: tuple
+    :returns: the partition, or None if no partition was serialized, the
+              :class:`~google.cloud.spanner_v1.transaction.BatchTransactionId`,
+              or None, and the client context, or None.
+    :raises ValueError: if the data was written with another version of the
+                        format.
+    """
+    message = SerializedPartition.pb().FromString(data)
+    if message.version != FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported serialized partition version: %d" % message.version
+        )
+    request_kind = message.WhichOneof("request")
+    if request_kind == "execute_sql":
+        batch = _decode_query(message.execute_sql)
+    elif request_kind == "read":
+        batch = _decode_read(message.read, message.key_int_positions)
+    else:
+        batch = None
+    batch_transaction_id = None
+    if message.session_id or message.transaction_id:
+        read_timestamp = None
+        if message.HasField("read_timestamp"):
+            read_timestamp = DatetimeWithNanoseconds.from_timestamp_pb(
+                message.read_timestamp
+            )
+        batch_transaction_id = BatchTransactionId(
+            message.transaction_id, message.session_id, read_timestamp
+        )
+    client_context = None
+    if message.HasField("client_context"):
+        client_context = ClientContext.wrap(message.client_context)
+    return batch, batch_transaction_id, client_context
+
+
+def _encode_transaction(message, session_id, transaction_id, read_timestamp):
+    if session_id:
+        message.session_id = session_id
+    if transaction_id:
+        message.transaction_id = transaction_id
+    if read_timestamp is not None:
+        if isinstance(read_timestamp, DatetimeWithNanoseconds):
+            message.read_timestamp.CopyFrom(read_timestamp.timestamp_pb())
+        else:
+            message.read_timestamp.FromDatetime(read_timestamp)
+
+
+def _to_pb(value, message_class):
+    """Return the protobuf of a proto-plus message, a dict or a protobuf."""
+    if not isinstance(value, message_class):
+        value = message_class(value)
+    return message_class.pb(value)
+
+
+def _encode_query(request, partition, query):
+    request.partition_token = partition
+    request.sql = query["sql"]
+    params = query.get("params")
+    if params:
+        fields = request.params.fields
+        for name, value in params.items():
+            fields[name].CopyFrom(_make_value_pb(value))
+    param_types = query.get("param_types")
+    if param_types:
+        for name, param_type in param_types.items():
+            request.param_types[name].CopyFrom(_to_pb(param_type, Type))
+    query_options = query.get("query_options")
+    if query_options is not None:
+        request.query_options.CopyFrom(
+            _to_pb(query_options, ExecuteSqlRequest.QueryOptions)
+        )
+    request.data_boost_enabled = query.get("data_boost_enabled", False)
+    directed_read_options = query.get("directed_read_options")
+    if directed_read_options is not None:
+        request.directed_read_options.CopyFrom(
+            _to_pb(directed_read_options, DirectedReadOptions)
+        )
+
+
+def _decode_query(request):
+    query = {
+        "sql": request.sql,
+        "data_boost_enabled": request.data_boost_enabled,
+        "directed_read_options": None,
+    }
+    if request.params.fields:
+        query["params"] = dict(request.params.fields)
+        query["param_types"] = {
+            name: Type.wrap(param_type)
+            for name, param_type in request.param_types.items()
+        }
+    if request.HasField("directed_read_options"):
+        query["directed_read_options"] = DirectedReadOptions.wrap(
+            request.directed_read_options
+        )
+    query["query_options"] = None
+    if request.HasField("query_options"):
+        query["query_options"] = ExecuteSqlRequest.QueryOptions.wrap(
+            request.query_options
+        )
+    return {"partition": request.partition_token, "query": query}
+
+
+def _encode_read(request, partition, read):
+    request.partition_token = partition
+    request.table = read["table"]
+    request.columns.extend(read["columns"])
+    keyset = read["keyset"]
+    if "encoded" not in keyset:
+        keyset = KeySet._from_dict(keyset)
+        keyset = EncodedKeySet(
+            keys=keyset.keys, ranges=keyset.ranges, all_=keyset.all_
+        )._to_dict()
+    request.key_set.ParseFromString(keyset["encoded"])
+    request.index = read.get("index") or ""
+    request.data_boost_enabled = read.get("data_boost_enabled", False)
+    directed_read_options = read.get("directed_read_options")
+    if directed_read_options is not None:
+        request.directed_read_options.CopyFrom(
+            _to_pb(directed_read_options, DirectedReadOptions)
+        )
+    return keyset.get("int_positions", ())
+
+
+def _decode_read(request, key_int_positions):
+    keyset = {"encoded": request.key_set.SerializeToString()}
+    if key_int_positions:
+        keyset["int_positions"] = list(key_int_positions)
+    read = {
+        "table": request.table,
+        "columns": list(request.columns),
+        "keyset": keyset,
+        "index": request.index,
+        "data_boost_enabled": request.data_boost_enabled,
+        "directed_read_options": None,
+    }
+    if request.HasField("directed_read_options"):
+        read["directed_read_options"] = DirectedReadOptions.wrap(
+            request.directed_read_options
+        )
+    return {"partition": request.partition_token, "read": read}
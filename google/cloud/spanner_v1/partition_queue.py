@@ -0,0 +1,762 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Distribution of the partitions of a batch transaction to many workers.
+
+:meth:`BatchSnapshot.run_partitioned_query` processes all partitions of a
+query in the current process. A :class:`PartitionCoordinator` instead
+generates the partitions of a query or read and puts them on a
+:class:`PartitionQueue`, from which any number of :class:`PartitionWorker`
+instances, in other processes or on other hosts, claim and process them.
+
+A claimed partition is leased to its worker for a limited time, which the
+worker extends while it processes the partition. A partition whose worker
+fails, or whose lease expires because the worker stopped, is returned to the
+queue and is claimed again, up to a maximum number of attempts. Partitions
+are thus processed at least once, and the handlers of the workers should be
+idempotent.
+
+:class:`SQLitePartitionQueue` stores the queue in a SQLite database file,
+which can be shared by the processes of a host, or by hosts that share a
+file system with reliable locking. Other stores implement
+:class:`PartitionQueue`.
+"""
+
+from concurrent import futures
+from dataclasses import dataclass
+import sqlite3
+import threading
+import time
+import uuid
+
+from google.cloud.spanner_v1.database import BatchSnapshot
+from google.cloud.spanner_v1.partition_codec import encode_partition
+
+_PENDING = "pending"
+_CLAIMED = "claimed"
+_DONE = "done"
+_FAILED = "failed"
+
+
+@dataclass
+class PartitionLease:
+    """A partition that has been claimed by a worker."""
+
+    job_id: str
+    """The ID of the job of the partition."""
+
+    index: int
+    """The index of the partition in its job."""
+
+    data: bytes
+    """The partition, as serialized by
+    :func:`~google.cloud.spanner_v1.partition_codec.encode_partition`."""
+
+    state: bytes
+    """The batch transaction of the job, as serialized by
+    :meth:`BatchSnapshot.to_bytes`."""
+
+    worker_id: str
+    """The ID of the worker that claimed the partition."""
+
+    attempt: int
+    """The number of times that the partition has been claimed, including
+    this claim."""
+
+    lease_expires: float
+    """The time at which the lease expires, in seconds since the epoch."""
+
+
+@dataclass
+class PartitionJobProgress:
+    """The progress of the partitions of a job."""
+
+    job_id: str
+    """The ID of the job."""
+
+    total: int
+    """The number of partitions of the job."""
+
+    pending: int
+    """The number of partitions that wait to be claimed."""
+
+    claimed: int
+    """The number of partitions that are being processed."""
+
+    done: int
+    """The number of partitions that have been processed."""
+
+    failed: int
+    """The number of partitions that failed in all attempts."""
+
+    rows: int
+    """The number of rows of the processed partitions."""
+
+    elapsed: float
+    """The seconds since the job was submitted, or until its last partition
+    completed if all partitions have completed."""
+
+    @property
+    def finished(self) -> bool:
+        """Whether all partitions have been processed or have failed."""
+        return self.done + self.failed == self.total
+
+    @property
+    def partitions_per_second(self) -> float:
+        """The number of processed partitions per second."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """The number of rows of the processed partitions per second."""
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class PartitionQueue(object):
+    """The interface of the stores of the partitions of jobs.
+
+    Implementations must be safe to use from the threads of a process, and
+    from all processes that share the store.
+    """
+
+    def put(self, job_id, state, partitions, max_attempts=3):
+        """Add a job and its partitions.
+
+        :type job_id: str
+        :param job_id: the ID of the job.
+
+        :type state: bytes
+        :param state: the batch transaction of the job, as serialized by
+                      :meth:`BatchSnapshot.to_bytes`.
+
+        :type partitions: list of bytes
+        :param partitions: the serialized partitions of the job.
+
+        :type max_attempts: int
+        :param max_attempts: (Optional) the number of times that a partition
+                             is claimed before it is considered failed.
+
+        :raises ValueError: if a job with the same ID exists.
+        """
+        raise NotImplementedError()
+
+    def claim(self, worker_id, lease_seconds, job_id=None):
+        """Claim a pending partition, or a partition whose lease expired.
+
+        :type worker_id: str
+        :param worker_id: the ID of the claiming worker.
+
+        :type lease_seconds: float
+        :param lease_seconds: the duration of the lease.
+
+        :type job_id: str
+        :param job_id: (Optional) only claim a partition of this job.
+
+        :rtype: :class:`PartitionLease`
+        :returns: the claimed partition, or None if no partition can be
+                  claimed.
+        """
+        raise NotImplementedError()
+
+    def extend(self, lease, lease_seconds):
+        """Extend the lease of a claimed partition.
+
+        :type lease: :class:`PartitionLease`
+        :param lease: the lease to extend.
+
+        :type lease_seconds: float
+        :param lease_seconds: the new duration of the lease, from now.
+
+        :rtype: bool
+        :returns: False if the partition is no longer leased to the worker.
+        """
+        raise NotImplementedError()
+
+    def ack(self, lease, rows=0):
+        """Mark a claimed partition as processed.
+
+        :type lease: :class:`PartitionLease`
+        :param lease: the lease of the partition.
+
+        :type rows: int
+        :param rows: (Optional) the number of rows of the partition.
+
+        :rtype: bool
+        :returns: False if the partition is no longer leased to the worker,
+                  e.g. because the lease expired and the partition was
+                  claimed by another worker.
+        """
+        raise NotImplementedError()
+
+    def nack(self, lease, error=None):
+        """Return a claimed partition that could not be processed.
+
+        The partition is claimed again, unless it has been claimed the
+        maximum number of times, in which case it has failed.
+
+        :type lease: :class:`PartitionLease`
+        :param lease: the lease of the partition.
+
+        :type error: str
+        :param error: (Optional) a description of the error.
+
+        :rtype: bool
+        :returns: False if the partition is no longer leased to the worker.
+        """
+        raise NotImplementedError()
+
+    def progress(self, job_id):
+        """Return the progress of a job.
+
+        :type job_id: str
+        :param job_id: the ID of the job.
+
+        :rtype: :class:`PartitionJobProgress`
+        :returns: the progress of the job.
+
+        :raises KeyError: if the job does not exist.
+        """
+        raise NotImplementedError()
+
+    def errors(self, job_id):
+        """Return the last errors of the partitions of a job.
+
+        :type job_id: str
+        :param job_id: the ID of the job.
+
+        :rtype: dict
+        :returns: the last error of each partition that had one, by index.
+        """
+        raise NotImplementedError()
+
+
+class SQLitePartitionQueue(PartitionQueue):
+    """A :class:`PartitionQueue` that is stored in a SQLite database.
+
+    :type path: str
+    :param path: the path of the database file, which is created if it does
+                 not exist.
+
+    :type timeout: float
+    :param timeout: (Optional) the seconds to wait for the locks of other
+                    processes.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    state BLOB NOT NULL,
+                    total INTEGER NOT NULL,
+                    max_attempts INTEGER NOT NULL,
+                    created REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS partitions (
+                    job_id TEXT NOT NULL,
+                    partition_index INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    status TEXT NOT NULL,
+                    worker_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    rows INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    completed REAL,
+                    PRIMARY KEY (job_id, partition_index)
+                );
+                CREATE INDEX IF NOT EXISTS partitions_by_status
+                    ON partitions (status, lease_expires);
+                """
+            )
+
+    def close(self):
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _transaction(self, statements):
+        """Run ``statements(cursor)`` in a transaction that holds the write
+        lock of the database from its start."""
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return result
+
+    def put(self, job_id, state, partitions, max_attempts=3):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        partitions = list(partitions)
+
+        def statements(cursor):
+            try:
+                cursor.execute(
+                    "INSERT INTO jobs VALUES (?, ?, ?, ?, ?)",
+                    (job_id, state, len(partitions), max_attempts, time.time()),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError("Job %s already exists" % job_id)
+            cursor.executemany(
+                "INSERT INTO partitions (job_id, partition_index, data, status) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (job_id, index, data, _PENDING)
+                    for index, data in enumerate(partitions)
+                ],
+            )
+
+        self._transaction(statements)
+
+    def claim(self, worker_id, lease_seconds, job_id=None):
+        def statements(cursor):
+            now = time.time()
+            job_filter = "" if job_id is None else " AND p.job_id = ?"
+            job_params = () if job_id is None else (job_id,)
+            # Partitions whose last lease expired fail if they have been
+            # claimed the maximum number of times.
+            cursor.execute(
+                "UPDATE partitions SET status = ?, worker_id = NULL, "
+                "error = 'Lease expired', completed = ? "
+                "WHERE rowid IN (SELECT p.rowid FROM partitions p "
+                "JOIN jobs j ON p.job_id = j.job_id "
+                "WHERE p.status = ? AND p.lease_expires <= ? "
+                "AND p.attempts >= j.max_attempts%s)" % job_filter,
+                (_FAILED, now, _CLAIMED, now) + job_params,
+            )
+            row = cursor.execute(
+                "SELECT p.job_id, p.partition_index, p.data, j.state, p.attempts "
+                "FROM partitions p JOIN jobs j ON p.job_id = j.job_id "
+                "WHERE (p.status = ? OR (p.status = ? AND p.lease_expires <= ?))%s "
+                "ORDER BY j.created, p.job_id, p.partition_index LIMIT 1" % job_filter,
+                (_PENDING, _CLAIMED, now) + job_params,
+            ).fetchone()
+            if row is None:
+                return None
+            claimed_job_id, index, data, state, attempts = row
+            lease_expires = now + lease_seconds
+            cursor.execute(
+                "UPDATE partitions SET status = ?, worker_id = ?, "
+                "lease_expires = ?, attempts = ? "
+                "WHERE job_id = ? AND partition_index = ?",
+                (
+                    _CLAIMED,
+                    worker_id,
+                    lease_expires,
+                    attempts + 1,
+                    claimed_job_id,
+                    index,
+                ),
+            )
+            return PartitionLease(
+                job_id=claimed_job_id,
+                index=index,
+                data=data,
+                state=state,
+                worker_id=worker_id,
+                attempt=attempts + 1,
+                lease_expires=lease_expires,
+            )
+
+        return self._transaction(statements)
+
+    def _update_lease(self, lease, assignments, params):
+        """Update a partition if it is still leased to the worker.
+
+        An expired lease that has not been claimed by another worker is
+        still valid.
+        """
+
+        def statements(cursor):
+            cursor.execute(
+                "UPDATE partitions SET %s "
+                "WHERE job_id = ? AND partition_index = ? AND status = ? "
+                "AND worker_id = ? AND attempts = ?" % assignments,
+                tuple(params)
+                + (lease.job_id, lease.index, _CLAIMED, lease.worker_id, lease.attempt),
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(statements)
+
+    def extend(self, lease, lease_seconds):
+        lease_expires = time.time() + lease_seconds
+        if not self._update_lease(lease, "lease_expires = ?", (lease_expires,)):
+            return False
+        lease.lease_expires = lease_expires
+        return True
+
+    def ack(self, lease, rows=0):
+        return self._update_lease(
+            lease,
+            "status = ?, rows = ?, error = NULL, completed = ?",
+            (_DONE, rows, time.time()),
+        )
+
+    def nack(self, lease, error=None):
+        return self._update_lease(
+            lease,
+            "status = CASE WHEN attempts >= "
+            "(SELECT max_attempts FROM jobs WHERE jobs.job_id = partitions.job_id) "
+            "THEN ? ELSE ? END, "
+            "worker_id = NULL, lease_expires = NULL, error = ?, completed = ?",
+            (_FAILED, _PENDING, error, time.time()),
+        )
+
+    def progress(self, job_id):
+        with self._lock:
+            job = self._connection.execute(
+                "SELECT total, created FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                raise KeyError(job_id)
+            counts = self._connection.execute(
+                "SELECT status, COUNT(*), SUM(rows), MAX(completed) "
+                "FROM partitions WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            ).fetchall()
+        total, created = job
+        statuses = {status: (count, rows) for status, count, rows, _ in counts}
+        progress = PartitionJobProgress(
+            job_id=job_id,
+            total=total,
+            pending=statuses.get(_PENDING, (0, 0))[0],
+            claimed=statuses.get(_CLAIMED, (0, 0))[0],
+            done=statuses.get(_DONE, (0, 0))[0],
+            failed=statuses.get(_FAILED, (0, 0))[0],
+            rows=statuses.get(_DONE, (0, 0))[1],
+            elapsed=time.time() - created,
+        )
+        if progress.finished:
+            completed = [last for _, _, _, last in counts if last is not None]
+            end = max(completed) if completed else created
+            progress.elapsed = end - created
+        return progress
+
+    def errors(self, job_id):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT partition_index, error FROM partitions "
+                "WHERE job_id = ? AND error IS NOT NULL ORDER BY partition_index",
+                (job_id,),
+            ).fetchall()
+        return dict(rows)
+
+
+class PartitionCoordinator(object):
+    """Generates the partitions of queries and reads of a batch transaction,
+    and puts them on a :class:`PartitionQueue`.
+
+    The batch transaction must stay open until all partitions have been
+    processed: the caller closes ``batch_snapshot`` when :meth:`wait`
+    returns.
+
+    :type batch_snapshot: :class:`~google.cloud.spanner_v1.database.BatchSnapshot`
+    :param batch_snapshot: the batch transaction of the partitions.
+
+    :type queue: :class:`PartitionQueue`
+    :param queue: the queue to put the partitions on.
+
+    :type max_attempts: int
+    :param max_attempts: (Optional) the number of times that a partition is
+                         claimed before it is considered failed.
+    """
+
+    def __init__(self, batch_snapshot, queue, max_attempts=3):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self._batch_snapshot = batch_snapshot
+        self._queue = queue
+        self._max_attempts = max_attempts
+
+    def submit_query(self, sql, job_id=None, **kwargs):
+        """Partition a query and put its partitions on the queue.
+
+        :type sql: str
+        :param sql: the query.
+
+        :type job_id: str
+        :param job_id: (Optional) the ID of the job. A random ID is used by
+                       default.
+
+        :type kwargs: dict
+        :param kwargs: (Optional) the other arguments of
+                       :meth:`BatchSnapshot.generate_query_batches`.
+
+        :rtype: str
+        :returns: the ID of the job.
+        """
+        return self._submit(
+            job_id, self._batch_snapshot.generate_query_batches(sql, **kwargs)
+        )
+
+    def submit_read(self, table, columns, keyset, job_id=None, **kwargs):
+        """Partition a read and put its partitions on the queue.
+
+        :type table: str
+        :param table: the name of the table to read.
+
+        :type columns: list of str
+        :param columns: the names of the columns to read.
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.KeySet`
+        :param keyset: the keys or key ranges to read.
+
+        :type job_id: str
+        :param job_id: (Optional) the ID of the job. A random ID is used by
+                       default.
+
+        :type kwargs: dict
+        :param kwargs: (Optional) the other arguments of
+                       :meth:`BatchSnapshot.generate_read_batches`.
+
+        :rtype: str
+        :returns: the ID of the job.
+        """
+        return self._submit(
+            job_id,
+            self._batch_snapshot.generate_read_batches(
+                table, columns, keyset, **kwargs
+            ),
+        )
+
+    def _submit(self, job_id, batches):
+        if job_id is None:
+            job_id = uuid.uuid4().hex
+        partitions = [encode_partition(batch) for batch in batches]
+        self._queue.put(
+            job_id,
+            self._batch_snapshot.to_bytes(),
+            partitions,
+            max_attempts=self._max_attempts,
+        )
+        return job_id
+
+    def progress(self, job_id):
+        """Return the progress of a job.
+
+        :type job_id: str
+        :param job_id: the ID of the job.
+
+        :rtype: :class:`PartitionJobProgress`
+        :returns: the progress of the job.
+        """
+        return self._queue.progress(job_id)
+
+    def wait(self, job_id, timeout=None, poll_interval=1.0, progress_callback=None):
+        """Wait until all partitions of a job have been processed or have
+        failed.
+
+        :type job_id: str
+        :param job_id: the ID of the job.
+
+        :type timeout: float
+        :param timeout: (Optional) the maximum time to wait, in seconds.
+
+        :type poll_interval: float
+        :param poll_interval: (Optional) the seconds between two checks of
+                              the progress of the job.
+
+        :type progress_callback: callable
+        :param progress_callback: (Optional) called with the
+                                  :class:`PartitionJobProgress` of the job
+                                  after every check.
+
+        :rtype: :class:`PartitionJobProgress`
+        :returns: the final progress of the job. Failed partitions are
+                  counted in ``failed``, and their errors are returned by
+                  :meth:`PartitionQueue.errors`.
+
+        :raises: :exc:`concurrent.futures.TimeoutError` if the job did not
+                 finish within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            progress = self._queue.progress(job_id)
+            if progress_callback is not None:
+                progress_callback(progress)
+            if progress.finished:
+                return progress
+            if deadline is not None and time.monotonic() >= deadline:
+                raise futures.TimeoutError(
+                    "Job %s did not finish within %s seconds" % (job_id, timeout)
+                )
+            wait = poll_interval
+            if deadline is not None:
+                wait = min(wait, max(deadline - time.monotonic(), 0))
+            time.sleep(wait)
+
+
+class PartitionWorker(object):
+    """Claims, processes and acknowledges the partitions of a
+    :class:`PartitionQueue`.
+
+    While a partition is processed, its lease is extended every
+    ``heartbeat_interval`` seconds. A partition whose handler raises an
+    exception is returned to the queue.
+
+    The batch transaction of the last processed job is kept for the next
+    partition, until :meth:`close` is called. The batch transactions are
+    owned by the coordinator, so the worker never closes their sessions.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: the database of the partitions.
+
+    :type queue: :class:`PartitionQueue`
+    :param queue: the queue to claim the partitions from.
+
+    :type worker_id: str
+    :param worker_id: (Optional) the ID of the worker. A random ID is used
+                      by default.
+
+    :type lease_seconds: float
+    :param lease_seconds: (Optional) the duration of the leases of the
+                          claimed partitions.
+
+    :type heartbeat_interval: float
+    :param heartbeat_interval: (Optional) the seconds between two extensions
+                               of a lease. Defaults to a third of
+                               ``lease_seconds``.
+    """
+
+    def __init__(
+        self,
+        database,
+        queue,
+        worker_id=None,
+        lease_seconds=300.0,
+        heartbeat_interval=None,
+    ):
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        self._database = database
+        self._queue = queue
+        self.worker_id = worker_id or uuid.uuid4().hex
+        self._lease_seconds = lease_seconds
+        self._heartbeat_interval = (
+            heartbeat_interval
+            if heartbeat_interval is not None
+            else lease_seconds / 3.0
+        )
+        # The serialized state and the batch transaction of the last job.
+        self._snapshot_state = None
+        self._batch_snapshot = None
+
+    def run(
+        self,
+        handler,
+        job_id=None,
+        max_partitions=None,
+        idle_timeout=0.0,
+        poll_interval=1.0,
+    ):
+        """Process partitions until no partition can be claimed.
+
+        :type handler: callable
+        :param handler: called with the :class:`PartitionLease` and an
+                        iterator over the rows of each partition. The rows
+                        that the handler consumes are counted.
+
+        :type job_id: str
+        :param job_id: (Optional) only process partitions of this job.
+
+        :type max_partitions: int
+        :param max_partitions: (Optional) the maximum number of partitions
+                               to process.
+
+        :type idle_timeout: float
+        :param idle_timeout: (Optional) the seconds to wait for a partition
+                             that can be claimed, e.g. a partition whose
+                             lease expires, before returning.
+
+        :type poll_interval: float
+        :param poll_interval: (Optional) the seconds between two claims
+                              while waiting for a partition.
+
+        :rtype: int
+        :returns: the number of partitions that have been processed.
+        """
+        processed = 0
+        idle_since = None
+        while max_partitions is None or processed < max_partitions:
+            lease = self._queue.claim(self.worker_id, self._lease_seconds, job_id)
+            if lease is None:
+                now = time.monotonic()
+                if idle_since is None:
+                    idle_since = now
+                if now - idle_since >= idle_timeout:
+                    break
+                time.sleep(min(poll_interval, idle_timeout - (now - idle_since)))
+                continue
+            idle_since = None
+            if self._process(lease, handler):
+                processed += 1
+        return processed
+
+    def _process(self, lease, handler):
+        """Process a claimed partition, extending its lease meanwhile.
+
+        :rtype: bool
+        :returns: True if the partition has been processed and acknowledged.
+        """
+        stopped = threading.Event()
+
+        def heartbeat():
+            while not stopped.wait(self._heartbeat_interval):
+                if not self._queue.extend(lease, self._lease_seconds):
+                    return
+
+        heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+        heartbeat_thread.start()
+        rows = [0]
+
+        def count(results):
+            for row in results:
+                rows[0] += 1
+                yield row
+
+        try:
+            snapshot = self._snapshot(lease.state)
+            handler(lease, count(snapshot.process(lease.data)))
+        except Exception as exc:
+            stopped.set()
+            heartbeat_thread.join()
+            self._queue.nack(lease, repr(exc))
+            return False
+        stopped.set()
+        heartbeat_thread.join()
+        return self._queue.ack(lease, rows[0])
+
+    def close(self):
+        """Drop the batch transaction that is kept for the next partition."""
+        self._snapshot_state = None
+        self._batch_snapshot = None
+
+    def _snapshot(self, state):
+        # Only the last batch transaction is kept, so that a long-lived
+        # worker does not keep the transactions of all jobs it has seen.
+        if state != self._snapshot_state:
+            self._batch_snapshot = BatchSnapshot.from_bytes(self._database, state)
+            self._snapshot_state = state
+        return self._batch_snapshot
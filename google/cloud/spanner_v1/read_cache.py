@@ -0,0 +1,172 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read-through cache for point reads of bounded-staleness snapshots."""
+
+from collections import OrderedDict
+import threading
+import time
+
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+from google.cloud.spanner_v1._helpers import _make_list_value_pb
+from google.cloud.spanner_v1.types.result_set import PartialResultSet
+
+
+class _ReadCacheEntry(object):
+    """The partial result sets of a read, and the timestamp of the read."""
+
+    __slots__ = ("result_sets", "read_timestamp", "read_timestamp_seconds")
+
+    def __init__(self, result_sets, read_timestamp_pb):
+        # The result sets are kept serialized, so that every read decodes
+        # its own copy of the values.
+        self.result_sets = result_sets
+        self.read_timestamp = DatetimeWithNanoseconds.from_timestamp_pb(
+            read_timestamp_pb
+        )
+        self.read_timestamp_seconds = (
+            read_timestamp_pb.seconds + read_timestamp_pb.nanos / 1e9
+        )
+
+
+class ReadCache(object):
+    """Size-bounded cache of the rows of single-key snapshot reads.
+
+    A cache is passed to snapshots with ``database.snapshot(max_staleness=...,
+    read_cache=cache)``, and can be shared by all snapshots of all databases
+    in a process. A read of a single key of a table or index by a single-use
+    snapshot with a ``max_staleness`` bound is served from the cache without
+    an RPC if the cached rows were read at a timestamp that is within the
+    staleness bound. Otherwise, the rows are read from Spanner and stored in
+    the cache. When the cache is full, the least recently used entry is
+    evicted.
+
+    The age of an entry is measured with the local clock against the read
+    timestamp that was returned by Spanner, so a skewed local clock changes
+    the effective staleness.
+
+    :type max_entries: int
+    :param max_entries: the maximum number of reads that are cached.
+    """
+
+    def __init__(self, max_entries=10000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+
+    def get(self, key, max_staleness):
+        """Return the cached result sets of a read.
+
+        :type key: tuple
+        :param key: the key of the read, see :func:`_make_read_cache_key`.
+
+        :type max_staleness: :class:`datetime.timedelta`
+        :param max_staleness: the maximum age of the cached rows.
+
+        :rtype: tuple
+        :returns: a list of
+                  :class:`~google.cloud.spanner_v1.types.PartialResultSet`
+                  and the read timestamp of the rows, or None if the rows are
+                  not cached or are too old.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            age = time.time() - entry.read_timestamp_seconds
+            if age > max_staleness.total_seconds():
+                self._stale += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        result_sets = [PartialResultSet.deserialize(data) for data in entry.result_sets]
+        return result_sets, entry.read_timestamp
+
+    def put(self, key, result_sets):
+        """Cache the result sets of a read.
+
+        The result sets are not cached if Spanner did not return the read
+        timestamp.
+
+        :type key: tuple
+        :param key: the key of the read, see :func:`_make_read_cache_key`.
+
+        :type result_sets: list
+        :param result_sets: all partial result sets of the read.
+        """
+        if not result_sets:
+            return
+        metadata_pb = PartialResultSet.pb(result_sets[0]).metadata
+        if not metadata_pb.transaction.HasField("read_timestamp"):
+            return
+        entry = _ReadCacheEntry(
+            [PartialResultSet.serialize(result_set) for result_set in result_sets],
+            metadata_pb.transaction.read_timestamp,
+        )
+        with self._lock:
+            current = self._entries.get(key)
+            if (
+                current is not None
+                and current.read_timestamp_seconds > entry.read_timestamp_seconds
+            ):
+                # A concurrent read has already cached newer rows.
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the hit and miss counts of the cache.
+
+        :rtype: dict
+        :returns: the number of ``hits`` and ``misses``, the number of misses
+                  because the cached rows were too old (``stale``), the number
+                  of ``evictions``, and the number of cached ``entries``.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+            }
+
+
+def _make_read_cache_key(database_name, table, columns, key, index=""):
+    """Return the cache key of a read of a single key."""
+    key_pb = _make_list_value_pb(key)
+    return (
+        database_name,
+        table,
+        index or "",
+        tuple(columns),
+        key_pb.SerializeToString(deterministic=True),
+    )
@@ -0,0 +1,298 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side retry policies for Cloud Spanner operations.
+
+These policies control the retries that the client library performs on top of
+the retries of the generated API layer: retrying ``BeginTransaction``,
+``Commit``, ``Rollback``, ``PartitionQuery`` and ``PartitionRead`` after a
+``RST_STREAM`` error, retrying a ``Commit`` of a batch after an ``ABORTED``
+error, and resuming streaming reads and queries after an ``UNAVAILABLE``
+error.
+"""
+
+import random
+import threading
+import time
+
+JITTER_NONE = "none"
+"""Sleep exactly the exponentially growing delay."""
+
+JITTER_FULL = "full"
+"""Sleep a random delay between zero and the exponentially growing delay."""
+
+JITTER_DECORRELATED = "decorrelated"
+"""Sleep a random delay between the initial delay and three times the
+previous delay."""
+
+_JITTER_MODES = (JITTER_NONE, JITTER_FULL, JITTER_DECORRELATED)
+
+
+class RetryBudget(object):
+    """Token bucket that limits the number of retries across operations.
+
+    Every failed attempt removes a token from the bucket and every successful
+    operation adds ``token_ratio`` tokens, up to ``max_tokens``. Retries are
+    only allowed as long as more than half of the tokens are left, so that
+    retries stop when most requests fail, instead of adding to the load of an
+    overloaded backend. These are the same semantics as gRPC retry
+    throttling.
+
+    A budget can be shared by multiple policies.
+
+    :type max_tokens: float
+    :param max_tokens: the capacity of the bucket.
+
+    :type token_ratio: float
+    :param token_ratio: the number of tokens that a successful operation adds.
+    """
+
+    def __init__(self, max_tokens=100.0, token_ratio=0.1):
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        if token_ratio <= 0:
+            raise ValueError("token_ratio must be positive")
+        self._max_tokens = float(max_tokens)
+        self._token_ratio = float(token_ratio)
+        self._tokens = self._max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        """The number of tokens that are currently in the bucket.
+
+        :rtype: float
+        :returns: the number of tokens.
+        """
+        with self._lock:
+            return self._tokens
+
+    def record_failure(self):
+        """Remove a token for a failed attempt.
+
+        :rtype: bool
+        :returns: True if a retry is allowed after this failure.
+        """
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self._max_tokens / 2
+
+    def record_success(self):
+        """Add tokens for a successful operation."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+
+class RetryPolicy(object):
+    """Exponential backoff with jitter, an overall deadline and a budget.
+
+    :type initial_delay: float
+    :param initial_delay: the delay in seconds before the first retry.
+
+    :type max_delay: float
+    :param max_delay: the maximum delay in seconds between two attempts.
+
+    :type multiplier: float
+    :param multiplier: the factor by which the delay grows after every retry.
+
+    :type jitter: str
+    :param jitter: one of :data:`JITTER_FULL` (default),
+                   :data:`JITTER_DECORRELATED` or :data:`JITTER_NONE`.
+
+    :type deadline: float
+    :param deadline: (Optional) the maximum time in seconds that is spent on
+                     an operation, including all attempts and delays. No retry
+                     is made if its delay would end after the deadline.
+
+    :type predicate: callable
+    :param predicate: (Optional) a function that is called with the error of
+                      a failed attempt, and that returns False if the error
+                      should not be retried. The predicate can only restrict
+                      the errors that a caller considers retryable.
+
+    :type budget: :class:`RetryBudget`
+    :param budget: (Optional) a retry budget that is shared by all operations
+                   that use this policy.
+    """
+
+    def __init__(
+        self,
+        initial_delay=1.0,
+        max_delay=32.0,
+        multiplier=2.0,
+        jitter=JITTER_FULL,
+        deadline=None,
+        predicate=None,
+        budget=None,
+    ):
+        if initial_delay < 0:
+            raise ValueError("initial_delay must not be negative")
+        if max_delay < initial_delay:
+            raise ValueError("max_delay must not be smaller than initial_delay")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if jitter not in _JITTER_MODES:
+            raise ValueError("jitter must be one of %s" % (_JITTER_MODES,))
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.predicate = predicate
+        self.budget = budget
+
+    def compute_delay(self, retry_number, previous_delay=None, initial_delay=None):
+        """Compute the delay before a retry.
+
+        :type retry_number: int
+        :param retry_number: the number of retries that have already been made.
+
+        :type previous_delay: float
+        :param previous_delay: (Optional) the delay before the previous retry,
+                               used for decorrelated jitter.
+
+        :type initial_delay: float
+        :param initial_delay: (Optional) overrides the initial delay of the
+                              policy.
+
+        :rtype: float
+        :returns: the delay in seconds.
+        """
+        if initial_delay is None:
+            initial_delay = self.initial_delay
+        max_delay = max(self.max_delay, initial_delay)
+        if self.jitter == JITTER_DECORRELATED:
+            if not previous_delay:
+                return min(max_delay, initial_delay)
+            return min(max_delay, random.uniform(initial_delay, previous_delay * 3))
+        delay = min(max_delay, initial_delay * self.multiplier**retry_number)
+        if self.jitter == JITTER_FULL:
+            return random.uniform(0, delay)
+        return delay
+
+    def start(self, initial_delay=None, deadline=None):
+        """Start tracking the retries of a single operation.
+
+        :type initial_delay: float
+        :param initial_delay: (Optional) overrides the initial delay of the
+                              policy for this operation.
+
+        :type deadline: float
+        :param deadline: (Optional) an absolute time, as returned by
+                         :func:`time.time`, after which the operation is not
+                         retried. The deadline of the policy applies as well.
+
+        :rtype: :class:`RetryState`
+        :returns: the retry state of the operation.
+        """
+        return RetryState(self, initial_delay, deadline)
+
+
+class RetryState(object):
+    """The retries of a single operation, see :meth:`RetryPolicy.start`."""
+
+    def __init__(self, policy, initial_delay, deadline):
+        self._policy = policy
+        self._initial_delay = initial_delay
+        self._previous_delay = None
+        self._expires_at = None
+        if policy.deadline is not None:
+            # The deadline of the policy is measured with a monotonic clock.
+            self._expires_at = time.monotonic() + policy.deadline
+        self.deadline = deadline
+        self.retries = 0
+
+    def next_delay(self, exc, delay=None):
+        """Return the delay before retrying a failed attempt.
+
+        :type exc: Exception
+        :param exc: the error of the failed attempt.
+
+        :type delay: float
+        :param delay: (Optional) a delay that overrides the backoff of the
+                      policy, e.g. the retry delay returned by the server.
+
+        :rtype: float
+        :returns: the delay in seconds, or None if the operation should not
+                  be retried.
+        """
+        policy = self._policy
+        if policy.predicate is not None and not policy.predicate(exc):
+            return None
+        if policy.budget is not None and not policy.budget.record_failure():
+            return None
+        if delay is None:
+            delay = policy.compute_delay(
+                self.retries, self._previous_delay, self._initial_delay
+            )
+        if self.deadline is not None and time.time() + delay > self.deadline:
+            return None
+        if self._expires_at is not None and (
+            time.monotonic() + delay > self._expires_at
+        ):
+            return None
+        self._previous_delay = delay
+        self.retries += 1
+        return delay
+
+    def record_success(self):
+        """Record that the operation succeeded."""
+        if self._policy.budget is not None:
+            self._policy.budget.record_success()
+
+
+_default_retry_policy = RetryPolicy(initial_delay=1.0, max_delay=32.0, deadline=120.0)
+_stream_resumption_retry_policy = RetryPolicy(initial_delay=0.01, max_delay=1.0)
+
+
+def get_default_retry_policy():
+    """Return the policy for retrying unary RPCs and aborted batch commits.
+
+    :rtype: :class:`RetryPolicy`
+    :returns: the policy.
+    """
+    return _default_retry_policy
+
+
+def set_default_retry_policy(policy):
+    """Set the policy for retrying unary RPCs and aborted batch commits.
+
+    The policy applies to all clients in the process.
+
+    :type policy: :class:`RetryPolicy`
+    :param policy: the new policy.
+    """
+    global _default_retry_policy
+    _default_retry_policy = policy
+
+
+def get_stream_resumption_retry_policy():
+    """Return the policy for resuming streaming reads and queries.
+
+    :rtype: :class:`RetryPolicy`
+    :returns: the policy.
+    """
+    return _stream_resumption_retry_policy
+
+
+def set_stream_resumption_retry_policy(policy):
+    """Set the policy for resuming streaming reads and queries.
+
+    The policy applies to all clients in the process.
+
+    :type policy: :class:`RetryPolicy`
+    :param policy: the new policy.
+    """
+    global _stream_resumption_retry_policy
+    _stream_resumption_retry_policy = policy
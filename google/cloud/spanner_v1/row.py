@@ -0,0 +1,158 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rows of a result set that are decoded on demand."""
+
+from google.cloud.spanner_v1._helpers import _parse_nullable
+
+
+class _RowSchema(object):
+    """The column names and decoders that are shared by all rows of a result
+    set."""
+
+    __slots__ = ("names", "indexes", "decoders", "usage")
+
+    def __init__(self, names, decoders, usage=None):
+        self.names = tuple(names)
+        # A name that is used for more than one column refers to the last of
+        # those columns, as in a dict that is built from the row.
+        self.indexes = {name: index for index, name in enumerate(self.names)}
+        self.decoders = decoders
+        # Records the accessed columns if column access profiling is enabled.
+        self.usage = usage
+
+
+class Row(object):
+    """A row of a result set, which decodes a value when it is first accessed.
+
+    Rows are returned by result sets that use ``lazy_rows=True``. A row is a
+    read-only sequence of the values of its columns, which can be accessed
+    by index or by column name. Every value is decoded at most once, so
+    reading a few columns of a wide row does not decode the other columns.
+    """
+
+    __slots__ = ("_schema", "_values", "_pending")
+
+    def __init__(self, schema, values):
+        self._schema = schema
+        self._values = values
+        # A bit per column that has not been decoded yet.
+        self._pending = (1 << len(values)) - 1
+
+    def _decode(self, index):
+        if self._pending >> index & 1:
+            self._values[index] = _parse_nullable(
+                self._values[index], self._schema.decoders[index]
+            )
+            self._pending &= ~(1 << index)
+        return self._values[index]
+
+    def _decoded_values(self):
+        """Return the decoded values of all columns, without recording them
+        as accessed."""
+        return [self._decode(index) for index in range(len(self._values))]
+
+    def _value(self, index):
+        value = self._decode(index)
+        usage = self._schema.usage
+        if usage is not None:
+            usage.accessed |= 1 << index
+        return value
+
+    @property
+    def fields(self):
+        """The names of the columns of the row.
+
+        :rtype: tuple of str
+        :returns: the column names, in column order.
+        """
+        return self._schema.names
+
+    def keys(self):
+        """Return the names of the columns of the row.
+
+        :rtype: tuple of str
+        :returns: the column names, in column order.
+        """
+        return self._schema.names
+
+    def get(self, name, default=None):
+        """Return the value of a column, or ``default`` if there is no column
+        with the given name.
+
+        :type name: str
+        :param name: the name of the column.
+
+        :type default: object
+        :param default: (Optional) the value to return for an unknown column.
+
+        :returns: the decoded value of the column.
+        """
+        index = self._schema.indexes.get(name)
+        if index is None:
+            return default
+        return self._value(index)
+
+    def items(self):
+        """Return the names and decoded values of the columns of the row.
+
+        :rtype: list of tuple
+        :returns: (name, value) pairs, in column order.
+        """
+        return list(zip(self._schema.names, self))
+
+    def to_dict(self):
+        """Return the row as a dict from column name to decoded value.
+
+        :rtype: dict
+        :returns: the values of the row, keyed by column name.
+        """
+        return dict(zip(self._schema.names, self))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            index = self._schema.indexes.get(key)
+            if index is None:
+                raise KeyError(key)
+            return self._value(index)
+        if isinstance(key, slice):
+            return [self._value(index) for index in range(*key.indices(len(self)))]
+        length = len(self._values)
+        index = key + length if key < 0 else key
+        if not 0 <= index < length:
+            raise IndexError("row index out of range")
+        return self._value(index)
+
+    def __iter__(self):
+        for index in range(len(self._values)):
+            yield self._value(index)
+
+    def __eq__(self, other):
+        if isinstance(other, (Row, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # A row is pickled as the list of its decoded values, as the schema
+        # is shared with the result set and may hold a lock. Pickling does
+        # not count as an access of the columns.
+        return list, (self._decoded_values(),)
+
+    def __repr__(self):
+        return "Row(%r)" % (list(self),)
@@ -37,7 +37,10 @@ from google.cloud.spanner_v1._opentelemetry_tracing import (
     get_current_span,
     trace_call,
 )
-from google.cloud.spanner_v1.metrics.metrics_capture import MetricsCapture
+from google.cloud.spanner_v1.metrics.metrics_capture import (
+    MetricsCapture,
+    TransactionMetricsCapture,
+)
 from google.cloud.spanner_v1.types.spanner import (
     CreateSessionRequest,
     ExecuteSqlRequest,
@@ -351,6 +354,9 @@ class Session(object):
             the custom object enables deserialization of backend-received column data.
             If not provided, data remains serialized as bytes for Proto Messages and
             integer for Proto Enums.
+            Use :data:`~google.cloud.spanner_v1.data_types.COMPACT_TEMPORAL` as the value
+            of a column, or of the ``"*"`` key for all columns, to decode TIMESTAMP
+            values as int nanoseconds and DATE values as int days since the Unix epoch.
 
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows."""
@@ -416,6 +422,9 @@ class Session(object):
             the custom object enables deserialization of backend-received column data.
             If not provided, data remains serialized as bytes for Proto Messages and
             integer for Proto Enums.
+            Use :data:`~google.cloud.spanner_v1.data_types.COMPACT_TEMPORAL` as the value
+            of a column, or of the ``"*"`` key for all columns, to decode TIMESTAMP
+            values as int nanoseconds and DATE values as int days since the Unix epoch.
 
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows."""
@@ -479,6 +488,11 @@ class Session(object):
                    the DDL option `allow_txn_exclusion` being false or unset.
                    "isolation_level" sets the isolation level for the transaction.
                    "read_lock_mode" sets the read lock mode for the transaction.
+                   "single_use_commit" if true, commits a transaction that only
+                   buffers mutations in a single Commit RPC, instead of a
+                   BeginTransaction and a Commit RPC. Such a commit is not
+                   replay-protected, and the mutations may be applied more than
+                   once if the Commit RPC is sent more than once.
 
         :rtype: Any
         :returns: The return value of ``func``.
@@ -495,6 +509,7 @@ class Session(object):
         )
         isolation_level = kw.pop("isolation_level", None)
         read_lock_mode = kw.pop("read_lock_mode", None)
+        single_use_commit = kw.pop("single_use_commit", False)
         client_context = kw.pop("client_context", None)
         database = self._database
         log_commit_stats = database.log_commit_stats
@@ -506,7 +521,9 @@ class Session(object):
             self,
             extra_attributes=extra_attributes,
             observability_options=getattr(database, "observability_options", None),
-        ) as span, MetricsCapture(self._resource_info):
+        ) as span, MetricsCapture(self._resource_info), TransactionMetricsCapture(
+            self._resource_info, transaction_tag
+        ) as transaction_metrics:
             attempts: int = 0
             previous_transaction_id: Optional[bytes] = None
             while True:
@@ -515,6 +532,8 @@ class Session(object):
                 txn.exclude_txn_from_change_streams = exclude_txn_from_change_streams
                 txn.isolation_level = isolation_level
                 txn.read_lock_mode = read_lock_mode
+                txn.single_use_commit = single_use_commit
+                transaction_metrics.add_transaction(txn)
                 if self.is_multiplexed:
                     txn._multiplexed_session_previous_transaction_id = (
                         previous_transaction_id
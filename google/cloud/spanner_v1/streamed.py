@@ -18,7 +18,9 @@
 """Wrapper for streaming results."""
 from google.protobuf.struct_pb2 import ListValue, Value
 from google.cloud import exceptions
+from google.cloud.aio._cross_sync import CrossSync
 from google.cloud.spanner_v1._helpers import _get_type_decoder, _parse_nullable
+from google.cloud.spanner_v1.row import Row, _RowSchema
 from google.cloud.spanner_v1.types.result_set import PartialResultSet, ResultSetMetadata
 from google.cloud.spanner_v1.types.type import TypeCode
 
@@ -34,6 +36,27 @@ class StreamedResultSet(object):
 
     :type source: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
     :param source: Deprecated. Snapshot from which the result set was fetched.
+
+    :type decode_offload_bytes: int
+    :param decode_offload_bytes: (Optional) partial result sets of at least
+        this many bytes are decoded in a worker thread instead of on the
+        event loop. Only used by the asyncio client.
+
+    :type lazy_rows: bool
+    :param lazy_rows: (Optional) return the rows as
+        :class:`~google.cloud.spanner_v1.row.Row` objects, which decode a
+        value when it is first accessed.
+
+    :type column_profiler:
+        :class:`~google.cloud.spanner_v1.column_profiler.ColumnAccessProfiler`
+    :param column_profiler: (Optional) records the columns of the rows that
+        are accessed. The rows are returned as
+        :class:`~google.cloud.spanner_v1.row.Row` objects, unless
+        ``lazy_decode`` is used.
+
+    :type column_profile_tag: str
+    :param column_profile_tag: (Optional) the tag under which the columns
+        are recorded by ``column_profiler``.
     """
 
     def __init__(
@@ -42,6 +65,10 @@ class StreamedResultSet(object):
         source=None,
         column_info=None,
         lazy_decode: bool = False,
+        decode_offload_bytes: int = None,
+        lazy_rows: bool = False,
+        column_profiler=None,
+        column_profile_tag: str = None,
     ):
         self._response_iterator = response_iterator
         self._rows = []
@@ -52,6 +79,13 @@ class StreamedResultSet(object):
         self._column_info = column_info
         self._field_decoders = None
         self._lazy_decode = lazy_decode
+        self._decode_offload_bytes = decode_offload_bytes
+        self._lazy_rows = lazy_rows or (
+            column_profiler is not None and (not lazy_decode)
+        )
+        self._column_profiler = column_profiler
+        self._column_profile_tag = column_profile_tag
+        self._row_schema = None
         self._done = False
 
     @property
@@ -92,6 +126,18 @@ class StreamedResultSet(object):
             ]
         return self._field_decoders
 
+    @property
+    def _schema(self):
+        if self._row_schema is None:
+            names = [field.name for field in self.fields]
+            usage = None
+            if self._column_profiler is not None:
+                usage = self._column_profiler._start_result_set(
+                    self._column_profile_tag, names
+                )
+            self._row_schema = _RowSchema(names, self._decoders, usage)
+        return self._row_schema
+
     def _merge_chunk(self, value):
         """Merge pending chunk with next value.
 
@@ -115,14 +161,21 @@ class StreamedResultSet(object):
         decoders = self._decoders
         width = len(self.fields)
         index = len(self._current_row)
+        decode = not (self._lazy_decode or self._lazy_rows)
         for value in values:
-            if self._lazy_decode:
-                self._current_row.append(value)
-            else:
+            if decode:
                 self._current_row.append(_parse_nullable(value, decoders[index]))
+            else:
+                self._current_row.append(value)
             index += 1
             if index == width:
-                self._rows.append(self._current_row)
+                if self._lazy_rows:
+                    schema = self._schema
+                    if schema.usage is not None:
+                        schema.usage.add_row(self._current_row)
+                    self._rows.append(Row(schema, self._current_row))
+                else:
+                    self._rows.append(self._current_row)
                 self._current_row = []
                 index = 0
 
@@ -131,6 +184,13 @@ class StreamedResultSet(object):
 
         Parse the result set into new/existing rows in :attr:`_rows`"""
         response = self._response_iterator.__next__()
+        self._merge_response(response)
+
+    def _merge_response(self, response):
+        """Merge a partial result set into new/existing rows in :attr:`_rows`.
+
+        :type response: :class:`~google.cloud.spanner_v1.types.PartialResultSet`
+        :param response: the partial result set."""
         response_pb = PartialResultSet.pb(response)
         if self._metadata is None:
             self._metadata = response_pb.metadata
@@ -147,15 +207,69 @@ class StreamedResultSet(object):
 
     def __iter__(self):
         while True:
-            (iter_rows, self._rows[:]) = (self._rows[:], ())
-            while iter_rows:
-                yield iter_rows.pop(0)
+            iter_rows, self._rows = (self._rows, [])
+            for row in iter_rows:
+                yield row
             if self._done:
                 return
             try:
                 self._consume_next()
             except StopIteration:
                 return
+            CrossSync._Sync_Impl.yield_to_event_loop()
+
+    def _next_batches(self, batch_size):
+        """Consume the stream until at least one batch of rows is available.
+
+        :type batch_size: int
+        :param batch_size: the maximum number of rows in a batch, or None to
+            return the rows of each partial result set as one batch.
+
+        :rtype: list of list
+        :returns: the batches, or an empty list at the end of the stream."""
+        while not self._done and (
+            not self._rows or (batch_size is not None and len(self._rows) < batch_size)
+        ):
+            try:
+                self._consume_next()
+            except StopIteration:
+                self._done = True
+        rows = self._rows
+        if batch_size is None:
+            self._rows = []
+            return [rows] if rows else []
+        end = len(rows) if self._done else len(rows) - len(rows) % batch_size
+        self._rows = rows[end:]
+        return [rows[start : start + batch_size] for start in range(0, end, batch_size)]
+
+    def batches(self, batch_size: int = None, max_buffered_batches: int = 2):
+        """Iterate over the rows of the result set in batches.
+
+        With the asyncio client, the stream is read and decoded by a
+        background task while the batches are consumed. That task stops
+        reading from the stream when ``max_buffered_batches`` batches are
+        waiting to be consumed, so a slow consumer does not cause the whole
+        result set to be buffered in memory.
+
+        :type batch_size: int
+        :param batch_size: (Optional) the maximum number of rows in a batch.
+            By default, a batch contains the rows that were completed by one
+            partial result set.
+
+        :type max_buffered_batches: int
+        :param max_buffered_batches: the maximum number of batches that are
+            read ahead of the consumer. Only used by the asyncio client.
+
+        :rtype: iterable of list
+        :returns: lists of rows"""
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        while True:
+            batches = self._next_batches(batch_size)
+            if not batches:
+                return
+            for batch in batches:
+                yield batch
 
     def decode_row(self, row: []) -> []:
         """Decodes a row from protobuf values to Python objects. This function
@@ -165,6 +279,8 @@ class StreamedResultSet(object):
 
         :returns: an array containing the decoded values of all the columns in the given row
         """
+        if isinstance(row, Row):
+            return list(row)
         if not hasattr(row, "__len__"):
             raise TypeError("row", "row must be an array of protobuf values")
         decoders = self._decoders
@@ -179,6 +295,8 @@ class StreamedResultSet(object):
            that would have been returned by the rows iterator if ``lazy_decoding=False``.
 
         :returns: the decoded column value"""
+        if isinstance(row, Row):
+            return row[column_index]
         if not hasattr(row, "__len__"):
             raise TypeError("row", "row must be an array of protobuf values")
         decoders = self._decoders
@@ -226,15 +344,13 @@ class StreamedResultSet(object):
            :class:`list of dict`
         :returns: result rows as a list of dictionaries"""
         rows = []
+        names = None
         for row in self:
-            rows.append(
-                {
-                    column: value
-                    for (column, value) in zip(
-                        [column.name for column in self._metadata.row_type.fields], row
-                    )
-                }
-            )
+            if names is None:
+                names = [column.name for column in self._metadata.row_type.fields]
+            if isinstance(row, Row):
+                row = row._decoded_values()
+            rows.append(dict(zip(names, row)))
         return rows
 
 
@@ -291,7 +407,7 @@ def _merge_array(lhs, rhs, type_):
     if element_type.code in _UNMERGEABLE_TYPES:
         lhs.list_value.values.extend(rhs.list_value.values)
         return lhs
-    (lhs, rhs) = (list(lhs.list_value.values), list(rhs.list_value.values))
+    lhs, rhs = (list(lhs.list_value.values), list(rhs.list_value.values))
     if not len(lhs) or not len(rhs):
         return Value(list_value=ListValue(values=lhs + rhs))
     first = rhs.pop(0)
@@ -316,7 +432,7 @@ def _merge_array(lhs, rhs, type_):
 def _merge_struct(lhs, rhs, type_):
     """Helper for '_merge_by_type'."""
     fields = type_.struct_type.fields
-    (lhs, rhs) = (list(lhs.list_value.values), list(rhs.list_value.values))
+    lhs, rhs = (list(lhs.list_value.values), list(rhs.list_value.values))
     if not len(lhs) or not len(rhs):
         return Value(list_value=ListValue(values=lhs + rhs))
     candidate_type = fields[len(lhs) - 1].type_
@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import threading
+
+import grpc
+from google.longrunning import operations_grpc_pb2
 from google.longrunning import operations_pb2 as operations_pb2
 from google.protobuf import empty_pb2
 
+from google.cloud.spanner_admin_database_v1.types import spanner_database_admin
 import google.cloud.spanner_v1.testing.spanner_database_admin_pb2_grpc as database_admin_grpc
 
 
@@ -22,6 +28,10 @@ import google.cloud.spanner_v1.testing.spanner_database_admin_pb2_grpc as databa
 class DatabaseAdminServicer(database_admin_grpc.DatabaseAdminServicer):
     def __init__(self):
         self._requests = []
+        self._lock = threading.Lock()
+        self._ddl_polls = 0
+        self._operations = {}
+        self._operation_ids = itertools.count()
 
     @property
     def requests(self):
@@ -29,11 +39,68 @@ class DatabaseAdminServicer(database_admin_grpc.DatabaseAdminServicer):
 
     def clear_requests(self):
         self._requests = []
+        with self._lock:
+            self._ddl_polls = 0
+            self._operations = {}
+
+    def set_ddl_polls(self, polls):
+        # The number of GetOperation requests after which an UpdateDatabaseDdl
+        # operation is done. The statements of the operation are committed
+        # one by one while it is polled.
+        self._ddl_polls = polls
 
     def UpdateDatabaseDdl(self, request, context):
         self._requests.append(request)
         operation = operations_pb2.Operation()
-        operation.done = True
-        operation.name = "projects/test-project/operations/test-operation"
-        operation.response.Pack(empty_pb2.Empty())
+        if not self._ddl_polls:
+            operation.done = True
+            operation.name = "projects/test-project/operations/test-operation"
+            operation.response.Pack(empty_pb2.Empty())
+            return operation
+        with self._lock:
+            operation.name = "%s/operations/ddl-%d" % (
+                request.database,
+                next(self._operation_ids),
+            )
+            self._operations[operation.name] = [request, 0]
+        self._set_ddl_metadata(operation, request, 0)
+        return operation
+
+    def GetOperation(self, request, context):
+        self._requests.append(request)
+        with self._lock:
+            state = self._operations.get(request.name)
+            if state is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Operation not found")
+            state[1] += 1
+            ddl_request, polls = state
+        operation = operations_pb2.Operation(name=request.name)
+        committed = len(ddl_request.statements) * polls // self._ddl_polls
+        self._set_ddl_metadata(operation, ddl_request, committed)
+        if polls >= self._ddl_polls:
+            operation.done = True
+            operation.response.Pack(empty_pb2.Empty())
         return operation
+
+    @staticmethod
+    def _set_ddl_metadata(operation, request, committed):
+        metadata = spanner_database_admin.UpdateDatabaseDdlMetadata(
+            database=request.database, statements=request.statements
+        )
+        metadata_pb = spanner_database_admin.UpdateDatabaseDdlMetadata.pb(metadata)
+        for index in range(len(request.statements)):
+            progress = metadata_pb.progress.add()
+            if index < committed:
+                progress.progress_percent = 100
+                metadata_pb.commit_timestamps.add(seconds=1700000000 + index)
+        operation.metadata.Pack(metadata_pb)
+
+
+# An in-memory mock Operations server for the operations of the mock
+# DatabaseAdmin server.
+class OperationsServicer(operations_grpc_pb2.OperationsServicer):
+    def __init__(self, database_admin_servicer):
+        self._database_admin_servicer = database_admin_servicer
+
+    def GetOperation(self, request, context):
+        return self._database_admin_servicer.GetOperation(request, context)
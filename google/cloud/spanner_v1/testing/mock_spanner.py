@@ -13,14 +13,28 @@
 # limitations under the License.
 import base64
 from concurrent import futures
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import inspect
+import math
+import random
+import threading
+import time
+from typing import Dict, List, Optional
 import grpc
+from grpc_status._common import code_to_grpc_status_code
 from grpc_status.rpc_status import _Status
+from google.longrunning import operations_grpc_pb2
+from google.rpc import code_pb2, status_pb2
 from google.rpc.code_pb2 import OK
+from google.rpc.error_details_pb2 import RetryInfo
 from google.protobuf import empty_pb2
+from google.protobuf.duration_pb2 import Duration
 
-from google.cloud.spanner_v1.testing.mock_database_admin import DatabaseAdminServicer
+from google.cloud.spanner_v1.testing.mock_database_admin import (
+    DatabaseAdminServicer,
+    OperationsServicer,
+)
+from google.cloud.spanner_v1.testing.synthetic_results import SyntheticResult
 import google.cloud.spanner_v1.testing.spanner_database_admin_pb2_grpc as database_admin_grpc
 import google.cloud.spanner_v1.testing.spanner_pb2_grpc as spanner_grpc
 import google.cloud.spanner_v1.types.commit_response as commit
@@ -35,13 +49,29 @@ class MockSpanner:
     def __init__(self):
         self.results = {}
         self.execute_streaming_sql_results = {}
+        self.synthetic_results = {}
+        self.synthetic_read_results = {}
         self.errors = {}
 
     def clear_results(self):
         self.results = {}
         self.execute_streaming_sql_results = {}
+        self.synthetic_results = {}
+        self.synthetic_read_results = {}
         self.errors = {}
 
+    def add_synthetic_result(self, sql: str, result: SyntheticResult):
+        """Return rows that are generated while they are streamed for a query."""
+        self.synthetic_results[sql.lower().strip()] = result
+
+    def add_synthetic_read_result(self, table: str, result: SyntheticResult):
+        """Return rows that are generated while they are streamed for all
+        reads of a table, regardless of the key set and the columns."""
+        self.synthetic_read_results[table] = result
+
+    def get_synthetic_result(self, sql: str) -> Optional[SyntheticResult]:
+        return self.synthetic_results.get(sql.lower().strip())
+
     def add_result(self, sql: str, result: result_set.ResultSet):
         self.results[sql.lower().strip()] = result
 
@@ -117,6 +147,122 @@ class BatchDmlResponseConfig:
     include_transaction_id: bool = True
 
 
+# The z-score of the 99th percentile of the standard normal distribution.
+_P99_Z_SCORE = 2.3263
+
+# The error code that is used to simulate a connection reset. The client
+# library treats INTERNAL errors with this message as retryable.
+RST_STREAM = "RST_STREAM"
+_RST_STREAM_MESSAGE = "Received RST_STREAM with error code 2"
+
+
+@dataclass
+class Latency:
+    """A simulated server latency in seconds.
+
+    Latencies follow a log-normal distribution with the given median and 99th
+    percentile, which resembles the latencies of a real server. The latency
+    is fixed to the median if no 99th percentile is given.
+    """
+
+    median: float = 0.0
+    p99: Optional[float] = None
+
+    def sample(self, rng: random.Random) -> float:
+        if self.median <= 0:
+            return 0.0
+        if self.p99 is None or self.p99 <= self.median:
+            return self.median
+        sigma = math.log(self.p99 / self.median) / _P99_Z_SCORE
+        return rng.lognormvariate(math.log(self.median), sigma)
+
+
+@dataclass
+class FaultInjection:
+    """An error that the mock server returns for a method.
+
+    ``code`` is the name of a canonical error code, e.g. ``UNAVAILABLE`` or
+    ``ABORTED``, or ``RST_STREAM`` for an INTERNAL error that simulates a
+    connection reset. Streaming methods return the error after
+    ``after_partial_result_sets`` partial result sets if it is set, and
+    otherwise before returning any results. ``retry_delay`` adds a RetryInfo
+    with the given delay in seconds to the error.
+    """
+
+    method: str
+    code: str = "UNAVAILABLE"
+    probability: float = 1.0
+    max_occurrences: Optional[int] = None
+    after_partial_result_sets: Optional[int] = None
+    retry_delay: Optional[float] = None
+    message: Optional[str] = None
+
+    def to_status(self) -> _Status:
+        if self.code == RST_STREAM:
+            code = code_pb2.INTERNAL
+            message = self.message or _RST_STREAM_MESSAGE
+        else:
+            code = code_pb2.Code.Value(self.code)
+            message = self.message or "Simulated %s error." % self.code
+        return make_status(code, message, self.retry_delay)
+
+
+@dataclass
+class SimulationProfile:
+    """Declarative description of the behavior of a production-like server.
+
+    ``latencies`` maps method names, e.g. ``ExecuteStreamingSql``, to the
+    latency before the server starts responding. The entry ``*`` applies to
+    all other methods. ``stream_bytes_per_second`` limits the throughput of
+    each stream. ``resume_token_interval`` adds a resume token to every n-th
+    partial result set that does not have one, so that streams can be
+    resumed. Non-multiplexed sessions return NOT_FOUND once they are older
+    than ``session_ttl`` seconds. All random choices use ``seed``, so that a
+    sequence of requests is handled the same way on every run.
+    """
+
+    latencies: Dict[str, Latency] = field(default_factory=dict)
+    stream_bytes_per_second: Optional[float] = None
+    resume_token_interval: Optional[int] = None
+    faults: List[FaultInjection] = field(default_factory=list)
+    session_ttl: Optional[float] = None
+    seed: int = 0
+
+    @classmethod
+    def from_dict(cls, mapping: dict) -> "SimulationProfile":
+        """Create a profile from a dict, e.g. one that is loaded from JSON."""
+        mapping = dict(mapping)
+        mapping["latencies"] = {
+            method: Latency(**latency)
+            for method, latency in mapping.get("latencies", {}).items()
+        }
+        mapping["faults"] = [
+            FaultInjection(**fault) for fault in mapping.get("faults", [])
+        ]
+        return cls(**mapping)
+
+
+def make_status(code: int, message: str, retry_delay: Optional[float] = None):
+    """Create a status that the mock server can return as an error."""
+    error = status_pb2.Status(code=code, message=message)
+    trailing_metadata = [("grpc-status-details-bin", error.SerializeToString())]
+    if retry_delay is not None:
+        seconds = int(retry_delay)
+        retry_info = RetryInfo(
+            retry_delay=Duration(
+                seconds=seconds, nanos=int((retry_delay - seconds) * 1e9)
+            )
+        )
+        trailing_metadata.append(
+            ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
+        )
+    return _Status(
+        code=code_to_grpc_status_code(code),
+        details=message,
+        trailing_metadata=tuple(trailing_metadata),
+    )
+
+
 # An in-memory mock Spanner server that can be used for testing.
 class SpannerServicer(spanner_grpc.SpannerServicer):
     def __init__(self):
@@ -127,6 +273,11 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
         self.transactions = {}
         self._mock_spanner = MockSpanner()
         self._batch_dml_response_configs = []
+        self._session_create_times = {}
+        self._simulation_profile = None
+        self._simulation_lock = threading.Lock()
+        self._simulation_rng = random.Random()
+        self._fault_occurrences = {}
 
     @property
     def mock_spanner(self):
@@ -151,12 +302,140 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
     def clear_results(self):
         self.mock_spanner.clear_results()
 
+    @property
+    def simulation_profile(self):
+        return self._simulation_profile
+
+    def set_simulation_profile(self, profile: SimulationProfile):
+        """Simulate latencies, throughput limits and errors of a real server."""
+        with self._simulation_lock:
+            self._simulation_profile = profile
+            self._simulation_rng = random.Random(profile.seed)
+            self._fault_occurrences = {}
+
+    def clear_simulation_profile(self):
+        with self._simulation_lock:
+            self._simulation_profile = None
+            self._fault_occurrences = {}
+
+    def __simulate_request(self, method, request, context, session=None):
+        profile = self._simulation_profile
+        if profile is None:
+            return
+        with self._simulation_lock:
+            latency = profile.latencies.get(method) or profile.latencies.get("*")
+            delay = latency.sample(self._simulation_rng) if latency else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        if session is None:
+            session = getattr(request, "session", "")
+        if session and profile.session_ttl is not None:
+            self.__check_session_ttl(session, profile.session_ttl, context)
+        fault = self.__select_fault(method, streaming=False)
+        if fault is not None:
+            context.abort_with_status(fault.to_status())
+
+    def __check_session_ttl(self, name, ttl, context):
+        session = self.sessions.get(name)
+        if session is not None and not session.multiplexed:
+            created = self._session_create_times.get(name, time.monotonic())
+            if time.monotonic() - created < ttl:
+                return
+            self.sessions.pop(name, None)
+        elif session is not None:
+            return
+        context.abort_with_status(
+            make_status(code_pb2.NOT_FOUND, "Session not found: " + name)
+        )
+
+    def __select_fault(self, method, streaming):
+        profile = self._simulation_profile
+        if profile is None or not profile.faults:
+            return None
+        with self._simulation_lock:
+            for index, fault in enumerate(profile.faults):
+                if fault.method != method:
+                    continue
+                if streaming != (fault.after_partial_result_sets is not None):
+                    continue
+                occurrences = self._fault_occurrences.get(index, 0)
+                if (
+                    fault.max_occurrences is not None
+                    and occurrences >= fault.max_occurrences
+                ):
+                    continue
+                if self._simulation_rng.random() >= fault.probability:
+                    continue
+                self._fault_occurrences[index] = occurrences + 1
+                return fault
+        return None
+
+    def __release_fault(self, fault):
+        with self._simulation_lock:
+            index = self._simulation_profile.faults.index(fault)
+            self._fault_occurrences[index] -= 1
+
+    def __stream_partial_result_sets(self, method, request, partials, context):
+        """Stream a list of partial result sets, starting after the resume
+        token in the request."""
+        profile = self._simulation_profile
+        interval = profile.resume_token_interval if profile else None
+
+        def resume_token(index):
+            token = partials[index].resume_token
+            if not token and interval and (index + 1) % interval == 0:
+                token = b"%d" % index
+            return token
+
+        start = 0
+        if request.resume_token:
+            for index in range(len(partials)):
+                if resume_token(index) == request.resume_token:
+                    start = index + 1
+                    break
+        if profile is None:
+            yield from partials[start:]
+            return
+
+        def with_resume_tokens():
+            for index in range(start, len(partials)):
+                partial = partials[index]
+                token = resume_token(index)
+                if token != partial.resume_token:
+                    partial = result_set.PartialResultSet(partial)
+                    partial.resume_token = token
+                yield partial
+
+        yield from self.__simulate_stream(method, with_resume_tokens(), context)
+
+    def __simulate_stream(self, method, partials, context):
+        profile = self._simulation_profile
+        if profile is None:
+            yield from partials
+            return
+
+        fault = self.__select_fault(method, streaming=True)
+        count = 0
+        for partial in partials:
+            if fault is not None and count == fault.after_partial_result_sets:
+                context.abort_with_status(fault.to_status())
+            yield partial
+            count += 1
+            if profile.stream_bytes_per_second:
+                size = result_set.PartialResultSet.pb(partial).ByteSize()
+                time.sleep(size / profile.stream_bytes_per_second)
+        if fault is not None:
+            # The stream ended before the error would be returned.
+            self.__release_fault(fault)
+
     def CreateSession(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("CreateSession", request, context, session="")
         return self.__create_session(request.database, request.session)
 
     def BatchCreateSessions(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("BatchCreateSessions", request, context, session="")
         self.mock_spanner.pop_error(context)
         sessions = []
         for i in range(request.session_count):
@@ -173,22 +452,27 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
         session.labels.MergeFrom(session_template.labels)
         session.creator_role = session_template.creator_role
         self.sessions[session.name] = session
+        self._session_create_times[session.name] = time.monotonic()
         return session
 
     def GetSession(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("GetSession", request, context, session=request.name)
         return spanner.Session()
 
     def ListSessions(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("ListSessions", request, context, session="")
         return [spanner.Session()]
 
     def DeleteSession(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("DeleteSession", request, context, session=request.name)
         return empty_pb2.Empty()
 
     def ExecuteSql(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("ExecuteSql", request, context)
         self.mock_spanner.pop_error(context)
         started_transaction = self.__maybe_create_transaction(request)
         result: result_set.ResultSet = self.mock_spanner.get_result(request.sql)
@@ -199,16 +483,26 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def ExecuteStreamingSql(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("ExecuteStreamingSql", request, context)
         self.mock_spanner.pop_error(context)
         started_transaction = self.__maybe_create_transaction(request)
+        synthetic = self.mock_spanner.get_synthetic_result(request.sql)
+        if synthetic is not None:
+            partials = synthetic.partial_result_sets(
+                request.partition_token, request.resume_token, started_transaction
+            )
+            yield from self.__simulate_stream("ExecuteStreamingSql", partials, context)
+            return
         partials = self.mock_spanner.get_execute_streaming_sql_results(
             request.sql, started_transaction
         )
-        for result in partials:
-            yield result
+        yield from self.__stream_partial_result_sets(
+            "ExecuteStreamingSql", request, partials, context
+        )
 
     def ExecuteBatchDml(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("ExecuteBatchDml", request, context)
         self.mock_spanner.pop_error(context)
         response = spanner.ExecuteBatchDmlResponse()
         started_transaction = self.__maybe_create_transaction(request)
@@ -242,15 +536,29 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def Read(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("Read", request, context)
         return result_set.ResultSet()
 
     def StreamingRead(self, request, context):
         self._requests.append(request)
-        for result in [result_set.PartialResultSet(), result_set.PartialResultSet()]:
-            yield result
+        self.__simulate_request("StreamingRead", request, context)
+        synthetic = self.mock_spanner.synthetic_read_results.get(request.table)
+        if synthetic is not None:
+            partials = synthetic.partial_result_sets(
+                request.partition_token,
+                request.resume_token,
+                self.__maybe_create_transaction(request),
+            )
+            yield from self.__simulate_stream("StreamingRead", partials, context)
+            return
+        partials = [result_set.PartialResultSet(), result_set.PartialResultSet()]
+        yield from self.__stream_partial_result_sets(
+            "StreamingRead", request, partials, context
+        )
 
     def BeginTransaction(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("BeginTransaction", request, context)
         return self.__create_transaction(request.session, request.options)
 
     def __maybe_create_transaction(self, request):
@@ -277,6 +585,7 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def Commit(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("Commit", request, context)
         self.mock_spanner.pop_error(context)
         if not request.transaction_id == b"":
             tx = self.transactions[request.transaction_id]
@@ -295,33 +604,60 @@ class SpannerServicer(spanner_grpc.SpannerServicer):
 
     def Rollback(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("Rollback", request, context)
         return empty_pb2.Empty()
 
     def PartitionQuery(self, request, context):
         self._requests.append(request)
-        return spanner.PartitionResponse()
+        self.__simulate_request("PartitionQuery", request, context)
+        synthetic = self.mock_spanner.get_synthetic_result(request.sql)
+        return self.__partition(synthetic, request)
 
     def PartitionRead(self, request, context):
         self._requests.append(request)
-        return spanner.PartitionResponse()
+        self.__simulate_request("PartitionRead", request, context)
+        synthetic = self.mock_spanner.synthetic_read_results.get(request.table)
+        return self.__partition(synthetic, request)
+
+    def __partition(self, synthetic, request):
+        response = spanner.PartitionResponse()
+        if synthetic is not None:
+            tokens = synthetic.partition_tokens(
+                request.partition_options.max_partitions
+            )
+            response.partitions.extend(
+                [spanner.Partition(partition_token=token) for token in tokens]
+            )
+        started_transaction = self.__maybe_create_transaction(request)
+        if started_transaction is not None:
+            response.transaction = started_transaction
+        return response
 
     def BatchWrite(self, request, context):
         self._requests.append(request)
+        self.__simulate_request("BatchWrite", request, context)
         for result in [spanner.BatchWriteResponse(), spanner.BatchWriteResponse()]:
             yield result
 
 
-def start_mock_server() -> (grpc.Server, SpannerServicer, DatabaseAdminServicer, int):
+def start_mock_server(
+    simulation_profile: Optional[SimulationProfile] = None, max_workers: int = 10
+) -> (grpc.Server, SpannerServicer, DatabaseAdminServicer, int):
     # Create a gRPC server.
-    spanner_server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    spanner_server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
 
     # Add the Spanner services to the gRPC server.
     spanner_servicer = SpannerServicer()
+    if simulation_profile is not None:
+        spanner_servicer.set_simulation_profile(simulation_profile)
     spanner_grpc.add_SpannerServicer_to_server(spanner_servicer, spanner_server)
     database_admin_servicer = DatabaseAdminServicer()
     database_admin_grpc.add_DatabaseAdminServicer_to_server(
         database_admin_servicer, spanner_server
     )
+    operations_grpc_pb2.add_OperationsServicer_to_server(
+        OperationsServicer(database_admin_servicer), spanner_server
+    )
 
     # Start the server on a random port.
     port = spanner_server.add_insecure_port("[::]:0")
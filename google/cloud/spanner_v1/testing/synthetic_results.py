@@ -0,0 +1,323 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazily generated result sets for the mock Spanner server."""
+
+import base64
+import datetime
+import json
+import random
+import struct
+from typing import Callable, Iterator, List, Tuple
+import uuid
+
+from google.protobuf import struct_pb2
+
+import google.cloud.spanner_v1.types.result_set as result_set
+from google.cloud.spanner_v1.types.result_set import ResultSetMetadata
+from google.cloud.spanner_v1.types.type import StructType, Type, TypeCode
+
+# Spanner returns partial result sets of roughly this size.
+DEFAULT_PARTIAL_RESULT_SET_BYTES = 1024 * 1024
+
+_PartialResultSetPb = result_set.PartialResultSet.pb()
+_RESUME_TOKEN_PREFIX = b"synthetic-position:"
+_PARTITION_TOKEN_PREFIX = b"synthetic-partition:"
+_CHUNKABLE_TYPE_CODES = (TypeCode.STRING, TypeCode.BYTES, TypeCode.JSON)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# The number of days and seconds between the epoch and 10000-01-01.
+_MAX_DAYS = 2932897
+_MAX_SECONDS = _MAX_DAYS * 86400
+
+
+class SyntheticResult:
+    """A large result set whose rows are generated while they are streamed.
+
+    Every row is generated from the seed and its row number, so that a row
+    has the same values whenever it is generated again, e.g. after a stream
+    is resumed or when the rows are read with partitions. Rows are packed
+    into partial result sets of roughly ``partial_result_set_bytes`` bytes,
+    and string values that do not fit in the current partial result set are
+    chunked. Every partial result set that does not end with a chunked value
+    has a resume token.
+
+    ``fields`` is a list of ``(name, type)`` tuples, where ``type`` is either
+    a ``TypeCode`` or a ``Type``, which allows ARRAY and STRUCT columns.
+    """
+
+    def __init__(
+        self,
+        fields: List[Tuple[str, object]],
+        row_count: int,
+        seed: int = 0,
+        partial_result_set_bytes: int = DEFAULT_PARTIAL_RESULT_SET_BYTES,
+        string_length: int = 32,
+        array_length: int = 3,
+        null_fraction: float = 0.0,
+        partition_count: int = 4,
+    ):
+        self.fields = [
+            StructType.Field(
+                name=name,
+                type_=field_type
+                if isinstance(field_type, Type)
+                else Type(code=field_type),
+            )
+            for name, field_type in fields
+        ]
+        self.row_count = row_count
+        self.seed = seed
+        self.partial_result_set_bytes = partial_result_set_bytes
+        self.string_length = string_length
+        self.array_length = array_length
+        self.null_fraction = null_fraction
+        self.partition_count = partition_count
+        self._generators = [self._value_generator(field.type_) for field in self.fields]
+        self._chunkable = [
+            field.type_.code in _CHUNKABLE_TYPE_CODES for field in self.fields
+        ]
+
+    @property
+    def metadata(self) -> ResultSetMetadata:
+        return ResultSetMetadata(row_type=StructType(fields=self.fields))
+
+    def row(self, row_number: int) -> List[struct_pb2.Value]:
+        """Generate the values of a row."""
+        rng = random.Random(self.seed * 1000003 + row_number)
+        return [generate(rng) for generate in self._generators]
+
+    def partition_tokens(self, max_partitions: int = 0) -> List[bytes]:
+        """Split the rows into disjoint slices, one per partition token."""
+        count = max_partitions or self.partition_count
+        count = max(1, min(count, self.row_count))
+        bounds = [self.row_count * index // count for index in range(count + 1)]
+        return [
+            _PARTITION_TOKEN_PREFIX + b"%d:%d" % (start, end)
+            for start, end in zip(bounds, bounds[1:])
+        ]
+
+    def partial_result_sets(
+        self,
+        partition_token: bytes = b"",
+        resume_token: bytes = b"",
+        transaction=None,
+    ) -> Iterator[result_set.PartialResultSet]:
+        """Lazily generate the partial result sets of a stream.
+
+        :param partition_token: (Optional) only return the rows of this
+            partition, as returned by :meth:`partition_tokens`.
+        :param resume_token: (Optional) continue a stream after the partial
+            result set with this resume token.
+        :param transaction: (Optional) the transaction that was started by
+            the request, which is returned in the metadata.
+        """
+        start, end = 0, self.row_count
+        start_column = 0
+        if partition_token:
+            start, end = _parse_partition_token(partition_token)
+        if resume_token:
+            start, start_column = _parse_resume_token(resume_token)
+
+        # The partial result sets are built as protobuf messages, as they are
+        # much faster to fill than their proto-plus wrappers.
+        partial = _PartialResultSetPb()
+        partial.metadata.CopyFrom(ResultSetMetadata.pb(self.metadata))
+        if transaction is not None:
+            partial.metadata.transaction.CopyFrom(type(transaction).pb(transaction))
+        size = 0
+        for row_number in range(start, end):
+            values = self.row(row_number)
+            for column in range(start_column, len(values)):
+                value = values[column]
+                value_size = value.ByteSize()
+                remaining = self.partial_result_set_bytes - size
+                if value_size > remaining:
+                    if (
+                        self._chunkable[column]
+                        and value.WhichOneof("kind") == "string_value"
+                    ):
+                        # Chunk the value, like Spanner does for values that
+                        # do not fit in the current partial result set.
+                        chunks, value = _split_string(
+                            value.string_value,
+                            remaining,
+                            self.partial_result_set_bytes,
+                        )
+                        for chunk in chunks:
+                            partial.values.add(string_value=chunk)
+                            partial.chunked_value = True
+                            yield result_set.PartialResultSet.wrap(partial)
+                            partial = _PartialResultSetPb()
+                            size = 0
+                        value_size = value.ByteSize()
+                    elif size > 0:
+                        partial.resume_token = _resume_token(row_number, column)
+                        yield result_set.PartialResultSet.wrap(partial)
+                        partial = _PartialResultSetPb()
+                        size = 0
+                partial.values.append(value)
+                size += value_size
+            start_column = 0
+            if size >= self.partial_result_set_bytes:
+                partial.resume_token = _resume_token(row_number + 1, 0)
+                yield result_set.PartialResultSet.wrap(partial)
+                partial = _PartialResultSetPb()
+                size = 0
+        partial.resume_token = _resume_token(end, 0)
+        partial.last = True
+        yield result_set.PartialResultSet.wrap(partial)
+
+    def _value_generator(self, field_type: Type) -> Callable:
+        """Return a function that generates random values of a type."""
+        generate = self._non_null_value_generator(field_type)
+        null_fraction = self.null_fraction
+        if not null_fraction:
+            return generate
+
+        def generate_nullable(rng):
+            if rng.random() < null_fraction:
+                return struct_pb2.Value(null_value=struct_pb2.NULL_VALUE)
+            return generate(rng)
+
+        return generate_nullable
+
+    def _non_null_value_generator(self, field_type: Type) -> Callable:
+        code = field_type.code
+        length = self.string_length
+        if code == TypeCode.BOOL:
+            return lambda rng: struct_pb2.Value(bool_value=rng.random() < 0.5)
+        elif code in (TypeCode.INT64, TypeCode.ENUM):
+            return lambda rng: struct_pb2.Value(
+                string_value=str(rng.getrandbits(64) - 2**63)
+            )
+        elif code == TypeCode.FLOAT64:
+            return lambda rng: struct_pb2.Value(number_value=rng.uniform(-1e9, 1e9))
+        elif code == TypeCode.FLOAT32:
+            return lambda rng: struct_pb2.Value(
+                number_value=struct.unpack(
+                    "f", struct.pack("f", rng.uniform(-1e6, 1e6))
+                )[0]
+            )
+        elif code == TypeCode.STRING:
+            return lambda rng: struct_pb2.Value(string_value=_string(rng, length))
+        elif code in (TypeCode.BYTES, TypeCode.PROTO):
+            return lambda rng: struct_pb2.Value(
+                string_value=base64.b64encode(_bytes(rng, length)).decode("ascii")
+            )
+        elif code == TypeCode.JSON:
+            return lambda rng: struct_pb2.Value(
+                string_value=json.dumps(
+                    {"id": rng.getrandbits(31), "name": _string(rng, length)},
+                    sort_keys=True,
+                )
+            )
+        elif code == TypeCode.NUMERIC:
+            return lambda rng: struct_pb2.Value(
+                string_value="%d.%09d"
+                % (rng.randint(-(10**20), 10**20), rng.randrange(10**9))
+            )
+        elif code == TypeCode.DATE:
+            return lambda rng: struct_pb2.Value(
+                string_value=(
+                    _EPOCH.date() + datetime.timedelta(days=rng.randrange(_MAX_DAYS))
+                ).isoformat()
+            )
+        elif code == TypeCode.TIMESTAMP:
+            return lambda rng: struct_pb2.Value(
+                string_value=(
+                    _EPOCH + datetime.timedelta(seconds=rng.randrange(_MAX_SECONDS))
+                ).strftime("%Y-%m-%dT%H:%M:%S")
+                + ".%09dZ" % rng.randrange(10**9)
+            )
+        elif code == TypeCode.UUID:
+            return lambda rng: struct_pb2.Value(
+                string_value=str(uuid.UUID(int=rng.getrandbits(128)))
+            )
+        elif code == TypeCode.INTERVAL:
+            return lambda rng: struct_pb2.Value(
+                string_value="P%dY%dM%dDT%dH%dM%d.%09dS"
+                % (
+                    rng.randrange(100),
+                    rng.randrange(12),
+                    rng.randrange(31),
+                    rng.randrange(24),
+                    rng.randrange(60),
+                    rng.randrange(60),
+                    rng.randrange(10**9),
+                )
+            )
+        elif code == TypeCode.ARRAY:
+            generate_element = self._value_generator(field_type.array_element_type)
+            array_length = self.array_length
+            return lambda rng: struct_pb2.Value(
+                list_value=struct_pb2.ListValue(
+                    values=[
+                        generate_element(rng)
+                        for _ in range(rng.randint(0, array_length))
+                    ]
+                )
+            )
+        elif code == TypeCode.STRUCT:
+            generators = [
+                self._value_generator(item_field.type_)
+                for item_field in field_type.struct_type.fields
+            ]
+            return lambda rng: struct_pb2.Value(
+                list_value=struct_pb2.ListValue(
+                    values=[generate(rng) for generate in generators]
+                )
+            )
+        raise ValueError("Unsupported type: %s" % (field_type,))
+
+
+# Maps random bytes to lowercase letters.
+_LETTERS = bytes(ord("a") + index % 26 for index in range(256))
+
+
+def _bytes(rng, length):
+    return rng.getrandbits(8 * length).to_bytes(length, "little") if length else b""
+
+
+def _string(rng, length):
+    return _bytes(rng, length).translate(_LETTERS).decode("ascii")
+
+
+def _split_string(value, first_chunk_size, chunk_size):
+    """Split a string into the chunks that fill partial result sets, and the
+    value with the rest of the string."""
+    chunks = []
+    size = max(1, first_chunk_size)
+    while len(value) > size:
+        chunks.append(value[:size])
+        value = value[size:]
+        size = chunk_size
+    return chunks, struct_pb2.Value(string_value=value)
+
+
+def _parse_partition_token(token: bytes) -> Tuple[int, int]:
+    if not token.startswith(_PARTITION_TOKEN_PREFIX):
+        raise ValueError("Invalid partition token: %r" % (token,))
+    start, end = token[len(_PARTITION_TOKEN_PREFIX) :].split(b":")
+    return int(start), int(end)
+
+
+def _resume_token(row_number: int, column: int) -> bytes:
+    """Return the token for resuming a stream at a column of a row."""
+    return _RESUME_TOKEN_PREFIX + b"%d:%d" % (row_number, column)
+
+
+def _parse_resume_token(token: bytes) -> Tuple[int, int]:
+    if not token.startswith(_RESUME_TOKEN_PREFIX):
+        raise ValueError("Invalid resume token: %r" % (token,))
+    row_number, column = token[len(_RESUME_TOKEN_PREFIX) :].split(b":")
+    return int(row_number), int(column)
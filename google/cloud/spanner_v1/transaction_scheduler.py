@@ -0,0 +1,319 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side scheduling of read/write transactions that contend on keys.
+
+:meth:`Database.run_in_transaction` retries a transaction that is aborted
+independently of all other transactions. When many transactions update the
+same rows, the retries abort each other again, and most attempts are wasted.
+A :class:`TransactionScheduler` tracks the abort rate of the keys that the
+transactions declare, and limits the number of transactions that run at the
+same time on a key whose abort rate is high, letting the oldest transaction
+go first.
+"""
+
+import itertools
+import threading
+import time
+
+from google.api_core.exceptions import Aborted
+
+
+class _Requeue(Exception):
+    """Raised by a retry that must wait, to give back its session."""
+
+
+class _KeyState(object):
+    """The abort rate, running transactions and queueing delay of a key."""
+
+    def __init__(self):
+        self.attempts = 0
+        self.aborts = 0
+        self.abort_rate = 0.0
+        self.running = set()
+        self.queued = 0
+        self.queueing_delay_count = 0
+        self.queueing_delay_total = 0.0
+        self.queueing_delay_max = 0.0
+
+
+class _Ticket(object):
+    """A transaction of the scheduler, including all of its attempts."""
+
+    def __init__(self, keys, sequence_number):
+        self.keys = keys
+        # Transactions are admitted in the order in which they first
+        # started, so that an aborted transaction is retried before the
+        # transactions that started after it.
+        self.priority = (time.monotonic(), sequence_number)
+        self.attempts = 0
+        self.admitted = False
+        self.in_attempt = False
+        self.queued_since = None
+
+
+class TransactionScheduler(object):
+    """Runs read/write transactions, limiting concurrency on hot keys.
+
+    Every transaction declares the keys that it contends on, e.g. the primary
+    keys of the rows that it updates or a name for a group of rows. The
+    transaction tag is used as the key if no keys are given. The scheduler
+    keeps an exponentially weighted abort rate per key. A key whose abort
+    rate reaches ``abort_rate_threshold`` is hot: at most
+    ``hot_key_concurrency`` transactions on the key run at the same time, and
+    the other transactions wait in the order in which they first started.
+    Transactions wait before a session is checked out, so that waiting
+    transactions do not hold the sessions of the pool. An aborted
+    transaction keeps its keys and its session during the backoff before
+    the retry. If the retry exceeds the limit of a key that has become hot,
+    the transaction gives back its session and waits again, ahead of all
+    newer transactions. The waiting time before every attempt is reported
+    as queueing delay.
+
+    Keys are kept for the lifetime of the scheduler, so they should have a
+    bounded number of values.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: the database to run the transactions on.
+
+    :type abort_rate_threshold: float
+    :param abort_rate_threshold: the abort rate from which a key is hot.
+
+    :type hot_key_concurrency: int
+    :param hot_key_concurrency: the maximum number of transactions that run
+                                at the same time on a hot key. The default of
+                                1 serializes the transactions on a hot key.
+
+    :type smoothing: float
+    :param smoothing: the weight of the outcome of the latest attempt in the
+                      abort rate of a key.
+    """
+
+    def __init__(
+        self,
+        database,
+        abort_rate_threshold=0.2,
+        hot_key_concurrency=1,
+        smoothing=0.2,
+    ):
+        if not 0 < abort_rate_threshold <= 1:
+            raise ValueError("abort_rate_threshold must be in (0, 1]")
+        if hot_key_concurrency < 1:
+            raise ValueError("hot_key_concurrency must be at least 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self._database = database
+        self.abort_rate_threshold = abort_rate_threshold
+        self.hot_key_concurrency = hot_key_concurrency
+        self.smoothing = smoothing
+        self._keys = {}
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def run_in_transaction(self, func, *args, keys=None, **kw):
+        """Perform a unit of work in a transaction, retrying on abort.
+
+        Every attempt of the transaction waits until it may run on all of
+        its keys, without holding a session while it waits. The arguments
+        are the same as the arguments of :meth:`Database.run_in_transaction`.
+
+        :type func: callable
+        :param func: takes a required positional argument, the transaction,
+                     and additional positional / keyword arguments as supplied
+                     by the caller.
+
+        :type args: tuple
+        :param args: additional positional arguments to be passed to ``func``.
+
+        :type keys: str or iterable of str
+        :param keys: (Optional) the keys that the transaction contends on.
+                     Defaults to the "transaction_tag" keyword argument. A
+                     transaction without keys is not scheduled.
+
+        :type kw: dict
+        :param kw: (Optional) keyword arguments to be passed to
+                   :meth:`Database.run_in_transaction`.
+
+        :rtype: Any
+        :returns: The return value of ``func``.
+        """
+        keys = _normalize_keys(keys, kw.get("transaction_tag"))
+        if not keys:
+            return self._database.run_in_transaction(func, *args, **kw)
+        ticket = _Ticket(keys, next(self._sequence))
+
+        def scheduled(transaction, *func_args, **func_kw):
+            if ticket.in_attempt:
+                # The previous attempt was aborted, either by func or by the
+                # commit, which is not seen by this wrapper.
+                self._record_attempt(ticket, aborted=True)
+                if not self._reacquire(ticket):
+                    # Give back the session instead of waiting with it.
+                    ticket.in_attempt = False
+                    raise _Requeue()
+            ticket.in_attempt = True
+            ticket.attempts += 1
+            return func(transaction, *func_args, **func_kw)
+
+        while True:
+            self._acquire(ticket)
+            try:
+                return_value = self._database.run_in_transaction(scheduled, *args, **kw)
+            except _Requeue:
+                continue
+            except Aborted:
+                self._release(ticket)
+                self._record_attempt(ticket, aborted=True)
+                raise
+            except Exception:
+                self._release(ticket)
+                raise
+            self._release(ticket)
+            self._record_attempt(ticket, aborted=False)
+            return return_value
+
+    def snapshot(self):
+        """Return the abort rate and queueing delay of every key.
+
+        :rtype: dict
+        :returns: a dict from key to a dict with the number of ``attempts``
+                  and ``aborts``, the ``abort_rate``, whether the key is
+                  ``hot``, the number of ``running`` and ``queued``
+                  transactions, and the ``queueing_delay`` of the attempts
+                  with its ``count``, ``total_seconds`` and ``max_seconds``.
+        """
+        with self._condition:
+            return {
+                key: {
+                    "attempts": state.attempts,
+                    "aborts": state.aborts,
+                    "abort_rate": state.abort_rate,
+                    "hot": self._is_hot(state),
+                    "running": len(state.running),
+                    "queued": state.queued,
+                    "queueing_delay": {
+                        "count": state.queueing_delay_count,
+                        "total_seconds": state.queueing_delay_total,
+                        "max_seconds": state.queueing_delay_max,
+                    },
+                }
+                for key, state in self._keys.items()
+            }
+
+    def reset(self):
+        """Clear the statistics of all keys that have no transactions."""
+        with self._condition:
+            self._keys = {
+                key: state
+                for key, state in self._keys.items()
+                if state.running or state.queued
+            }
+            for state in self._keys.values():
+                state.attempts = state.aborts = state.queueing_delay_count = 0
+                state.abort_rate = 0.0
+                state.queueing_delay_total = state.queueing_delay_max = 0.0
+            self._condition.notify_all()
+
+    def _is_hot(self, state):
+        return state.abort_rate >= self.abort_rate_threshold
+
+    def _can_run(self, ticket):
+        for key in ticket.keys:
+            state = self._keys[key]
+            if not self._is_hot(state):
+                continue
+            if len(state.running) >= self.hot_key_concurrency:
+                return False
+            for other in self._waiting:
+                if other.priority < ticket.priority and key in other.keys:
+                    return False
+        return True
+
+    def _acquire(self, ticket):
+        with self._condition:
+            if ticket.queued_since is None:
+                self._enqueue(ticket)
+            try:
+                while not self._can_run(ticket):
+                    self._condition.wait()
+            finally:
+                started, ticket.queued_since = ticket.queued_since, None
+                self._waiting.remove(ticket)
+                for key in ticket.keys:
+                    self._keys[key].queued -= 1
+                # A waiting ticket may block younger tickets on its keys.
+                self._condition.notify_all()
+            self._admit(ticket, time.monotonic() - started)
+
+    def _reacquire(self, ticket):
+        """Admit a retry without waiting, or queue it and return False."""
+        with self._condition:
+            # A retry gives up its keys and waits again, ahead of all newer
+            # transactions, as the keys may have become hot.
+            for key in ticket.keys:
+                self._keys[key].running.discard(ticket)
+            if self._can_run(ticket):
+                self._admit(ticket, 0.0)
+                return True
+            ticket.admitted = False
+            # The ticket is queued right away, so that no newer transaction
+            # overtakes it while it gives back its session.
+            self._enqueue(ticket)
+            self._condition.notify_all()
+            return False
+
+    def _enqueue(self, ticket):
+        ticket.queued_since = time.monotonic()
+        self._waiting.append(ticket)
+        for key in ticket.keys:
+            self._keys.setdefault(key, _KeyState()).queued += 1
+
+    def _admit(self, ticket, delay):
+        for key in ticket.keys:
+            state = self._keys[key]
+            state.running.add(ticket)
+            state.queueing_delay_count += 1
+            state.queueing_delay_total += delay
+            state.queueing_delay_max = max(state.queueing_delay_max, delay)
+        ticket.admitted = True
+
+    def _release(self, ticket):
+        with self._condition:
+            if not ticket.admitted:
+                return
+            ticket.admitted = False
+            for key in ticket.keys:
+                self._keys[key].running.discard(ticket)
+            self._condition.notify_all()
+
+    def _record_attempt(self, ticket, aborted):
+        with self._condition:
+            for key in ticket.keys:
+                state = self._keys.setdefault(key, _KeyState())
+                state.attempts += 1
+                if aborted:
+                    state.aborts += 1
+                state.abort_rate += self.smoothing * (float(aborted) - state.abort_rate)
+            self._condition.notify_all()
+
+
+def _normalize_keys(keys, transaction_tag):
+    if keys is None:
+        keys = transaction_tag
+    if not keys:
+        return ()
+    if isinstance(keys, str):
+        return (keys,)
+    return tuple(sorted(set(keys)))
@@ -276,6 +276,25 @@ def mockserver(session):
     )
 
 
+@nox.session(python=DEFAULT_MOCK_SERVER_TESTS_PYTHON_VERSION)
+def benchmark(session):
+    """Run the offline benchmarks against the mock server.
+
+    Pass a file name to write the JSON results to, e.g.
+    ``nox -s benchmark -- --output results.json``.
+    """
+    constraints_path = str(
+        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
+    )
+    session.install("-e", ".", "-c", constraints_path)
+
+    session.run(
+        "python",
+        os.path.join("benchmark", "mock_server_benchmark.py"),
+        *session.posargs,
+    )
+
+
 def install_systemtest_dependencies(session, *constraints):
     # Use pre-release gRPC for system tests.
     # Exclude version 1.52.0rc1 which has a known issue.
@@ -56,7 +56,12 @@ dependencies = [
     "google-cloud-monitoring >= 2.16.0",
     "mmh3 >= 4.1.0 ",
 ]
-extras = {"libcst": "libcst >= 0.2.5"}
+extras = {
+    "libcst": "libcst >= 0.2.5",
+    "arrow": ["pyarrow >= 10.0.0"],
+    "pandas": ["pyarrow >= 10.0.0", "pandas >= 1.5.0"],
+    "json": ["orjson >= 3.9.0"],
+}
 
 url = "https://github.com/googleapis/python-spanner"
 
@@ -237,6 +237,7 @@ class MockServerTestBase(unittest.TestCase):
     def tearDown(self):
         MockServerTestBase.spanner_service.clear_requests()
         MockServerTestBase.spanner_service.clear_results()
+        MockServerTestBase.spanner_service.clear_simulation_profile()
         MockServerTestBase.database_admin_service.clear_requests()
 
     @property
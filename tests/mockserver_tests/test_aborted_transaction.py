@@ -24,6 +24,7 @@ from google.cloud.spanner_v1 import (
 from google.cloud.spanner_v1.database_sessions_manager import TransactionType
 from google.cloud.spanner_v1.testing.mock_spanner import SpannerServicer
 from google.cloud.spanner_v1.transaction import Transaction
+from google.cloud.spanner_v1.transaction_scheduler import TransactionScheduler
 from tests.mockserver_tests.mock_server_test_base import (
     MockServerTestBase,
     aborted_status,
@@ -107,6 +108,33 @@ class TestAbortedTransaction(MockServerTestBase):
             TransactionType.READ_WRITE,
         )
 
+    def test_transaction_scheduler_commit_aborted(self):
+        add_error(SpannerServicer.Commit.__name__, aborted_status())
+        scheduler = TransactionScheduler(self.database, abort_rate_threshold=0.1)
+
+        scheduler.run_in_transaction(_insert_mutations, transaction_tag="my_table")
+        scheduler.run_in_transaction(_insert_mutations, transaction_tag="my_table")
+
+        requests = self.spanner_service.requests
+        self.assert_requests_sequence(
+            requests,
+            [
+                BeginTransactionRequest,
+                CommitRequest,
+                BeginTransactionRequest,
+                CommitRequest,
+                BeginTransactionRequest,
+                CommitRequest,
+            ],
+            TransactionType.READ_WRITE,
+        )
+        stats = scheduler.snapshot()["my_table"]
+        self.assertEqual(3, stats["attempts"])
+        self.assertEqual(1, stats["aborts"])
+        self.assertTrue(stats["hot"])
+        self.assertEqual(0, stats["running"])
+        self.assertEqual(3, stats["queueing_delay"]["count"])
+
     def test_batch_commit_aborted(self):
         # Add an Aborted error for the Commit method on the mock server.
         add_error(SpannerServicer.Commit.__name__, aborted_status())
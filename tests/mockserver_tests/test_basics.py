@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from google.longrunning.operations_pb2 import GetOperationRequest
+
 from google.cloud.spanner_admin_database_v1.types import spanner_database_admin
 from google.cloud.spanner_dbapi import Connection
 from google.cloud.spanner_dbapi.parsed_statement import AutocommitDmlMode
@@ -22,6 +24,7 @@ from google.cloud.spanner_v1 import (
     TransactionOptions,
     TypeCode,
 )
+from google.cloud.spanner_v1.ddl_executor import DdlExecutor
 from google.cloud.spanner_v1.database_sessions_manager import TransactionType
 from google.cloud.spanner_v1.testing.mock_spanner import SpannerServicer
 from google.cloud.spanner_v1.transaction import Transaction
@@ -73,6 +76,44 @@ class TestBasics(MockServerTestBase):
         operation = database_admin_api.update_database_ddl(request)
         operation.result(1)
 
+    def test_ddl_executor(self):
+        self.database_admin_service.set_ddl_polls(2)
+        databases = [
+            self.instance.database("test-database-%d" % index) for index in range(3)
+        ]
+        progress = []
+        executor = DdlExecutor(
+            initial_poll_interval=0.01, progress_callback=progress.append
+        )
+        for database in databases:
+            executor.add(database, ["CREATE TABLE A (Id INT64) PRIMARY KEY (Id)"])
+            executor.add(database, ["CREATE TABLE B (Id INT64) PRIMARY KEY (Id)"])
+
+        batches = executor.run(timeout=30)
+
+        self.assertEqual(3, len(batches))
+        for batch in batches:
+            batch.result()
+            self.assertEqual([100, 100], [p.progress_percent for p in batch.progress])
+            self.assertTrue(all(p.commit_timestamp for p in batch.progress))
+        requests = self.database_admin_service.requests
+        ddl_requests = [
+            r
+            for r in requests
+            if isinstance(r, spanner_database_admin.UpdateDatabaseDdlRequest)
+        ]
+        self.assertEqual(
+            sorted(database.name for database in databases),
+            sorted(r.database for r in ddl_requests),
+        )
+        for request in ddl_requests:
+            self.assertEqual(2, len(request.statements))
+        self.assertEqual(6, len(progress))
+        # Every operation is polled until it is done.
+        self.assertEqual(
+            6, len([r for r in requests if isinstance(r, GetOperationRequest)])
+        )
+
     # TODO: Move this to a separate class once the mock server test setup has
     #       been re-factored to use a base class for the boiler plate code.
     def test_dbapi_partitioned_dml(self):
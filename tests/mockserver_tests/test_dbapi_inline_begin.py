@@ -34,6 +34,10 @@ from google.cloud.spanner_v1 import (
     RollbackRequest,
     TypeCode,
 )
+from google.cloud.spanner_v1.column_profiler import (
+    ColumnAccessProfiler,
+    set_column_profiler,
+)
 from google.cloud.spanner_v1.testing.mock_spanner import SpannerServicer
 from google.cloud.spanner_v1.database_sessions_manager import TransactionType
 from google.rpc import code_pb2, status_pb2
@@ -112,6 +116,30 @@ class TestDbapiInlineBegin(MockServerTestBase):
             TransactionType.READ_WRITE,
         )
 
+    def test_read_write_w_column_profiler(self):
+        """Rows of a profiled query are returned as tuples, can be
+        checksummed for transaction retries, and record the columns that
+        are read."""
+        profiler = ColumnAccessProfiler()
+        set_column_profiler(profiler)
+        try:
+            connection = Connection(self.instance, self.database)
+            connection.autocommit = False
+            with connection.cursor() as cursor:
+                cursor.execute("select name from singers")
+                rows = cursor.fetchall()
+            connection.commit()
+        finally:
+            set_column_profiler()
+
+        self.assertEqual([("Some Singer",)], rows)
+        (usage,) = profiler.report()
+        self.assertEqual(1, usage.result_sets)
+        self.assertEqual(("name",), usage.unused_columns)
+
+        self.assertEqual("Some Singer", rows[0][0])
+        self.assertEqual([], profiler.report())
+
     def test_read_write_dml_request_sequence(self):
         """DML write via DBAPI: ExecuteSql + Commit (no BeginTransaction)."""
         connection = Connection(self.instance, self.database)
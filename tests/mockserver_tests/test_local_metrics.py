@@ -0,0 +1,96 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    CommitRequest,
+    FixedSizePool,
+    TypeCode,
+)
+from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+    SpannerMetricsTracerFactory,
+)
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    add_single_result,
+)
+
+
+class TestLocalMetrics(MockServerTestBase):
+    def setUp(self):
+        super().setUp()
+        add_single_result(
+            "select name from singers", "name", TypeCode.STRING, [("Some Singer",)]
+        )
+        SpannerMetricsTracerFactory().enable_local_metrics().reset()
+
+    def tearDown(self):
+        SpannerMetricsTracerFactory().local_sink = None
+        super().tearDown()
+
+    def test_snapshot_execute_sql_w_request_tag(self):
+        # The test database of the base class uses its own channel without
+        # the metrics interceptor.
+        database = self.instance.database("test-database", pool=FixedSizePool(size=1))
+        with database.snapshot() as snapshot:
+            results = snapshot.execute_sql(
+                "select name from singers",
+                request_options={"request_tag": "my_tag"},
+            )
+            self.assertEqual([["Some Singer"]], list(results))
+
+        metrics = self.client.metrics_snapshot()
+        attempts = metrics["attempt_latencies"]
+        self.assertEqual(1, attempts["method"]["Spanner.ExecuteStreamingSql"]["count"])
+        self.assertEqual(1, attempts["request_tag"]["my_tag"]["count"])
+        self.assertIn("test-database", attempts["database"])
+        operations = metrics["operation_latencies"]
+        self.assertEqual(1, operations["request_tag"]["my_tag"]["attempt_count"])
+        self.assertIn('request_tag="my_tag"', self.client.metrics_prometheus_text())
+
+    def _run_mutations_only_transaction(self, **kwargs):
+        def insert_singer(transaction):
+            transaction.insert("singers", ["id", "name"], [(1, "Some Singer")])
+
+        self.database.run_in_transaction(
+            insert_singer, transaction_tag="insert_singer", **kwargs
+        )
+        requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, (BeginTransactionRequest, CommitRequest))
+        ]
+        transactions = self.client.metrics_snapshot()["transactions"]
+        return requests, transactions["transaction_tag"]["insert_singer"]
+
+    def test_run_in_transaction_mutations_only(self):
+        requests, transaction = self._run_mutations_only_transaction()
+
+        self.assertEqual(
+            [BeginTransactionRequest, CommitRequest], [type(r) for r in requests]
+        )
+        self.assertEqual(1, transaction["count"])
+        self.assertEqual(2, transaction["rpc_count"])
+
+    def test_run_in_transaction_mutations_only_single_use_commit(self):
+        requests, transaction = self._run_mutations_only_transaction(
+            single_use_commit=True
+        )
+
+        self.assertEqual([CommitRequest], [type(r) for r in requests])
+        self.assertIn("read_write", requests[0].single_use_transaction)
+        self.assertEqual(1, len(requests[0].mutations))
+        self.assertEqual(1, transaction["count"])
+        self.assertEqual(1, transaction["rpc_count"])
+        self.assertEqual(1.0, transaction["rpcs_per_transaction"])
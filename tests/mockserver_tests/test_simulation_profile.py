@@ -0,0 +1,199 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+from google.cloud.spanner_v1 import CommitRequest, ExecuteSqlRequest, TypeCode
+from google.cloud.spanner_v1.session import Session
+from google.cloud.spanner_v1.testing.mock_spanner import (
+    RST_STREAM,
+    FaultInjection,
+    Latency,
+    SimulationProfile,
+)
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    _make_partial_result_sets,
+    add_execute_streaming_sql_results,
+    add_select1_result,
+)
+
+_ROW_COUNT = 10
+
+
+class TestSimulationProfile(MockServerTestBase):
+    def setUp(self):
+        super().setUp()
+        add_execute_streaming_sql_results(
+            "select id from numbers",
+            _make_partial_result_sets(
+                [("id", TypeCode.INT64)],
+                [{"values": [str(value)]} for value in range(_ROW_COUNT)],
+            ),
+        )
+
+    def _select_numbers(self):
+        with self.database.snapshot() as snapshot:
+            return [row[0] for row in snapshot.execute_sql("select id from numbers")]
+
+    def _streaming_requests(self):
+        return [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+
+    def test_latency(self):
+        add_select1_result()
+        self.spanner_service.set_simulation_profile(
+            SimulationProfile(latencies={"ExecuteStreamingSql": Latency(median=0.2)})
+        )
+        start = time.monotonic()
+        with self.database.snapshot() as snapshot:
+            self.assertEqual([[1]], list(snapshot.execute_sql("select 1")))
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_latency_distribution_is_deterministic(self):
+        latency = Latency(median=0.01, p99=0.1)
+        first = [latency.sample(random.Random(1)) for _ in range(100)]
+        second = [latency.sample(random.Random(1)) for _ in range(100)]
+        self.assertEqual(first, second)
+        self.assertTrue(all(value > 0 for value in first))
+        self.assertEqual(0.01, Latency(median=0.01).sample(random.Random()))
+
+    def test_stream_throughput_limit(self):
+        self.spanner_service.set_simulation_profile(
+            SimulationProfile(stream_bytes_per_second=200)
+        )
+        start = time.monotonic()
+        self.assertEqual(list(range(_ROW_COUNT)), self._select_numbers())
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_mid_stream_unavailable_resumes_from_resume_token(self):
+        self.spanner_service.set_simulation_profile(
+            SimulationProfile(
+                resume_token_interval=2,
+                faults=[
+                    FaultInjection(
+                        method="ExecuteStreamingSql",
+                        code="UNAVAILABLE",
+                        after_partial_result_sets=5,
+                        max_occurrences=1,
+                    )
+                ],
+            )
+        )
+        self.assertEqual(list(range(_ROW_COUNT)), self._select_numbers())
+        requests = self._streaming_requests()
+        self.assertEqual(2, len(requests))
+        self.assertEqual(b"", requests[0].resume_token)
+        self.assertEqual(b"3", requests[1].resume_token)
+
+    def test_mid_stream_rst_stream_is_retried(self):
+        self.spanner_service.set_simulation_profile(
+            SimulationProfile(
+                resume_token_interval=1,
+                faults=[
+                    FaultInjection(
+                        method="ExecuteStreamingSql",
+                        code=RST_STREAM,
+                        after_partial_result_sets=3,
+                        max_occurrences=2,
+                    )
+                ],
+            )
+        )
+        self.assertEqual(list(range(_ROW_COUNT)), self._select_numbers())
+        requests = self._streaming_requests()
+        self.assertEqual([b"", b"2", b"5"], [r.resume_token for r in requests])
+
+    def test_aborted_commit_with_retry_info(self):
+        self.spanner_service.set_simulation_profile(
+            SimulationProfile(
+                faults=[
+                    FaultInjection(
+                        method="Commit",
+                        code="ABORTED",
+                        retry_delay=0.001,
+                        max_occurrences=1,
+                    )
+                ]
+            )
+        )
+        self.database.run_in_transaction(
+            lambda transaction: transaction.insert(
+                "singers", ("id", "name"), [(1, "Alice")]
+            )
+        )
+        commits = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, CommitRequest)
+        ]
+        self.assertEqual(2, len(commits))
+
+    def test_fault_probability_is_deterministic(self):
+        def run():
+            self.spanner_service.set_simulation_profile(
+                SimulationProfile(
+                    faults=[
+                        FaultInjection(
+                            method="GetSession", code="NOT_FOUND", probability=0.5
+                        )
+                    ],
+                    seed=42,
+                )
+            )
+            session = Session(self.database)
+            session.create()
+            return [session.exists() for _ in range(20)]
+
+        outcomes = run()
+        self.assertIn(True, outcomes)
+        self.assertIn(False, outcomes)
+        self.assertEqual(outcomes, run())
+
+    def test_session_not_found_after_ttl(self):
+        self.spanner_service.set_simulation_profile(SimulationProfile(session_ttl=0.1))
+        session = Session(self.database)
+        session.create()
+        self.assertTrue(session.exists())
+        time.sleep(0.2)
+        self.assertFalse(session.exists())
+
+    def test_session_ttl_does_not_apply_to_multiplexed_sessions(self):
+        self.spanner_service.set_simulation_profile(SimulationProfile(session_ttl=0.1))
+        session = Session(self.database, is_multiplexed=True)
+        session.create()
+        time.sleep(0.2)
+        self.assertTrue(session.exists())
+
+    def test_from_dict(self):
+        profile = SimulationProfile.from_dict(
+            {
+                "latencies": {"*": {"median": 0.001, "p99": 0.01}},
+                "resume_token_interval": 10,
+                "faults": [{"method": "Commit", "code": "ABORTED"}],
+                "session_ttl": 3600,
+                "seed": 7,
+            }
+        )
+        self.assertEqual(Latency(median=0.001, p99=0.01), profile.latencies["*"])
+        self.assertEqual(10, profile.resume_token_interval)
+        self.assertEqual(
+            [FaultInjection(method="Commit", code="ABORTED")], profile.faults
+        )
+        self.assertEqual(3600, profile.session_ttl)
+        self.assertEqual(7, profile.seed)
@@ -0,0 +1,337 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+from google.cloud.spanner_v1 import (
+    BeginTransactionRequest,
+    ExecuteSqlRequest,
+    KeySet,
+    PartitionQueryRequest,
+    ReadRequest,
+    StructType,
+    Type,
+    TypeCode,
+)
+from google.cloud.spanner_v1.column_profiler import (
+    ColumnAccessProfiler,
+    set_column_profiler,
+)
+from google.cloud.spanner_v1.database import BatchSnapshot
+from google.cloud.spanner_v1.partition_queue import (
+    PartitionCoordinator,
+    PartitionWorker,
+    SQLitePartitionQueue,
+)
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+from google.cloud.spanner_v1.testing.mock_spanner import (
+    FaultInjection,
+    SimulationProfile,
+)
+from google.cloud.spanner_v1.testing.synthetic_results import SyntheticResult
+from tests.mockserver_tests.mock_server_test_base import (
+    MockServerTestBase,
+    get_spanner_service,
+)
+
+_SQL = "select * from synthetic"
+_ALL_TYPE_CODES = [
+    code
+    for code in TypeCode
+    if code not in (TypeCode.TYPE_CODE_UNSPECIFIED, TypeCode.ARRAY, TypeCode.STRUCT)
+]
+
+
+def _all_types_result(**kwargs):
+    fields = [(code.name.lower(), code) for code in _ALL_TYPE_CODES]
+    fields.append(
+        (
+            "timestamps",
+            Type(
+                code=TypeCode.ARRAY,
+                array_element_type=Type(code=TypeCode.TIMESTAMP),
+            ),
+        )
+    )
+    fields.append(
+        (
+            "struct",
+            Type(
+                code=TypeCode.STRUCT,
+                struct_type=StructType(
+                    fields=[
+                        StructType.Field(name="id", type_=Type(code=TypeCode.INT64)),
+                        StructType.Field(
+                            name="names",
+                            type_=Type(
+                                code=TypeCode.ARRAY,
+                                array_element_type=Type(code=TypeCode.STRING),
+                            ),
+                        ),
+                    ]
+                ),
+            ),
+        )
+    )
+    return SyntheticResult(fields, **kwargs)
+
+
+class TestSyntheticResult(MockServerTestBase):
+    def test_rows_are_deterministic(self):
+        result = _all_types_result(row_count=10, seed=1)
+        self.assertEqual(result.row(3), result.row(3))
+        self.assertNotEqual(result.row(3), result.row(4))
+        self.assertNotEqual(
+            result.row(3), _all_types_result(row_count=10, seed=2).row(3)
+        )
+
+    def test_chunked_values_and_resume_tokens(self):
+        result = _all_types_result(
+            row_count=50,
+            string_length=2000,
+            partial_result_set_bytes=4096,
+            null_fraction=0.1,
+        )
+        partials = list(result.partial_result_sets())
+        self.assertTrue(any(partial.chunked_value for partial in partials))
+        self.assertTrue(
+            all(
+                partial.resume_token
+                for partial in partials
+                if not partial.chunked_value
+            )
+        )
+        self.assertTrue(partials[-1].last)
+        unchunked = _all_types_result(
+            row_count=50,
+            string_length=2000,
+            partial_result_set_bytes=10**9,
+            null_fraction=0.1,
+        )
+        expected = list(StreamedResultSet(unchunked.partial_result_sets()))
+        self.assertEqual(50, len(expected))
+        self.assertEqual(expected, list(StreamedResultSet(iter(partials))))
+
+        # Resuming after any resume token returns the remaining rows.
+        for index in (3, len(partials) // 2):
+            while partials[index].chunked_value:
+                index += 1
+            resumed = partials[: index + 1] + list(
+                result.partial_result_sets(resume_token=partials[index].resume_token)
+            )
+            self.assertEqual(expected, list(StreamedResultSet(iter(resumed))))
+
+    def test_partition_tokens_are_disjoint(self):
+        result = _all_types_result(row_count=10)
+        tokens = result.partition_tokens(3)
+        self.assertEqual(3, len(tokens))
+        rows = []
+        for token in tokens:
+            rows.extend(
+                StreamedResultSet(result.partial_result_sets(partition_token=token))
+            )
+        self.assertEqual(list(StreamedResultSet(result.partial_result_sets())), rows)
+        self.assertEqual(10, len(result.partition_tokens(100)))
+
+    def test_execute_streaming_sql(self):
+        get_spanner_service().mock_spanner.add_synthetic_result(
+            _SQL,
+            _all_types_result(row_count=1000, partial_result_set_bytes=16 * 1024),
+        )
+        with self.database.snapshot() as snapshot:
+            rows = list(snapshot.execute_sql(_SQL))
+        self.assertEqual(1000, len(rows))
+        self.assertEqual(len(_ALL_TYPE_CODES) + 2, len(rows[0]))
+
+    def test_execute_streaming_sql_resumes_after_unavailable(self):
+        result = SyntheticResult(
+            [("id", TypeCode.INT64), ("name", TypeCode.STRING)],
+            row_count=1000,
+            partial_result_set_bytes=1024,
+        )
+        get_spanner_service().mock_spanner.add_synthetic_result(_SQL, result)
+        self.spanner_service.set_simulation_profile(
+            SimulationProfile(
+                faults=[
+                    FaultInjection(
+                        method="ExecuteStreamingSql",
+                        after_partial_result_sets=10,
+                        max_occurrences=2,
+                    )
+                ]
+            )
+        )
+        with self.database.snapshot() as snapshot:
+            rows = list(snapshot.execute_sql(_SQL))
+        self.assertEqual(list(StreamedResultSet(result.partial_result_sets())), rows)
+        requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+        self.assertEqual(3, len(requests))
+        self.assertTrue(requests[2].resume_token)
+
+    def test_column_profiler(self):
+        result = SyntheticResult(
+            [("id", TypeCode.INT64), ("name", TypeCode.STRING)], row_count=100
+        )
+        get_spanner_service().mock_spanner.add_synthetic_result(_SQL, result)
+        profiler = ColumnAccessProfiler()
+        set_column_profiler(profiler)
+        try:
+            with self.database.snapshot() as snapshot:
+                ids = [row["id"] for row in snapshot.execute_sql(_SQL)]
+        finally:
+            set_column_profiler()
+
+        self.assertEqual(
+            [row[0] for row in StreamedResultSet(result.partial_result_sets())], ids
+        )
+        [usage] = profiler.report()
+        self.assertEqual(_SQL, usage.tag)
+        self.assertEqual(("name",), usage.unused_columns)
+        self.assertEqual(100, usage.rows)
+        self.assertGreater(usage.wasted_bytes, 0)
+
+    def test_partitioned_query(self):
+        result = SyntheticResult(
+            [("id", TypeCode.INT64), ("name", TypeCode.STRING)],
+            row_count=100,
+        )
+        get_spanner_service().mock_spanner.add_synthetic_result(_SQL, result)
+        batch_snapshot = self.database.batch_snapshot()
+        batches = list(batch_snapshot.generate_query_batches(_SQL, max_partitions=5))
+        self.assertEqual(5, len(batches))
+        rows = []
+        for batch in batches:
+            rows.extend(batch_snapshot.process_query_batch(batch))
+        batch_snapshot.close()
+
+        self.assertEqual(list(StreamedResultSet(result.partial_result_sets())), rows)
+        partition_requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, PartitionQueryRequest)
+        ]
+        self.assertEqual(5, partition_requests[0].partition_options.max_partitions)
+
+    def test_partitioned_query_w_encoded_batches(self):
+        result = SyntheticResult(
+            [("id", TypeCode.INT64), ("name", TypeCode.STRING)],
+            row_count=100,
+        )
+        get_spanner_service().mock_spanner.add_synthetic_result(_SQL, result)
+        batch_snapshot = self.database.batch_snapshot()
+        encoded = [
+            batch_snapshot.encode_batch(batch)
+            for batch in batch_snapshot.generate_query_batches(_SQL, max_partitions=5)
+        ]
+        state = batch_snapshot.to_bytes()
+
+        # The encoded batches are processed by another batch snapshot, as
+        # they would be on another host.
+        worker = BatchSnapshot.from_bytes(self.database, state)
+        rows = []
+        for batch in encoded:
+            rows.extend(worker.process(batch))
+        batch_snapshot.close()
+
+        self.assertEqual(list(StreamedResultSet(result.partial_result_sets())), rows)
+        execute_requests = [
+            request
+            for request in self.spanner_service.requests
+            if isinstance(request, ExecuteSqlRequest)
+        ]
+        self.assertEqual(5, len(execute_requests))
+        self.assertEqual(
+            {batch_snapshot._snapshot._transaction_id},
+            {request.transaction.id for request in execute_requests},
+        )
+
+    def test_partition_queue(self):
+        result = SyntheticResult(
+            [("id", TypeCode.INT64), ("name", TypeCode.STRING)],
+            row_count=100,
+        )
+        get_spanner_service().mock_spanner.add_synthetic_result(_SQL, result)
+        with tempfile.TemporaryDirectory() as directory:
+            queue = SQLitePartitionQueue(os.path.join(directory, "queue.db"))
+            batch_snapshot = self.database.batch_snapshot()
+            coordinator = PartitionCoordinator(batch_snapshot, queue)
+            job_id = coordinator.submit_query(_SQL, max_partitions=5)
+
+            rows = []
+            workers = [
+                PartitionWorker(self.database, queue, worker_id="worker-%d" % index)
+                for index in range(2)
+            ]
+            for worker in workers:
+                worker.run(
+                    lambda lease, partition_rows: rows.extend(partition_rows),
+                    max_partitions=3,
+                )
+            progress = coordinator.wait(job_id, timeout=5)
+            batch_snapshot.close()
+            queue.close()
+
+        self.assertEqual((5, 0), (progress.done, progress.failed))
+        self.assertEqual(100, progress.rows)
+        self.assertEqual(list(StreamedResultSet(result.partial_result_sets())), rows)
+
+    def test_partitioned_read(self):
+        result = SyntheticResult([("id", TypeCode.INT64)], row_count=40)
+        get_spanner_service().mock_spanner.add_synthetic_read_result("numbers", result)
+        batch_snapshot = self.database.batch_snapshot()
+        rows = []
+        for batch in batch_snapshot.generate_read_batches(
+            "numbers", ["id"], KeySet(all_=True)
+        ):
+            rows.extend(batch_snapshot.process_read_batch(batch))
+        batch_snapshot.close()
+        self.assertEqual(list(StreamedResultSet(result.partial_result_sets())), rows)
+
+    def test_read_many(self):
+        result = SyntheticResult([("id", TypeCode.INT64)], row_count=10)
+        get_spanner_service().mock_spanner.add_synthetic_read_result("numbers", result)
+
+        rows = self.database.read_many(
+            "numbers", ["id"], [[key] for key in range(100)], parallelism=4
+        )
+
+        # The mock server returns all rows for every read.
+        self.assertEqual(
+            4 * list(StreamedResultSet(result.partial_result_sets())), rows
+        )
+        requests = self.spanner_service.requests
+        begin_requests = [r for r in requests if isinstance(r, BeginTransactionRequest)]
+        read_requests = [r for r in requests if isinstance(r, ReadRequest)]
+        self.assertEqual(1, len(begin_requests))
+        self.assertTrue(begin_requests[0].options.read_only.strong)
+        self.assertEqual(4, len(read_requests))
+        self.assertEqual(1, len({r.transaction.id for r in read_requests}))
+        self.assertTrue(read_requests[0].transaction.id)
+        # INT64 keys are sent as strings.
+        self.assertEqual(
+            [str(key) for key in range(100)],
+            sorted(
+                (
+                    key.values[0].string_value
+                    for r in read_requests
+                    for key in ReadRequest.pb(r).key_set.keys
+                ),
+                key=int,
+            ),
+        )
@@ -1771,6 +1771,61 @@ class TestDatabase(_BaseTest):
         if not multiplexed_enabled:
             self.assertIs(pool._session, session)
 
+    async def _make_read_many_database(self, rows):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = await self._make_one(self.DATABASE_ID, instance, pool=_Pool())
+        snapshot = mock.Mock(spec=["begin", "read"])
+        snapshot.begin = mock.AsyncMock()
+
+        async def read(table, columns, keyset, index="", request_options=None):
+            keys = {tuple(key) for key in keyset.keys}
+            for row in rows:
+                if tuple(row[:1]) in keys:
+                    yield row
+
+        async def read_results(*args, **kwargs):
+            return read(*args, **kwargs)
+
+        snapshot.read = mock.Mock(side_effect=read_results)
+        checkout = mock.MagicMock()
+        checkout.__aenter__.return_value = snapshot
+        database.snapshot = mock.Mock(return_value=checkout)
+        return database, snapshot
+
+    @CrossSync.pytest
+    async def test_read_many(self):
+        rows = [[1, "a"], [2, "b"], [3, "c"], [4, "d"]]
+        database, snapshot = await self._make_read_many_database(rows)
+
+        result = await database.read_many(
+            "table",
+            ["id", "name"],
+            [[4], [2], [5], [1], [2], [3]],
+            parallelism=2,
+            key_columns=["id"],
+        )
+
+        self.assertEqual(result, [[4, "d"], [2, "b"], [1, "a"], [3, "c"]])
+        database.snapshot.assert_called_once_with(multi_use=True)
+        snapshot.begin.assert_awaited_once_with()
+        self.assertEqual(snapshot.read.call_count, 2)
+
+    @CrossSync.pytest
+    async def test_read_many_w_generator_keys(self):
+        rows = [[1, "a"], [2, "b"], [3, "c"]]
+        database, _ = await self._make_read_many_database(rows)
+
+        result = await database.read_many(
+            "table",
+            ["id", "name"],
+            ([key] for key in (3, 1, 2)),
+            parallelism=2,
+            key_columns=["id"],
+        )
+
+        self.assertEqual(result, [[3, "c"], [1, "a"], [2, "b"]])
+
     @CrossSync.pytest
     async def test_batch(self):
         from google.cloud.spanner_v1._async.database import BatchCheckout
@@ -0,0 +1,187 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from google.cloud.spanner_v1._async.merged_result_set import MergedResultSet
+from google.cloud.spanner_v1._async.streamed import StreamedResultSet
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.types.result_set import (
+    PartialResultSet,
+    ResultSetMetadata,
+    ResultSetStats,
+)
+from google.cloud.spanner_v1.types.type import StructType, Type, TypeCode
+
+_METADATA = ResultSetMetadata(
+    row_type=StructType(
+        fields=[StructType.Field(name="id", type_=Type(code=TypeCode.INT64))]
+    )
+)
+
+
+class _PartitionIterator(object):
+    def __init__(self, batch_snapshot, partition):
+        self._batch_snapshot = batch_snapshot
+        self._result_sets = iter(batch_snapshot.partitions[partition])
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self._batch_snapshot.running += 1
+        self._batch_snapshot.max_running = max(
+            self._batch_snapshot.max_running, self._batch_snapshot.running
+        )
+        try:
+            await asyncio.sleep(0)
+            result_set = next(self._result_sets, None)
+        finally:
+            self._batch_snapshot.running -= 1
+        if result_set is None:
+            raise StopAsyncIteration
+        if isinstance(result_set, Exception):
+            raise result_set
+        return result_set
+
+
+class _BatchSnapshot(object):
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.running = 0
+        self.max_running = 0
+        self.lazy_decode = None
+
+    async def process_query_batch(self, partition, lazy_decode=False):
+        self.lazy_decode = lazy_decode
+        return StreamedResultSet(
+            _PartitionIterator(self, partition), lazy_decode=lazy_decode
+        )
+
+
+def _partial_result_sets(numbers, batch_size=2):
+    result_sets = []
+    for start in range(0, len(numbers), batch_size):
+        result_set = PartialResultSet(metadata=_METADATA)
+        for number in numbers[start : start + batch_size]:
+            result_set._pb.values.append(_make_value_pb(number))
+        result_sets.append(result_set)
+    return result_sets
+
+
+class TestMergedResultSet(unittest.IsolatedAsyncioTestCase):
+    async def test_merges_all_partitions(self):
+        partitions = {
+            index: _partial_result_sets(list(range(index * 10, index * 10 + 10)))
+            for index in range(5)
+        }
+        batch_snapshot = _BatchSnapshot(partitions)
+        merged = MergedResultSet(batch_snapshot, list(partitions), 0)
+        self.assertIsNone(merged.metadata)
+
+        rows = [row async for row in merged]
+
+        self.assertEqual(sorted(rows), [[number] for number in range(50)])
+        self.assertEqual(merged.metadata, _METADATA)
+        self.assertIsNone(merged.stats)
+        self.assertFalse(batch_snapshot.lazy_decode)
+
+    async def test_concurrency_limit(self):
+        partitions = {
+            index: _partial_result_sets(list(range(10))) for index in range(6)
+        }
+        batch_snapshot = _BatchSnapshot(partitions)
+        merged = MergedResultSet(batch_snapshot, list(partitions), 2)
+
+        rows = [row async for row in merged]
+
+        self.assertEqual(60, len(rows))
+        self.assertEqual(2, batch_snapshot.max_running)
+
+    async def test_no_partitions(self):
+        merged = MergedResultSet(_BatchSnapshot({}), [], 0)
+        self.assertEqual([], [row async for row in merged])
+
+    async def test_empty_partition_sets_metadata(self):
+        batch_snapshot = _BatchSnapshot(
+            {0: [PartialResultSet(metadata=_METADATA, last=True)]}
+        )
+        merged = MergedResultSet(batch_snapshot, [0], 0)
+        self.assertEqual([], [row async for row in merged])
+        self.assertEqual(merged.metadata, _METADATA)
+
+    async def test_error_cancels_other_partitions(self):
+        partitions = {
+            0: _partial_result_sets([1, 2]) + [ValueError("broken")],
+            1: _partial_result_sets(list(range(1000))),
+        }
+        batch_snapshot = _BatchSnapshot(partitions)
+        merged = MergedResultSet(batch_snapshot, [0, 1], 0)
+
+        with self.assertRaisesRegex(ValueError, "broken"):
+            async for _ in merged:
+                pass
+
+        self.assertTrue(all(task.done() for task in merged._tasks))
+        self.assertEqual(0, batch_snapshot.running)
+        # The error is raised again by the next call.
+        with self.assertRaisesRegex(ValueError, "broken"):
+            await merged.__anext__()
+
+    async def test_close_cancels_partitions(self):
+        partitions = {0: _partial_result_sets(list(range(1000)))}
+        merged = MergedResultSet(_BatchSnapshot(partitions), [0], 0)
+        self.assertEqual([0], await merged.__anext__())
+
+        await merged.close()
+
+        self.assertTrue(all(task.cancelled() for task in merged._tasks))
+        with self.assertRaises(StopAsyncIteration):
+            await merged.__anext__()
+
+    async def test_async_with_closes_on_early_exit(self):
+        partitions = {0: _partial_result_sets(list(range(1000)))}
+        batch_snapshot = _BatchSnapshot(partitions)
+
+        async with MergedResultSet(batch_snapshot, [0], 0) as merged:
+            async for row in merged:
+                break
+
+        self.assertEqual([0], row)
+        self.assertTrue(all(task.done() for task in merged._tasks))
+        self.assertEqual(0, batch_snapshot.running)
+
+    async def test_stats(self):
+        result_sets = _partial_result_sets([7])
+        result_sets[-1].stats = ResultSetStats(row_count_exact=1)
+        merged = MergedResultSet(_BatchSnapshot({0: result_sets}), [0], 0)
+        self.assertIsNone(merged.stats)
+
+        self.assertEqual([[7]], [row async for row in merged])
+
+        self.assertEqual(ResultSetStats(row_count_exact=1), merged.stats)
+
+    async def test_lazy_decode(self):
+        batch_snapshot = _BatchSnapshot({0: _partial_result_sets([7])})
+        merged = MergedResultSet(batch_snapshot, [0], 0, lazy_decode=True)
+        with self.assertRaisesRegex(ValueError, "iterator not started"):
+            merged.decode_row([])
+
+        rows = [row async for row in merged]
+
+        self.assertTrue(batch_snapshot.lazy_decode)
+        self.assertEqual([[_make_value_pb(7)]], rows)
+        self.assertEqual([7], merged.decode_row(rows[0]))
+        self.assertEqual(7, merged.decode_column(rows[0], 0))
@@ -528,6 +528,161 @@ class TestFixedSizePool(IsolatedAsyncioTestCase):
         self.assertIs(got, new_session)
         new_session.create.assert_called_once()
 
+    async def test_get_waiters_are_served_in_order(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=1)
+        await pool.bind(db)
+        session = await pool.get()
+
+        served = []
+
+        async def waiter(name):
+            got = await pool.get()
+            served.append(name)
+            await pool.put(got)
+
+        tasks = [asyncio.create_task(waiter(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        self.assertEqual(3, len(pool._waiters))
+        await pool.put(session)
+        # A new caller does not take the session from the waiters.
+        late = asyncio.create_task(waiter("late"))
+        await asyncio.gather(*tasks, late)
+
+        self.assertEqual(["a", "b", "c", "late"], served)
+        self.assertEqual(0, len(pool._waiters))
+        self.assertEqual(1, pool._sessions.qsize())
+
+    async def test_get_timeout_removes_waiter(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=1)
+        await pool.bind(db)
+        session = await pool.get()
+
+        with self.assertRaises(CrossSync.QueueEmpty):
+            await pool.get(timeout=0.01)
+
+        self.assertEqual(0, len(pool._waiters))
+        await pool.put(session)
+        self.assertEqual(1, pool._sessions.qsize())
+
+    async def test_get_timeout_after_hand_off(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=1)
+        await pool.bind(db)
+        session = await pool.get()
+
+        async def wait_for(waiter, timeout):
+            # The session is handed over in the iteration in which the wait
+            # times out.
+            pool._hand_off(session)
+            raise asyncio.TimeoutError()
+
+        with mock.patch.object(asyncio, "wait_for", wait_for):
+            got = await pool.get(timeout=0.01)
+
+        self.assertIs(session, got)
+        self.assertEqual(0, len(pool._waiters))
+        self.assertEqual(0, pool._sessions.qsize())
+
+    async def test_get_cancelled_while_waiting(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=1)
+        await pool.bind(db)
+        session = await pool.get()
+
+        task = asyncio.create_task(pool.get())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(0, len(pool._waiters))
+        await pool.put(session)
+        self.assertIs(session, await pool.get())
+
+    async def test_get_cancelled_while_checking_session(self):
+        from google.cloud.spanner_v1._async.pool import _NOW
+
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=1)
+        await pool.bind(db)
+        session = await pool.get()
+        session.last_use_time = _NOW() - datetime.timedelta(minutes=60)
+        checking = asyncio.Event()
+
+        async def exists():
+            checking.set()
+            await asyncio.sleep(10)
+
+        session.exists = mock.AsyncMock(side_effect=exists)
+        await pool.put(session)
+
+        task = asyncio.create_task(pool.get())
+        await checking.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(1, pool._sessions.qsize())
+
+    async def test_get_replaces_defunct_session_in_background(self):
+        from google.cloud.spanner_v1._async.pool import _NOW
+
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=2)
+        await pool.bind(db)
+        first = await pool.get()
+        second = await pool.get()
+        first.last_use_time = _NOW() - datetime.timedelta(minutes=60)
+        first.exists = mock.AsyncMock(return_value=False)
+
+        replacement = _Session(self.SESSION_NAME + "/new")
+        created = asyncio.Event()
+
+        async def create():
+            await created.wait()
+
+        replacement.create = mock.AsyncMock(side_effect=create)
+        pool._new_session = mock.Mock(return_value=replacement)
+        await pool.put(first)
+
+        task = asyncio.create_task(pool.get())
+        await asyncio.sleep(0)
+        # The session that is returned first is handed to the waiting caller.
+        await pool.put(second)
+        self.assertIs(second, await task)
+
+        created.set()
+        await asyncio.gather(*pool._background_tasks)
+        self.assertIs(replacement, await pool.get())
+
+    async def test_ping_pings_sessions_concurrently(self):
+        from google.cloud.spanner_v1._async.pool import _NOW
+
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one(size=3)
+        await pool.bind(db)
+        sessions = [await pool.get() for _ in range(3)]
+        running = []
+        max_running = []
+
+        async def ping():
+            running.append(None)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        for session in sessions:
+            session.last_use_time = _NOW() - datetime.timedelta(minutes=60)
+            session.ping = mock.AsyncMock(side_effect=ping)
+            await pool.put(session)
+
+        await pool.ping()
+
+        self.assertEqual(3, max(max_running))
+        self.assertEqual(3, pool._sessions.qsize())
+
 
 class TestBurstyPool(IsolatedAsyncioTestCase):
     DATABASE_NAME = "projects/p/instances/i/databases/d"
@@ -639,6 +794,142 @@ class TestBurstyPool(IsolatedAsyncioTestCase):
 
         session.delete.assert_called_once()
 
+    async def test_get_concurrent_misses_use_one_batch_create_sessions(self):
+        db = _Database(self.DATABASE_NAME)
+        db.spanner_api.batch_create_sessions.return_value = BatchCreateSessionsResponse(
+            session=[
+                SessionProto(name=self.SESSION_NAME + str(index)) for index in range(3)
+            ]
+        )
+        pool = self._make_one()
+        await pool.bind(db)
+
+        sessions = await asyncio.gather(*[pool.get() for _ in range(3)])
+
+        self.assertEqual(3, len({id(session) for session in sessions}))
+        self.assertEqual(
+            ["s0", "s1", "s2"], sorted(session._session_id for session in sessions)
+        )
+        db.spanner_api.batch_create_sessions.assert_called_once()
+        request = db.spanner_api.batch_create_sessions.call_args.kwargs["request"]
+        self.assertEqual(3, request.session_count)
+        for session in sessions:
+            session.create.assert_not_called()
+
+    async def test_get_concurrent_misses_short_batch_response(self):
+        db = _Database(self.DATABASE_NAME)
+        db.spanner_api.batch_create_sessions.return_value = BatchCreateSessionsResponse(
+            session=[
+                SessionProto(name=self.SESSION_NAME + str(index)) for index in range(2)
+            ]
+        )
+        pool = self._make_one()
+        await pool.bind(db)
+
+        sessions = await asyncio.gather(*[pool.get() for _ in range(3)])
+
+        self.assertEqual(3, len({id(session) for session in sessions}))
+        db.spanner_api.batch_create_sessions.assert_called_once()
+        # The missing session is created with a separate request.
+        self.assertEqual(1, sum(session.create.call_count for session in sessions))
+
+    async def test_get_concurrent_misses_empty_batch_response(self):
+        db = _Database(self.DATABASE_NAME)
+        db.spanner_api.batch_create_sessions.return_value = BatchCreateSessionsResponse(
+            session=[]
+        )
+        pool = self._make_one()
+        await pool.bind(db)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*[pool.get() for _ in range(2)], return_exceptions=True),
+            timeout=5,
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        db.spanner_api.batch_create_sessions.assert_called_once()
+        self.assertEqual([], pool._pending_creates)
+
+    async def test_get_concurrent_misses_error(self):
+        import contextlib
+
+        db = _Database(self.DATABASE_NAME)
+        db.spanner_api.batch_create_sessions.side_effect = NotFound("no database")
+        db.with_error_augmentation = mock.Mock(
+            return_value=([], contextlib.nullcontext())
+        )
+        pool = self._make_one()
+        await pool.bind(db)
+
+        results = await asyncio.gather(
+            *[pool.get() for _ in range(2)], return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, NotFound) for result in results))
+        self.assertEqual([], pool._pending_creates)
+
+    async def test_get_cancelled_while_creating_returns_session_to_pool(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one()
+        await pool.bind(db)
+        session = _Session(self.SESSION_NAME)
+        creating = asyncio.Event()
+        created = asyncio.Event()
+
+        async def create():
+            creating.set()
+            await created.wait()
+
+        session.create = mock.AsyncMock(side_effect=create)
+        pool._new_session = mock.Mock(return_value=session)
+
+        task = asyncio.create_task(pool.get())
+        await creating.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        created.set()
+        await pool._create_task
+
+        self.assertIs(session, pool._sessions.get_nowait())
+
+    async def test_get_cancelled_before_creating(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one()
+        await pool.bind(db)
+
+        task = asyncio.create_task(pool.get())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await pool._create_task
+
+        pool._new_session.assert_not_called()
+        self.assertEqual(0, pool._sessions.qsize())
+
+    async def test_get_cancelled_while_checking_session(self):
+        db = _Database(self.DATABASE_NAME)
+        pool = self._make_one()
+        await pool.bind(db)
+        session = _Session(self.SESSION_NAME)
+        checking = asyncio.Event()
+
+        async def exists():
+            checking.set()
+            await asyncio.sleep(10)
+
+        session.exists = mock.AsyncMock(side_effect=exists)
+        await pool.put(session)
+
+        task = asyncio.create_task(pool.get())
+        await checking.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertIs(session, pool._sessions.get_nowait())
+
 
 class TestPingingPool(IsolatedAsyncioTestCase):
     DATABASE_NAME = "projects/p/instances/i/databases/d"
@@ -196,6 +196,49 @@ class Test_snapshot_coverage(unittest.IsolatedAsyncioTestCase):
         async for _ in result:
             pass
 
+    async def test_read_w_read_cache(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        fields = [StructType.Field(name="col", type_=Type(code=TypeCode.STRING))]
+        metadata_pb = ResultSetMetadata(row_type=StructType(fields=fields))
+        metadata_pb.transaction.read_timestamp = datetime.datetime.now(
+            datetime.timezone.utc
+        )
+        result_set = PartialResultSet(metadata=metadata_pb)
+        result_set._pb.values.add(string_value="value")
+        database = _Database()
+        database.spanner_api.streaming_read.side_effect = lambda **kw: _MockIterator(
+            result_set
+        )
+        read_cache = ReadCache()
+
+        async def read(key, **kwargs):
+            snapshot = self._make_snapshot(
+                _Session(database), read_cache=read_cache, **kwargs
+            )
+            results = await snapshot.read(TABLE_NAME, ["col"], KeySet(keys=[[key]]))
+            return snapshot, [row async for row in results]
+
+        snapshot, rows = await read("a", max_staleness=DURATION)
+        self.assertEqual([["value"]], rows)
+        snapshot, rows = await read("a", max_staleness=DURATION)
+        self.assertEqual([["value"]], rows)
+        self.assertEqual(
+            metadata_pb.transaction.read_timestamp,
+            snapshot._transaction_read_timestamp,
+        )
+        self.assertEqual(1, database.spanner_api.streaming_read.call_count)
+
+        # Other keys and strong reads are not served from the cache.
+        await read("b", max_staleness=DURATION)
+        await read("a")
+        self.assertEqual(3, database.spanner_api.streaming_read.call_count)
+        stats = read_cache.stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(2, stats["misses"])
+        self.assertEqual(2, stats["entries"])
+
     async def test_restart_on_unavailable_service_unavailable(self):
         from google.cloud.spanner_v1._async.snapshot import _restart_on_unavailable
         from google.cloud.spanner_v1.types.result_set import PartialResultSet
@@ -478,6 +521,7 @@ class Test_snapshot_coverage(unittest.IsolatedAsyncioTestCase):
 
         # Mock transaction and transaction selector
         transaction = mock.Mock()
+        transaction._wait_for_inline_begin = mock.AsyncMock(return_value=False)
         selector_pb = TransactionSelector(id=TXN_ID)
         transaction._build_transaction_selector_pb.return_value = selector_pb
 
@@ -522,6 +566,7 @@ class Test_snapshot_coverage(unittest.IsolatedAsyncioTestCase):
         database = _Database()
         session = _Session(database)
         transaction = mock.Mock()
+        transaction._wait_for_inline_begin = mock.AsyncMock(return_value=False)
         selector_pb = TransactionSelector(id=TXN_ID)
         transaction._build_transaction_selector_pb.return_value = selector_pb
 
@@ -1115,21 +1115,126 @@ class TestStreamedResultSet(IsolatedAsyncioTestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def _make_numbers_result_sets(self, counts):
+        from google.cloud.spanner_v1 import TypeCode
+
+        metadata = self._make_result_set_metadata(
+            [self._make_scalar_field("id", TypeCode.INT64)]
+        )
+        result_sets = []
+        start = 0
+        for count in counts:
+            values = [
+                self._make_value(number) for number in range(start, start + count)
+            ]
+            result_sets.append(
+                self._make_partial_result_set(
+                    values, metadata=metadata if not result_sets else None
+                )
+            )
+            start += count
+        return result_sets
+
+    @CrossSync.pytest
+    async def test_batches_per_partial_result_set(self):
+        result_sets = self._make_numbers_result_sets([2, 0, 3])
+        streamed = self._make_one(_MockCancellableIterator(*result_sets))
+        found = [batch async for batch in streamed.batches()]
+        self.assertEqual(found, [[[0], [1]], [[2], [3], [4]]])
+
+    @CrossSync.pytest
+    async def test_batches_w_batch_size(self):
+        result_sets = self._make_numbers_result_sets([2, 3, 2])
+        streamed = self._make_one(_MockCancellableIterator(*result_sets))
+        found = [batch async for batch in streamed.batches(batch_size=3)]
+        self.assertEqual(found, [[[0], [1], [2]], [[3], [4], [5]], [[6]]])
+
+    @CrossSync.pytest
+    async def test_batches_w_invalid_batch_size(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            [batch async for batch in streamed.batches(batch_size=0)]
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test_batches_bounded_buffering(self):
+        result_sets = self._make_numbers_result_sets([1] * 10)
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator)
+        batches = streamed.batches(max_buffered_batches=2)
+        self.assertEqual(await batches.__anext__(), [[0]])
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # One batch was consumed, two are buffered and one is waiting to be
+        # put in the queue.
+        self.assertEqual(iterator.next_calls, 4)
+        await batches.aclose()
+        self.assertEqual(iterator.next_calls, 4)
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test_batches_propagates_stream_error(self):
+        result_sets = self._make_numbers_result_sets([2])
+        iterator = _MockCancellableIterator(*result_sets, ValueError("broken"))
+        streamed = self._make_one(iterator)
+        found = []
+        with self.assertRaises(ValueError):
+            async for batch in streamed.batches():
+                found.append(batch)
+        self.assertEqual(found, [[[0], [1]]])
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test___iter___yields_to_event_loop(self):
+        result_sets = self._make_numbers_result_sets([1] * 3)
+        streamed = self._make_one(_MockCancellableIterator(*result_sets))
+        events = []
+
+        async def other():
+            for _ in range(3):
+                events.append("other")
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(other())
+        async for row in streamed:
+            events.append(row[0])
+        await task
+        self.assertEqual(events, ["other", 0, "other", 1, "other", 2])
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test_decode_offload_bytes(self):
+        result_sets = self._make_numbers_result_sets([1, 100])
+        streamed = self._make_one(
+            _MockCancellableIterator(*result_sets), decode_offload_bytes=100
+        )
+        with mock.patch(
+            "asyncio.to_thread", side_effect=asyncio.to_thread
+        ) as to_thread:
+            found = [row async for row in streamed]
+        self.assertEqual(found, [[number] for number in range(101)])
+        to_thread.assert_called_once_with(streamed._merge_response, result_sets[1])
+
 
 class _MockCancellableIterator(object):
     cancel_calls = 0
 
     def __init__(self, *values):
         self.iter_values = iter(values)
+        self.next_calls = 0
 
     def __aiter__(self):
         return self
 
     async def __anext__(self):
+        self.next_calls += 1
         try:
-            return next(self.iter_values)
+            value = next(self.iter_values)
         except StopIteration:
             raise StopAsyncIteration
+        if isinstance(value, Exception):
+            raise value
+        return value
 
 
 @CrossSync.convert_class(
@@ -739,6 +739,51 @@ class TestTransaction(OpenTelemetryBase):
         with pytest.raises(RuntimeError):
             await transaction.commit()
 
+    @CrossSync.pytest
+    async def test_commit_single_use_commit(self):
+        transaction = build_transaction()
+        transaction.single_use_commit = True
+        transaction._mutations = [DELETE_MUTATION]
+
+        api = transaction._session._database.spanner_api
+        # A precommit token in the response does not cause a retry, as the
+        # commit of a single-use transaction cannot be retried.
+        api.commit.return_value = build_commit_response_pb(
+            precommit_token=PRECOMMIT_TOKEN_PB_0
+        )
+
+        await transaction.commit()
+
+        api.begin_transaction.assert_not_called()
+        self.assertEqual(1, api.commit.call_count)
+        request = api.commit.call_args.kwargs["request"]
+        self.assertEqual(
+            TransactionOptions(read_write=TransactionOptions.ReadWrite()),
+            request.single_use_transaction,
+        )
+        self.assertEqual(b"", request.transaction_id)
+        self.assertEqual([DELETE_MUTATION], list(request.mutations))
+        self.assertEqual(1, transaction._rpc_count.value)
+
+    @CrossSync.pytest
+    async def test_commit_single_use_commit_after_query_begins(self):
+        transaction = build_transaction()
+        transaction.single_use_commit = True
+        transaction._mutations = [DELETE_MUTATION]
+        transaction._execute_sql_request_count = 1
+
+        api = transaction._session._database.spanner_api
+        api.begin_transaction.return_value = build_transaction_pb(id=TRANSACTION_ID)
+        api.commit.return_value = build_commit_response_pb()
+
+        await transaction.commit()
+
+        self.assertEqual(1, api.begin_transaction.call_count)
+        request = api.commit.call_args.kwargs["request"]
+        self.assertEqual(TRANSACTION_ID, request.transaction_id)
+        self.assertNotIn("single_use_transaction", request)
+        self.assertEqual(2, transaction._rpc_count.value)
+
     @CrossSync.pytest
     async def test__make_params_pb_w_params_w_param_types(self):
         from google.protobuf.struct_pb2 import Struct
@@ -1357,6 +1402,151 @@ class TestTransaction(OpenTelemetryBase):
     async def test_batch_update_w_precommit_token(self, mock_region):
         await self._batch_update_helper(use_multiplexed=True)
 
+    @CrossSync.drop
+    def _make_concurrent_execute_sql(self, requests, errors=()):
+        import asyncio
+        from google.cloud.spanner_v1 import ResultSet, ResultSetStats
+
+        errors = list(errors)
+        precommit_tokens = [PRECOMMIT_TOKEN_PB_2, PRECOMMIT_TOKEN_PB_0]
+        in_flight = [0, 0]
+
+        async def execute_sql(request=None, metadata=None, **kwargs):
+            requests.append(request)
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                in_flight[0] -= 1
+            if errors:
+                raise errors.pop(0)
+            metadata_pb = ResultSetMetadata()
+            if "begin" in request.transaction:
+                metadata_pb = ResultSetMetadata(
+                    transaction=build_transaction_pb(id=TRANSACTION_ID)
+                )
+            return ResultSet(
+                metadata=metadata_pb,
+                stats=ResultSetStats(row_count_exact=1),
+                precommit_token=precommit_tokens.pop(0)
+                if precommit_tokens
+                else PRECOMMIT_TOKEN_PB_1,
+            )
+
+        return execute_sql, in_flight
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test_execute_update_concurrent_begins_once(self):
+        import asyncio
+
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        requests = []
+        execute_sql, in_flight = self._make_concurrent_execute_sql(requests)
+        database.spanner_api.execute_sql.side_effect = execute_sql
+        transaction = self._make_one(_Session(database))
+
+        row_counts = await asyncio.gather(
+            *(transaction.execute_update(DML_QUERY) for _ in range(4))
+        )
+
+        self.assertEqual([1, 1, 1, 1], row_counts)
+        self.assertEqual(4, len(requests))
+        self.assertIn("begin", requests[0].transaction)
+        for request in requests[1:]:
+            self.assertEqual(TRANSACTION_ID, request.transaction.id)
+        self.assertEqual([0, 1, 2, 3], sorted(request.seqno for request in requests))
+        # The statements after the first one are executed in parallel.
+        self.assertEqual(3, in_flight[1])
+        self.assertEqual(PRECOMMIT_TOKEN_PB_2, transaction._precommit_token)
+        self.assertFalse(transaction._lock.locked())
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test_execute_update_concurrent_first_statement_fails(self):
+        import asyncio
+
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        requests = []
+        execute_sql, _ = self._make_concurrent_execute_sql(
+            requests, errors=[RuntimeError("first")]
+        )
+        database.spanner_api.execute_sql.side_effect = execute_sql
+        transaction = self._make_one(_Session(database))
+
+        results = await asyncio.gather(
+            *(transaction.execute_update(DML_QUERY) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertEqual([1, 1], results[1:])
+        # The next statement begins the transaction instead.
+        self.assertIn("begin", requests[0].transaction)
+        self.assertIn("begin", requests[1].transaction)
+        self.assertEqual(TRANSACTION_ID, requests[2].transaction.id)
+        self.assertFalse(transaction._lock.locked())
+
+    @CrossSync.drop
+    @CrossSync.pytest
+    async def test_execute_sql_concurrent_waits_for_begin(self):
+        import asyncio
+        from google.cloud.spanner_v1 import PartialResultSet
+
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        requests = []
+        first_response = asyncio.Event()
+
+        async def execute_streaming_sql(request=None, metadata=None, **kwargs):
+            requests.append(request)
+            if "begin" in request.transaction:
+                await first_response.wait()
+                metadata_pb = ResultSetMetadata(
+                    transaction=build_transaction_pb(id=TRANSACTION_ID)
+                )
+            else:
+                metadata_pb = ResultSetMetadata()
+
+            async def responses():
+                yield PartialResultSet(metadata=metadata_pb, resume_token=b"t")
+
+            return responses()
+
+        database.spanner_api.execute_streaming_sql.side_effect = execute_streaming_sql
+        database.spanner_api.execute_sql.side_effect = (
+            self._make_concurrent_execute_sql(requests)[0]
+        )
+        transaction = self._make_one(_Session(database))
+
+        async def consume(results):
+            return [row async for row in results]
+
+        first = asyncio.ensure_future(
+            consume(await transaction.execute_sql("SELECT 1"))
+        )
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(
+            consume(await transaction.execute_sql("SELECT 2"))
+        )
+        update = asyncio.ensure_future(transaction.execute_update(DML_QUERY))
+        await asyncio.sleep(0)
+        # Only the first statement has been sent while it begins the transaction.
+        self.assertEqual(1, len(requests))
+
+        first_response.set()
+        await asyncio.gather(first, second, update)
+
+        self.assertEqual(3, len(requests))
+        self.assertIn("begin", requests[0].transaction)
+        self.assertEqual(TRANSACTION_ID, requests[1].transaction.id)
+        self.assertEqual(TRANSACTION_ID, requests[2].transaction.id)
+        self.assertEqual([0, 1, 2], sorted(request.seqno for request in requests))
+        self.assertFalse(transaction._lock.locked())
+
     @mock.patch(
         "google.cloud.spanner_v1._opentelemetry_tracing._get_cloud_region",
         return_value="global",
@@ -1525,6 +1715,19 @@ class _Database(object):
             span,
         )
 
+    def metadata_and_request_id(
+        self, nth_request, nth_attempt, prior_metadata=[], span=None
+    ):
+        metadata, request_id = _metadata_with_request_id_and_req_id(
+            self._nth_client_id,
+            self._channel_id,
+            nth_request,
+            nth_attempt,
+            prior_metadata,
+            span,
+        )
+        return metadata, request_id
+
     def with_error_augmentation(
         self, nth_request, nth_attempt, prior_metadata=[], span=None
     ):
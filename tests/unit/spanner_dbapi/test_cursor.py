@@ -27,6 +27,7 @@ from google.cloud.spanner_dbapi.parsed_statement import (
     Statement,
     StatementType,
 )
+from google.cloud.spanner_v1 import _arrow
 
 
 class TestCursor(unittest.TestCase):
@@ -890,6 +891,89 @@ class TestCursor(unittest.TestCase):
         cursor._itr = iter(lst)
         self.assertEqual(cursor.fetchall(), lst)
 
+    def test_fetch_w_peek_iterator_uses_batches(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        cursor = self._make_one(connection)
+        cursor.arraysize = 3
+        source = iter([[1], [2], [3], [4], [5], [6]])
+        cursor._itr = PeekIterator(source)
+
+        self.assertEqual(cursor.fetchone(), (1,))
+        # fetchone() reads arraysize rows from the source at once.
+        self.assertEqual(cursor.fetchone(), (2,))
+        self.assertEqual(list(cursor._itr._buffer), [(3,), (4,)])
+        self.assertEqual(cursor.fetchmany(), [(3,), (4,), (5,)])
+        self.assertEqual(cursor.fetchall(), [(6,)])
+        self.assertEqual(cursor.fetchmany(), [])
+        self.assertIsNone(cursor.fetchone())
+
+    def _make_arrow_cursor(self, rows):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+        from google.cloud.spanner_v1 import StructType, Type, TypeCode
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        cursor = self._make_one(connection)
+        cursor._result_set = mock.Mock()
+        cursor._result_set.metadata.row_type.fields = [
+            StructType.Field(name="id", type_=Type(code=TypeCode.INT64)),
+            StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+        ]
+        cursor._itr = PeekIterator(rows)
+        return cursor
+
+    @unittest.skipIf(_arrow.pyarrow is None, "pyarrow is not installed")
+    def test_fetch_record_batches(self):
+        cursor = self._make_arrow_cursor([[1, "a"], [2, "b"], [3, None]])
+
+        batches = list(cursor.fetch_record_batches(batch_size=2))
+
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(batches[0].schema.names, ["id", "name"])
+        self.assertEqual(batches[1].column(1).to_pylist(), [None])
+        self.assertEqual(cursor.fetchall(), [])
+
+    @unittest.skipIf(_arrow.pyarrow is None, "pyarrow is not installed")
+    def test_fetch_arrow_table(self):
+        cursor = self._make_arrow_cursor([[1, "a"], [2, "b"], [3, None]])
+        self.assertEqual(cursor.fetchone(), (1, "a"))
+
+        table = cursor.fetch_arrow_table()
+
+        self.assertEqual(table.to_pydict(), {"id": [2, 3], "name": ["b", None]})
+
+    @unittest.skipIf(_arrow.pyarrow is None, "pyarrow is not installed")
+    def test_fetch_arrow_table_empty(self):
+        cursor = self._make_arrow_cursor([])
+
+        table = cursor.fetch_arrow_table()
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["id", "name"])
+
+    @unittest.skipIf(_arrow.pyarrow is None, "pyarrow is not installed")
+    def test_fetch_df(self):
+        try:
+            import pandas  # noqa: F401
+        except ImportError:  # pragma: NO COVER
+            self.skipTest("pandas is not installed")
+        cursor = self._make_arrow_cursor([[1, "a"], [2, "b"]])
+
+        df = cursor.fetch_df()
+
+        self.assertEqual(list(df.columns), ["id", "name"])
+        self.assertEqual(df["id"].tolist(), [1, 2])
+
+    def test_fetch_arrow_table_without_results(self):
+        from google.cloud.spanner_dbapi.exceptions import ProgrammingError
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        cursor = self._make_one(connection)
+
+        with self.assertRaises(ProgrammingError):
+            cursor.fetch_arrow_table()
+
     def test_nextset(self):
         from google.cloud.spanner_dbapi import exceptions
 
@@ -60,6 +60,64 @@ class TestUtils(unittest.TestCase):
         pit = PeekIterator([("Clark", "Kent")])
         self.assertEqual(next(pit), ("Clark", "Kent"))
 
+    def test_peekIterator_row_objects_converted_to_tuples(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+        from google.cloud.spanner_v1.row import Row, _RowSchema
+
+        schema = _RowSchema(["name"], [lambda value_pb: value_pb.string_value])
+        rows = [Row(schema, [Value(string_value=name)]) for name in ("a", "b")]
+
+        self.assertEqual(list(PeekIterator(rows)), [("a",), ("b",)])
+
+    def test_peekIterator_profiled_rows_record_read_columns(self):
+        import pickle
+
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+        from google.cloud.spanner_v1.column_profiler import _ColumnUsageCounter
+        from google.cloud.spanner_v1.row import Row, _RowSchema
+
+        names = ["a", "b", "c"]
+        usage = _ColumnUsageCounter("tag", names)
+        schema = _RowSchema(names, [lambda value_pb: value_pb.string_value] * 3, usage)
+        rows = [
+            Row(schema, [Value(string_value=value) for value in "xyz"])
+            for _ in range(3)
+        ]
+
+        fetched = PeekIterator(rows).fetch()
+
+        self.assertEqual(fetched, [("x", "y", "z")] * 3)
+        # Pickling the rows for retry checksums is not an access.
+        restored = pickle.loads(pickle.dumps(fetched[0]))
+        self.assertEqual(type(restored), tuple)
+        self.assertEqual(restored, ("x", "y", "z"))
+        self.assertEqual(usage.usage().unused_columns, ("a", "b", "c"))
+
+        self.assertEqual(fetched[0][-1], "z")
+        first, _, _ = fetched[1]
+
+        self.assertEqual(first, "x")
+        self.assertEqual(usage.usage().accessed_columns, ("a", "b", "c"))
+
+    def test_peekIterator_profiled_rows_unread_column(self):
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+        from google.cloud.spanner_v1.column_profiler import _ColumnUsageCounter
+        from google.cloud.spanner_v1.row import Row, _RowSchema
+
+        names = ["a", "b", "c"]
+        usage = _ColumnUsageCounter("tag", names)
+        schema = _RowSchema(names, [lambda value_pb: value_pb.string_value] * 3, usage)
+        rows = [Row(schema, [Value(string_value=value) for value in "xyz"])]
+
+        for row in PeekIterator(rows):
+            self.assertEqual(row[:2], ("x", "y"))
+
+        self.assertEqual(usage.usage().accessed_columns, ("a", "b"))
+        self.assertEqual(usage.usage().unused_columns, ("c",))
+
     @unittest.skipIf(skip_condition, "Python 2 has an outdated iterator definition")
     def test_peekIterator_nonlist_rows_unconverted(self):
         from google.cloud.spanner_dbapi.utils import PeekIterator
@@ -69,6 +127,39 @@ class TestUtils(unittest.TestCase):
         want = ["a", "b", "c", "d", "e"]
         self.assertEqual(got, want, "Values should be returned unchanged")
 
+    def test_peekIterator_fetch(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        pit = PeekIterator([["a"], ["b"], ["c"], ["d"], ["e"]])
+        self.assertEqual(next(pit), ("a",))
+        self.assertEqual(pit.fetch(2), [("b",), ("c",)])
+        self.assertEqual(pit.fetch(), [("d",), ("e",)])
+        self.assertEqual(pit.fetch(), [])
+        self.assertEqual(pit.fetch(3), [])
+        with self.assertRaises(StopIteration):
+            next(pit)
+
+    def test_peekIterator_fetch_w_prefetch(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        source = iter([[1], [2], [3], [4], [5], [6], [7]])
+        pit = PeekIterator(source)
+        self.assertEqual(pit.fetch(2, prefetch=4), [(1,), (2,)])
+        # The first row was read by the constructor, and four more rows
+        # were read from the source in one go.
+        self.assertEqual(next(source), [6])
+        self.assertEqual(pit.fetch(1, prefetch=4), [(3,)])
+        self.assertEqual(next(pit), (4,))
+        self.assertEqual(pit.fetch(5), [(5,), (7,)])
+        self.assertEqual(pit.fetch(1), [])
+
+    def test_peekIterator_empty(self):
+        from google.cloud.spanner_dbapi.utils import PeekIterator
+
+        pit = PeekIterator([])
+        self.assertEqual(pit.fetch(), [])
+        self.assertEqual(pit.fetch(5, prefetch=10), [])
+
     @unittest.skipIf(skip_condition, skip_message)
     def test_backtick_unicode(self):
         from google.cloud.spanner_dbapi.utils import backtick_unicode
@@ -0,0 +1,203 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import unittest
+import uuid
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _make_field(name, type_):
+    from google.cloud.spanner_v1 import StructType
+
+    return StructType.Field(name=name, type_=type_)
+
+
+def _make_type(code, **kwargs):
+    from google.cloud.spanner_v1 import Type
+
+    return Type(code=code, **kwargs)
+
+
+class Test_to_arrow_type(unittest.TestCase):
+    def _call_fut(self, field_type):
+        from google.cloud.spanner_v1._arrow import to_arrow_type
+
+        return to_arrow_type(field_type)
+
+    def test_scalar_types(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        cases = [
+            (TypeCode.STRING, pa.string()),
+            (TypeCode.BYTES, pa.binary()),
+            (TypeCode.BOOL, pa.bool_()),
+            (TypeCode.INT64, pa.int64()),
+            (TypeCode.FLOAT64, pa.float64()),
+            (TypeCode.FLOAT32, pa.float32()),
+            (TypeCode.DATE, pa.date32()),
+            (TypeCode.TIMESTAMP, pa.timestamp("ns", tz="UTC")),
+            (TypeCode.NUMERIC, pa.decimal128(38, 9)),
+            (TypeCode.JSON, pa.string()),
+            (TypeCode.UUID, pa.string()),
+            (TypeCode.PROTO, pa.binary()),
+            (TypeCode.ENUM, pa.int64()),
+        ]
+        for code, expected in cases:
+            self.assertEqual(self._call_fut(_make_type(code)), expected)
+
+    def test_array_and_struct(self):
+        from google.cloud.spanner_v1 import StructType, TypeCode
+
+        array_type = _make_type(
+            TypeCode.ARRAY, array_element_type=_make_type(TypeCode.NUMERIC)
+        )
+        self.assertEqual(self._call_fut(array_type), pa.list_(pa.decimal128(38, 9)))
+
+        struct_type = _make_type(
+            TypeCode.STRUCT,
+            struct_type=StructType(
+                fields=[
+                    _make_field("a", _make_type(TypeCode.INT64)),
+                    _make_field("", _make_type(TypeCode.STRING)),
+                ]
+            ),
+        )
+        self.assertEqual(
+            self._call_fut(struct_type),
+            pa.struct([("a", pa.int64()), ("_1", pa.string())]),
+        )
+
+    def test_unknown_type(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        with self.assertRaises(ValueError):
+            self._call_fut(_make_type(TypeCode.TYPE_CODE_UNSPECIFIED))
+
+
+class Test_rows_to_record_batch(unittest.TestCase):
+    def _call_fut(self, rows, fields, schema=None):
+        from google.cloud.spanner_v1._arrow import rows_to_record_batch
+
+        return rows_to_record_batch(rows, fields, schema)
+
+    def test_conversions(self):
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+        from google.cloud.spanner_v1 import JsonObject, TypeCode
+
+        fields = [
+            _make_field("id", _make_type(TypeCode.INT64)),
+            _make_field("amount", _make_type(TypeCode.NUMERIC)),
+            _make_field("ts", _make_type(TypeCode.TIMESTAMP)),
+            _make_field("doc", _make_type(TypeCode.JSON)),
+            _make_field(
+                "tags",
+                _make_type(
+                    TypeCode.ARRAY, array_element_type=_make_type(TypeCode.TIMESTAMP)
+                ),
+            ),
+            _make_field("uid", _make_type(TypeCode.UUID)),
+        ]
+        ts = DatetimeWithNanoseconds(
+            2024, 1, 2, 3, 4, 5, nanosecond=123456789, tzinfo=datetime.timezone.utc
+        )
+        uid = uuid.uuid4()
+        rows = [
+            (1, decimal.Decimal("1.5"), ts, JsonObject({"b": 1, "a": 2}), [ts], uid),
+            (2, None, None, None, [None], None),
+        ]
+
+        batch = self._call_fut(rows, fields)
+
+        self.assertEqual(batch.num_rows, 2)
+        self.assertEqual(
+            batch.schema.names, ["id", "amount", "ts", "doc", "tags", "uid"]
+        )
+        self.assertEqual(batch.column(0).to_pylist(), [1, 2])
+        self.assertEqual(
+            batch.column(1).to_pylist(), [decimal.Decimal("1.500000000"), None]
+        )
+        expected_nanos = 1704164645123456789
+        self.assertEqual(
+            batch.column(2).cast(pa.int64()).to_pylist(), [expected_nanos, None]
+        )
+        self.assertEqual(batch.column(3).to_pylist(), ['{"a":2,"b":1}', None])
+        self.assertEqual(batch.column(4).to_pylist()[1], [None])
+        self.assertEqual(batch.column(5).to_pylist(), [str(uid), None])
+
+    def test_compact_temporal(self):
+        from google.protobuf.struct_pb2 import Value
+
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1._helpers import _parse_value_pb
+        from google.cloud.spanner_v1.data_types import ALL_COLUMNS, COMPACT_TEMPORAL
+
+        fields = [
+            _make_field("ts", _make_type(TypeCode.TIMESTAMP)),
+            _make_field("d", _make_type(TypeCode.DATE)),
+        ]
+        values = ["2024-01-02T03:04:05.123456789Z", "2024-01-02"]
+        row = [
+            _parse_value_pb(
+                Value(string_value=value),
+                field.type_,
+                field.name,
+                {ALL_COLUMNS: COMPACT_TEMPORAL},
+            )
+            for value, field in zip(values, fields)
+        ]
+
+        batch = self._call_fut([row, [None, None]], fields)
+
+        self.assertEqual(
+            batch.column(0).cast(pa.int64()).to_pylist(), [1704164645123456789, None]
+        )
+        self.assertEqual(batch.column(1).to_pylist(), [datetime.date(2024, 1, 2), None])
+
+    def test_empty(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        fields = [_make_field("id", _make_type(TypeCode.INT64))]
+
+        batch = self._call_fut([], fields)
+
+        self.assertEqual(batch.num_rows, 0)
+        self.assertEqual(batch.schema.names, ["id"])
+
+    def test_struct(self):
+        from google.cloud.spanner_v1 import StructType, TypeCode
+
+        struct_type = _make_type(
+            TypeCode.STRUCT,
+            struct_type=StructType(
+                fields=[
+                    _make_field("a", _make_type(TypeCode.INT64)),
+                    _make_field("b", _make_type(TypeCode.JSON)),
+                ]
+            ),
+        )
+        fields = [
+            _make_field(
+                "structs", _make_type(TypeCode.ARRAY, array_element_type=struct_type)
+            )
+        ]
+
+        batch = self._call_fut([([[1, None]],)], fields)
+
+        self.assertEqual(batch.column(0).to_pylist(), [[{"a": 1, "b": None}]])
@@ -653,6 +653,89 @@ class Test_parse_value_pb(unittest.TestCase):
         self.assertIsInstance(parsed, datetime_helpers.DatetimeWithNanoseconds)
         self.assertEqual(parsed, value)
 
+    def test_w_date_compact_temporal(self):
+        from google.protobuf.struct_pb2 import Value
+
+        from google.cloud.spanner_v1 import Type, TypeCode
+        from google.cloud.spanner_v1.data_types import COMPACT_TEMPORAL
+
+        field_type = Type(code=TypeCode.DATE)
+        column_info = {"date_column": COMPACT_TEMPORAL}
+        for value in ("1970-01-01", "2024-02-29", "0001-01-01", "1969-12-31"):
+            value_pb = Value(string_value=value)
+            expected = (
+                datetime.date.fromisoformat(value) - datetime.date(1970, 1, 1)
+            ).days
+
+            parsed = self._callFUT(value_pb, field_type, "date_column", column_info)
+            self.assertEqual(parsed, expected)
+
+        # Other columns are not affected.
+        value_pb = Value(string_value="2024-02-29")
+        self.assertEqual(
+            self._callFUT(value_pb, field_type, "other_column", column_info),
+            datetime.date(2024, 2, 29),
+        )
+
+    def test_w_timestamp_compact_temporal(self):
+        from google.api_core import datetime_helpers
+        from google.protobuf.struct_pb2 import Value
+
+        from google.cloud.spanner_v1 import Type, TypeCode
+        from google.cloud.spanner_v1.data_types import ALL_COLUMNS, COMPACT_TEMPORAL
+
+        field_type = Type(code=TypeCode.TIMESTAMP)
+        column_info = {ALL_COLUMNS: COMPACT_TEMPORAL}
+        for value in (
+            "1970-01-01T00:00:00Z",
+            "2016-12-20T21:13:47Z",
+            "2016-12-20T21:13:47.1Z",
+            "2016-12-20T21:13:47.123456Z",
+            "2016-12-20T21:13:47.123456789Z",
+            "1969-12-31T23:59:59.999999999Z",
+            "0001-01-01T00:00:00Z",
+            "9999-12-31T23:59:59.999999999Z",
+            # Not a valid timestamp.
+            "2016-12-20T21:13:47.Z",
+        ):
+            value_pb = Value(string_value=value)
+            if value.endswith(".Z"):
+                with self.assertRaises(ValueError):
+                    self._callFUT(value_pb, field_type, "ts", column_info)
+                continue
+            timestamp = datetime_helpers.DatetimeWithNanoseconds.from_rfc3339(value)
+            delta = timestamp - datetime.datetime(1970, 1, 1, tzinfo=timezone.utc)
+            expected = (
+                delta.days * 86400 + delta.seconds
+            ) * 1000000000 + timestamp.nanosecond
+
+            parsed = self._callFUT(value_pb, field_type, "ts", column_info)
+            self.assertIsInstance(parsed, int)
+            self.assertEqual(parsed, expected, value)
+
+    def test_w_array_of_timestamp_compact_temporal(self):
+        from google.protobuf.struct_pb2 import ListValue, Value
+
+        from google.cloud.spanner_v1 import Type, TypeCode
+        from google.cloud.spanner_v1.data_types import COMPACT_TEMPORAL
+
+        field_type = Type(
+            code=TypeCode.ARRAY, array_element_type=Type(code=TypeCode.TIMESTAMP)
+        )
+        value_pb = Value(
+            list_value=ListValue(
+                values=[
+                    Value(string_value="1970-01-01T00:00:01.000000002Z"),
+                    Value(null_value=0),
+                ]
+            )
+        )
+
+        parsed = self._callFUT(
+            value_pb, field_type, "ts", {"ts": COMPACT_TEMPORAL, "*": None}
+        )
+        self.assertEqual(parsed, [1000000002, None])
+
     def test_w_array_empty(self):
         from google.protobuf.struct_pb2 import ListValue, Value
 
@@ -1020,6 +1103,67 @@ class Test_retry(unittest.TestCase):
 
         self.assertEqual(test_api.test_fxn.call_count, 1)
 
+    def test_retry_w_retry_policy(self):
+        import functools
+
+        from google.api_core.exceptions import InternalServerError
+
+        from google.cloud.spanner_v1._helpers import _retry
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE, RetryPolicy
+
+        test_api = mock.create_autospec(self.test_class)
+        test_api.test_fxn.side_effect = [
+            InternalServerError("testing"),
+            InternalServerError("testing"),
+            True,
+        ]
+        policy = RetryPolicy(initial_delay=0.5, jitter=JITTER_NONE)
+
+        with mock.patch("time.sleep") as sleep_mock:
+            _retry(functools.partial(test_api.test_fxn), retry_policy=policy)
+
+        self.assertEqual(test_api.test_fxn.call_count, 3)
+        self.assertEqual(
+            [call.args[0] for call in sleep_mock.call_args_list], [0.5, 1.0]
+        )
+
+    def test_retry_w_retry_policy_predicate(self):
+        import functools
+
+        from google.api_core.exceptions import InternalServerError
+
+        from google.cloud.spanner_v1._helpers import _retry
+        from google.cloud.spanner_v1.retry_policy import RetryPolicy
+
+        test_api = mock.create_autospec(self.test_class)
+        test_api.test_fxn.side_effect = [InternalServerError("testing"), True]
+        policy = RetryPolicy(predicate=lambda exc: False)
+
+        with self.assertRaises(InternalServerError):
+            _retry(functools.partial(test_api.test_fxn), retry_policy=policy)
+
+        self.assertEqual(test_api.test_fxn.call_count, 1)
+
+    def test_retry_records_retry_in_metrics_tracer(self):
+        import functools
+
+        from google.api_core.exceptions import InternalServerError
+
+        from google.cloud.spanner_v1._helpers import _retry
+
+        test_api = mock.create_autospec(self.test_class)
+        test_api.test_fxn.side_effect = [InternalServerError("testing"), True]
+        tracer = mock.Mock()
+
+        with mock.patch(
+            "google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory."
+            "SpannerMetricsTracerFactory.get_current_tracer",
+            return_value=tracer,
+        ):
+            _retry(functools.partial(test_api.test_fxn), delay=0)
+
+        tracer.record_retry.assert_called_once_with()
+
 
 class Test_metadata_with_leader_aware_routing(unittest.TestCase):
     def _call_fut(self, *args, **kw):
@@ -1,3 +1,5 @@
+import datetime
+
 import mock
 
 try:
@@ -224,3 +226,74 @@ class TestTracing(OpenTelemetryBase):
         assert type(used_span).__name__ == "NonRecordingSpan"
         span_list = list(trace_exporter.get_finished_spans())
         assert span_list == []
+
+    def test_is_tracing_enabled(self):
+        from opentelemetry.sdk.trace import TracerProvider
+
+        assert _opentelemetry_tracing.is_tracing_enabled()
+        assert _opentelemetry_tracing.is_tracing_enabled(TracerProvider())
+        assert not _opentelemetry_tracing.is_tracing_enabled(
+            trace_api.NoOpTracerProvider()
+        )
+        assert not _opentelemetry_tracing.is_tracing_enabled(
+            trace_api.ProxyTracerProvider()
+        )
+
+    def test_trace_call_w_noop_tracer_provider(self):
+        observability_options = dict(tracer_provider=trace_api.NoOpTracerProvider())
+        session = _make_session()
+
+        tracer = trace_api.get_tracer(__name__)
+        with tracer.start_as_current_span("outer") as outer_span:
+            with mock.patch(
+                "google.cloud.spanner_v1._opentelemetry_tracing.get_tracer"
+            ) as get_tracer:
+                with _opentelemetry_tracing.trace_call(
+                    "CloudSpanner.Test",
+                    session,
+                    observability_options=observability_options,
+                ) as span:
+                    assert span is trace_api.INVALID_SPAN
+                    assert _opentelemetry_tracing.get_current_span() is span
+
+            get_tracer.assert_not_called()
+            assert _opentelemetry_tracing.get_current_span() is outer_span
+
+        span_names = [span.name for span in self.ot_exporter.get_finished_spans()]
+        assert span_names == ["outer"]
+        assert isinstance(session._last_use_time, datetime.datetime)
+
+    def test_trace_call_sets_metrics_request_tag(self):
+        from google.cloud.spanner_v1 import RequestOptions
+        from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+            SpannerMetricsTracerFactory,
+        )
+
+        factory = SpannerMetricsTracerFactory()
+        factory.enable_local_metrics()
+        extra_attributes = {"request_options": RequestOptions(request_tag="my_tag")}
+        try:
+            for observability_options in (
+                dict(tracer_provider=trace_api.NoOpTracerProvider()),
+                None,
+            ):
+                with _opentelemetry_tracing.trace_call(
+                    "CloudSpanner.Test",
+                    extra_attributes=dict(extra_attributes),
+                    observability_options=observability_options,
+                ):
+                    tracer = SpannerMetricsTracerFactory.get_current_tracer()
+                    assert tracer.request_tag == "my_tag"
+        finally:
+            factory.local_sink = None
+
+    def test_trace_call_w_noop_tracer_provider_propagates_error(self):
+        observability_options = dict(tracer_provider=trace_api.NoOpTracerProvider())
+
+        with self.assertRaises(ValueError):
+            with _opentelemetry_tracing.trace_call(
+                "CloudSpanner.Test", observability_options=observability_options
+            ):
+                raise ValueError("error")
+
+        assert _opentelemetry_tracing.get_current_span() is trace_api.INVALID_SPAN
@@ -0,0 +1,246 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import threading
+
+from google.api_core.exceptions import ServiceUnavailable
+import pytest
+
+from google.cloud.spanner_admin_database_v1.types import Backup, Database
+from google.cloud.spanner_admin_instance_v1.types import Instance as InstancePB
+from google.cloud.spanner_v1.admin_index import AdminIndex, AdminLister
+
+PROJECT = "projects/p"
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _backup(instance, name, database, state, expire_hours, size_bytes):
+    return Backup(
+        name="%s/instances/%s/backups/%s" % (PROJECT, instance, name),
+        database="%s/instances/%s/databases/%s" % (PROJECT, instance, database),
+        state=state,
+        expire_time=NOW + datetime.timedelta(hours=expire_hours),
+        size_bytes=size_bytes,
+    )
+
+
+class _Instance(object):
+    def __init__(self, instance_id, count=0, exception=None):
+        self.instance_id = instance_id
+        self.name = "%s/instances/%s" % (PROJECT, instance_id)
+        self.count = count
+        self.exception = exception
+        self.calls = []
+
+    def _items(self, factory):
+        for index in range(self.count):
+            yield factory(index)
+        if self.exception is not None:
+            raise self.exception
+
+    def list_databases(self, page_size=None):
+        self.calls.append(("list_databases", page_size))
+        return self._items(
+            lambda index: Database(name="%s/databases/db%d" % (self.name, index))
+        )
+
+    def list_backups(self, filter_="", page_size=None):
+        self.calls.append(("list_backups", filter_, page_size))
+        return self._items(
+            lambda index: Backup(name="%s/backups/b%d" % (self.name, index))
+        )
+
+    def list_backup_operations(self, filter_="", page_size=None):
+        self.calls.append(("list_backup_operations", filter_, page_size))
+        return self._items(lambda index: index)
+
+
+class _Client(object):
+    project = "p"
+
+    def __init__(self, instances):
+        self.instances = {instance.instance_id: instance for instance in instances}
+
+    def instance(self, instance_id):
+        return self.instances[instance_id]
+
+    def list_instances(self, filter_=""):
+        return [
+            InstancePB(
+                name="%s/instances/%s" % (PROJECT, instance_id),
+                display_name=instance_id,
+            )
+            for instance_id in self.instances
+        ]
+
+
+def test_lister_invalid_arguments():
+    with pytest.raises(ValueError):
+        AdminLister(_Client([]), max_workers=0)
+    with pytest.raises(ValueError):
+        AdminLister(_Client([]), prefetch=0)
+
+
+def test_list_backups():
+    instances = [_Instance("i%d" % index, count=50) for index in range(4)]
+    lister = AdminLister(_Client(instances), max_workers=2, prefetch=3)
+
+    backups = list(lister.list_backups(instances, filter_="f", page_size=10))
+
+    assert len(backups) == 200
+    assert len({backup.name for backup in backups}) == 200
+    for instance in instances:
+        assert instance.calls == [("list_backups", "f", 10)]
+
+
+def test_list_databases_by_instance_id():
+    instances = [_Instance("i0", count=2), _Instance("i1", count=3)]
+    lister = AdminLister(_Client(instances))
+
+    databases = list(lister.list_databases(["i1"]))
+
+    assert sorted(database.name for database in databases) == [
+        "%s/instances/i1/databases/db%d" % (PROJECT, index) for index in range(3)
+    ]
+    assert instances[0].calls == []
+
+
+def test_list_backup_operations():
+    instance = _Instance("i0", count=5)
+    lister = AdminLister(_Client([instance]))
+
+    assert sorted(lister.list_backup_operations([instance])) == list(range(5))
+
+
+def test_list_all_instances():
+    from google.cloud.spanner_v1.instance import Instance
+
+    client = _Client([_Instance("i0"), _Instance("i1")])
+    lister = AdminLister(client)
+
+    instances = lister.list_instances()
+
+    assert [type(instance) for instance in instances] == [Instance, Instance]
+    assert [instance.instance_id for instance in instances] == ["i0", "i1"]
+
+
+def test_list_wo_instances():
+    lister = AdminLister(_Client([]))
+    assert list(lister.list_backups([])) == []
+
+
+def test_list_error():
+    instances = [
+        _Instance("i0", count=5),
+        _Instance("i1", count=1, exception=ServiceUnavailable("unavailable")),
+    ]
+    lister = AdminLister(_Client(instances))
+
+    with pytest.raises(ServiceUnavailable):
+        list(lister.list_backups(instances))
+
+
+def test_list_stops_workers_when_closed():
+    instance = _Instance("i0", count=1000)
+    lister = AdminLister(_Client([instance]), prefetch=1)
+    threads = threading.active_count()
+
+    backups = lister.list_backups([instance])
+    next(backups)
+    backups.close()
+
+    for _ in range(100):
+        if threading.active_count() <= threads:
+            break
+        threading.Event().wait(0.05)
+    assert threading.active_count() <= threads
+
+
+def _make_index():
+    return AdminIndex(
+        [
+            _backup("i0", "b0", "db0", Backup.State.READY, 1, 100),
+            _backup("i0", "b1", "db0", Backup.State.READY, 48, 5000),
+            _backup("i0", "b2", "db1", Backup.State.CREATING, 12, 0),
+            _backup("i1", "b3", "db2", Backup.State.READY, 20, 9000),
+            Database(
+                name="%s/instances/i1/databases/db2" % PROJECT,
+                state=Database.State.READY,
+            ),
+        ]
+    )
+
+
+def _names(resources):
+    return [resource.name.rsplit("/", 1)[1] for resource in resources]
+
+
+def test_index_query():
+    index = _make_index()
+
+    assert len(index) == 5
+    assert _names(index.query()) == ["b0", "b1", "b2", "b3", "db2"]
+    assert _names(index.query(state=Backup.State.READY)) == ["b0", "b1", "b3"]
+    assert _names(index.query(state=Database.State.READY)) == ["db2"]
+    assert _names(index.query(instance="%s/instances/i1" % PROJECT)) == [
+        "b3",
+        "db2",
+    ]
+    assert _names(
+        index.query(source_database="%s/instances/i0/databases/db0" % PROJECT)
+    ) == ["b0", "b1"]
+
+
+def test_index_query_expire_time_and_size():
+    index = _make_index()
+
+    expiring = index.query(expire_before=NOW + datetime.timedelta(hours=24))
+    assert _names(expiring) == ["b0", "b2", "b3"]
+    assert _names(
+        index.query(
+            expire_after=NOW + datetime.timedelta(hours=1),
+            expire_before=NOW + datetime.timedelta(hours=24),
+            min_size_bytes=1000,
+        )
+    ) == ["b3"]
+    assert _names(index.query(min_size_bytes=0, max_size_bytes=5000)) == [
+        "b0",
+        "b1",
+        "b2",
+    ]
+    assert index.query(state=Backup.State.CREATING, min_size_bytes=1) == []
+
+
+def test_index_add_and_remove():
+    index = _make_index()
+    name = "%s/instances/i0/backups/b0" % PROJECT
+    assert _names(index.query(max_size_bytes=100)) == ["b0", "b2"]
+
+    index.add(_backup("i0", "b0", "db1", Backup.State.READY, 1, 200))
+
+    assert len(index) == 5
+    assert index.get(name).size_bytes == 200
+    assert _names(index.query(max_size_bytes=100)) == ["b2"]
+    assert _names(
+        index.query(source_database="%s/instances/i0/databases/db0" % PROJECT)
+    ) == ["b1"]
+
+    index.remove(name)
+
+    assert index.get(name) is None
+    assert name not in {resource.name for resource in index}
+    assert _names(index.query(expire_before=NOW + datetime.timedelta(hours=2))) == []
+    with pytest.raises(KeyError):
+        index.remove(name)
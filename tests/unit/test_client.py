@@ -380,6 +380,54 @@ class TestClient(unittest.TestCase):
         self.assertIsNotNone(client)
         mock_spanner_metrics_factory.assert_called_once_with(enabled=False)
 
+    def test_constructor_w_enable_local_metrics(self):
+        from google.cloud.spanner_v1.client import Client
+        from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+            SpannerMetricsTracerFactory,
+        )
+
+        factory = SpannerMetricsTracerFactory()
+        factory.local_sink = None
+        creds = build_scoped_credentials()
+        try:
+            client = Client(
+                project=self.PROJECT,
+                credentials=creds,
+                disable_builtin_metrics=True,
+                enable_local_metrics=True,
+            )
+            sink = factory.local_sink
+            self.assertIsNotNone(sink)
+            sink.record_attempt("Spanner.Read", "db", "tag", 1.0)
+
+            snapshot = client.metrics_snapshot()
+            attempts = snapshot["attempt_latencies"]
+            self.assertEqual(attempts["method"]["Spanner.Read"]["count"], 1)
+            self.assertEqual(attempts["request_tag"]["tag"]["p50"], 1.0)
+            self.assertIn(
+                "spanner_client_attempt_latency_ms_count"
+                '{method="Spanner.Read",database="db",request_tag="tag"} 1',
+                client.metrics_prometheus_text(),
+            )
+        finally:
+            factory.local_sink = None
+
+    def test_metrics_snapshot_wo_local_metrics(self):
+        from google.cloud.spanner_v1.client import Client
+        from google.cloud.spanner_v1.metrics.spanner_metrics_tracer_factory import (
+            SpannerMetricsTracerFactory,
+        )
+
+        SpannerMetricsTracerFactory().local_sink = None
+        creds = build_scoped_credentials()
+        client = Client(
+            project=self.PROJECT, credentials=creds, disable_builtin_metrics=True
+        )
+        with self.assertRaises(ValueError):
+            client.metrics_snapshot()
+        with self.assertRaises(ValueError):
+            client.metrics_prometheus_text()
+
     def test_constructor_route_to_leader_disbled(self):
         from google.cloud.spanner_v1 import client as MUT
 
@@ -0,0 +1,151 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from google.cloud.spanner_v1 import (
+    ExecuteSqlRequest,
+    PartialResultSet,
+    ReadRequest,
+    RequestOptions,
+    ResultSetMetadata,
+    StructType,
+    Type,
+    TypeCode,
+)
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.column_profiler import (
+    ColumnAccessProfiler,
+    ColumnUsage,
+    _column_profile_tag,
+    get_column_profiler,
+    set_column_profiler,
+)
+from google.cloud.spanner_v1.row import Row
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+FIELDS = [("id", TypeCode.INT64), ("name", TypeCode.STRING), ("bio", TypeCode.STRING)]
+
+
+@pytest.fixture(autouse=True)
+def _reset_column_profiler():
+    yield
+    set_column_profiler()
+
+
+def _result_set(profiler, tag="tag", rows=2, lazy_decode=False):
+    metadata = ResultSetMetadata(
+        row_type=StructType(
+            fields=[
+                StructType.Field(name=name, type_=Type(code=code))
+                for name, code in FIELDS
+            ]
+        )
+    )
+    result_set = PartialResultSet(metadata=metadata)
+    for index in range(rows):
+        for value in [index, "name-%d" % index, "x" * 100]:
+            result_set._pb.values.append(_make_value_pb(value))
+    return StreamedResultSet(
+        iter([result_set]),
+        lazy_decode=lazy_decode,
+        column_profiler=profiler,
+        column_profile_tag=tag,
+    )
+
+
+def test_set_column_profiler():
+    assert get_column_profiler() is None
+    profiler = ColumnAccessProfiler()
+
+    set_column_profiler(profiler)
+    assert get_column_profiler() is profiler
+
+    set_column_profiler()
+    assert get_column_profiler() is None
+
+
+def test_report():
+    profiler = ColumnAccessProfiler()
+    for _ in range(2):
+        for row in _result_set(profiler):
+            assert isinstance(row, Row)
+            row["id"]
+
+    [usage] = profiler.report()
+
+    assert usage.tag == "tag"
+    assert usage.columns == ("id", "name", "bio")
+    assert usage.accessed_columns == ("id",)
+    assert usage.unused_columns == ("name", "bio")
+    assert usage.result_sets == 2
+    assert usage.rows == 4
+    assert usage.wasted_bytes > 400
+    assert usage.fetched_bytes > usage.wasted_bytes
+    assert usage.accessed_fraction == pytest.approx(1 / 3)
+
+
+def test_report_filters_and_sorts():
+    profiler = ColumnAccessProfiler()
+    for row in _result_set(profiler, tag="small", rows=1):
+        row["id"]
+    for row in _result_set(profiler, tag="large", rows=10):
+        row["id"]
+    for row in _result_set(profiler, tag="used"):
+        list(row)
+
+    assert [usage.tag for usage in profiler.report()] == ["large", "small"]
+    assert [usage.tag for usage in profiler.report(min_rows=2)] == ["large"]
+    assert len(profiler.report(max_accessed_fraction=1.0)) == 3
+
+
+def test_reset():
+    profiler = ColumnAccessProfiler()
+    list(_result_set(profiler))
+
+    profiler.reset()
+
+    assert profiler.report() == []
+
+
+def test_lazy_decode_is_not_profiled():
+    profiler = ColumnAccessProfiler()
+    rows = list(_result_set(profiler, lazy_decode=True))
+
+    assert not isinstance(rows[0], Row)
+    assert profiler.report() == []
+
+
+def test_column_usage_wo_columns():
+    usage = ColumnUsage("tag", (), (), (), 1, 1, 0, 0)
+    assert usage.accessed_fraction == 1.0
+
+
+def test_column_profile_tag():
+    request_options = RequestOptions(request_tag="my-tag")
+    assert _column_profile_tag(ExecuteSqlRequest(sql="SELECT 1")) == "SELECT 1"
+    assert (
+        _column_profile_tag(
+            ExecuteSqlRequest(sql="SELECT 1", request_options=request_options)
+        )
+        == "my-tag"
+    )
+    assert (
+        _column_profile_tag(ReadRequest(table="t", columns=["a", "b"]))
+        == "READ t(a, b)"
+    )
+    assert (
+        _column_profile_tag(ReadRequest(table="t", index="i", columns=["a"]))
+        == "READ t@i(a)"
+    )
@@ -1635,6 +1635,114 @@ class TestDatabase(_BaseTest):
         if not multiplexed_enabled:
             self.assertIs(pool._session, session)
 
+    def _make_read_many_database(self, rows):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = self._make_one(self.DATABASE_ID, instance, pool=_Pool())
+        snapshot = mock.Mock(spec=["begin", "read"])
+
+        def read(table, columns, keyset, index="", request_options=None):
+            keys = {tuple(key) for key in keyset.keys}
+            return iter([row for row in rows if tuple(row[:1]) in keys])
+
+        snapshot.read.side_effect = read
+        checkout = mock.MagicMock()
+        checkout.__enter__.return_value = snapshot
+        database.snapshot = mock.Mock(return_value=checkout)
+        return database, snapshot
+
+    def test_read_many(self):
+        rows = [[1, "a"], [2, "b"], [3, "c"], [4, "d"]]
+        database, snapshot = self._make_read_many_database(rows)
+
+        result = database.read_many(
+            "table",
+            ["id", "name"],
+            [[4], [2], [1], [2], [3]],
+            parallelism=2,
+            exact_staleness="staleness",
+        )
+
+        self.assertEqual(result, rows)
+        database.snapshot.assert_called_once_with(
+            multi_use=True, exact_staleness="staleness"
+        )
+        snapshot.begin.assert_called_once_with()
+        self.assertEqual(
+            sorted(call.args[2].keys for call in snapshot.read.call_args_list),
+            [[[1], [2]], [[3], [4]]],
+        )
+        for call in snapshot.read.call_args_list:
+            self.assertEqual(call.args[:2], ("table", ["id", "name"]))
+
+    def test_read_many_w_key_columns(self):
+        rows = [[1, "a"], [2, "b"], [3, "c"], [4, "d"]]
+        database, _ = self._make_read_many_database(rows)
+
+        result = database.read_many(
+            "table",
+            ["id", "name"],
+            [[4], [2], [5], [1], [2], [3]],
+            parallelism=3,
+            key_columns=["id"],
+        )
+
+        self.assertEqual(result, [[4, "d"], [2, "b"], [1, "a"], [3, "c"]])
+
+    def test_read_many_w_key_columns_unmatched_rows(self):
+        # BYTES keys are returned as bytes, but may be given as base64.
+        rows = [[b"\x01", "a"], [b"\x02", "b"]]
+        database, snapshot = self._make_read_many_database(rows)
+        snapshot.read.side_effect = lambda *args, **kwargs: iter(rows)
+
+        result = database.read_many(
+            "table",
+            ["id", "name"],
+            [["Ag=="], [b"\x01"]],
+            parallelism=1,
+            key_columns=["id"],
+        )
+
+        self.assertEqual(result, [[b"\x01", "a"], [b"\x02", "b"]])
+
+    def test_read_many_w_generator_keys(self):
+        rows = [[1, "a"], [2, "b"], [3, "c"]]
+        database, _ = self._make_read_many_database(rows)
+
+        result = database.read_many(
+            "table",
+            ["id", "name"],
+            ([key] for key in (3, 1, 2)),
+            parallelism=2,
+            key_columns=["id"],
+        )
+
+        self.assertEqual(result, [[3, "c"], [1, "a"], [2, "b"]])
+
+    def test_read_many_single_chunk(self):
+        rows = [[1, "a"], [2, "b"]]
+        database, snapshot = self._make_read_many_database(rows)
+
+        result = database.read_many("table", ["id", "name"], [[2], [1]], parallelism=1)
+
+        self.assertEqual(result, rows)
+        snapshot.begin.assert_not_called()
+        snapshot.read.assert_called_once()
+
+    def test_read_many_wo_keys(self):
+        database, snapshot = self._make_read_many_database([])
+
+        self.assertEqual(database.read_many("table", ["id"], []), [])
+        database.snapshot.assert_not_called()
+
+    def test_read_many_invalid_arguments(self):
+        database, _ = self._make_read_many_database([])
+
+        with self.assertRaises(ValueError):
+            database.read_many("table", ["id"], [[1]], parallelism=0)
+        with self.assertRaises(ValueError):
+            database.read_many("table", ["id"], [[1]], key_columns=["other"])
+
     def test_batch(self):
         from google.cloud.spanner_v1.database import BatchCheckout
 
@@ -2591,6 +2699,38 @@ class TestBatchSnapshot(_BaseTest):
         }
         self.assertEqual(batch_txn.to_dict(), expected)
 
+    def test_to_bytes_from_bytes(self):
+        klass = self._get_target_class()
+        database = self._make_database()
+        api = database.spanner_api = build_spanner_api()
+        batch_txn = self._make_one(database)
+        batch_txn._session = self._make_session(_session_id=self.SESSION_ID)
+        batch_txn._snapshot = self._make_snapshot(transaction_id=self.TRANSACTION_ID)
+
+        data = batch_txn.to_bytes()
+
+        self.assertIsInstance(data, bytes)
+        for restored in (
+            klass.from_bytes(database, data),
+            klass.from_dict(database, data),
+        ):
+            self.assertIs(restored._database, database)
+            snapshot = restored._get_snapshot()
+            self.assertEqual(restored._get_session()._session_id, self.SESSION_ID)
+            self.assertEqual(snapshot._transaction_id, self.TRANSACTION_ID)
+            self.assertTrue(snapshot._multi_use)
+        api.create_session.assert_not_called()
+        api.begin_transaction.assert_not_called()
+
+    def test_from_bytes_wo_transaction(self):
+        from google.cloud.spanner_v1.partition_codec import encode_partition
+
+        klass = self._get_target_class()
+        database = self._make_database()
+
+        with self.assertRaises(ValueError):
+            klass.from_bytes(database, encode_partition())
+
     def test__get_session_already(self):
         database = self._make_database()
         batch_txn = self._make_one(database)
@@ -3318,6 +3458,116 @@ class TestBatchSnapshot(_BaseTest):
             timeout=gapic_v1.method.DEFAULT,
         )
 
+    def test_process_w_encoded_read_batch(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        token = b"TOKEN"
+        batch = {
+            "partition": token,
+            "read": {
+                "table": self.TABLE,
+                "columns": self.COLUMNS,
+                "keyset": {"keys": [[1]], "ranges": []},
+                "index": self.INDEX,
+            },
+        }
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot(
+            transaction_id=self.TRANSACTION_ID
+        )
+        snapshot._session = self._make_session(session_id=self.SESSION_ID)
+        expected = snapshot.read.return_value = object()
+
+        found = batch_txn.process(batch_txn.encode_batch(batch))
+
+        self.assertIs(found, expected)
+        _, kwargs = snapshot.read.call_args
+        self.assertEqual(kwargs["table"], self.TABLE)
+        self.assertEqual(kwargs["columns"], self.COLUMNS)
+        self.assertEqual(kwargs["index"], self.INDEX)
+        self.assertEqual(kwargs["partition"], token)
+        self.assertEqual(kwargs["keyset"]._to_pb(), KeySet(keys=[[1]])._to_pb())
+
+    def test_process_w_encoded_query_batch(self):
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+        from google.cloud.spanner_v1.partition_codec import encode_partition
+
+        sql = "SELECT first_name FROM citizens WHERE age <= @max_age"
+        token = b"TOKEN"
+        batch = {
+            "partition": token,
+            "query": {"sql": sql, "params": {"max_age": 30}},
+        }
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+        expected = snapshot.execute_sql.return_value = object()
+
+        found = batch_txn.process(encode_partition(batch))
+
+        self.assertIs(found, expected)
+        snapshot.execute_sql.assert_called_once_with(
+            sql=sql,
+            params={"max_age": _make_value_pb(30)},
+            param_types={},
+            data_boost_enabled=False,
+            directed_read_options=None,
+            query_options=None,
+            partition=token,
+            lazy_decode=False,
+            retry=gapic_v1.method.DEFAULT,
+            timeout=gapic_v1.method.DEFAULT,
+        )
+
+    def test_process_w_encoded_invalid_batch(self):
+        from google.cloud.spanner_v1.partition_codec import encode_partition
+
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+
+        with self.assertRaises(ValueError):
+            batch_txn.process(encode_partition())
+
+    def test_process_w_encoded_batch_on_fresh_instance(self):
+        from google.cloud.spanner_v1.partition_codec import encode_partition
+        from google.cloud.spanner_v1.transaction import BatchTransactionId
+
+        batch = {"partition": b"TOKEN", "query": {"sql": "SELECT 1"}}
+        data = encode_partition(
+            batch, BatchTransactionId(self.TRANSACTION_ID, self.SESSION_ID, None)
+        )
+        database = self._make_database()
+        api = database.spanner_api = build_spanner_api()
+        batch_txn = self._make_one(database)
+
+        with mock.patch.object(batch_txn, "process_query_batch") as process_query:
+            found = batch_txn.process(data)
+
+        self.assertIs(found, process_query.return_value)
+        snapshot = batch_txn._get_snapshot()
+        self.assertEqual(batch_txn._get_session()._session_id, self.SESSION_ID)
+        self.assertEqual(snapshot._transaction_id, self.TRANSACTION_ID)
+        api.create_session.assert_not_called()
+        api.begin_transaction.assert_not_called()
+
+    def test_process_w_encoded_batch_of_other_transaction(self):
+        from google.cloud.spanner_v1.partition_codec import encode_partition
+        from google.cloud.spanner_v1.transaction import BatchTransactionId
+
+        batch = {"partition": b"TOKEN", "query": {"sql": "SELECT 1"}}
+        data = encode_partition(
+            batch, BatchTransactionId(b"OTHER", self.SESSION_ID, None)
+        )
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batch_txn._snapshot = self._make_snapshot(transaction_id=self.TRANSACTION_ID)
+
+        with self.assertRaises(ValueError):
+            batch_txn.process(data)
+
+        batch_txn._snapshot.execute_sql.assert_not_called()
+
     def test_process_w_query_batch(self):
         sql = (
             "SELECT first_name, last_name, email FROM citizens " "WHERE age <= @max_age"
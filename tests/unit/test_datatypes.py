@@ -16,7 +16,7 @@
 import json
 import unittest
 
-from google.cloud.spanner_v1.data_types import JsonObject
+from google.cloud.spanner_v1.data_types import JsonObject, LazyJsonObject
 
 
 class Test_JsonObject_serde(unittest.TestCase):
@@ -96,3 +96,98 @@ class Test_JsonObject_serde(unittest.TestCase):
         expected = json.dumps(data, sort_keys=True, separators=(",", ":"))
         data_jsonobject = JsonObject(JsonObject(data))
         self.assertEqual(data_jsonobject.serialize(), expected)
+
+
+class Test_JsonObject_from_str(unittest.TestCase):
+    def tearDown(self):
+        from google.cloud.spanner_v1.json_codec import set_json_codec
+
+        set_json_codec()
+
+    def test_w_dict(self):
+        data_jsonobject = JsonObject.from_str('{"foo":{"bar":[1,2]}}')
+        self.assertNotIsInstance(data_jsonobject, LazyJsonObject)
+        self.assertEqual(data_jsonobject, {"foo": {"bar": [1, 2]}})
+
+    def test_w_null(self):
+        data_jsonobject = JsonObject.from_str("null")
+        self.assertIsNone(data_jsonobject.serialize())
+
+    def test_w_lazy(self):
+        data_jsonobject = JsonObject.from_str('{"foo":"bar"}', lazy=True)
+        self.assertIsInstance(data_jsonobject, LazyJsonObject)
+        self.assertFalse(data_jsonobject.is_parsed)
+
+    def test_w_lazy_codec(self):
+        from google.cloud.spanner_v1.json_codec import JsonCodec, set_json_codec
+
+        set_json_codec(JsonCodec(lazy=True))
+        data_jsonobject = JsonObject.from_str('{"foo":"bar"}')
+        self.assertIsInstance(data_jsonobject, LazyJsonObject)
+        self.assertNotIsInstance(
+            JsonObject.from_str('{"foo":"bar"}', lazy=False), LazyJsonObject
+        )
+
+
+class Test_LazyJsonObject(unittest.TestCase):
+    def test_json_dumps(self):
+        self.assertEqual(json.dumps(LazyJsonObject('{"a":1}')), '{"a": 1}')
+        self.assertEqual(
+            json.dumps({"x": LazyJsonObject('{"b":[1]}')}), '{"x": {"b": [1]}}'
+        )
+        self.assertEqual(json.dumps(LazyJsonObject("{}")), "{}")
+
+    def test_serialize_wo_parsing(self):
+        text = '{"b": 1, "a": 2}'
+        data_jsonobject = LazyJsonObject(text)
+        self.assertEqual(data_jsonobject.serialize(), text)
+        self.assertFalse(data_jsonobject.is_parsed)
+
+    def test_serialize_null(self):
+        self.assertIsNone(LazyJsonObject("null").serialize())
+
+    def test_serialize_after_update(self):
+        data_jsonobject = LazyJsonObject('{"b":1,"a":2}')
+        data_jsonobject["c"] = 3
+        self.assertTrue(data_jsonobject.is_parsed)
+        self.assertEqual(data_jsonobject.serialize(), '{"a":2,"b":1,"c":3}')
+
+    def test_dict_access(self):
+        data_jsonobject = LazyJsonObject('{"b":1,"a":{"c":[1,2]}}')
+        self.assertEqual(data_jsonobject["a"], {"c": [1, 2]})
+        self.assertEqual(len(data_jsonobject), 2)
+        self.assertEqual(sorted(data_jsonobject), ["a", "b"])
+        self.assertIn("b", data_jsonobject)
+        self.assertEqual(data_jsonobject.get("b"), 1)
+        self.assertEqual(dict(data_jsonobject), {"b": 1, "a": {"c": [1, 2]}})
+
+    def test_eq(self):
+        self.assertEqual(LazyJsonObject('{"a":1}'), {"a": 1})
+        self.assertEqual({"a": 1}, LazyJsonObject('{"a":1}'))
+        self.assertEqual(LazyJsonObject('{"a":1}'), LazyJsonObject('{ "a": 1 }'))
+        self.assertNotEqual(LazyJsonObject('{"a":1}'), JsonObject({"a": 2}))
+
+    def test_array(self):
+        data_jsonobject = LazyJsonObject("[1,2]")
+        self.assertEqual(repr(data_jsonobject), "[1, 2]")
+        self.assertTrue(data_jsonobject._is_array)
+        self.assertEqual(data_jsonobject.serialize(), "[1,2]")
+
+    def test_scalar(self):
+        data_jsonobject = LazyJsonObject('"foo"')
+        self.assertEqual(repr(data_jsonobject), "foo")
+        self.assertEqual(JsonObject(data_jsonobject).serialize(), '"foo"')
+
+    def test_nested_in_JsonObject(self):
+        data_jsonobject = JsonObject({"a": LazyJsonObject('{"b":1}')})
+        self.assertEqual(data_jsonobject.serialize(), '{"a":{"b":1}}')
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            LazyJsonObject("{}").missing
+
+    def test_pickle(self):
+        import pickle
+
+        data_jsonobject = pickle.loads(pickle.dumps(LazyJsonObject('{"a":[1]}')))
+        self.assertEqual(data_jsonobject, {"a": [1]})
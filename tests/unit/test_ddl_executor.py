@@ -0,0 +1,258 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent import futures
+import datetime
+import threading
+
+from google.api_core.exceptions import FailedPrecondition
+import pytest
+
+from google.cloud.spanner_admin_database_v1.types import UpdateDatabaseDdlMetadata
+from google.cloud.spanner_v1.ddl_executor import DdlExecutor
+
+COMMIT_TIMESTAMP = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class _OperationPb(object):
+    def __init__(self):
+        self.done = False
+
+
+class _Operation(object):
+    """Commits one statement per poll, and is done after ``polls`` polls."""
+
+    def __init__(self, statements, polls, exception=None):
+        self.statements = statements
+        self.polls = 0
+        self.max_polls = polls
+        self.error = exception
+        self.operation = _OperationPb()
+        self.operation.done = polls == 0
+
+    def done(self):
+        self.polls += 1
+        self.operation.done = self.polls >= self.max_polls
+        return self.operation.done
+
+    @property
+    def metadata(self):
+        committed = min(self.polls, len(self.statements))
+        return UpdateDatabaseDdlMetadata(
+            statements=self.statements,
+            commit_timestamps=[COMMIT_TIMESTAMP] * committed,
+        )
+
+    def exception(self):
+        return self.error
+
+
+class _Database(object):
+    def __init__(self, name, polls=0, exception=None, start_exception=None):
+        self.name = name
+        self.polls = polls
+        self.exception = exception
+        self.start_exception = start_exception
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def update_ddl(self, statements, proto_descriptors=None):
+        with self._lock:
+            self.calls.append((list(statements), proto_descriptors))
+        if self.start_exception is not None:
+            raise self.start_exception
+        return _Operation(statements, self.polls, self.exception)
+
+
+def _make_executor(**kwargs):
+    kwargs.setdefault("initial_poll_interval", 0.001)
+    kwargs.setdefault("max_poll_interval", 0.01)
+    return DdlExecutor(**kwargs)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DdlExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        DdlExecutor(max_statements_per_batch=0)
+    with pytest.raises(ValueError):
+        DdlExecutor(poll_multiplier=0.5)
+
+
+def test_add_merges_statements():
+    database = _Database("db")
+    executor = _make_executor(max_statements_per_batch=3)
+    executor.add(database, ["a", "b"])
+    executor.add(database, ["c", "d"])
+    executor.add(database, ["e"], proto_descriptors=b"protos")
+    executor.add(database, ["f"], proto_descriptors=b"other")
+
+    assert [
+        (batch.statements, batch.proto_descriptors) for batch in executor.batches
+    ] == [
+        (["a", "b", "c"], None),
+        (["d", "e"], b"protos"),
+        (["f"], b"other"),
+    ]
+
+
+def test_run():
+    databases = [_Database("db%d" % index, polls=3) for index in range(3)]
+    progress = []
+    executor = _make_executor(progress_callback=progress.append)
+    for database in databases:
+        executor.add(database, ["a"])
+        executor.add(database, ["b", "c"])
+
+    batches = executor.run()
+
+    assert len(batches) == 3
+    for database in databases:
+        assert database.calls == [(["a", "b", "c"], None)]
+    for batch in batches:
+        assert batch.done
+        batch.result()
+        assert [p.progress_percent for p in batch.progress] == [100, 100, 100]
+        assert [p.commit_timestamp for p in batch.progress] == [COMMIT_TIMESTAMP] * 3
+    assert len(progress) == 9
+    assert {p.database for p in progress} == {"db0", "db1", "db2"}
+
+
+def test_run_batches_in_order():
+    database = _Database("db", polls=2)
+    executor = _make_executor(max_statements_per_batch=1)
+    executor.add(database, ["a", "b"])
+
+    executor.run()
+
+    assert database.calls == [(["a"], None), (["b"], None)]
+
+
+def test_run_done_wo_metadata():
+    database = _Database("db")
+    progress = []
+    executor = _make_executor(progress_callback=progress.append)
+    executor.add(database, ["a"])
+
+    executor.run()
+
+    assert [(p.statement, p.progress_percent) for p in progress] == [("a", 100)]
+
+
+def test_run_w_failed_batch():
+    error = FailedPrecondition("invalid statement")
+    failing = _Database("failing", polls=1, exception=error)
+    other = _Database("other", polls=2)
+    executor = _make_executor(max_statements_per_batch=1)
+    executor.add(failing, ["a", "b"])
+    executor.add(other, ["c", "d"])
+
+    with pytest.raises(FailedPrecondition):
+        executor.run()
+
+    first, second, third, fourth = executor.batches
+    assert first.exception is error
+    assert second.skipped
+    with pytest.raises(RuntimeError):
+        second.result()
+    assert failing.calls == [(["a"], None)]
+    third.result()
+    fourth.result()
+
+
+def test_run_w_failed_request():
+    error = FailedPrecondition("database not found")
+    database = _Database("db", start_exception=error)
+    executor = _make_executor()
+    executor.add(database, ["a"])
+
+    with pytest.raises(FailedPrecondition):
+        executor.run()
+
+    assert executor.batches[0].operation is None
+    assert executor.batches[0].exception is error
+
+
+def test_run_timeout():
+    database = _Database("db", polls=1000000)
+    executor = _make_executor()
+    executor.add(database, ["a"])
+
+    with pytest.raises(futures.TimeoutError):
+        executor.run(timeout=0.05)
+
+    assert not executor.batches[0].done
+    with pytest.raises(RuntimeError):
+        executor.batches[0].result()
+
+
+def test_run_after_timeout_resumes_polling():
+    database = _Database("db", polls=20)
+    executor = _make_executor(initial_poll_interval=0.01, max_poll_interval=0.01)
+    executor.add(database, ["a"])
+
+    with pytest.raises(futures.TimeoutError):
+        executor.run(timeout=0.05)
+    batches = executor.run()
+
+    assert database.calls == [(["a"], None)]
+    assert batches[0].operation.polls == 20
+    batches[0].result()
+
+
+def test_run_after_timeout_w_request_in_flight():
+    sent = threading.Event()
+    release = threading.Event()
+
+    class _SlowDatabase(_Database):
+        def update_ddl(self, statements, proto_descriptors=None):
+            sent.set()
+            assert release.wait(5)
+            return super(_SlowDatabase, self).update_ddl(statements, proto_descriptors)
+
+    database = _SlowDatabase("db", polls=1)
+    executor = _make_executor()
+    executor.add(database, ["a"])
+
+    timer = threading.Timer(0.1, release.set)
+    timer.start()
+    with pytest.raises(futures.TimeoutError):
+        executor.run(timeout=0.05)
+    assert sent.is_set()
+    batches = executor.run()
+
+    assert database.calls == [(["a"], None)]
+    batches[0].result()
+
+
+def test_run_adaptive_poll_interval():
+    class _SlowOperation(_Operation):
+        @property
+        def metadata(self):
+            return UpdateDatabaseDdlMetadata(statements=self.statements)
+
+    class _SlowDatabase(_Database):
+        def update_ddl(self, statements, proto_descriptors=None):
+            self.operation = _SlowOperation(statements, 6)
+            return self.operation
+
+    database = _SlowDatabase("db")
+    executor = DdlExecutor(
+        initial_poll_interval=0.001, max_poll_interval=0.004, poll_multiplier=2
+    )
+    executor.add(database, ["a"])
+
+    executor.run()
+
+    assert database.operation.polls == 6
@@ -0,0 +1,143 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+from google.cloud.spanner_v1 import json_codec
+from google.cloud.spanner_v1.data_types import JsonObject, LazyJsonObject
+from google.cloud.spanner_v1.json_codec import (
+    JsonCodec,
+    OrjsonCodec,
+    UjsonCodec,
+    get_json_codec,
+    set_json_codec,
+)
+
+
+def _codecs():
+    codecs = [JsonCodec()]
+    if json_codec.HAS_ORJSON_INSTALLED:
+        codecs.append(OrjsonCodec())
+    if json_codec.HAS_UJSON_INSTALLED:
+        codecs.append(UjsonCodec())
+    return codecs
+
+
+@pytest.fixture(autouse=True)
+def _reset_json_codec():
+    yield
+    set_json_codec()
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_loads(codec):
+    assert codec.loads('{"a":[1,2.5,"x",true,null]}') == {
+        "a": [1, 2.5, "x", True, None]
+    }
+    assert codec.loads('"1234567890123456789012"') == "1234567890123456789012"
+
+
+def test_loads_long_integer():
+    assert JsonCodec().loads("[123456789012345678901234567890]") == [
+        123456789012345678901234567890
+    ]
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_dumps(codec):
+    assert codec.dumps({"b": 1, "a": {"d": [1, "x"], "c": None}}) == (
+        '{"a":{"c":null,"d":[1,"x"]},"b":1}'
+    )
+    assert codec.dumps("a/b") == '"a/b"'
+    assert codec.dumps(123456789012345678901234567890) == (
+        "123456789012345678901234567890"
+    )
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_json_object_w_nested_lazy_json_object(codec):
+    set_json_codec(codec)
+    value = JsonObject({"a": [LazyJsonObject('{"c":1,"b":2}')]})
+    assert value.serialize() == '{"a":[{"b":2,"c":1}]}'
+
+
+def test_fastest_json_codec():
+    codec = json_codec.fastest_json_codec(lazy=True)
+    assert codec.lazy
+    if json_codec.HAS_ORJSON_INSTALLED:
+        assert isinstance(codec, OrjsonCodec)
+    elif json_codec.HAS_UJSON_INSTALLED:  # pragma: NO COVER
+        assert isinstance(codec, UjsonCodec)
+    else:  # pragma: NO COVER
+        assert type(codec) is JsonCodec
+
+
+def test_set_json_codec():
+    codec = JsonCodec()
+    set_json_codec(codec)
+    assert get_json_codec() is codec
+
+    set_json_codec()
+    assert get_json_codec() is not codec
+    assert type(get_json_codec()) is JsonCodec
+    assert not get_json_codec().lazy
+
+
+def test_default_json_codec_is_stdlib():
+    # The serialized values must not depend on the installed packages, so
+    # the codec of a new process is checked.
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "from google.cloud.spanner_v1 import json_codec; "
+            "print(type(json_codec.get_json_codec()).__name__)",
+        ]
+    )
+    assert output.decode().strip() == "JsonCodec"
+
+
+def test_default_json_codec_serialization():
+    set_json_codec()
+    assert JsonObject({"a": "\u00e9"}).serialize() == '{"a":"\\u00e9"}'
+    assert JsonObject({"a": float("nan")}).serialize() == '{"a":NaN}'
+    assert JsonObject({"a": float("inf")}).serialize() == '{"a":Infinity}'
+
+
+def test_json_object_uses_codec():
+    class _Codec(JsonCodec):
+        def loads(self, text):
+            return {"loaded": text}
+
+        def dumps(self, value):
+            return "dumped"
+
+    set_json_codec(_Codec())
+    assert JsonObject.from_str("{}") == {"loaded": "{}"}
+    assert JsonObject({"a": 1}).serialize() == "dumped"
+
+
+def test_orjson_codec_not_installed(monkeypatch):
+    monkeypatch.setattr(json_codec, "HAS_ORJSON_INSTALLED", False)
+    with pytest.raises(ImportError):
+        OrjsonCodec()
+
+
+def test_ujson_codec_not_installed(monkeypatch):
+    monkeypatch.setattr(json_codec, "HAS_UJSON_INSTALLED", False)
+    with pytest.raises(ImportError):
+        UjsonCodec()
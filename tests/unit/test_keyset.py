@@ -410,3 +410,127 @@ class TestKeySet(unittest.TestCase):
         self.assertFalse(keyset.all_)
         self.assertEqual(keyset.keys, [])
         self.assertEqual(keyset.ranges, [range_1, range_2])
+
+
+class TestEncodedKeySet(unittest.TestCase):
+    def _get_target_class(self):
+        from google.cloud.spanner_v1.keyset import EncodedKeySet
+
+        return EncodedKeySet
+
+    def test_to_pb_matches_keyset(self):
+        from google.cloud.spanner_v1.keyset import KeyRange, KeySet
+
+        keys = [[1, "a"], [2, None], [3, 1.5]]
+        ranges = [KeyRange(start_open=[4], end_closed=[5])]
+
+        keyset = self._get_target_class()(keys=keys, ranges=ranges)
+
+        self.assertEqual(keyset._to_pb(), KeySet(keys=keys, ranges=ranges)._to_pb())
+        self.assertIs(keyset._to_pb(), keyset._to_pb())
+
+    def test_to_pb_w_all(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        keyset = self._get_target_class()(all_=True)
+
+        self.assertEqual(keyset._to_pb(), KeySet(all_=True)._to_pb())
+
+    def test_from_keys_dedupes_and_sorts(self):
+        keyset = self._get_target_class().from_keys([[3], [1], [3], [2]])
+
+        self.assertEqual(keyset.keys, [[1], [2], [3]])
+        self.assertEqual(keyset.ranges, [])
+
+    def test_from_keys_wo_sort(self):
+        keyset = self._get_target_class().from_keys([[3], [1], [3]], sort=False)
+
+        self.assertEqual(keyset.keys, [[3], [1]])
+
+    def test_from_keys_w_incomparable_keys(self):
+        keyset = self._get_target_class().from_keys([[3], [None], [1]], coalesce=True)
+
+        self.assertEqual(keyset.keys, [[3], [None], [1]])
+        self.assertEqual(keyset.ranges, [])
+
+    def test_from_keys_w_coalesce(self):
+        from google.cloud.spanner_v1.keyset import KeyRange
+
+        keys = [["a", 1], ["a", 2], ["a", 3], ["a", 5], ["b", 6], ["b", 7], ["c", "x"]]
+
+        keyset = self._get_target_class().from_keys(reversed(keys), coalesce=True)
+
+        self.assertEqual(keyset.keys, [["a", 5], ["c", "x"]])
+        self.assertEqual(
+            keyset.ranges,
+            [
+                KeyRange(start_closed=["a", 1], end_closed=["a", 3]),
+                KeyRange(start_closed=["b", 6], end_closed=["b", 7]),
+            ],
+        )
+
+    def test_from_columns(self):
+        keyset = self._get_target_class().from_columns(["b", "a", "b"], (2, 1, 2))
+
+        self.assertEqual(keyset.keys, [["a", 1], ["b", 2]])
+
+    def test_from_columns_w_numpy_and_arrow(self):
+        import pytest
+
+        np = pytest.importorskip("numpy")
+        pa = pytest.importorskip("pyarrow")
+
+        keyset = self._get_target_class().from_columns(
+            np.array([3, 1, 2], dtype=np.int64), pa.array(["c", "a", "b"])
+        )
+
+        self.assertEqual(keyset.keys, [[1, "a"], [2, "b"], [3, "c"]])
+        self.assertIs(type(keyset.keys[0][0]), int)
+
+    def test_from_columns_errors(self):
+        klass = self._get_target_class()
+        with self.assertRaises(ValueError):
+            klass.from_columns()
+        with self.assertRaises(ValueError):
+            klass.from_columns([1, 2], [1])
+
+    def test_to_dict_from_dict(self):
+        from google.cloud.spanner_v1.keyset import KeyRange, KeySet
+
+        keyset = self._get_target_class()(
+            keys=[["a", 1]], ranges=[KeyRange(start_closed=["b"], end_open=["c"])]
+        )
+
+        mapping = keyset._to_dict()
+        restored = KeySet._from_dict(mapping)
+
+        self.assertEqual(list(mapping), ["encoded", "int_positions"])
+        self.assertIsInstance(restored, self._get_target_class())
+        self.assertEqual(restored, keyset)
+        self.assertEqual(restored._to_pb(), keyset._to_pb())
+        self.assertFalse(restored.all_)
+        self.assertEqual(restored.keys, [["a", 1]])
+        self.assertEqual(
+            restored.ranges, [KeyRange(start_closed=["b"], end_open=["c"])]
+        )
+
+    def test_to_dict_from_dict_w_mixed_int64_and_string_keys(self):
+        from google.cloud.spanner_v1.keyset import KeyRange, KeySet
+
+        keys = [[1, "1"], [2, "b"], [None, "c"], [12345678901234567890, "d"]]
+        keyset = self._get_target_class().from_keys(keys, sort=False)
+        keyset.ranges = [KeyRange(start_closed=[3, "x"], end_open=[4])]
+
+        restored = KeySet._from_dict(KeySet._from_dict(keyset._to_dict())._to_dict())
+
+        self.assertEqual(restored.keys, keys)
+        self.assertIs(type(restored.keys[0][0]), int)
+        self.assertIs(type(restored.keys[0][1]), str)
+        self.assertEqual(
+            restored.ranges, [KeyRange(start_closed=[3, "x"], end_open=[4])]
+        )
+
+    def test_to_dict_wo_int_keys(self):
+        keyset = self._get_target_class()(keys=[["a"], ["b"]])
+
+        self.assertEqual(list(keyset._to_dict()), ["encoded"])
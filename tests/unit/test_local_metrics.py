@@ -0,0 +1,209 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from google.cloud.spanner_v1.metrics.local_metrics import (
+    OTHER_REQUEST_TAG,
+    LatencyHistogram,
+    LocalMetricsSink,
+)
+
+
+def test_histogram_empty():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    assert histogram.stats() == {
+        "count": 0,
+        "sum": 0.0,
+        "min": 0.0,
+        "max": 0.0,
+        "mean": 0.0,
+        "p50": 0.0,
+        "p90": 0.0,
+        "p99": 0.0,
+        "p999": 0.0,
+    }
+
+
+def test_histogram_percentiles_within_relative_error():
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value / 10.0)
+
+    assert histogram.count == 10000
+    assert histogram.min == 0.1
+    assert histogram.max == 1000.0
+    for percentile, expected in ((50, 500.0), (90, 900.0), (99, 990.0)):
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.016)
+    assert histogram.percentile(100) == 1000.0
+    assert histogram.percentile(0) == pytest.approx(0.1, rel=0.016)
+
+
+def test_histogram_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in (0.001, 0.002, 0.003, 0.004):
+        histogram.record(value)
+    assert histogram.percentile(50) == 0.002
+
+
+def test_histogram_invalid_arguments():
+    with pytest.raises(ValueError):
+        LatencyHistogram(significant_bits=0)
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(101)
+    with pytest.raises(ValueError):
+        LatencyHistogram().merge(LatencyHistogram(significant_bits=3))
+
+
+def test_histogram_merge():
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.record(1.0)
+    second.record(3.0)
+    first.merge(second)
+
+    assert first.count == 2
+    assert first.sum == 4.0
+    assert first.min == 1.0
+    assert first.max == 3.0
+    assert first.percentile(100) == 3.0
+
+
+def test_sink_snapshot_dimensions():
+    sink = LocalMetricsSink()
+    sink.record_attempt("Spanner.ExecuteStreamingSql", "db1", "tag1", 2.0)
+    sink.record_attempt("Spanner.ExecuteStreamingSql", "db2", None, 4.0)
+    sink.record_attempt("Spanner.Commit", "db1", "tag1", 8.0)
+    sink.record_operation("Spanner.Commit", "db1", "tag1", 10.0, attempt_count=2)
+
+    snapshot = sink.snapshot(percentiles=(50,))
+
+    attempts = snapshot["attempt_latencies"]
+    assert set(attempts["method"]) == {"Spanner.ExecuteStreamingSql", "Spanner.Commit"}
+    assert attempts["method"]["Spanner.ExecuteStreamingSql"]["count"] == 2
+    assert attempts["database"]["db1"]["count"] == 2
+    assert attempts["database"]["db2"]["max"] == 4.0
+    assert list(attempts["request_tag"]) == ["tag1"]
+    assert attempts["request_tag"]["tag1"]["sum"] == 10.0
+    assert "p50" in attempts["request_tag"]["tag1"]
+
+    operations = snapshot["operation_latencies"]
+    assert operations["method"]["Spanner.Commit"]["count"] == 1
+    assert operations["method"]["Spanner.Commit"]["attempt_count"] == 2
+    assert operations["request_tag"]["tag1"]["attempt_count"] == 2
+
+
+def test_sink_limits_request_tags():
+    sink = LocalMetricsSink(max_request_tags=2)
+    for tag in ("a", "b", "c", "d", "a"):
+        sink.record_attempt("m", "db", tag, 1.0)
+
+    tags = sink.snapshot()["attempt_latencies"]["request_tag"]
+    assert tags["a"]["count"] == 2
+    assert tags["b"]["count"] == 1
+    assert tags[OTHER_REQUEST_TAG]["count"] == 2
+
+
+def test_sink_reset():
+    sink = LocalMetricsSink()
+    sink.record_attempt("m", "db", "tag", 1.0)
+    sink.reset()
+    snapshot = sink.snapshot()
+    assert snapshot["attempt_latencies"]["method"] == {}
+    assert snapshot["operation_latencies"]["method"] == {}
+
+
+def test_sink_concurrent_recording():
+    sink = LocalMetricsSink()
+
+    def record():
+        for _ in range(1000):
+            sink.record_attempt("m", "db", None, 1.0)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sink.snapshot()["attempt_latencies"]["method"]["m"]["count"] == 4000
+
+
+def test_sink_to_prometheus():
+    sink = LocalMetricsSink()
+    sink.record_attempt("Spanner.Read", "db", 'my"tag', 2.0)
+    sink.record_operation("Spanner.Read", "db", 'my"tag', 3.0, attempt_count=1)
+
+    text = sink.to_prometheus(percentiles=(50, 99.9))
+
+    labels = 'method="Spanner.Read",database="db",request_tag="my\\"tag"'
+    assert "# TYPE spanner_client_attempt_latency_ms summary\n" in text
+    assert (
+        'spanner_client_attempt_latency_ms{%s,quantile="0.5"} 2.0\n' % labels
+    ) in text
+    assert (
+        'spanner_client_attempt_latency_ms{%s,quantile="0.999"} 2.0\n' % labels
+    ) in text
+    assert "spanner_client_attempt_latency_ms_sum{%s} 2.0\n" % labels in text
+    assert "spanner_client_attempt_latency_ms_count{%s} 1\n" % labels in text
+    assert "# TYPE spanner_client_operation_latency_ms summary\n" in text
+    assert "spanner_client_operation_latency_ms_count{%s} 1\n" % labels in text
+
+
+def test_sink_retry_count():
+    sink = LocalMetricsSink()
+    sink.record_operation("Spanner.Read", "db", None, 3.0, 3, retry_count=2)
+    sink.record_operation("Spanner.Read", "db", None, 1.0, 1)
+
+    operations = sink.snapshot()["operation_latencies"]
+    assert operations["method"]["Spanner.Read"]["retry_count"] == 2
+    assert operations["method"]["Spanner.Read"]["attempt_count"] == 4
+
+    text = sink.to_prometheus()
+    assert "# TYPE spanner_client_retries_total counter\n" in text
+    assert (
+        'spanner_client_retries_total{method="Spanner.Read",database="db",'
+        'request_tag=""} 2\n'
+    ) in text
+
+
+def test_sink_transactions():
+    sink = LocalMetricsSink()
+    sink.record_transaction("db", "tag", rpc_count=2)
+    sink.record_transaction("db", None, rpc_count=5, attempt_count=2)
+    sink.record_transaction("other", "tag", rpc_count=1)
+
+    transactions = sink.snapshot()["transactions"]
+    assert transactions["database"]["db"] == {
+        "count": 2,
+        "rpc_count": 7,
+        "attempt_count": 3,
+        "max_rpc_count": 5,
+        "rpcs_per_transaction": 3.5,
+    }
+    assert transactions["transaction_tag"]["tag"]["count"] == 2
+    assert transactions["transaction_tag"]["tag"]["rpcs_per_transaction"] == 1.5
+    assert "" not in transactions["transaction_tag"]
+
+    text = sink.to_prometheus()
+    assert "# TYPE spanner_client_transactions_total counter\n" in text
+    assert (
+        'spanner_client_transaction_rpcs_total{database="db",transaction_tag=""} 5\n'
+    ) in text
+
+    sink.reset()
+    assert sink.snapshot()["transactions"]["database"] == {}
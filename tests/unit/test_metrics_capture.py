@@ -50,3 +50,47 @@ def test_metrics_capture_exit(mock_tracer_factory):
         pass
 
     mock_tracer.record_operation_completion.assert_called_once()
+
+
+def test_metrics_capture_is_enabled():
+    factory = SpannerMetricsTracerFactory()
+    original = factory.enabled
+    try:
+        factory.enabled = True
+        assert MetricsCapture.is_enabled()
+        factory.enabled = False
+        assert not MetricsCapture.is_enabled()
+    finally:
+        factory.enabled = original
+
+
+def test_metrics_capture_disabled(mock_tracer_factory):
+    factory = SpannerMetricsTracerFactory()
+    factory.enabled = False
+    try:
+        with MetricsCapture():
+            pass
+    finally:
+        factory.enabled = True
+
+    mock_tracer_factory.assert_not_called()
+
+
+def test_metrics_capture_w_local_sink():
+    factory = SpannerMetricsTracerFactory()
+    original = factory.enabled
+    factory.enabled = False
+    sink = factory.enable_local_metrics()
+    try:
+        assert MetricsCapture.is_enabled()
+        with MetricsCapture():
+            outer = SpannerMetricsTracerFactory.get_current_tracer()
+            assert outer.local_sink is sink
+            outer.set_request_tag("my_tag")
+            with MetricsCapture():
+                inner = SpannerMetricsTracerFactory.get_current_tracer()
+                assert inner is not outer
+                assert inner.request_tag == "my_tag"
+    finally:
+        factory.local_sink = None
+        factory.enabled = original
@@ -18,6 +18,7 @@ import mock
 from opentelemetry.metrics import Counter, Histogram
 import pytest
 
+from google.cloud.spanner_v1.metrics.local_metrics import LocalMetricsSink
 from google.cloud.spanner_v1.metrics.metrics_tracer import MetricOpTracer, MetricsTracer
 
 pytest.importorskip("opentelemetry")
@@ -264,3 +265,54 @@ def test_record_gfe_missing_header_count(metrics_tracer):
     metrics_tracer.record_gfe_missing_header_count()
     assert mock_gfe_missing_header_count.add.call_count == 1  # Should not increment
     metrics_tracer.enabled = True  # Reset for next test
+
+
+def test_record_to_local_sink_when_disabled(metrics_tracer):
+    sink = LocalMetricsSink()
+    metrics_tracer.local_sink = sink
+    metrics_tracer.enabled = False
+    metrics_tracer.set_method("Spanner.Commit")
+    metrics_tracer.set_database("my_db")
+    metrics_tracer.set_request_tag("my_tag")
+
+    metrics_tracer.record_operation_start()
+    metrics_tracer.record_attempt_start()
+    metrics_tracer.record_attempt_completion()
+    metrics_tracer.record_attempt_start()
+    metrics_tracer.record_attempt_completion()
+    metrics_tracer.record_operation_completion()
+
+    snapshot = sink.snapshot()
+    assert snapshot["attempt_latencies"]["method"]["Spanner.Commit"]["count"] == 2
+    operations = snapshot["operation_latencies"]
+    assert operations["database"]["my_db"]["count"] == 1
+    assert operations["request_tag"]["my_tag"]["attempt_count"] == 2
+    metrics_tracer.instrument_attempt_latency.record.assert_not_called()
+    metrics_tracer.instrument_operation_latency.record.assert_not_called()
+
+
+def test_record_to_local_sink_skips_operations_wo_attempts(metrics_tracer):
+    sink = LocalMetricsSink()
+    metrics_tracer.local_sink = sink
+    metrics_tracer.record_operation_start()
+    metrics_tracer.record_operation_completion()
+    assert sink.snapshot()["operation_latencies"]["method"] == {}
+
+
+def test_record_retry_to_local_sink(metrics_tracer):
+    sink = LocalMetricsSink()
+    metrics_tracer.local_sink = sink
+    metrics_tracer.set_method("Spanner.ExecuteStreamingSql")
+
+    metrics_tracer.record_operation_start()
+    metrics_tracer.record_attempt_start()
+    metrics_tracer.record_attempt_completion()
+    metrics_tracer.record_retry()
+    metrics_tracer.record_attempt_start()
+    metrics_tracer.record_attempt_completion()
+    metrics_tracer.record_operation_completion()
+
+    assert metrics_tracer.current_op.retry_count == 1
+    operations = sink.snapshot()["operation_latencies"]["method"]
+    assert operations["Spanner.ExecuteStreamingSql"]["retry_count"] == 1
+    assert operations["Spanner.ExecuteStreamingSql"]["attempt_count"] == 2
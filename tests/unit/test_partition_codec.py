@@ -0,0 +1,201 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import datetime
+import gzip
+import pickle
+
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from google.protobuf.struct_pb2 import Value
+import pytest
+
+from google.cloud.spanner_dbapi import partition_helper
+from google.cloud.spanner_v1 import (
+    BatchTransactionId,
+    ClientContext,
+    DirectedReadOptions,
+    ExecuteSqlRequest,
+    KeyRange,
+    KeySet,
+    param_types,
+)
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.partition_codec import (
+    FORMAT_VERSION,
+    SerializedPartition,
+    decode_partition,
+    encode_partition,
+)
+
+READ_TIMESTAMP = DatetimeWithNanoseconds(
+    2026, 1, 2, 3, 4, 5, nanosecond=123456789, tzinfo=datetime.timezone.utc
+)
+TRANSACTION = BatchTransactionId(b"transaction-id", "session-id", READ_TIMESTAMP)
+DIRECTED_READ_OPTIONS = {
+    "include_replicas": {"replica_selections": [{"location": "us-east1"}]}
+}
+
+
+def _query_batch():
+    return {
+        "partition": b"partition-token",
+        "query": {
+            "sql": "SELECT * FROM T WHERE A = @a AND B = @b",
+            "data_boost_enabled": True,
+            "directed_read_options": DIRECTED_READ_OPTIONS,
+            "params": {"a": 42, "b": "x"},
+            "param_types": {"a": param_types.INT64},
+            "query_options": ExecuteSqlRequest.QueryOptions(optimizer_version="3"),
+        },
+    }
+
+
+def test_query_round_trip():
+    batch, transaction, client_context = decode_partition(
+        encode_partition(_query_batch(), TRANSACTION)
+    )
+
+    assert transaction == TRANSACTION
+    assert client_context is None
+    assert batch["partition"] == b"partition-token"
+    query = batch["query"]
+    assert query["sql"] == "SELECT * FROM T WHERE A = @a AND B = @b"
+    assert query["data_boost_enabled"]
+    assert query["directed_read_options"] == DirectedReadOptions(DIRECTED_READ_OPTIONS)
+    assert query["params"] == {"a": _make_value_pb(42), "b": _make_value_pb("x")}
+    assert query["param_types"] == {"a": param_types.INT64}
+    assert query["query_options"].optimizer_version == "3"
+
+
+def test_query_params_are_encoded_as_is():
+    batch, _, _ = decode_partition(encode_partition(_query_batch()))
+
+    # Decoded parameters are sent unchanged.
+    for value in batch["query"]["params"].values():
+        assert isinstance(value, Value)
+        assert _make_value_pb(value) is value
+
+
+def test_query_wo_params():
+    batch = {"partition": b"token", "query": {"sql": "SELECT 1"}}
+
+    decoded, transaction, _ = decode_partition(encode_partition(batch))
+
+    assert transaction is None
+    assert decoded == {
+        "partition": b"token",
+        "query": {
+            "sql": "SELECT 1",
+            "data_boost_enabled": False,
+            "directed_read_options": None,
+            "query_options": None,
+        },
+    }
+
+
+def test_read_round_trip():
+    keyset = KeySet(
+        keys=[[1, "a"], [2, "b"]],
+        ranges=[KeyRange(start_closed=[3], end_open=[4])],
+    )
+    batch = {
+        "partition": b"partition-token",
+        "read": {
+            "table": "T",
+            "columns": ["A", "B"],
+            "keyset": keyset._to_dict(),
+            "index": "I",
+            "data_boost_enabled": False,
+            "directed_read_options": None,
+        },
+    }
+
+    decoded, _, _ = decode_partition(encode_partition(batch, TRANSACTION))
+
+    read = decoded["read"]
+    assert decoded["partition"] == b"partition-token"
+    assert read["table"] == "T"
+    assert read["columns"] == ["A", "B"]
+    assert read["index"] == "I"
+    assert read["directed_read_options"] is None
+    assert KeySet._from_dict(read["keyset"])._to_pb() == keyset._to_pb()
+    assert KeySet._from_dict(read["keyset"]).keys == [[1, "a"], [2, "b"]]
+    # Encoded key sets are copied without being decoded.
+    decoded_again, _, _ = decode_partition(encode_partition(decoded))
+    assert decoded_again["read"]["keyset"] == read["keyset"]
+
+
+def test_transaction_wo_partition():
+    client_context = ClientContext(secure_context={"k": _make_value_pb("v")})
+
+    batch, transaction, decoded_context = decode_partition(
+        encode_partition(
+            batch_transaction_id=BatchTransactionId(b"id", "session", None),
+            client_context=client_context,
+        )
+    )
+
+    assert batch is None
+    assert transaction == BatchTransactionId(b"id", "session", None)
+    assert decoded_context == client_context
+
+
+def test_naive_read_timestamp():
+    transaction = BatchTransactionId(b"id", "session", datetime.datetime(2026, 1, 1))
+
+    _, decoded, _ = decode_partition(encode_partition(None, transaction))
+
+    assert decoded.read_timestamp == datetime.datetime(
+        2026, 1, 1, tzinfo=datetime.timezone.utc
+    )
+
+
+def test_invalid_batch():
+    with pytest.raises(ValueError):
+        encode_partition({"partition": b"token"})
+
+
+def test_unsupported_version():
+    message = SerializedPartition.pb()(version=FORMAT_VERSION + 1)
+
+    with pytest.raises(ValueError):
+        decode_partition(message.SerializeToString())
+
+
+def test_smaller_than_pickle():
+    batch = _query_batch()
+    pickled = gzip.compress(
+        pickle.dumps(partition_helper.PartitionId(TRANSACTION, batch))
+    )
+
+    assert len(encode_partition(batch, TRANSACTION)) < len(pickled)
+
+
+def test_partition_helper_round_trip():
+    batch = _query_batch()
+
+    encoded = partition_helper.encode_to_string(TRANSACTION, batch)
+    partition_id = partition_helper.decode_from_string(encoded)
+
+    assert base64.b64decode(encoded) == encode_partition(batch, TRANSACTION)
+    assert partition_id.batch_transaction_id == TRANSACTION
+    assert partition_id.partition_result["query"]["sql"] == batch["query"]["sql"]
+
+
+def test_partition_helper_invalid_partition_id():
+    encoded = str(base64.b64encode(encode_partition(None, TRANSACTION)), "utf-8")
+
+    with pytest.raises(ValueError):
+        partition_helper.decode_from_string(encoded)
@@ -0,0 +1,347 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent import futures
+import threading
+
+import pytest
+
+from google.cloud.spanner_v1 import partition_queue
+from google.cloud.spanner_v1.partition_codec import decode_partition
+from google.cloud.spanner_v1.partition_queue import (
+    PartitionCoordinator,
+    PartitionWorker,
+    SQLitePartitionQueue,
+)
+
+STATE = b"state"
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = SQLitePartitionQueue(str(tmp_path / "queue.db"))
+    yield queue
+    queue.close()
+
+
+def _put(queue, job_id="job", count=3, max_attempts=3):
+    queue.put(job_id, STATE, [b"p%d" % index for index in range(count)], max_attempts)
+
+
+def test_put_and_claim(queue):
+    _put(queue)
+
+    leases = [queue.claim("worker", 60) for _ in range(4)]
+
+    assert [lease.index for lease in leases[:3]] == [0, 1, 2]
+    assert leases[3] is None
+    assert leases[0].data == b"p0"
+    assert leases[0].state == STATE
+    assert leases[0].attempt == 1
+    progress = queue.progress("job")
+    assert (progress.pending, progress.claimed, progress.done) == (0, 3, 0)
+
+
+def test_put_duplicate_job(queue):
+    _put(queue)
+
+    with pytest.raises(ValueError):
+        _put(queue)
+
+
+def test_claim_w_job_id(queue):
+    _put(queue, "first")
+    _put(queue, "second")
+
+    assert queue.claim("worker", 60, job_id="second").job_id == "second"
+
+
+def test_ack(queue):
+    _put(queue, count=2)
+    lease = queue.claim("worker", 60)
+
+    assert queue.ack(lease, rows=5)
+
+    progress = queue.progress("job")
+    assert (progress.pending, progress.done, progress.rows) == (1, 1, 5)
+    assert not progress.finished
+    assert not queue.ack(lease)
+
+
+def test_nack_retries_then_fails(queue):
+    _put(queue, count=1, max_attempts=2)
+
+    lease = queue.claim("worker", 60)
+    assert queue.nack(lease, "first error")
+    lease = queue.claim("worker", 60)
+    assert lease.attempt == 2
+    assert queue.nack(lease, "second error")
+
+    assert queue.claim("worker", 60) is None
+    progress = queue.progress("job")
+    assert (progress.pending, progress.failed) == (0, 1)
+    assert progress.finished
+    assert queue.errors("job") == {0: "second error"}
+
+
+def test_expired_lease_is_claimed_again(queue):
+    _put(queue, count=1)
+    expired = queue.claim("first", 0)
+
+    lease = queue.claim("second", 60)
+
+    assert lease.index == expired.index
+    assert lease.attempt == 2
+    assert not queue.extend(expired, 60)
+    assert not queue.ack(expired)
+    assert queue.ack(lease)
+
+
+def test_expired_lease_fails_after_max_attempts(queue):
+    _put(queue, count=1, max_attempts=1)
+    queue.claim("worker", 0)
+
+    assert queue.claim("worker", 60) is None
+    assert queue.progress("job").failed == 1
+    assert queue.errors("job") == {0: "Lease expired"}
+
+
+def test_extend(queue):
+    _put(queue, count=1)
+    lease = queue.claim("worker", 0)
+
+    assert queue.extend(lease, 60)
+
+    assert queue.claim("other", 60) is None
+
+
+def test_progress_unknown_job(queue):
+    with pytest.raises(KeyError):
+        queue.progress("unknown")
+
+
+def test_concurrent_claims(tmp_path):
+    path = str(tmp_path / "queue.db")
+    setup = SQLitePartitionQueue(path)
+    _put(setup, count=50)
+    claimed = []
+    lock = threading.Lock()
+
+    def claim_all(worker_id):
+        # Every worker has its own connection, like separate processes.
+        queue = SQLitePartitionQueue(path)
+        while True:
+            lease = queue.claim(worker_id, 60)
+            if lease is None:
+                queue.close()
+                return
+            with lock:
+                claimed.append(lease.index)
+            queue.ack(lease)
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(claim_all, ["w%d" % index for index in range(4)]))
+
+    assert sorted(claimed) == list(range(50))
+    assert setup.progress("job").done == 50
+    setup.close()
+
+
+class _BatchSnapshot(object):
+    def __init__(self):
+        self.generated = []
+
+    def generate_query_batches(self, sql, **kwargs):
+        self.generated.append((sql, kwargs))
+        for index in range(3):
+            yield {
+                "partition": b"token-%d" % index,
+                "query": {"sql": sql, "data_boost_enabled": False},
+            }
+
+    def generate_read_batches(self, table, columns, keyset, **kwargs):
+        yield {
+            "partition": b"token",
+            "read": {
+                "table": table,
+                "columns": columns,
+                "keyset": {"all": True},
+                "data_boost_enabled": False,
+            },
+        }
+
+    def to_bytes(self):
+        return STATE
+
+
+def test_coordinator_submit_query(queue):
+    batch_snapshot = _BatchSnapshot()
+    coordinator = PartitionCoordinator(batch_snapshot, queue)
+
+    job_id = coordinator.submit_query("SELECT 1", max_partitions=3)
+
+    assert batch_snapshot.generated == [("SELECT 1", {"max_partitions": 3})]
+    assert coordinator.progress(job_id).total == 3
+    lease = queue.claim("worker", 60)
+    batch, transaction_id, _ = decode_partition(lease.data)
+    assert batch["partition"] == b"token-0"
+    assert batch["query"]["sql"] == "SELECT 1"
+    assert transaction_id is None
+    assert lease.state == STATE
+
+
+def test_coordinator_submit_read(queue):
+    coordinator = PartitionCoordinator(_BatchSnapshot(), queue)
+
+    job_id = coordinator.submit_read("users", ["id"], None, job_id="read")
+
+    assert job_id == "read"
+    batch, _, _ = decode_partition(queue.claim("worker", 60).data)
+    assert batch["read"]["table"] == "users"
+
+
+def test_coordinator_wait(queue):
+    coordinator = PartitionCoordinator(_BatchSnapshot(), queue)
+    job_id = coordinator.submit_query("SELECT 1")
+    reported = []
+
+    def process():
+        for _ in range(3):
+            queue.ack(queue.claim("worker", 60), rows=2)
+
+    thread = threading.Thread(target=process)
+    thread.start()
+    progress = coordinator.wait(
+        job_id, poll_interval=0.01, progress_callback=reported.append
+    )
+    thread.join()
+
+    assert progress.finished
+    assert (progress.done, progress.rows) == (3, 6)
+    assert reported[-1] == progress
+    assert progress.rows_per_second >= 0
+
+
+def test_coordinator_wait_timeout(queue):
+    coordinator = PartitionCoordinator(_BatchSnapshot(), queue)
+    job_id = coordinator.submit_query("SELECT 1")
+
+    with pytest.raises(futures.TimeoutError):
+        coordinator.wait(job_id, timeout=0.05, poll_interval=0.01)
+
+
+class _WorkerSnapshot(object):
+    def process(self, data):
+        return iter([[data], [data]])
+
+
+@pytest.fixture
+def snapshots(monkeypatch):
+    snapshots = []
+
+    def from_bytes(database, state):
+        assert state == STATE
+        snapshot = _WorkerSnapshot()
+        snapshots.append(snapshot)
+        return snapshot
+
+    monkeypatch.setattr(
+        partition_queue.BatchSnapshot, "from_bytes", staticmethod(from_bytes)
+    )
+    return snapshots
+
+
+def test_worker_run(queue, snapshots):
+    _put(queue)
+    processed = []
+    worker = PartitionWorker(object(), queue, worker_id="worker")
+
+    count = worker.run(lambda lease, rows: processed.append((lease.index, list(rows))))
+
+    assert count == 3
+    assert processed == [(index, [[b"p%d" % index]] * 2) for index in range(3)]
+    # The batch transaction of a job is restored once.
+    assert len(snapshots) == 1
+    progress = queue.progress("job")
+    assert (progress.done, progress.rows) == (3, 6)
+
+
+def test_worker_keeps_last_snapshot(queue, monkeypatch):
+    restored = []
+
+    def from_bytes(database, state):
+        restored.append(state)
+        return _WorkerSnapshot()
+
+    monkeypatch.setattr(
+        partition_queue.BatchSnapshot, "from_bytes", staticmethod(from_bytes)
+    )
+    queue.put("first", b"first", [b"p0", b"p1"], 3)
+    queue.put("second", b"second", [b"p0"], 3)
+    queue.put("third", b"first", [b"p0"], 3)
+    worker = PartitionWorker(object(), queue)
+
+    assert worker.run(lambda lease, rows: list(rows)) == 4
+
+    # Only the batch transaction of the last job is kept.
+    assert restored == [b"first", b"second", b"first"]
+    assert worker._snapshot_state == b"first"
+    worker.close()
+    assert worker._batch_snapshot is None
+
+
+def test_worker_run_max_partitions(queue, snapshots):
+    _put(queue)
+    worker = PartitionWorker(object(), queue)
+
+    assert worker.run(lambda lease, rows: None, max_partitions=2) == 2
+    assert queue.progress("job").pending == 1
+
+
+def test_worker_retries_failed_partition(queue, snapshots):
+    _put(queue, count=1)
+    worker = PartitionWorker(object(), queue)
+    calls = []
+
+    def handler(lease, rows):
+        calls.append(lease.attempt)
+        if lease.attempt == 1:
+            raise RuntimeError("handler failed")
+        list(rows)
+
+    assert worker.run(handler) == 1
+    assert calls == [1, 2]
+    assert queue.errors("job") == {}
+    assert queue.progress("job").done == 1
+
+
+def test_worker_heartbeat_extends_lease(queue, snapshots):
+    _put(queue, count=1)
+    worker = PartitionWorker(
+        object(), queue, lease_seconds=0.2, heartbeat_interval=0.02
+    )
+    claimed_by_other = []
+
+    def handler(lease, rows):
+        # The lease would expire while the handler runs without heartbeats.
+        threading.Event().wait(0.4)
+        claimed_by_other.append(queue.claim("other", 60))
+
+    assert worker.run(handler) == 1
+    assert claimed_by_other == [None]
+
+
+def test_worker_invalid_lease_seconds(queue):
+    with pytest.raises(ValueError):
+        PartitionWorker(object(), queue, lease_seconds=0)
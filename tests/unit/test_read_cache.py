@@ -0,0 +1,133 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+import pytest
+
+from google.cloud.spanner_v1.read_cache import ReadCache, _make_read_cache_key
+from google.cloud.spanner_v1.types.result_set import PartialResultSet
+
+STALENESS = datetime.timedelta(seconds=10)
+
+
+def _result_sets(value, age=datetime.timedelta()):
+    result_set = PartialResultSet()
+    result_set.metadata.transaction.read_timestamp = (
+        datetime.datetime.now(datetime.timezone.utc) - age
+    )
+    result_set._pb.values.add(string_value=value)
+    return [result_set, PartialResultSet(last=True)]
+
+
+def _values(result_sets):
+    return [
+        value.string_value
+        for result_set in result_sets
+        for value in PartialResultSet.pb(result_set).values
+    ]
+
+
+def test_invalid_max_entries():
+    with pytest.raises(ValueError):
+        ReadCache(max_entries=0)
+
+
+def test_make_read_cache_key():
+    key = _make_read_cache_key("db", "table", ["a", "b"], [1, "x"])
+    assert key == _make_read_cache_key("db", "table", ("a", "b"), [1, "x"], None)
+    assert key != _make_read_cache_key("db", "table", ["a", "b"], [1, "y"])
+    assert key != _make_read_cache_key("db", "table", ["a", "b"], [1, "x"], "idx")
+    assert key != _make_read_cache_key("db", "table", ["b", "a"], [1, "x"])
+    assert key != _make_read_cache_key("other", "table", ["a", "b"], [1, "x"])
+
+
+def test_get_put():
+    cache = ReadCache()
+    assert cache.get("key", STALENESS) is None
+
+    cache.put("key", _result_sets("value"))
+    result_sets, read_timestamp = cache.get("key", STALENESS)
+
+    assert _values(result_sets) == ["value"]
+    assert read_timestamp == result_sets[0].metadata.transaction.read_timestamp
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "stale": 0,
+        "evictions": 0,
+        "entries": 1,
+    }
+
+
+def test_get_returns_copies():
+    cache = ReadCache()
+    cache.put("key", _result_sets("value"))
+
+    result_sets, _ = cache.get("key", STALENESS)
+    PartialResultSet.pb(result_sets[0]).values[0].string_value = "changed"
+
+    result_sets, _ = cache.get("key", STALENESS)
+    assert _values(result_sets) == ["value"]
+
+
+def test_get_stale():
+    cache = ReadCache()
+    cache.put("key", _result_sets("value", age=datetime.timedelta(seconds=5)))
+
+    assert cache.get("key", datetime.timedelta(seconds=1)) is None
+    assert cache.get("key", STALENESS) is not None
+    assert cache.stats()["stale"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_put_wo_read_timestamp():
+    cache = ReadCache()
+    cache.put("key", [PartialResultSet(last=True)])
+    cache.put("other", [])
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_put_keeps_newer_rows():
+    cache = ReadCache()
+    cache.put("key", _result_sets("new"))
+    cache.put("key", _result_sets("old", age=datetime.timedelta(seconds=1)))
+
+    result_sets, _ = cache.get("key", STALENESS)
+    assert _values(result_sets) == ["new"]
+
+
+def test_lru_eviction():
+    cache = ReadCache(max_entries=2)
+    cache.put("a", _result_sets("a"))
+    cache.put("b", _result_sets("b"))
+    assert cache.get("a", STALENESS) is not None
+
+    cache.put("c", _result_sets("c"))
+
+    assert cache.get("b", STALENESS) is None
+    assert cache.get("a", STALENESS) is not None
+    assert cache.get("c", STALENESS) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_clear():
+    cache = ReadCache()
+    cache.put("key", _result_sets("value"))
+
+    cache.clear()
+
+    assert cache.get("key", STALENESS) is None
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,151 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import pytest
+
+from google.api_core.exceptions import InternalServerError, NotFound
+
+from google.cloud.spanner_v1 import retry_policy
+from google.cloud.spanner_v1.retry_policy import (
+    JITTER_DECORRELATED,
+    JITTER_FULL,
+    JITTER_NONE,
+    RetryBudget,
+    RetryPolicy,
+)
+
+
+def test_policy_invalid_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(initial_delay=-1)
+    with pytest.raises(ValueError):
+        RetryPolicy(initial_delay=2, max_delay=1)
+    with pytest.raises(ValueError):
+        RetryPolicy(multiplier=0.5)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter="bogus")
+
+
+def test_compute_delay_wo_jitter():
+    policy = RetryPolicy(initial_delay=1, max_delay=5, jitter=JITTER_NONE)
+    delays = [policy.compute_delay(retry_number) for retry_number in range(5)]
+    assert delays == [1, 2, 4, 5, 5]
+    assert policy.compute_delay(1, initial_delay=0.5) == 1
+
+
+def test_compute_delay_w_full_jitter():
+    policy = RetryPolicy(initial_delay=1, max_delay=5, jitter=JITTER_FULL)
+    for retry_number in range(10):
+        delay = policy.compute_delay(retry_number)
+        assert 0 <= delay <= min(5, 2**retry_number)
+
+
+def test_compute_delay_w_decorrelated_jitter():
+    policy = RetryPolicy(initial_delay=1, max_delay=10, jitter=JITTER_DECORRELATED)
+    assert policy.compute_delay(0) == 1
+    previous = 1
+    for retry_number in range(1, 10):
+        delay = policy.compute_delay(retry_number, previous)
+        assert 1 <= delay <= min(10, previous * 3)
+        previous = delay
+
+
+def test_state_next_delay():
+    policy = RetryPolicy(initial_delay=1, max_delay=5, jitter=JITTER_NONE)
+    state = policy.start()
+    error = InternalServerError("testing")
+    assert [state.next_delay(error) for _ in range(4)] == [1, 2, 4, 5]
+    assert state.retries == 4
+    assert state.next_delay(error, delay=0.5) == 0.5
+
+
+def test_state_w_predicate():
+    policy = RetryPolicy(
+        jitter=JITTER_NONE,
+        predicate=lambda exc: isinstance(exc, InternalServerError),
+    )
+    state = policy.start()
+    assert state.next_delay(NotFound("testing")) is None
+    assert state.next_delay(InternalServerError("testing")) == 1.0
+    assert state.retries == 1
+
+
+def test_state_w_absolute_deadline():
+    policy = RetryPolicy(initial_delay=1, jitter=JITTER_NONE)
+    with mock.patch("time.time", return_value=100.0):
+        state = policy.start(deadline=102.5)
+        error = InternalServerError("testing")
+        assert state.next_delay(error) == 1
+        assert state.next_delay(error) == 2
+        assert state.next_delay(error, delay=2.5) == 2.5
+        assert state.next_delay(error, delay=3) is None
+
+
+def test_state_w_policy_deadline():
+    policy = RetryPolicy(initial_delay=1, jitter=JITTER_NONE, deadline=2.5)
+    with mock.patch("time.monotonic", return_value=100.0):
+        state = policy.start()
+        error = InternalServerError("testing")
+        assert state.next_delay(error) == 1
+        assert state.next_delay(error) == 2
+        assert state.next_delay(error) is None
+
+
+def test_budget():
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    assert budget.record_failure()
+    assert not budget.record_failure()
+    assert budget.tokens == 2
+    budget.record_success()
+    assert budget.tokens == 3
+    for _ in range(5):
+        budget.record_success()
+    assert budget.tokens == 4
+    for _ in range(10):
+        budget.record_failure()
+    assert budget.tokens == 0
+
+
+def test_budget_invalid_arguments():
+    with pytest.raises(ValueError):
+        RetryBudget(max_tokens=0)
+    with pytest.raises(ValueError):
+        RetryBudget(token_ratio=0)
+
+
+def test_state_w_budget():
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    policy = RetryPolicy(jitter=JITTER_NONE, budget=budget)
+    error = InternalServerError("testing")
+    state = policy.start()
+    assert state.next_delay(error) == 1.0
+    assert state.next_delay(error) is None
+    state.record_success()
+    assert budget.tokens == 3
+    assert policy.start().next_delay(error) is None
+
+
+def test_default_policies():
+    default = retry_policy.get_default_retry_policy()
+    stream = retry_policy.get_stream_resumption_retry_policy()
+    custom = RetryPolicy()
+    try:
+        retry_policy.set_default_retry_policy(custom)
+        retry_policy.set_stream_resumption_retry_policy(custom)
+        assert retry_policy.get_default_retry_policy() is custom
+        assert retry_policy.get_stream_resumption_retry_policy() is custom
+    finally:
+        retry_policy.set_default_retry_policy(default)
+        retry_policy.set_stream_resumption_retry_policy(stream)
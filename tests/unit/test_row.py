@@ -0,0 +1,136 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import pytest
+from google.protobuf.struct_pb2 import NULL_VALUE, Value
+
+from google.cloud.spanner_v1.row import Row, _RowSchema
+
+
+class _CountingDecoder(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value_pb):
+        self.calls += 1
+        return value_pb.string_value.upper()
+
+
+def _make_row(values=("a", "b", "c"), names=("x", "y", "z")):
+    decoders = [_CountingDecoder() for _ in names]
+    schema = _RowSchema(names, decoders)
+    row = Row(schema, [Value(string_value=value) for value in values])
+    return row, decoders
+
+
+def test_index_access():
+    row, decoders = _make_row()
+
+    assert len(row) == 3
+    assert row[0] == "A"
+    assert row[-1] == "C"
+    assert [decoder.calls for decoder in decoders] == [1, 0, 1]
+
+
+def test_index_out_of_range():
+    row, _ = _make_row()
+
+    with pytest.raises(IndexError):
+        row[3]
+    with pytest.raises(IndexError):
+        row[-4]
+
+
+def test_slice_access():
+    row, _ = _make_row()
+
+    assert row[1:] == ["B", "C"]
+    assert row[::-1] == ["C", "B", "A"]
+
+
+def test_name_access():
+    row, decoders = _make_row()
+
+    assert row["y"] == "B"
+    assert row.get("z") == "C"
+    assert row.get("unknown", 42) == 42
+    assert [decoder.calls for decoder in decoders] == [0, 1, 1]
+    with pytest.raises(KeyError):
+        row["unknown"]
+
+
+def test_duplicate_names():
+    row, _ = _make_row(names=("x", "x", "z"))
+
+    assert row["x"] == "B"
+
+
+def test_values_are_decoded_once():
+    row, decoders = _make_row()
+
+    assert list(row) == ["A", "B", "C"]
+    assert list(row) == ["A", "B", "C"]
+    assert row["x"] == "A"
+    assert [decoder.calls for decoder in decoders] == [1, 1, 1]
+
+
+def test_null_value():
+    decoder = _CountingDecoder()
+    row = Row(_RowSchema(["x"], [decoder]), [Value(null_value=NULL_VALUE)])
+
+    assert row[0] is None
+    assert decoder.calls == 0
+
+
+def test_to_dict():
+    row, _ = _make_row()
+
+    assert row.fields == ("x", "y", "z")
+    assert row.keys() == ("x", "y", "z")
+    assert row.items() == [("x", "A"), ("y", "B"), ("z", "C")]
+    assert row.to_dict() == {"x": "A", "y": "B", "z": "C"}
+
+
+def test_equality():
+    row, _ = _make_row()
+    other, _ = _make_row()
+
+    assert row == ["A", "B", "C"]
+    assert row == ("A", "B", "C")
+    assert row == other
+    assert row != ["A", "B"]
+    assert row != "ABC"
+    with pytest.raises(TypeError):
+        hash(row)
+
+
+def test_repr():
+    row, _ = _make_row()
+
+    assert repr(row) == "Row(['A', 'B', 'C'])"
+
+
+def test_pickle():
+    from google.cloud.spanner_v1.column_profiler import _ColumnUsageCounter
+
+    row, _ = _make_row()
+    row._schema.usage = _ColumnUsageCounter("tag", row.fields)
+
+    restored = pickle.loads(pickle.dumps(row))
+
+    assert restored == ["A", "B", "C"]
+    # Pickling does not count as an access of the columns.
+    assert row._schema.usage.accessed == 0
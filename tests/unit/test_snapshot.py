@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from threading import Lock
 from typing import Mapping
 
@@ -819,12 +819,18 @@ class Test_SnapshotBase(OpenTelemetryBase):
             build_transaction_pb(),
         ]
 
-        self._execute_begin(derived, attempts=2)
+        with mock.patch("time.sleep") as sleep_mock:
+            self._execute_begin(derived, attempts=2)
 
+        # The default retry policy sleeps between zero and the initial delay.
+        sleep_mock.assert_called_once()
+        sleep_seconds = sleep_mock.call_args[0][0]
+        self.assertLessEqual(0, sleep_seconds)
+        self.assertLessEqual(sleep_seconds, 1.0)
         expected_statuses = [
             (
                 "Transaction Begin Attempt Failed. Retrying",
-                {"attempt": 1, "sleep_seconds": 4},
+                {"attempt": 1, "sleep_seconds": sleep_seconds},
             )
         ]
         actual_statuses = self.finished_spans_events_statuses()
@@ -843,12 +849,18 @@ class Test_SnapshotBase(OpenTelemetryBase):
             build_transaction_pb(),
         ]
 
-        self._execute_begin(derived, attempts=2)
+        with mock.patch("time.sleep") as sleep_mock:
+            self._execute_begin(derived, attempts=2)
 
+        # The default retry policy sleeps between zero and the initial delay.
+        sleep_mock.assert_called_once()
+        sleep_seconds = sleep_mock.call_args[0][0]
+        self.assertLessEqual(0, sleep_seconds)
+        self.assertLessEqual(sleep_seconds, 1.0)
         expected_statuses = [
             (
                 "Transaction Begin Attempt Failed. Retrying",
-                {"attempt": 1, "sleep_seconds": 4},
+                {"attempt": 1, "sleep_seconds": sleep_seconds},
             )
         ]
         actual_statuses = self.finished_spans_events_statuses()
@@ -2110,6 +2122,50 @@ class TestSnapshot(OpenTelemetryBase):
         self.assertTrue(snapshot._multi_use)
         self.assertEqual(snapshot._exact_staleness, DURATION)
 
+    def test_read_w_read_cache(self):
+        from google.cloud.spanner_v1 import (
+            PartialResultSet,
+            ResultSetMetadata,
+            StructType,
+            Type,
+            TypeCode,
+        )
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+        from google.cloud.spanner_v1.keyset import KeySet
+        from google.cloud.spanner_v1.read_cache import ReadCache
+
+        metadata_pb = ResultSetMetadata(
+            row_type=StructType(
+                fields=[StructType.Field(name="col", type_=Type(code=TypeCode.STRING))]
+            ),
+            transaction=TransactionPB(read_timestamp=datetime.now(timezone.utc)),
+        )
+        result_set = PartialResultSet(metadata=metadata_pb)
+        result_set.values.extend([_make_value_pb("value")])
+        session = build_session()
+        api = session._database.spanner_api
+        api.streaming_read.side_effect = lambda **kw: _MockIterator(result_set)
+        read_cache = ReadCache()
+
+        for _ in range(3):
+            snapshot = build_snapshot(
+                session=session, max_staleness=DURATION, read_cache=read_cache
+            )
+            rows = list(snapshot.read(TABLE_NAME, ["col"], KeySet(keys=[["key"]])))
+            self.assertEqual([["value"]], rows)
+
+        self.assertEqual(1, api.streaming_read.call_count)
+        self.assertEqual(2, read_cache.stats()["hits"])
+
+        # Multi-key reads are not cached.
+        snapshot = build_snapshot(
+            session=session, max_staleness=DURATION, read_cache=read_cache
+        )
+        list(snapshot.read(TABLE_NAME, ["col"], KeySet(keys=[["key"], ["other"]])))
+        self.assertEqual(2, api.streaming_read.call_count)
+        self.assertEqual(1, read_cache.stats()["entries"])
+
     def test__build_transaction_options_strong(self):
         snapshot = build_snapshot()
         options = snapshot._build_transaction_options_pb()
@@ -994,6 +994,75 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def test___iter___w_lazy_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.row import Row
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred Phlyntstone", 42, "Bharney Rhubble", 39]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:3], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[3:])
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator, lazy_rows=True)
+        found = list(streamed)
+        self.assertEqual(len(found), 2)
+        for row in found:
+            self.assertIsInstance(row, Row)
+            self.assertIs(row._schema, found[0]._schema)
+        self.assertEqual(found[0]["age"], 42)
+        # Only the accessed column has been decoded.
+        self.assertEqual(found[0]._values[0], VALUES[0])
+        self.assertEqual(found[0].to_dict(), {"full_name": BARE[0], "age": 42})
+        self.assertEqual(streamed.decode_row(found[1]), [BARE[2], BARE[3]])
+        self.assertEqual(streamed.decode_column(found[1], 1), BARE[3])
+
+    def test_to_dict_list_w_lazy_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = ["Phred Phlyntstone", 42, "Bharney Rhubble", 39]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(iterator, lazy_rows=True)
+        self.assertEqual(
+            streamed.to_dict_list(),
+            [
+                {"full_name": BARE[0], "age": BARE[1]},
+                {"full_name": BARE[2], "age": BARE[3]},
+            ],
+        )
+
+    def test_to_dict_list_w_column_profiler(self):
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.column_profiler import ColumnAccessProfiler
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        VALUES = [self._make_value(bare) for bare in ["Phred Phlyntstone", 42]]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        profiler = ColumnAccessProfiler()
+        streamed = self._make_one(iterator, column_profiler=profiler)
+
+        streamed.to_dict_list()
+
+        # Converting the rows in bulk does not count as an access.
+        (usage,) = profiler.report()
+        self.assertEqual(usage.unused_columns, ("full_name", "age"))
+
     def test___iter___w_existing_rows_read(self):
         from google.cloud.spanner_v1 import TypeCode
 
@@ -1035,6 +1104,43 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def _make_numbers_result_sets(self, counts):
+        from google.cloud.spanner_v1 import TypeCode
+
+        metadata = self._make_result_set_metadata(
+            [self._make_scalar_field("id", TypeCode.INT64)]
+        )
+        result_sets = []
+        start = 0
+        for count in counts:
+            values = [
+                self._make_value(number) for number in range(start, start + count)
+            ]
+            result_sets.append(
+                self._make_partial_result_set(
+                    values, metadata=metadata if not result_sets else None
+                )
+            )
+            start += count
+        return result_sets
+
+    def test_batches_per_partial_result_set(self):
+        result_sets = self._make_numbers_result_sets([2, 0, 3])
+        streamed = self._make_one(_MockCancellableIterator(*result_sets))
+        found = list(streamed.batches())
+        self.assertEqual(found, [[[0], [1]], [[2], [3], [4]]])
+
+    def test_batches_w_batch_size(self):
+        result_sets = self._make_numbers_result_sets([2, 3, 2])
+        streamed = self._make_one(_MockCancellableIterator(*result_sets))
+        found = list(streamed.batches(batch_size=3))
+        self.assertEqual(found, [[[0], [1], [2]], [[3], [4], [5]], [[6]]])
+
+    def test_batches_w_invalid_batch_size(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        with self.assertRaises(ValueError):
+            list(streamed.batches(batch_size=0))
+
 
 class _MockCancellableIterator(object):
     cancel_calls = 0
@@ -699,6 +699,49 @@ class TestTransaction(OpenTelemetryBase):
         with self.assertRaises(RuntimeError):
             transaction.commit()
 
+    def test_commit_single_use_commit(self):
+        transaction = build_transaction()
+        transaction.single_use_commit = True
+        transaction._mutations = [DELETE_MUTATION]
+
+        api = transaction._session._database.spanner_api
+        # A precommit token in the response does not cause a retry, as the
+        # commit of a single-use transaction cannot be retried.
+        api.commit.return_value = build_commit_response_pb(
+            precommit_token=PRECOMMIT_TOKEN_PB_0
+        )
+
+        transaction.commit()
+
+        api.begin_transaction.assert_not_called()
+        self.assertEqual(1, api.commit.call_count)
+        request = api.commit.call_args.kwargs["request"]
+        self.assertEqual(
+            TransactionOptions(read_write=TransactionOptions.ReadWrite()),
+            request.single_use_transaction,
+        )
+        self.assertEqual(b"", request.transaction_id)
+        self.assertEqual([DELETE_MUTATION], list(request.mutations))
+        self.assertEqual(1, transaction._rpc_count.value)
+
+    def test_commit_single_use_commit_after_query_begins(self):
+        transaction = build_transaction()
+        transaction.single_use_commit = True
+        transaction._mutations = [DELETE_MUTATION]
+        transaction._execute_sql_request_count = 1
+
+        api = transaction._session._database.spanner_api
+        api.begin_transaction.return_value = build_transaction_pb(id=TRANSACTION_ID)
+        api.commit.return_value = build_commit_response_pb()
+
+        transaction.commit()
+
+        self.assertEqual(1, api.begin_transaction.call_count)
+        request = api.commit.call_args.kwargs["request"]
+        self.assertEqual(TRANSACTION_ID, request.transaction_id)
+        self.assertNotIn("single_use_transaction", request)
+        self.assertEqual(2, transaction._rpc_count.value)
+
     def test__make_params_pb_w_params_w_param_types(self):
         from google.protobuf.struct_pb2 import Struct
 
@@ -975,6 +1018,61 @@ class TestTransaction(OpenTelemetryBase):
     def test_execute_update_w_precommit_token(self, mock_region):
         self._execute_update_helper(use_multiplexed=True)
 
+    def test_execute_update_concurrent_begins_once(self):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from google.cloud.spanner_v1 import ResultSet, ResultSetStats
+
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        requests = []
+        precommit_tokens = [PRECOMMIT_TOKEN_PB_2, PRECOMMIT_TOKEN_PB_0]
+        in_flight = [0, 0]
+        state_lock = threading.Lock()
+
+        def execute_sql(request=None, metadata=None, **kwargs):
+            with state_lock:
+                requests.append(request)
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.05)
+            with state_lock:
+                in_flight[0] -= 1
+                precommit_token = (
+                    precommit_tokens.pop(0)
+                    if precommit_tokens
+                    else PRECOMMIT_TOKEN_PB_1
+                )
+            metadata_pb = ResultSetMetadata()
+            if "begin" in request.transaction:
+                metadata_pb = ResultSetMetadata(
+                    transaction=build_transaction_pb(id=TRANSACTION_ID)
+                )
+            return ResultSet(
+                metadata=metadata_pb,
+                stats=ResultSetStats(row_count_exact=1),
+                precommit_token=precommit_token,
+            )
+
+        database.spanner_api.execute_sql.side_effect = execute_sql
+        transaction = self._make_one(_Session(database))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            row_counts = list(
+                executor.map(lambda _: transaction.execute_update(DML_QUERY), range(4))
+            )
+
+        self.assertEqual([1, 1, 1, 1], row_counts)
+        self.assertIn("begin", requests[0].transaction)
+        for request in requests[1:]:
+            self.assertEqual(TRANSACTION_ID, request.transaction.id)
+        self.assertEqual([0, 1, 2, 3], sorted(request.seqno for request in requests))
+        # The statements after the first one are executed in parallel.
+        self.assertEqual(3, in_flight[1])
+        self.assertEqual(PRECOMMIT_TOKEN_PB_2, transaction._precommit_token)
+        self.assertFalse(transaction._lock.locked())
+
     @mock.patch(
         "google.cloud.spanner_v1._opentelemetry_tracing._get_cloud_region",
         return_value="global",
@@ -0,0 +1,322 @@
+# Copyright 2026 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from google.api_core.exceptions import Aborted, NotFound
+
+from google.cloud.spanner_v1.transaction_scheduler import TransactionScheduler
+
+
+class _Database(object):
+    """Retries aborted attempts like Session.run_in_transaction."""
+
+    def __init__(self, max_attempts=10):
+        self.max_attempts = max_attempts
+        self.kwargs = []
+
+    def run_in_transaction(self, func, *args, **kw):
+        self.kwargs.append(kw)
+        for _ in range(self.max_attempts - 1):
+            try:
+                return func(object(), *args)
+            except Aborted:
+                continue
+        return func(object(), *args)
+
+
+class _PooledDatabase(_Database):
+    """Checks out one of a limited number of sessions per transaction."""
+
+    def __init__(self, size, **kwargs):
+        super(_PooledDatabase, self).__init__(**kwargs)
+        self._sessions = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.max_in_use = 0
+
+    def run_in_transaction(self, func, *args, **kw):
+        if not self._sessions.acquire(timeout=5):
+            raise RuntimeError("The session pool is exhausted")
+        with self._lock:
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+        try:
+            return super(_PooledDatabase, self).run_in_transaction(func, *args, **kw)
+        finally:
+            with self._lock:
+                self.in_use -= 1
+            self._sessions.release()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TransactionScheduler(_Database(), abort_rate_threshold=0)
+    with pytest.raises(ValueError):
+        TransactionScheduler(_Database(), hot_key_concurrency=0)
+    with pytest.raises(ValueError):
+        TransactionScheduler(_Database(), smoothing=2)
+
+
+def test_run_in_transaction_wo_keys():
+    database = _Database()
+    scheduler = TransactionScheduler(database)
+
+    result = scheduler.run_in_transaction(lambda txn, value: value, 42)
+
+    assert result == 42
+    assert scheduler.snapshot() == {}
+
+
+def test_run_in_transaction_uses_transaction_tag_as_key():
+    database = _Database()
+    scheduler = TransactionScheduler(database)
+
+    scheduler.run_in_transaction(lambda txn: None, transaction_tag="tag")
+
+    assert database.kwargs == [{"transaction_tag": "tag"}]
+    stats = scheduler.snapshot()
+    assert list(stats) == ["tag"]
+    assert stats["tag"]["attempts"] == 1
+    assert stats["tag"]["aborts"] == 0
+    assert stats["tag"]["queueing_delay"]["count"] == 1
+
+
+def test_run_in_transaction_records_aborts():
+    scheduler = TransactionScheduler(_Database(), smoothing=0.5)
+    attempts = []
+
+    def unit_of_work(transaction):
+        attempts.append(transaction)
+        if len(attempts) < 3:
+            raise Aborted("aborted")
+        return "done"
+
+    result = scheduler.run_in_transaction(unit_of_work, keys=["a", "b"])
+
+    assert result == "done"
+    assert len(attempts) == 3
+    stats = scheduler.snapshot()
+    for key in ("a", "b"):
+        assert stats[key]["attempts"] == 3
+        assert stats[key]["aborts"] == 2
+        # 0 -> 0.5 -> 0.75 -> 0.375
+        assert stats[key]["abort_rate"] == 0.375
+        assert stats[key]["hot"]
+        assert stats[key]["running"] == 0
+        assert stats[key]["queueing_delay"]["count"] == 3
+
+
+def test_run_in_transaction_aborted_after_retries():
+    scheduler = TransactionScheduler(_Database(max_attempts=2))
+
+    def unit_of_work(transaction):
+        raise Aborted("aborted")
+
+    with pytest.raises(Aborted):
+        scheduler.run_in_transaction(unit_of_work, keys="a")
+
+    stats = scheduler.snapshot()["a"]
+    assert stats["attempts"] == 2
+    assert stats["aborts"] == 2
+    assert stats["running"] == 0
+
+
+def test_run_in_transaction_error_releases_key():
+    scheduler = TransactionScheduler(_Database(), abort_rate_threshold=0.01)
+    scheduler.run_in_transaction(_raise_aborted_once(), keys="a")
+
+    with pytest.raises(NotFound):
+        scheduler.run_in_transaction(_raise(NotFound("missing")), keys="a")
+
+    # The key is hot, but no transaction is running on it anymore.
+    assert scheduler.run_in_transaction(lambda txn: 1, keys="a") == 1
+    assert scheduler.snapshot()["a"]["running"] == 0
+
+
+def test_hot_key_is_serialized():
+    scheduler = TransactionScheduler(_Database(), abort_rate_threshold=0.01)
+    scheduler.run_in_transaction(_raise_aborted_once(), keys="hot")
+    assert scheduler.snapshot()["hot"]["hot"]
+
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def unit_of_work(transaction):
+        with lock:
+            running.append(transaction)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(transaction)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(scheduler.run_in_transaction, unit_of_work, keys="hot")
+            for _ in range(8)
+        ]
+        for future in futures:
+            future.result()
+
+    assert max(max_running) == 1
+    stats = scheduler.snapshot()["hot"]
+    assert stats["queueing_delay"]["max_seconds"] > 0
+    assert stats["queued"] == 0
+
+
+def test_waiting_transactions_do_not_hold_sessions():
+    database = _PooledDatabase(2)
+    scheduler = TransactionScheduler(database, abort_rate_threshold=0.01)
+    scheduler.run_in_transaction(_raise_aborted_once(), keys="hot")
+    lock = threading.Lock()
+    attempts = []
+
+    def unit_of_work(transaction, name):
+        with lock:
+            attempts.append(name)
+            attempt = attempts.count(name)
+        time.sleep(0.01)
+        if attempt == 1:
+            raise Aborted("aborted")
+        return name
+
+    # More transactions on the hot key than sessions in the pool.
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [
+            executor.submit(
+                scheduler.run_in_transaction, unit_of_work, index, keys="hot"
+            )
+            for index in range(6)
+        ]
+        assert [future.result() for future in futures] == list(range(6))
+
+    # Only the transaction that runs on the hot key has a session.
+    assert database.max_in_use == 1
+    assert scheduler.snapshot()["hot"]["running"] == 0
+
+
+def test_cold_key_is_not_serialized():
+    scheduler = TransactionScheduler(_Database())
+    barrier = threading.Barrier(3, timeout=5)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(
+                scheduler.run_in_transaction, lambda txn: barrier.wait(), keys="cold"
+            )
+            for _ in range(3)
+        ]
+        for future in futures:
+            future.result()
+
+    assert not scheduler.snapshot()["cold"]["hot"]
+
+
+def test_aborted_transaction_is_retried_before_newer_transaction():
+    scheduler = TransactionScheduler(_Database(), abort_rate_threshold=0.01)
+    scheduler.run_in_transaction(_raise_aborted_once(), keys="hot")
+
+    order = []
+    older_running = threading.Event()
+
+    def older(transaction):
+        order.append("older")
+        if order.count("older") == 1:
+            older_running.set()
+            # Wait until the newer transaction is queued on the key.
+            while not scheduler.snapshot()["hot"]["queued"]:
+                time.sleep(0.001)
+            raise Aborted("aborted")
+
+    def newer(transaction):
+        order.append("newer")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        older_future = executor.submit(scheduler.run_in_transaction, older, keys="hot")
+        assert older_running.wait(5)
+        newer_future = executor.submit(scheduler.run_in_transaction, newer, keys="hot")
+        older_future.result()
+        newer_future.result()
+
+    assert order == ["older", "older", "newer"]
+
+
+def test_retry_on_new_hot_key_waits_for_older_transaction():
+    database = _PooledDatabase(2)
+    scheduler = TransactionScheduler(database, abort_rate_threshold=0.5, smoothing=1)
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+    lock = threading.Lock()
+
+    def unit_of_work(transaction, name):
+        with lock:
+            order.append(name)
+            attempt = order.count(name)
+        if attempt == 1:
+            # Both transactions run on the cold key, and are aborted.
+            barrier.wait()
+            raise Aborted("aborted")
+        time.sleep(0.01)
+        with lock:
+            order.append(name)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(
+            scheduler.run_in_transaction, unit_of_work, "first", keys="key"
+        )
+        # Make sure that the first transaction is the older one.
+        time.sleep(0.01)
+        second = executor.submit(
+            scheduler.run_in_transaction, unit_of_work, "second", keys="key"
+        )
+        first.result()
+        second.result()
+
+    # The retries are serialized, and the older transaction runs first.
+    assert order[2:] == ["first", "first", "second", "second"]
+    assert scheduler.snapshot()["key"]["running"] == 0
+    # A retry that has to wait gives back its session and starts over.
+    assert len(database.kwargs) > 2
+
+
+def test_reset():
+    scheduler = TransactionScheduler(_Database())
+    scheduler.run_in_transaction(_raise_aborted_once(), keys="a")
+
+    scheduler.reset()
+
+    assert scheduler.snapshot() == {}
+
+
+def _raise(exc):
+    def unit_of_work(transaction):
+        raise exc
+
+    return unit_of_work
+
+
+def _raise_aborted_once():
+    attempts = []
+
+    def unit_of_work(transaction):
+        attempts.append(transaction)
+        if len(attempts) == 1:
+            raise Aborted("aborted")
+
+    return unit_of_work